@@ -0,0 +1,73 @@
+"""
+This script measures the memory used by the xDSL IR data structures.
+It builds a module with a single block containing the given number of
+operations, alternating `arith.constant` and `arith.addi` operations, and
+a single `func.func` wrapping them.
+It then prints the number of bytes allocated per operation, as measured by
+`tracemalloc`, along with the time taken to build the module.
+"""
+
+import argparse
+import gc
+import timeit
+import tracemalloc
+
+from xdsl.dialects.arith import Addi, Constant
+from xdsl.dialects.builtin import IntegerAttr, ModuleOp, i32
+from xdsl.dialects.func import FuncOp, Return
+from xdsl.ir import Block, Operation, Region
+
+
+def build_module(num_ops: int) -> ModuleOp:
+    """
+    Build a module containing `num_ops` operations in a single block.
+    """
+    value_attr = IntegerAttr.from_int_and_width(1, 32)
+    ops: list[Operation] = []
+    last = Constant.from_attr(value_attr, i32)
+    ops.append(last)
+    while len(ops) < num_ops - 1:
+        constant = Constant.from_attr(value_attr, i32)
+        last = Addi(last, constant)
+        ops.append(constant)
+        ops.append(last)
+    ops.append(Return.get(last))
+    block = Block(ops)
+    func = FuncOp.from_region("main", [], [i32], Region(block))
+    return ModuleOp([func])
+
+
+def run(num_ops: int):
+    """
+    Build a module, and print the memory used per operation.
+    """
+    gc.collect()
+    tracemalloc.start()
+    module = build_module(num_ops)
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    actual_num_ops = sum(1 for _ in module.walk())
+
+    del module
+    gc.collect()
+    build_time = timeit.timeit(lambda: build_module(num_ops), number=1)
+
+    print("Number of operations:", actual_num_ops)
+    print("Total memory (bytes):", size)
+    print("Memory per operation (bytes):", size / actual_num_ops)
+    print("Time to build:", build_time)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="xDSL IR memory benchmark")
+    arg_parser.add_argument(
+        "--ops",
+        type=int,
+        required=False,
+        default=1_000_000,
+        help="Number of operations in the generated module.",
+    )
+
+    args = arg_parser.parse_args()
+    run(args.ops)
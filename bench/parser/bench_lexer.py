@@ -2,6 +2,8 @@
 This script benchmarks the xDSL lexer by parsing all files in the
 given root directory.
 It then prints the total time taken to parse all files.
+When `--synthetic` is given, generated inputs of increasing sizes are lexed
+instead, to check that the lexing time scales linearly with the input size.
 """
 
 import cProfile
@@ -22,6 +24,36 @@ def lex_file(file: Input):
         pass
 
 
+def generate_synthetic_input(num_ops: int) -> str:
+    """
+    Generate a program in generic form containing `num_ops` operations.
+    """
+    lines = ['"builtin.module"() ({', '  %0 = "test.init"() : () -> i32']
+    for i in range(1, num_ops):
+        lines.append(
+            f'  %{i} = "test.op"(%{i - 1}) {{"index" = {i} : i64}} : (i32) -> i32'
+        )
+        if i % 100 == 0:
+            lines.append(f"  // Comment after operation {i}")
+    lines.append("}) : () -> ()")
+    return "\n".join(lines)
+
+
+def run_on_synthetic(sizes: Iterable[int]):
+    """
+    Lex generated inputs of the given sizes, and report the time per character
+    for each of them.
+    """
+    for num_ops in sizes:
+        input = Input(generate_synthetic_input(num_ops), f"<synthetic-{num_ops}>")
+        total_time = timeit.timeit(lambda: lex_file(input), number=args.num_iterations)
+        time_per_lex = total_time / args.num_iterations
+        print(f"Number of operations: {num_ops}")
+        print(f"  Input size (characters): {len(input)}")
+        print(f"  Time to lex: {time_per_lex}")
+        print(f"  Time per character (ns): {time_per_lex / len(input) * 1e9}")
+
+
 def run_on_files(file_names: Iterable[str]):
     total_time = 0
     for file_name in file_names:
@@ -46,6 +78,7 @@ if __name__ == "__main__":
     arg_parser.add_argument(
         "root_directory",
         type=str,
+        nargs="?",
         help="Path to the root directory containing MLIR files.",
     )
     arg_parser.add_argument(
@@ -55,12 +88,31 @@ if __name__ == "__main__":
         default=1,
         help="Number of times to lex each file.",
     )
+    arg_parser.add_argument(
+        "--synthetic",
+        type=int,
+        nargs="*",
+        metavar="N",
+        help="Lex generated inputs with N operations instead of files "
+        "(defaults to 10000, 100000, and 1000000 operations).",
+    )
     arg_parser.add_argument(
         "--profile", action="store_true", help="Enable profiling metrics."
     )
 
     args = arg_parser.parse_args()
 
+    if args.synthetic is not None:
+        sizes = args.synthetic or [10_000, 100_000, 1_000_000]
+        if args.profile:
+            cProfile.run("run_on_synthetic(sizes)")
+        else:
+            run_on_synthetic(sizes)
+        exit(0)
+
+    if args.root_directory is None:
+        arg_parser.error("a root directory is required without --synthetic")
+
     file_names = list(glob.iglob(args.root_directory + "/**/*.mlir", recursive=True))
     print("Found " + str(len(file_names)) + " files to lex.")
 
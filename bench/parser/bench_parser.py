@@ -6,6 +6,9 @@ Each file is first parsed by MLIR to check that it is valid, and in
 the generic form.
 Each file is also splitted according to `split-input-file` if it is
 present.
+When `--synthetic N` is given, a generic-form module containing N
+operations is generated instead, so the parser can be benchmarked without
+an MLIR installation.
 """
 
 import subprocess
@@ -23,10 +26,45 @@ def parse_file(file: str, ctx: MLContext):
     """
     Parse the given file.
     """
-    parser = Parser(ctx, file, allow_unregistered_dialect=True)
+    parser = Parser(
+        ctx,
+        file,
+        allow_unregistered_dialect=True,
+        memoize_attributes=args.memoize_attributes,
+    )
     parser.parse_op()
 
 
+def generate_synthetic_module(num_ops: int) -> str:
+    """
+    Generate a module in generic form containing `num_ops` unregistered
+    operations, each using the results of the previous ones.
+    """
+    lines = ['"builtin.module"() ({', '  %0 = "test.init"() : () -> i32']
+    for i in range(1, num_ops):
+        lines.append(
+            f'  %{i} = "test.op"(%{i - 1}, %{i - 1}) '
+            f'{{"index" = {i} : i64, "name" = "op{i}"}} : (i32, i32) -> i32'
+        )
+    lines.append("}) : () -> ()")
+    return "\n".join(lines)
+
+
+def run_on_synthetic(num_ops: int, ctx: MLContext):
+    """
+    Run the parser on a generated module with `num_ops` operations.
+    """
+    contents = generate_synthetic_module(num_ops)
+    total_time = timeit.timeit(
+        lambda: parse_file(contents, ctx), number=args.num_iterations
+    )
+    time_per_parse = total_time / args.num_iterations
+    print("Number of operations:", num_ops)
+    print("Input size (bytes):", len(contents))
+    print("Time to parse:", time_per_parse)
+    print("Operations per second:", num_ops / time_per_parse)
+
+
 def split_mlir_file(contents: str) -> list[str]:
     """
     Split the MLIR program into multiple ones, separated by `// -----`,
@@ -98,6 +136,7 @@ if __name__ == "__main__":
     arg_parser.add_argument(
         "root_directory",
         type=str,
+        nargs="?",
         help="Path to the root directory containing MLIR files.",
     )
     arg_parser.add_argument("--mlir-path", type=str, help="Path to mlir-opt.")
@@ -108,6 +147,23 @@ if __name__ == "__main__":
         default=1,
         help="Number of times to parse each file.",
     )
+    arg_parser.add_argument(
+        "--synthetic",
+        type=int,
+        required=False,
+        metavar="N",
+        help="Parse a generated module with N operations instead of files.",
+    )
+    arg_parser.add_argument(
+        "--memoize-attributes",
+        action="store_true",
+        help="Memoize attribute and type parsing results.",
+    )
+    arg_parser.add_argument(
+        "--unique-attributes",
+        action="store_true",
+        help="Represent structurally equal attributes by a single instance.",
+    )
     arg_parser.add_argument(
         "--profile", action="store_true", help="Enable profiling metrics."
     )
@@ -121,11 +177,21 @@ if __name__ == "__main__":
 
     args = arg_parser.parse_args()
 
+    ctx = MLContext(unique_attributes=args.unique_attributes)
+
+    if args.synthetic is not None:
+        if args.profile:
+            cProfile.run("run_on_synthetic(args.synthetic, ctx)")
+        else:
+            run_on_synthetic(args.synthetic, ctx)
+        exit(0)
+
+    if args.root_directory is None:
+        arg_parser.error("a root directory is required without --synthetic")
+
     file_names = list(glob.iglob(args.root_directory + "/**/*.mlir", recursive=True))
     print("Found " + str(len(file_names)) + " files to parse.")
 
-    ctx = MLContext()
-
     if args.profile:
         cProfile.run("run_on_files(file_names, args.mlir_path, ctx)")
     else:
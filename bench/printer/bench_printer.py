@@ -0,0 +1,97 @@
+"""
+This script benchmarks the xDSL printer on generated modules.
+The generated module contains a single region with many blocks, each with
+many named block arguments that are used by the operations of the block.
+It stresses the allocation of SSA value and block names, in particular
+when many block arguments share the same name hint.
+It then prints the time taken to print the module.
+"""
+
+import argparse
+import cProfile
+import timeit
+from io import StringIO
+
+from xdsl.dialects.builtin import ModuleOp, i32
+from xdsl.ir import Block, Region
+from xdsl.dialects.test import TestOp
+from xdsl.printer import Printer
+
+
+def generate_block_arg_module(num_blocks: int, num_args: int) -> ModuleOp:
+    """
+    Generate a module with `num_blocks` blocks, each having `num_args`
+    block arguments. Half of the block arguments are named after a small
+    set of name hints, so they collide with an already allocated name, and
+    the other half have a unique name hint.
+    """
+    blocks: list[Block] = []
+    for block_idx in range(num_blocks):
+        block = Block(arg_types=[i32] * num_args)
+        for i, arg in enumerate(block.args):
+            arg.name_hint = f"arg{i % 8}" if i % 2 else f"b{block_idx}_arg{i}"
+        ops = [TestOp.create(operands=[arg], result_types=[i32]) for arg in block.args]
+        for op in ops:
+            op.results[0].name_hint = "val"
+        block.add_ops(ops)
+        blocks.append(block)
+    region = Region(blocks)
+    return ModuleOp([TestOp.create(regions=[region])])
+
+
+def print_module(module: ModuleOp) -> int:
+    """
+    Print the given module in a string, and return the size of the output.
+    """
+    io = StringIO()
+    Printer(stream=io).print_op(module)
+    return len(io.getvalue())
+
+
+def run(num_blocks: int, num_args: int):
+    """
+    Run the printer on a generated module.
+    """
+    module = generate_block_arg_module(num_blocks, num_args)
+    output_size = print_module(module)
+    total_time = timeit.timeit(lambda: print_module(module), number=args.num_iterations)
+    time_per_print = total_time / args.num_iterations
+    print("Number of block arguments:", num_blocks * num_args)
+    print("Output size (bytes):", output_size)
+    print("Time to print:", time_per_print)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="xDSL printer benchmark")
+    arg_parser.add_argument(
+        "--blocks",
+        type=int,
+        required=False,
+        default=1000,
+        help="Number of blocks in the generated module.",
+    )
+    arg_parser.add_argument(
+        "--args",
+        type=int,
+        required=False,
+        default=20,
+        dest="block_args",
+        help="Number of arguments of each generated block.",
+    )
+    arg_parser.add_argument(
+        "--num_iterations",
+        type=int,
+        required=False,
+        default=1,
+        help="Number of times to print the module.",
+    )
+    arg_parser.add_argument(
+        "--profile", action="store_true", help="Enable profiling metrics."
+    )
+
+    args = arg_parser.parse_args()
+
+    if args.profile:
+        cProfile.run("run(args.blocks, args.block_args)")
+    else:
+        run(args.blocks, args.block_args)
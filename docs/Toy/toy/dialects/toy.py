@@ -84,7 +84,7 @@ class ConstantOp(IRDLOperation):
         return self.get_type().get_shape()
 
     def get_data(self) -> list[float]:
-        return [float(el.value.data) for el in self.value.data.data]
+        return [float(el) for el in self.value.as_tuple()]
 
 
 @irdl_op_definition
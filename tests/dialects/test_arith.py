@@ -3,6 +3,8 @@ import pytest
 
 from xdsl.dialects.arith import (
     Addi,
+    Muli,
+    Select,
     BinaryOperation,
     Constant,
     DivUI,
@@ -39,13 +41,19 @@ from xdsl.dialects.arith import (
     Negf,
 )
 from xdsl.dialects.builtin import (
+    FloatAttr,
+    IntegerAttr,
+    Signedness,
+    i1,
     i32,
     i64,
+    f16,
     f32,
     f64,
     IndexType,
     IntegerType,
 )
+from xdsl.dialects.test import TestOp
 from xdsl.ir import Attribute
 from xdsl.utils.exceptions import VerifyException
 
@@ -254,3 +262,149 @@ def test_cmpf_incorrect_comparison():
         # 'oeq' is a comparison op for cmpf but not cmpi
         cmpi_op = Cmpi.get(a, b, "oeq")
     assert e.value.args[0] == "Unknown comparison mnemonic: oeq"
+
+
+i8 = IntegerType(8)
+ui8 = IntegerType(8, Signedness.UNSIGNED)
+
+
+@pytest.mark.parametrize(
+    "OpClass, lhs, rhs, typ, expected",
+    [
+        (Addi, 100, 100, i8, -56),
+        (Addi, 200, 100, ui8, 44),
+        (Subi, 0, 1, i32, -1),
+        (Subi, 0, 1, ui8, 255),
+        (Muli, 1 << 62, 4, i64, 0),
+        (Muli, 3, -1, IndexType(), -3),
+        (DivUI, 6, -2, IntegerType(16), 0),
+        (DivSI, -7, 2, i32, -3),
+        (FloorDivSI, -7, 2, i32, -4),
+        (CeilDivSI, 7, 2, i32, 4),
+        (CeilDivUI, -1, 2, i8, -128),
+        (RemUI, -1, 10, i8, 5),
+        (RemSI, -7, 2, i32, -1),
+        (MinUI, -1, 1, i32, 1),
+        (MaxUI, -1, 1, i32, -1),
+        (MinSI, -1, 1, i32, -1),
+        (MaxSI, -1, 1, i32, 1),
+        (AndI, -1, 12, i32, 12),
+        (OrI, 10, 5, i32, 15),
+        (XOrI, -1, 1, i32, -2),
+        (ShLI, 1, 7, i8, -128),
+        (ShRUI, -128, 7, i8, 1),
+        (ShRSI, -128, 7, i8, -1),
+    ],
+)
+def test_fold_integer_binary_ops(
+    OpClass: type[BinaryOperation], lhs: int, rhs: int, typ: Attribute, expected: int
+):
+    a = Constant.from_int_and_width(lhs, typ)
+    b = Constant.from_int_and_width(rhs, typ)
+    op = OpClass.build(operands=[a, b], result_types=[typ])
+    assert op.fold() == [IntegerAttr(expected, typ)]
+
+
+@pytest.mark.parametrize(
+    "OpClass, lhs, rhs",
+    [
+        (DivUI, 1, 0),
+        (DivSI, -128, -1),
+        (RemSI, 1, 0),
+        (ShLI, 1, 8),
+        (ShRSI, 1, -1),
+    ],
+)
+def test_fold_undefined_integer_ops(OpClass: type[BinaryOperation], lhs: int, rhs: int):
+    a = Constant.from_int_and_width(lhs, IntegerType(8))
+    b = Constant.from_int_and_width(rhs, IntegerType(8))
+    op = OpClass.build(operands=[a, b], result_types=[IntegerType(8)])
+    assert op.fold() is None
+
+
+def test_fold_identities():
+    value = TestOp.create(result_types=[i32]).results[0]
+    zero = Constant.from_int_and_width(0, i32)
+    one = Constant.from_int_and_width(1, i32)
+    assert Addi(value, zero).fold() == [value]
+    assert Muli.get(value, one).fold() == [value]
+    assert Muli.get(value, zero).fold() is None
+    assert Addi(value, one).fold() is None
+
+
+@pytest.mark.parametrize(
+    "predicate, expected",
+    [
+        ("eq", 0),
+        ("ne", 1),
+        ("slt", 1),
+        ("sge", 0),
+        ("ult", 0),
+        ("uge", 1),
+    ],
+)
+def test_fold_cmpi(predicate: str, expected: int):
+    a = Constant.from_int_and_width(-1, i32)
+    b = Constant.from_int_and_width(1, i32)
+    assert Cmpi.get(a, b, predicate).fold() == [IntegerAttr(expected, i1)]
+
+
+@pytest.mark.parametrize(
+    "predicate, lhs, rhs, expected",
+    [
+        ("olt", 1.0, 2.0, 1),
+        ("olt", float("nan"), 2.0, 0),
+        ("ult", float("nan"), 2.0, 1),
+        ("one", 1.0, 1.0, 0),
+        ("ord", 1.0, 1.0, 1),
+        ("uno", 1.0, float("nan"), 1),
+        ("true", 1.0, 1.0, 1),
+    ],
+)
+def test_fold_cmpf(predicate: str, lhs: float, rhs: float, expected: int):
+    a = Constant.from_float_and_width(lhs, f64)
+    b = Constant.from_float_and_width(rhs, f64)
+    assert Cmpf.get(a, b, predicate).fold() == [IntegerAttr(expected, i1)]
+
+
+def test_fold_float_ops():
+    a = Constant.from_float_and_width(0.1, f32)
+    b = Constant.from_float_and_width(0.2, f32)
+    [result] = Addf.get(a, b).fold()
+    assert isinstance(result, FloatAttr)
+    assert result.value.data == pytest.approx(0.3, rel=1e-6)
+    assert result.value.data != 0.1 + 0.2
+
+    # Infinite and NaN results are not folded, as they cannot be printed.
+    zero = Constant.from_float_and_width(0.0, f64)
+    one = Constant.from_float_and_width(-1.0, f64)
+    assert Divf.get(one, zero).fold() is None
+    assert Divf.get(zero, zero).fold() is None
+    assert Negf.get(one).fold() == [FloatAttr(1.0, f64)]
+
+    big = Constant.from_float_and_width(1e10, f64)
+    assert ExtFOp.build(operands=[big], result_types=[f16]).fold() is None
+    huge = Constant.from_float_and_width(1e300, f64)
+    assert Mulf.get(huge, huge).fold() is None
+
+
+def test_fold_casts():
+    a = Constant.from_int_and_width(-1, i64)
+    assert IndexCastOp.get(a, i8).fold() == [IntegerAttr(-1, i8)]
+    assert IndexCastOp.get(a, ui8).fold() == [IntegerAttr(255, ui8)]
+    assert SIToFPOp.get(a, f32).fold() == [FloatAttr(-1.0, f32)]
+
+    b = Constant.from_float_and_width(-2.5, f32)
+    assert FPToSIOp.get(b, i8).fold() == [IntegerAttr(-2, i8)]
+    c = Constant.from_float_and_width(300.0, f32)
+    assert FPToSIOp.get(c, i8).fold() is None
+
+
+def test_fold_select():
+    true = Constant.from_int_and_width(1, i1)
+    a = TestOp.create(result_types=[i32]).results[0]
+    b = TestOp.create(result_types=[i32]).results[0]
+    assert Select.get(true, a, b).fold() == [a]
+    unknown = TestOp.create(result_types=[i1])
+    assert Select.get(unknown, a, b).fold() is None
+    assert Select.get(unknown, a, a).fold() == [a]
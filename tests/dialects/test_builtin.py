@@ -1,36 +1,45 @@
+import pickle
+from array import array
 from typing import Sequence
 import pytest
 
 from xdsl.dialects.builtin import (
+    AnyFloat,
     AnyTensorType,
     ComplexType,
     DenseArrayBase,
+    DenseElementsData,
     DenseIntOrFPElementsAttr,
     NoneAttr,
     StridedLayoutAttr,
+    TensorType,
     i32,
     f32,
+    f64,
     FloatAttr,
+    IndexType,
+    IntegerAttr,
+    IntegerType,
+    Signedness,
     ArrayAttr,
     IntAttr,
-    FloatData,
     SymbolRefAttr,
     VectorBaseTypeConstraint,
     VectorRankConstraint,
     VectorBaseTypeAndRankConstraint,
+    ModuleOp,
 )
 from xdsl.dialects.builtin import i32, i64, VectorType, UnrealizedConversionCastOp
-from xdsl.dialects.arith import Constant
+from xdsl.dialects.arith import Addi, Constant
 from xdsl.dialects.memref import MemRefType
-from xdsl.ir import Attribute
+from xdsl.ir import Attribute, Operation
 from xdsl.utils.exceptions import VerifyException
 
 
 def test_DenseIntOrFPElementsAttr_fp_type_conversion():
     check1 = DenseIntOrFPElementsAttr.tensor_from_list([4, 5], f32, [])
 
-    value1 = check1.data.data[0].value.data
-    value2 = check1.data.data[1].value.data
+    value1, value2 = check1.as_tuple()
 
     # Ensure type conversion happened properly during attribute construction.
     assert type(value1) == float
@@ -43,8 +52,7 @@ def test_DenseIntOrFPElementsAttr_fp_type_conversion():
 
     check2 = DenseIntOrFPElementsAttr.tensor_from_list([t1, t2], f32, [])
 
-    value3 = check2.data.data[0].value.data
-    value4 = check2.data.data[1].value.data
+    value3, value4 = check2.as_tuple()
 
     # Ensure type conversion happened properly during attribute construction.
     assert type(value3) == float
@@ -56,7 +64,8 @@ def test_DenseIntOrFPElementsAttr_fp_type_conversion():
 def test_DenseIntOrFPElementsAttr_from_list():
     attr = DenseIntOrFPElementsAttr.tensor_from_list([5.5], f32, [])
 
-    assert attr.data == ArrayAttr([FloatAttr(5.5, f32)])
+    assert attr.data == DenseElementsData.from_floats([5.5])
+    assert list(attr.iter_attrs()) == [FloatAttr(5.5, f32)]
     assert attr.type == AnyTensorType.from_type_and_list(f32, [])
 
 
@@ -64,13 +73,13 @@ def test_DenseArrayBase_verifier_failure():
     # Check that a malformed attribute raises a verify error
 
     with pytest.raises(VerifyException) as err:
-        DenseArrayBase([f32, ArrayAttr([IntAttr(0)])])
+        DenseArrayBase([f32, DenseElementsData.from_ints([0])])
     assert err.value.args[0] == (
         "dense array of float element type " "should only contain floats"
     )
 
     with pytest.raises(VerifyException) as err:
-        DenseArrayBase([i32, ArrayAttr([FloatData(0.0)])])
+        DenseArrayBase([i32, DenseElementsData.from_floats([0.0])])
     assert err.value.args[0] == (
         "dense array of integer element type " "should only contain integers"
     )
@@ -265,3 +274,111 @@ def test_dense_as_tuple():
 
     ints = DenseArrayBase.from_list(i32, [1, 1, 2, 3, 5, 8])
     assert ints.as_tuple() == (1, 1, 2, 3, 5, 8)
+
+
+def test_dense_elements_storage():
+    ints = DenseElementsData.from_ints([1, -2, 3])
+    assert isinstance(ints.data, memoryview) and ints.data.format == "q"
+    assert not ints.is_float
+
+    # The elements cannot be modified, as attributes may be shared.
+    with pytest.raises(TypeError):
+        ints.data[0] = 99  # pyright: ignore[reportGeneralTypeIssues]
+    assert tuple(ints) == (1, -2, 3)
+    assert pickle.loads(pickle.dumps(ints)) == ints
+    assert hash(DenseElementsData.from_ints([1, -2, 3])) == hash(ints)
+
+    unsigned = DenseElementsData.from_ints([2**64 - 1])
+    assert isinstance(unsigned.data, memoryview) and unsigned.data.format == "Q"
+
+    big = DenseElementsData.from_ints([2**64, -1])
+    assert big.data == (2**64, -1)
+
+    floats = DenseElementsData.from_floats([1, 2.5])
+    assert isinstance(floats.data, memoryview) and floats.data.format == "d"
+    assert floats.is_float
+    assert tuple(floats) == (1.0, 2.5)
+
+    with pytest.raises(VerifyException):
+        DenseElementsData(array("i", [1]))
+
+
+def test_dense_elements_equality():
+    # Equal elements of different formats are different attributes.
+    ints = DenseElementsData.from_ints([1, 2])
+    floats = DenseElementsData.from_floats([1.0, 2.0])
+    assert ints != floats
+    assert ints == DenseElementsData.from_ints([1, 2])
+    assert floats == DenseElementsData.from_floats([1, 2])
+
+    nan = DenseElementsData.from_floats([float("nan")])
+    assert nan == DenseElementsData.from_floats([float("nan")])
+    assert hash(nan) == hash(DenseElementsData.from_floats([float("nan")]))
+
+
+def test_dense_as_array_attr():
+    ints = DenseIntOrFPElementsAttr.create_dense_int(
+        TensorType.from_type_and_list(i32, [2]), [3, 4]
+    )
+    assert ints.as_array_attr() == ArrayAttr([IntegerAttr(3, i32), IntegerAttr(4, i32)])
+
+    floats = DenseIntOrFPElementsAttr.create_dense_float(
+        TensorType.from_type_and_list(f32, [1]), [0.5]
+    )
+    assert floats.as_array_attr() == ArrayAttr([FloatAttr(0.5, f32)])
+
+
+@pytest.mark.parametrize(
+    "element_type, values, raw_data",
+    [
+        (i32, [1, -2], bytes.fromhex("01000000feffffff")),
+        (IntegerType(8, Signedness.UNSIGNED), [255, 0], bytes.fromhex("ff00")),
+        (IntegerType(7), [-1, 63], bytes.fromhex("7f3f")),
+        (IntegerType(24), [-2, 1], bytes.fromhex("feffff010000")),
+        (IndexType(), [-1, 2], bytes.fromhex("ffffffffffffffff0200000000000000")),
+        (f32, [1.0, -2.0], bytes.fromhex("0000803f000000c0")),
+        (f64, [0.5], bytes.fromhex("000000000000e03f")),
+    ],
+)
+def test_dense_raw_data(
+    element_type: IntegerType | IndexType | AnyFloat,
+    values: list[int] | list[float],
+    raw_data: bytes,
+):
+    type = VectorType.from_element_type_and_shape(element_type, [len(values)])
+    attr = DenseIntOrFPElementsAttr.from_list(type, values)
+    assert attr.get_raw_data() == raw_data
+    assert DenseIntOrFPElementsAttr.from_raw_data(type, raw_data) == attr
+
+
+def test_dense_raw_data_splat():
+    type = VectorType.from_element_type_and_shape(i32, [3])
+    attr = DenseIntOrFPElementsAttr.from_raw_data(type, bytes.fromhex("07000000"))
+    assert attr.as_tuple() == (7, 7, 7)
+
+    with pytest.raises(ValueError):
+        DenseIntOrFPElementsAttr.from_raw_data(type, bytes.fromhex("0700"))
+
+
+def test_module_verify_jobs():
+    ops: list[Operation] = []
+    for i in range(8):
+        constant = Constant.from_int_and_width(i, i32)
+        ops += [constant, Addi(constant, constant)]
+    module = ModuleOp(ops)
+    module.verify(jobs=2)
+
+    # All invalid operations are reported, in order.
+    constant = Constant.from_int_and_width(0, i64)
+    module.body.block.insert_op_before(constant, ops[0])
+    for op in (ops[7], ops[3]):
+        op.operands = [op.operands[0], constant.result]
+    with pytest.raises(VerifyException) as e:
+        module.verify(jobs=2)
+    with pytest.raises(VerifyException) as sequential_e:
+        module.verify()
+    assert str(e.value) == (
+        f"{sequential_e.value}\n\n"
+        "Top-level operation #8 is invalid: expect all input and result types to "
+        "be equal"
+    )
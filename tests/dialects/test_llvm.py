@@ -1,6 +1,11 @@
 import pytest
 
+from io import StringIO
+
 from xdsl.dialects import llvm, builtin, arith
+from xdsl.ir import MLContext
+from xdsl.parser import Parser
+from xdsl.printer import Printer
 from xdsl.utils.exceptions import VerifyException
 
 
@@ -134,6 +139,30 @@ def test_llvm_getelementptr_op():
     assert len(gep3.ssa_indices) == 1
 
 
+@pytest.mark.parametrize(
+    "text, size, element_type",
+    [
+        ("!llvm.array<4xi32>", 4, builtin.i32),
+        ("!llvm.array<2 x i64>", 2, builtin.i64),
+        (
+            "!llvm.array<3 x !llvm.array<2xi32>>",
+            3,
+            llvm.LLVMArrayType([builtin.IntAttr(2), builtin.i32]),
+        ),
+    ],
+)
+def test_array_type_parsing(text: str, size: int, element_type: builtin.Attribute):
+    ctx = MLContext()
+    ctx.register_dialect(builtin.Builtin)
+    ctx.register_dialect(llvm.LLVM)
+
+    array_type = Parser(ctx, text).parse_attribute()
+    assert array_type == llvm.LLVMArrayType([builtin.IntAttr(size), element_type])
+    printed = StringIO()
+    Printer(stream=printed).print_attribute(array_type)
+    assert Parser(ctx, printed.getvalue()).parse_attribute() == array_type
+
+
 def test_array_type():
     array_type = llvm.LLVMArrayType.from_size_and_type(10, builtin.i32)
 
@@ -0,0 +1,31 @@
+// RUN: xdsl-opt %s -p constant-fold | filecheck %s
+
+"builtin.module"() ({
+  %0 = "arith.constant"() {"value" = 100 : i8} : () -> i8
+  %1 = "arith.constant"() {"value" = 3 : i8} : () -> i8
+  %2 = "arith.muli"(%0, %1) : (i8, i8) -> i8
+  %3 = "arith.addi"(%2, %1) : (i8, i8) -> i8
+  %4 = "arith.cmpi"(%3, %0) {"predicate" = 2 : i64} : (i8, i8) -> i1
+  %5 = "test.op"() : () -> i8
+  %6 = "arith.select"(%4, %5, %0) : (i1, i8, i8) -> i8
+  %7 = "arith.index_cast"(%3) : (i8) -> index
+  "test.op"(%3, %6, %7) : (i8, i8, index) -> ()
+
+  // CHECK:       %0 = "arith.constant"() {"value" = 47 : i8} : () -> i8
+  // CHECK-NEXT:  %1 = "test.op"() : () -> i8
+  // CHECK-NEXT:  %2 = "arith.constant"() {"value" = 47 : index} : () -> index
+  // CHECK-NEXT:  "test.op"(%0, %1, %2) : (i8, i8, index) -> ()
+
+  // Infinite results are not folded.
+  %8 = "arith.constant"() {"value" = 1.5 : f32} : () -> f32
+  %9 = "arith.constant"() {"value" = 0.0 : f32} : () -> f32
+  %10 = "arith.divf"(%8, %9) : (f32, f32) -> f32
+  %11 = "arith.addf"(%8, %8) : (f32, f32) -> f32
+  "test.op"(%10, %11) : (f32, f32) -> ()
+
+  // CHECK-NEXT:  %3 = "arith.constant"() {"value" = 1.5 : f32} : () -> f32
+  // CHECK-NEXT:  %4 = "arith.constant"() {"value" = 0.0 : f32} : () -> f32
+  // CHECK-NEXT:  %5 = "arith.divf"(%3, %4) : (f32, f32) -> f32
+  // CHECK-NEXT:  %6 = "arith.constant"() {"value" = 3.0 : f32} : () -> f32
+  // CHECK-NEXT:  "test.op"(%5, %6) : (f32, f32) -> ()
+}) : () -> ()
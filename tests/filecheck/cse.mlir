@@ -0,0 +1,77 @@
+// RUN: xdsl-opt %s -p cse | filecheck %s
+
+"builtin.module"() ({
+  "func.func"() ({
+  ^0(%arg : index, %cond : i1):
+    %0 = "arith.constant"() {"value" = 4 : index} : () -> index
+    %1 = "arith.constant"() {"value" = 4 : index} : () -> index
+    %2 = "arith.addi"(%arg, %0) : (index, index) -> index
+    %3 = "arith.addi"(%arg, %1) : (index, index) -> index
+    %4 = "arith.addi"(%1, %arg) : (index, index) -> index
+    %5 = "test.op"() : () -> index
+    %6 = "test.op"() : () -> index
+    "cf.cond_br"(%cond) [^1, ^2] {"operand_segment_sizes" = array<i32: 1, 0, 0>} : (i1) -> ()
+  ^1:
+    %7 = "arith.addi"(%arg, %0) : (index, index) -> index
+    %8 = "arith.muli"(%7, %7) : (index, index) -> index
+    "test.op"(%8) : (index) -> ()
+    "cf.br"() [^3] : () -> ()
+  ^2:
+    %9 = "arith.muli"(%2, %2) : (index, index) -> index
+    "test.op"(%9) : (index) -> ()
+    "cf.br"() [^3] : () -> ()
+  ^3:
+    %10 = "arith.muli"(%2, %2) : (index, index) -> index
+    "test.op"(%2, %3, %4, %5, %6, %10) : (index, index, index, index, index, index) -> ()
+    "func.return"() : () -> ()
+  }) {"sym_name" = "cse", "function_type" = (index, i1) -> ()} : () -> ()
+  %c = "arith.constant"() {"value" = 4 : index} : () -> index
+  "func.func"() ({
+    %11 = "arith.constant"() {"value" = 4 : index} : () -> index
+    "test.op"(%11) ({
+      %12 = "arith.constant"() {"value" = 4 : index} : () -> index
+      "test.op"(%12) : (index) -> ()
+    }) : (index) -> ()
+    "func.return"() : () -> ()
+  }) {"sym_name" = "isolated", "function_type" = () -> ()} : () -> ()
+  "test.op"(%c) : (index) -> ()
+  "func.func"() ({
+    %13 = "arith.constant"() {"value" = 0.0 : f32} : () -> f32
+    %14 = "arith.constant"() {"value" = -0.0 : f32} : () -> f32
+    %15 = "arith.constant"() {"value" = 0.0 : f32} : () -> f32
+    "test.op"(%13, %14, %15) : (f32, f32, f32) -> ()
+    "func.return"() : () -> ()
+  }) {"sym_name" = "signed_zeros", "function_type" = () -> ()} : () -> ()
+}) : () -> ()
+
+// CHECK:      ^0(%arg : index, %cond : i1):
+// CHECK-NEXT:   %0 = "arith.constant"() {"value" = 4 : index} : () -> index
+// CHECK-NEXT:   %1 = "arith.addi"(%arg, %0) : (index, index) -> index
+// CHECK-NEXT:   %2 = "arith.addi"(%0, %arg) : (index, index) -> index
+// CHECK-NEXT:   %3 = "test.op"() : () -> index
+// CHECK-NEXT:   %4 = "test.op"() : () -> index
+// CHECK-NEXT:   "cf.cond_br"(%cond) [^1, ^2] {"operand_segment_sizes" = array<i32: 1, 0, 0>} : (i1) -> ()
+// CHECK-NEXT: ^1:
+// CHECK-NEXT:   %5 = "arith.muli"(%1, %1) : (index, index) -> index
+// CHECK-NEXT:   "test.op"(%5) : (index) -> ()
+// CHECK-NEXT:   "cf.br"() [^3] : () -> ()
+// CHECK-NEXT: ^2:
+// CHECK-NEXT:   %6 = "arith.muli"(%1, %1) : (index, index) -> index
+// CHECK-NEXT:   "test.op"(%6) : (index) -> ()
+// CHECK-NEXT:   "cf.br"() [^3] : () -> ()
+// CHECK-NEXT: ^3:
+// CHECK-NEXT:   %7 = "arith.muli"(%1, %1) : (index, index) -> index
+// CHECK-NEXT:   "test.op"(%1, %1, %2, %3, %4, %7) : (index, index, index, index, index, index) -> ()
+
+// CHECK:      %c = "arith.constant"() {"value" = 4 : index} : () -> index
+// CHECK-NEXT: "func.func"() ({
+// CHECK-NEXT:   %8 = "arith.constant"() {"value" = 4 : index} : () -> index
+// CHECK-NEXT:   "test.op"(%8) ({
+// CHECK-NEXT:     "test.op"(%8) : (index) -> ()
+// CHECK-NEXT:   }) : (index) -> ()
+
+// The signed zeros compare equal, but are not merged.
+// CHECK:      "func.func"() ({
+// CHECK-NEXT:   %9 = "arith.constant"() {"value" = 0.0 : f32} : () -> f32
+// CHECK-NEXT:   %10 = "arith.constant"() {"value" = -0.0 : f32} : () -> f32
+// CHECK-NEXT:   "test.op"(%9, %10, %9) : (f32, f32, f32) -> ()
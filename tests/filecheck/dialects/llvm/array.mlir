@@ -2,9 +2,11 @@
 "builtin.module"() ({
   %0 = "llvm.mlir.undef"() : () -> !llvm.array<2 x i64>
   %1 = "llvm.mlir.undef"() : () -> !llvm.array<1 x i64>
+  %2 = "llvm.mlir.undef"() : () -> !llvm.array<4xi32>
 }) : () -> ()
 
 // CHECK: "builtin.module"() ({
 // CHECK-NEXT:   %0 = "llvm.mlir.undef"() : () -> !llvm.array<2 x i64>
 // CHECK-NEXT:   %1 = "llvm.mlir.undef"() : () -> !llvm.array<1 x i64>
+// CHECK-NEXT:   %2 = "llvm.mlir.undef"() : () -> !llvm.array<4 x i32>
 // CHECK-NEXT: }) : () -> ()
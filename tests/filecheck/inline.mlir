@@ -0,0 +1,109 @@
+// RUN: xdsl-opt %s -p inline | filecheck %s
+
+"builtin.module"() ({
+  "func.func"() ({
+  ^0(%x : i32):
+    %0 = "func.call"(%x) {"callee" = @add_one} : (i32) -> i32
+    %1 = "func.call"(%0) {"callee" = @add_one} : (i32) -> i32
+    %2 = "func.call"(%1) {"callee" = @select_positive} : (i32) -> i32
+    %3 = "func.call"(%2) {"callee" = @large} : (i32) -> i32
+    %4 = "func.call"(%3) {"callee" = @recursive} : (i32) -> i32
+    %5 = "func.call"(%4) {"callee" = @large_once} : (i32) -> i32
+    "func.return"(%5) : (i32) -> ()
+  }) {"sym_name" = "main", "function_type" = (i32) -> i32} : () -> ()
+  "func.func"() ({
+  ^1(%a : i32):
+    %c1 = "arith.constant"() {"value" = 1 : i32} : () -> i32
+    %50 = "arith.addi"(%a, %c1) : (i32, i32) -> i32
+    "func.return"(%50) : (i32) -> ()
+  }) {"sym_name" = "add_one", "function_type" = (i32) -> i32, "sym_visibility" = "private"} : () -> ()
+  "func.func"() ({
+  ^2(%b : i32):
+    %c0 = "arith.constant"() {"value" = 0 : i32} : () -> i32
+    %cond = "arith.cmpi"(%b, %c0) {"predicate" = 4 : i64} : (i32, i32) -> i1
+    "cf.cond_br"(%cond) [^3, ^4] {"operand_segment_sizes" = array<i32: 1, 0, 0>} : (i1) -> ()
+  ^3:
+    "func.return"(%b) : (i32) -> ()
+  ^4:
+    "func.return"(%c0) : (i32) -> ()
+  }) {"sym_name" = "select_positive", "function_type" = (i32) -> i32, "sym_visibility" = "private"} : () -> ()
+  "func.func"() ({
+  ^5(%c : i32):
+    %6 = "arith.muli"(%c, %c) : (i32, i32) -> i32
+    %7 = "arith.muli"(%6, %6) : (i32, i32) -> i32
+    %8 = "arith.muli"(%7, %7) : (i32, i32) -> i32
+    %9 = "arith.muli"(%8, %8) : (i32, i32) -> i32
+    %10 = "arith.muli"(%9, %9) : (i32, i32) -> i32
+    %11 = "arith.muli"(%10, %10) : (i32, i32) -> i32
+    %12 = "arith.muli"(%11, %11) : (i32, i32) -> i32
+    %13 = "arith.muli"(%12, %12) : (i32, i32) -> i32
+    %14 = "arith.muli"(%13, %13) : (i32, i32) -> i32
+    "func.return"(%14) : (i32) -> ()
+  }) {"sym_name" = "large", "function_type" = (i32) -> i32} : () -> ()
+  "func.func"() ({
+  ^7(%e : i32):
+    %26 = "arith.muli"(%e, %e) : (i32, i32) -> i32
+    %27 = "arith.muli"(%26, %26) : (i32, i32) -> i32
+    %28 = "arith.muli"(%27, %27) : (i32, i32) -> i32
+    %29 = "arith.muli"(%28, %28) : (i32, i32) -> i32
+    %30 = "arith.muli"(%29, %29) : (i32, i32) -> i32
+    %31 = "arith.muli"(%30, %30) : (i32, i32) -> i32
+    %32 = "arith.muli"(%31, %31) : (i32, i32) -> i32
+    %33 = "arith.muli"(%32, %32) : (i32, i32) -> i32
+    %34 = "arith.muli"(%33, %33) : (i32, i32) -> i32
+    "func.return"(%34) : (i32) -> ()
+  }) {"sym_name" = "large_once", "function_type" = (i32) -> i32, "sym_visibility" = "private"} : () -> ()
+  "func.func"() ({
+  ^6(%d : i32):
+    %15 = "func.call"(%d) {"callee" = @recursive} : (i32) -> i32
+    "func.return"(%15) : (i32) -> ()
+  }) {"sym_name" = "recursive", "function_type" = (i32) -> i32, "sym_visibility" = "private"} : () -> ()
+}) : () -> ()
+
+// CHECK:      "builtin.module"() ({
+// CHECK-NEXT:   "func.func"() ({
+// CHECK-NEXT:   ^0(%x : i32):
+// CHECK-NEXT:     %0 = "arith.constant"() {"value" = 1 : i32} : () -> i32
+// CHECK-NEXT:     %1 = "arith.addi"(%x, %0) : (i32, i32) -> i32
+// CHECK-NEXT:     %2 = "arith.constant"() {"value" = 1 : i32} : () -> i32
+// CHECK-NEXT:     %3 = "arith.addi"(%1, %2) : (i32, i32) -> i32
+// CHECK-NEXT:     %4 = "arith.constant"() {"value" = 0 : i32} : () -> i32
+// CHECK-NEXT:     %5 = "arith.cmpi"(%3, %4) {"predicate" = 4 : i64} : (i32, i32) -> i1
+// CHECK-NEXT:     "cf.cond_br"(%5) [^1, ^2] {"operand_segment_sizes" = array<i32: 1, 0, 0>} : (i1) -> ()
+// CHECK-NEXT:   ^1:
+// CHECK-NEXT:     "cf.br"(%3) [^3] : (i32) -> ()
+// CHECK-NEXT:   ^2:
+// CHECK-NEXT:     "cf.br"(%4) [^3] : (i32) -> ()
+// CHECK-NEXT:   ^3(%6 : i32):
+// CHECK-NEXT:     %7 = "func.call"(%6) {"callee" = @large} : (i32) -> i32
+// CHECK-NEXT:     %8 = "func.call"(%7) {"callee" = @recursive} : (i32) -> i32
+// CHECK-NEXT:     %9 = "arith.muli"(%8, %8) : (i32, i32) -> i32
+// CHECK-NEXT:     %10 = "arith.muli"(%9, %9) : (i32, i32) -> i32
+// CHECK-NEXT:     %11 = "arith.muli"(%10, %10) : (i32, i32) -> i32
+// CHECK-NEXT:     %12 = "arith.muli"(%11, %11) : (i32, i32) -> i32
+// CHECK-NEXT:     %13 = "arith.muli"(%12, %12) : (i32, i32) -> i32
+// CHECK-NEXT:     %14 = "arith.muli"(%13, %13) : (i32, i32) -> i32
+// CHECK-NEXT:     %15 = "arith.muli"(%14, %14) : (i32, i32) -> i32
+// CHECK-NEXT:     %16 = "arith.muli"(%15, %15) : (i32, i32) -> i32
+// CHECK-NEXT:     %17 = "arith.muli"(%16, %16) : (i32, i32) -> i32
+// CHECK-NEXT:     "func.return"(%17) : (i32) -> ()
+// CHECK-NEXT:   }) {"sym_name" = "main", "function_type" = (i32) -> i32} : () -> ()
+// CHECK-NEXT:   "func.func"() ({
+// CHECK-NEXT:   ^4(%c : i32):
+// CHECK-NEXT:     %18 = "arith.muli"(%c, %c) : (i32, i32) -> i32
+// CHECK-NEXT:     %19 = "arith.muli"(%18, %18) : (i32, i32) -> i32
+// CHECK-NEXT:     %20 = "arith.muli"(%19, %19) : (i32, i32) -> i32
+// CHECK-NEXT:     %21 = "arith.muli"(%20, %20) : (i32, i32) -> i32
+// CHECK-NEXT:     %22 = "arith.muli"(%21, %21) : (i32, i32) -> i32
+// CHECK-NEXT:     %23 = "arith.muli"(%22, %22) : (i32, i32) -> i32
+// CHECK-NEXT:     %24 = "arith.muli"(%23, %23) : (i32, i32) -> i32
+// CHECK-NEXT:     %25 = "arith.muli"(%24, %24) : (i32, i32) -> i32
+// CHECK-NEXT:     %26 = "arith.muli"(%25, %25) : (i32, i32) -> i32
+// CHECK-NEXT:     "func.return"(%26) : (i32) -> ()
+// CHECK-NEXT:   }) {"sym_name" = "large", "function_type" = (i32) -> i32} : () -> ()
+// CHECK-NEXT:   "func.func"() ({
+// CHECK-NEXT:   ^5(%d : i32):
+// CHECK-NEXT:     %27 = "func.call"(%d) {"callee" = @recursive} : (i32) -> i32
+// CHECK-NEXT:     "func.return"(%27) : (i32) -> ()
+// CHECK-NEXT:   }) {"sym_name" = "recursive", "function_type" = (i32) -> i32, "sym_visibility" = "private"} : () -> ()
+// CHECK-NEXT: }) : () -> ()
@@ -0,0 +1,32 @@
+// RUN: xdsl-opt %s -p inline | filecheck %s
+
+"builtin.module"() ({
+  "func.func"() ({
+  ^0(%c : i1, %x : i32):
+    %0 = "func.call"(%c, %x) {"callee" = @select} : (i1, i32) -> i32
+    "func.return"(%0) : (i32) -> ()
+  }) {"sym_name" = "g", "function_type" = (i1, i32) -> i32} : () -> ()
+  "func.func"() ({
+  ^1(%cond : i1, %a : i32):
+    "cf.cond_br"(%cond) [^2, ^3] {"operand_segment_sizes" = array<i32: 1, 0, 0>} : (i1) -> ()
+  ^2:
+    "func.return"(%a) : (i32) -> ()
+  ^3:
+    %1 = "arith.addi"(%a, %a) : (i32, i32) -> i32
+    "func.return"(%1) : (i32) -> ()
+  }) {"sym_name" = "select", "function_type" = (i1, i32) -> i32, "sym_visibility" = "private"} : () -> ()
+}) : () -> ()
+
+// CHECK:      "builtin.module"() ({
+// CHECK-NEXT:   "func.func"() ({
+// CHECK-NEXT:   ^0(%c : i1, %x : i32):
+// CHECK-NEXT:     "cf.cond_br"(%c) [^1, ^2] {"operand_segment_sizes" = array<i32: 1, 0, 0>} : (i1) -> ()
+// CHECK-NEXT:   ^1:
+// CHECK-NEXT:     "cf.br"(%x) [^3] : (i32) -> ()
+// CHECK-NEXT:   ^2:
+// CHECK-NEXT:     %0 = "arith.addi"(%x, %x) : (i32, i32) -> i32
+// CHECK-NEXT:     "cf.br"(%0) [^3] : (i32) -> ()
+// CHECK-NEXT:   ^3(%1 : i32):
+// CHECK-NEXT:     "func.return"(%1) : (i32) -> ()
+// CHECK-NEXT:   }) {"sym_name" = "g", "function_type" = (i1, i32) -> i32} : () -> ()
+// CHECK-NEXT: }) : () -> ()
@@ -0,0 +1,21 @@
+// RUN: xdsl-opt %s --verify-jobs 2 | filecheck %s
+
+"builtin.module"() ({
+  "func.func"() ({
+  ^0(%a : i32):
+    %b = "arith.addi"(%a, %a) : (i32, i32) -> i32
+    "func.return"(%b) : (i32) -> ()
+  }) {"sym_name" = "f", "function_type" = (i32) -> i32, "sym_visibility" = "private"} : () -> ()
+  "func.func"() ({
+  ^0(%a : i32):
+    %c = "func.call"(%a) {"callee" = @f} : (i32) -> i32
+    "func.return"(%c) : (i32) -> ()
+  }) {"sym_name" = "g", "function_type" = (i32) -> i32} : () -> ()
+}) : () -> ()
+
+// CHECK:      "builtin.module"() ({
+// CHECK-NEXT:   "func.func"() ({
+// CHECK:        }) {"sym_name" = "f", "function_type" = (i32) -> i32, "sym_visibility" = "private"} : () -> ()
+// CHECK-NEXT:   "func.func"() ({
+// CHECK:        }) {"sym_name" = "g", "function_type" = (i32) -> i32} : () -> ()
+// CHECK-NEXT: }) : () -> ()
@@ -0,0 +1,17 @@
+// RUN: xdsl-opt %s --verify-jobs 2 --verify-diagnostics | filecheck %s
+
+"builtin.module"() ({
+  "func.func"() ({
+  ^0(%a : i32):
+    %b = "arith.addi"(%a, %a) : (i32, i32) -> i32
+    "func.return"(%b) : (i32) -> ()
+  }) {"sym_name" = "f", "function_type" = (i32) -> i32} : () -> ()
+  "func.func"() ({
+  ^0(%a : i32):
+    %c = "arith.constant"() {"value" = 0 : i64} : () -> i64
+    %d = "arith.addi"(%a, %c) : (i32, i64) -> i32
+    "func.return"(%d) : (i32) -> ()
+  }) {"sym_name" = "g", "function_type" = (i32) -> i32} : () -> ()
+}) : () -> ()
+
+// CHECK: expect all input and result types to be equal
@@ -1,4 +1,5 @@
 // RUN: xdsl-opt %s | xdsl-opt | filecheck %s
+// RUN: xdsl-opt %s --unique-attributes | filecheck %s
 
 "builtin.module"() ({
   "func.func"() ({
@@ -145,6 +146,14 @@
 
   // CHECK: "value1" = dense<[1, 0]> : tensor<2xi1>
 
+  "func.func"() ({}) {function_type = () -> (),
+                      value1 = dense<"0x01000000FEFFFFFF"> : tensor<2xi32>,
+                      value2 = dense<"0x0000803F"> : tensor<2xf32>,
+                      value3 = dense<"0xFF00"> : vector<2xui8>,
+                      sym_name = "dense_attr"} : () -> ()
+
+  // CHECK: "value1" = dense<[1, -2]> : tensor<2xi32>, "value2" = dense<1.0> : tensor<2xf32>, "value3" = dense<[255, 0]> : vector<2xui8>
+
   "func.func"() ({}) {function_type = () -> (),
                       value1 = opaque<"test", "contents">,
                       value2 = opaque<"test", "contents"> : tensor<2xf64>,
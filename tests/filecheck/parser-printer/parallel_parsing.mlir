@@ -0,0 +1,32 @@
+// RUN: xdsl-opt %s --parse-jobs 2 | filecheck %s
+
+"builtin.module"() ({
+  "func.func"() ({
+  ^0(%a : i32):
+    %b = "arith.addi"(%a, %a) : (i32, i32) -> i32
+    "func.return"(%b) : (i32) -> ()
+  }) {"sym_name" = "f", "function_type" = (i32) -> i32, "sym_visibility" = "private"} : () -> ()
+  "func.func"() ({
+  ^0(%a : i32):
+    // A comment with unbalanced brackets: ({[
+    %c = "func.call"(%a) {"callee" = @f} : (i32) -> i32
+    "func.return"(%c) : (i32) -> ()
+  }) {"sym_name" = "g", "function_type" = (i32) -> i32} : () -> ()
+  %x = "arith.constant"() {"value" = 0 : i32} : () -> i32
+  %y = "arith.constant"() {"value" = 1 : i32} : () -> i32
+}) {"sym_name" = "module"} : () -> ()
+
+// CHECK:      "builtin.module"() ({
+// CHECK-NEXT:   "func.func"() ({
+// CHECK-NEXT:   ^0(%a : i32):
+// CHECK-NEXT:     %b = "arith.addi"(%a, %a) : (i32, i32) -> i32
+// CHECK-NEXT:     "func.return"(%b) : (i32) -> ()
+// CHECK-NEXT:   }) {"sym_name" = "f", "function_type" = (i32) -> i32, "sym_visibility" = "private"} : () -> ()
+// CHECK-NEXT:   "func.func"() ({
+// CHECK-NEXT:   ^1(%0 : i32):
+// CHECK-NEXT:     %c = "func.call"(%0) {"callee" = @f} : (i32) -> i32
+// CHECK-NEXT:     "func.return"(%c) : (i32) -> ()
+// CHECK-NEXT:   }) {"sym_name" = "g", "function_type" = (i32) -> i32} : () -> ()
+// CHECK-NEXT:   %x = "arith.constant"() {"value" = 0 : i32} : () -> i32
+// CHECK-NEXT:   %y = "arith.constant"() {"value" = 1 : i32} : () -> i32
+// CHECK-NEXT: }) {"sym_name" = "module"} : () -> ()
@@ -0,0 +1,22 @@
+// RUN: xdsl-opt %s --stream-input | filecheck %s
+// RUN: xdsl-opt --stream-input < %s | filecheck %s
+
+"builtin.module"() ({
+  "func.func"() ({
+  ^0(%a : i32):
+    %b = "arith.addi"(%a, %a) : (i32, i32) -> i32
+    "func.return"(%b) : (i32) -> ()
+  }) {"sym_name" = "f", "function_type" = (i32) -> i32, "sym_visibility" = "private"} : () -> ()
+  %x = "arith.constant"() {"value" = 0 : i32} : () -> i32
+  %y = "arith.addi"(%x, %x) : (i32, i32) -> i32
+}) {"sym_name" = "module"} : () -> ()
+
+// CHECK:      "builtin.module"() ({
+// CHECK-NEXT:   "func.func"() ({
+// CHECK-NEXT:   ^0(%a : i32):
+// CHECK-NEXT:     %b = "arith.addi"(%a, %a) : (i32, i32) -> i32
+// CHECK-NEXT:     "func.return"(%b) : (i32) -> ()
+// CHECK-NEXT:   }) {"sym_name" = "f", "function_type" = (i32) -> i32, "sym_visibility" = "private"} : () -> ()
+// CHECK-NEXT:   %x = "arith.constant"() {"value" = 0 : i32} : () -> i32
+// CHECK-NEXT:   %y = "arith.addi"(%x, %x) : (i32, i32) -> i32
+// CHECK-NEXT: }) {"sym_name" = "module"} : () -> ()
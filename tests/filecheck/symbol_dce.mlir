@@ -0,0 +1,46 @@
+// RUN: xdsl-opt %s -p symbol-dce | filecheck %s
+
+"builtin.module"() ({
+  "func.func"() ({
+    %0 = "func.call"() {"callee" = @used} : () -> i32
+    %1 = "memref.get_global"() {"name" = @used_global} : () -> memref<1xi32>
+    "func.return"(%0) : (i32) -> ()
+  }) {"sym_name" = "main", "function_type" = () -> i32} : () -> ()
+  "func.func"() ({
+    %2 = "func.call"() {"callee" = @used_by_used} : () -> i32
+    "func.return"(%2) : (i32) -> ()
+  }) {"sym_name" = "used", "function_type" = () -> i32, "sym_visibility" = "private"} : () -> ()
+  "func.func"() ({
+    %3 = "arith.constant"() {"value" = 0 : i32} : () -> i32
+    "func.return"(%3) : (i32) -> ()
+  }) {"sym_name" = "used_by_used", "function_type" = () -> i32, "sym_visibility" = "private"} : () -> ()
+  "func.func"() ({
+    %4 = "func.call"() {"callee" = @unused} : () -> i32
+    "func.return"(%4) : (i32) -> ()
+  }) {"sym_name" = "unused", "function_type" = () -> i32, "sym_visibility" = "private"} : () -> ()
+  "func.func"() ({
+  }) {"sym_name" = "unused_declaration", "function_type" = () -> (), "sym_visibility" = "private"} : () -> ()
+  "memref.global"() {"sym_name" = "used_global", "sym_visibility" = "private", "type" = memref<1xi32>, "initial_value" = dense<0> : tensor<1xi32>} : () -> ()
+  "memref.global"() {"sym_name" = "unused_global", "sym_visibility" = "private", "type" = memref<1xi32>, "initial_value" = dense<0> : tensor<1xi32>} : () -> ()
+  "llvm.mlir.global"() ({
+  }) {"global_type" = i32, "sym_name" = "public_global", "linkage" = #llvm.linkage<"internal">, "addr_space" = 0 : i32} : () -> ()
+}) : () -> ()
+
+// CHECK:      "builtin.module"() ({
+// CHECK-NEXT:   "func.func"() ({
+// CHECK-NEXT:     %0 = "func.call"() {"callee" = @used} : () -> i32
+// CHECK-NEXT:     %1 = "memref.get_global"() {"name" = @used_global} : () -> memref<1xi32>
+// CHECK-NEXT:     "func.return"(%0) : (i32) -> ()
+// CHECK-NEXT:   }) {"sym_name" = "main", "function_type" = () -> i32} : () -> ()
+// CHECK-NEXT:   "func.func"() ({
+// CHECK-NEXT:     %2 = "func.call"() {"callee" = @used_by_used} : () -> i32
+// CHECK-NEXT:     "func.return"(%2) : (i32) -> ()
+// CHECK-NEXT:   }) {"sym_name" = "used", "function_type" = () -> i32, "sym_visibility" = "private"} : () -> ()
+// CHECK-NEXT:   "func.func"() ({
+// CHECK-NEXT:     %3 = "arith.constant"() {"value" = 0 : i32} : () -> i32
+// CHECK-NEXT:     "func.return"(%3) : (i32) -> ()
+// CHECK-NEXT:   }) {"sym_name" = "used_by_used", "function_type" = () -> i32, "sym_visibility" = "private"} : () -> ()
+// CHECK-NEXT:   "memref.global"() {"sym_name" = "used_global", "sym_visibility" = "private", "type" = memref<1xi32>, "initial_value" = dense<0> : tensor<1xi32>} : () -> ()
+// CHECK-NEXT:   "llvm.mlir.global"() ({
+// CHECK-NEXT:   }) {"global_type" = i32, "sym_name" = "public_global", "linkage" = #llvm.linkage<"internal">, "addr_space" = 0 : i32} : () -> ()
+// CHECK-NEXT: }) : () -> ()
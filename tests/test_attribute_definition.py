@@ -37,7 +37,7 @@ class BoolData(Data[bool]):
 
     @staticmethod
     def parse_parameter(parser: Parser) -> bool:
-        val = parser.tokenizer.next_token_of_pattern("(True|False)")
+        val = parser.try_parse_bare_id()
         if val is None or val.text not in ("True", "False"):
             parser.raise_error("Expected True or False literal")
         if val.text == "True":
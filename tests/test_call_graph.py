@@ -0,0 +1,40 @@
+from xdsl.call_graph import CallGraph
+from xdsl.dialects.builtin import ModuleOp
+from xdsl.dialects.func import Call, FuncOp, Return
+from xdsl.ir import BlockArgument, Operation
+
+
+def build_func(name: str, *callees: str) -> FuncOp:
+    def body(*args: BlockArgument) -> list[Operation]:
+        return [*(Call.get(callee, [], []) for callee in callees), Return.get()]
+
+    return FuncOp.from_callable(name, [], [], body)
+
+
+def test_call_graph():
+    main = build_func("main", "leaf", "leaf", "even", "external")
+    even = build_func("even", "odd")
+    odd = build_func("odd", "even", "leaf")
+    leaf = build_func("leaf")
+    module = ModuleOp([main, even, odd, leaf])
+
+    graph = CallGraph.build(module)
+    main_node, even_node, odd_node, leaf_node = graph.nodes.values()
+
+    assert main_node.func is main
+    assert main_node.callees == [leaf_node, even_node]
+    assert len(main_node.calls) == 3
+    assert leaf_node.callers == [main_node, odd_node]
+    assert len(leaf_node.uses) == 3
+    assert even_node.callers == [main_node, odd_node]
+    assert [call.callee.root_reference.data for call in graph.unresolved_calls] == [
+        "external"
+    ]
+    assert graph.resolve_call(odd_node.calls[0]) is even_node
+    assert graph.get_caller(odd_node.calls[0]) is odd_node
+
+    # Callees come before their callers, and recursive functions are grouped.
+    sccs = graph.get_sccs()
+    assert sccs[0] == [leaf_node]
+    assert set(sccs[1]) == {even_node, odd_node}
+    assert sccs[2] == [main_node]
@@ -0,0 +1,172 @@
+import pytest
+
+from xdsl.dialects.builtin import ModuleOp, i1, i32
+from xdsl.dialects.cf import Branch, ConditionalBranch
+from xdsl.dialects.test import TestOp
+from xdsl.dominance import DominanceInfo, PostDominanceInfo
+from xdsl.ir import Block, Region
+from xdsl.utils.exceptions import VerifyException
+
+
+def build_diamond() -> tuple[Region, list[Block]]:
+    """
+    Build a region with the following control-flow graph:
+        entry -> left, right
+        left -> exit
+        right -> exit
+    """
+    entry, left, right, exit = Block(), Block(), Block(), Block()
+    cond = TestOp.create(result_types=[i1])
+    entry.add_ops([cond, ConditionalBranch.get(cond, left, [], right, [])])
+    left.add_ops([TestOp.create(result_types=[i32]), Branch.get(exit)])
+    right.add_ops([TestOp.create(result_types=[i32]), Branch.get(exit)])
+    exit.add_op(TestOp.create())
+    return Region([entry, left, right, exit]), [entry, left, right, exit]
+
+
+def test_block_dominance():
+    _, (entry, left, right, exit) = build_diamond()
+    dominance = DominanceInfo()
+
+    assert dominance.block_dominates(entry, exit)
+    assert dominance.block_dominates(exit, exit)
+    assert not dominance.block_properly_dominates(exit, exit)
+    assert not dominance.block_dominates(left, exit)
+    assert not dominance.block_dominates(left, right)
+    assert not dominance.block_dominates(exit, entry)
+
+    assert dominance.get_immediate_dominator(entry) is None
+    assert dominance.get_immediate_dominator(left) is entry
+    assert dominance.get_immediate_dominator(exit) is entry
+
+
+def test_block_post_dominance():
+    _, (entry, left, _, exit) = build_diamond()
+    post_dominance = PostDominanceInfo()
+
+    assert post_dominance.block_post_dominates(exit, entry)
+    assert post_dominance.block_post_dominates(exit, left)
+    assert not post_dominance.block_post_dominates(left, entry)
+    assert not post_dominance.block_post_dominates(entry, exit)
+
+    assert post_dominance.get_immediate_post_dominator(exit) is None
+    assert post_dominance.get_immediate_post_dominator(left) is exit
+    assert post_dominance.get_immediate_post_dominator(entry) is exit
+
+
+def test_unreachable_block():
+    region, (entry, _, _, exit) = build_diamond()
+    unreachable = Block([Branch.get(exit)])
+    region.add_block(unreachable)
+    dominance = DominanceInfo()
+
+    assert dominance.block_dominates(exit, unreachable)
+    assert not dominance.block_dominates(unreachable, exit)
+    assert dominance.get_immediate_dominator(exit) is entry
+    assert dominance.get_immediate_dominator(unreachable) is None
+
+
+def test_dominance_invalidation():
+    region, (entry, left, right, exit) = build_diamond()
+    dominance = DominanceInfo()
+    assert not dominance.block_dominates(left, exit)
+    tree = dominance.get_tree(region)
+
+    # Branch from `right` to `left` instead of `exit`.
+    right_terminator = right.last_op
+    assert right_terminator is not None
+    right.erase_op(right_terminator)
+    right.add_op(Branch.get(left))
+    assert dominance.get_tree(region) is not tree
+    assert dominance.block_dominates(left, exit)
+    assert dominance.get_immediate_dominator(left) is entry
+
+    # Adding a block also invalidates the tree.
+    tree = dominance.get_tree(region)
+    region.add_block(Block())
+    assert dominance.get_tree(region) is not tree
+    assert dominance.get_tree(region) is dominance.get_tree(region)
+
+
+def test_operation_dominance():
+    _, (entry, left, _, exit) = build_diamond()
+    cond, cond_br = entry.ops
+    left_op = left.first_op
+    exit_op = exit.first_op
+    assert left_op is not None and exit_op is not None
+    dominance = DominanceInfo()
+
+    assert dominance.dominates(cond, cond)
+    assert not dominance.properly_dominates(cond, cond)
+    assert dominance.properly_dominates(cond, cond_br)
+    assert not dominance.properly_dominates(cond_br, cond)
+    assert dominance.properly_dominates(cond.results[0], exit_op)
+    assert dominance.dominates(cond.results[0], cond)
+    assert not dominance.properly_dominates(left_op.results[0], exit_op)
+
+    post_dominance = PostDominanceInfo()
+    assert post_dominance.properly_post_dominates(exit_op, cond)
+    assert post_dominance.properly_post_dominates(cond_br, cond)
+    assert not post_dominance.post_dominates(left_op, cond)
+
+
+def test_nested_dominance():
+    block = Block(arg_types=[i32])
+    inner_block = Block(arg_types=[i32])
+    inner = TestOp.create(operands=[block.args[0]], result_types=[i32])
+    inner_block.add_op(inner)
+    before = TestOp.create(result_types=[i32])
+    parent = TestOp.create(result_types=[i32], regions=[Region(inner_block)])
+    after = TestOp.create(result_types=[i32])
+    block.add_ops([before, parent, after])
+    dominance = DominanceInfo()
+
+    assert dominance.properly_dominates(before.results[0], inner)
+    assert dominance.properly_dominates(block.args[0], inner)
+    assert dominance.properly_dominates(parent, inner)
+    assert not dominance.properly_dominates(parent.results[0], inner)
+    assert not dominance.properly_dominates(after, inner)
+    assert not dominance.properly_dominates(inner.results[0], after)
+    assert not dominance.properly_dominates(inner_block.args[0], after)
+    assert dominance.block_dominates(block, inner_block)
+    assert not dominance.block_dominates(inner_block, block)
+
+
+def test_verify_dominance():
+    first = TestOp.create(result_types=[i32])
+    second = TestOp.create(operands=[first.results[0]], result_types=[i32])
+    block = Block([second, first])
+    op = TestOp.create(regions=[Region(block)])
+    with pytest.raises(VerifyException, match="operand #0 of 'test.op'"):
+        op.verify()
+
+    block.detach_op(first)
+    block.insert_op_before(first, second)
+    op.verify()
+
+
+def test_verify_dominance_across_blocks():
+    _, (_, left, _, exit) = build_diamond()
+    left_op = left.first_op
+    assert left_op is not None
+    exit.add_op(TestOp.create(operands=[left_op.results[0]]))
+    with pytest.raises(VerifyException, match="does not dominate this use"):
+        exit.verify()
+
+
+def test_verify_dominance_graph_region():
+    # The body of a module is a graph region, where values can be used before
+    # their definition.
+    first = TestOp.create(result_types=[i32])
+    second = TestOp.create(operands=[first.results[0]], result_types=[i32])
+    module = ModuleOp([second, first])
+    module.verify()
+
+    # Regions nested in a graph region are still checked.
+    inner_first = TestOp.create(result_types=[i32])
+    inner_second = TestOp.create(operands=[inner_first.results[0]])
+    module.body.block.add_op(
+        TestOp.create(regions=[Region(Block([inner_second, inner_first]))])
+    )
+    with pytest.raises(VerifyException, match="does not dominate this use"):
+        module.verify()
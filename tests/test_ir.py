@@ -1,16 +1,26 @@
+import pickle
 import pytest
 
 from typing import cast, Annotated
 
 from xdsl.dialects.arith import Arith, Addi, Subi, Constant
 from xdsl.dialects.builtin import Builtin, IntegerType, i32, i64, IntegerAttr, ModuleOp
-from xdsl.dialects.func import Func
-from xdsl.dialects.cf import Cf
+from xdsl.dialects.func import Func, Return
+from xdsl.dialects.cf import Branch, Cf
 from xdsl.dialects.scf import If
 
-from xdsl.ir import MLContext, Operation, Block, Region, ErasedSSAValue, SSAValue
+from xdsl.ir import (
+    MLContext,
+    Operation,
+    Block,
+    Region,
+    ErasedSSAValue,
+    SSAValue,
+    record_modified_operations,
+)
 from xdsl.parser import Parser
 from xdsl.irdl import IRDLOperation, VarRegion, irdl_op_definition, Operand
+from xdsl.utils.exceptions import VerifyException
 
 
 def test_ops_accessor():
@@ -139,6 +149,51 @@ def test_op_clone_with_regions():
     assert if2.false_region.op is not if_.false_region.op
 
 
+def test_region_clone_into_forward_successors():
+    exit = Block()
+    entry = Block([Branch.get(exit)])
+    exit.add_op(Return.get())
+    region = Region([entry, exit])
+
+    dest = Region()
+    region.clone_into(dest)
+
+    new_entry, new_exit = dest.blocks
+    branch = new_entry.first_op
+    assert isinstance(branch, Branch)
+    assert branch.successors[0] is new_exit
+
+
+def test_region_clone_into_links_ops():
+    block = Block(arg_types=[i32, i64])
+    first = Addi(block.args[0], block.args[0])
+    second = Addi(first, block.args[0])
+    block.add_ops([first, second, Return.get(second)])
+    region = Region(block)
+
+    value_mapper: dict[SSAValue, SSAValue] = {}
+    dest = Region()
+    region.clone_into(dest, value_mapper=value_mapper)
+
+    new_block = dest.block
+    new_first, new_second, new_return = new_block.ops
+    assert [arg.typ for arg in new_block.args] == [i32, i64]
+    assert new_first.operands == (new_block.args[0], new_block.args[0])
+    assert new_second.operands == (new_first.results[0], new_block.args[0])
+    assert new_return.operands == (new_second.results[0],)
+    assert value_mapper[second.results[0]] is new_second.results[0]
+    assert len(new_block.args[0].uses) == 3
+    assert len(block.args[0].uses) == 3
+    assert new_first.is_before_in_block(new_second)
+    assert region.is_structurally_equivalent(dest)
+
+    # The cloned block can be modified as any other block.
+    new_op = Addi(new_block.args[0], new_block.args[0])
+    new_block.insert_op_after(new_op, new_first)
+    assert new_first.next_op is new_op and new_op.next_op is new_second
+    assert new_op.is_before_in_block(new_second)
+
+
 ##################### Testing is_structurally_equal #####################
 
 program_region = """
@@ -276,6 +331,22 @@ def test_is_structurally_equivalent_incompatible_ir_nodes():
     assert not block.is_structurally_equivalent(func_op.regions[0].blocks[1])
 
 
+def test_is_structurally_identical():
+    a = Constant.from_int_and_width(1, i32)
+    b = Constant.from_int_and_width(1, i32)
+    c = Constant.from_int_and_width(2, i32)
+    assert a.is_structurally_identical(b)
+    assert a.structural_hash() == b.structural_hash()
+    assert not a.is_structurally_identical(c)
+    assert not a.is_structurally_identical(Constant.from_int_and_width(1, i64))
+
+    # Operands are compared by identity.
+    assert Addi(a, c).is_structurally_identical(Addi(a, c))
+    assert Addi(a, c).structural_hash() == Addi(a, c).structural_hash()
+    assert not Addi(a, c).is_structurally_identical(Addi(b, c))
+    assert not Addi(a, c).is_structurally_identical(Addi(c, a))
+
+
 def test_descriptions():
     a = Constant.from_int_and_width(1, 32)
 
@@ -414,3 +485,160 @@ def test_replace_operand():
 
     with pytest.raises(ValueError):
         add.replace_operand(cst0, new_cst)
+
+
+def test_pickle_block():
+    a = Constant.from_int_and_width(1, i32)
+    b = Constant.from_int_and_width(2, i32)
+    c = Addi(a, b)
+    block = Block([a, b, c], arg_types=[i32])
+    d = Addi(c, block.args[0])
+    block.add_op(d)
+
+    new_block = pickle.loads(pickle.dumps(block))
+
+    new_a, new_b, new_c, new_d = new_block.ops
+    assert new_a.next_op is new_b
+    assert new_d.prev_op is new_c
+    assert new_block.last_op is new_d
+    assert new_c.operands == (new_a.results[0], new_b.results[0])
+    assert new_d.operands == (new_c.results[0], new_block.args[0])
+    assert {use.operation for use in new_a.results[0].uses} == {new_c}
+    assert {use.operation for use in new_block.args[0].uses} == {new_d}
+    assert new_d.parent is new_block
+
+
+def test_compact_operation():
+    a = Constant.from_int_and_width(1, i32)
+    b = Addi(a, a)
+    block = Block([a, b])
+    region = Region(block)
+
+    for obj in (a, b, a.result, b.operands[0], block, region):
+        assert not hasattr(obj, "__dict__")
+
+    # The lists of operations without results, successors, or regions are only
+    # allocated when accessed, and can be modified in place.
+    return_op = Return.get(b)
+    assert return_op._results is None  # pyright: ignore[reportPrivateUsage]
+    assert b._successors is None  # pyright: ignore[reportPrivateUsage]
+    assert b._regions is None  # pyright: ignore[reportPrivateUsage]
+    assert list(b.walk()) == [b]
+    assert b._regions is None  # pyright: ignore[reportPrivateUsage]
+    b.successors.append(block)
+    assert b.successors == [block]
+    assert a.successors == []
+    assert return_op.results == []
+
+    # Attributes are only allocated when accessed
+    assert b._attributes is None  # pyright: ignore[reportPrivateUsage]
+    assert b.attributes == {}
+    b.attributes["test"] = i32
+    assert b.attributes == {"test": i32}
+
+    # Unallocated lists stay unallocated when pickling
+    new_block = pickle.loads(pickle.dumps(block))
+    new_a, _ = new_block.ops
+    assert new_a._regions is None  # pyright: ignore[reportPrivateUsage]
+
+
+def test_is_before_in_block():
+    ops = [Constant.from_int_and_width(i, i32) for i in range(4)]
+    block = Block(ops)
+    a, b, c, d = ops
+
+    assert a.is_before_in_block(b)
+    assert a.is_before_in_block(d)
+    assert not d.is_before_in_block(c)
+    assert not a.is_before_in_block(a)
+
+    # Repeatedly inserting between two operations exhausts the gap between
+    # their order indices, and invalidates the order.
+    inserted: list[Operation] = []
+    for i in range(10):
+        new_op = Constant.from_int_and_width(10 + i, i32)
+        block.insert_op_before(new_op, b)
+        inserted.append(new_op)
+    assert not block.is_op_order_valid
+    assert a.is_before_in_block(inserted[0])
+    assert block.is_op_order_valid
+    for prev, next in zip([a, *inserted], [*inserted, b]):
+        assert prev.is_before_in_block(next)
+        assert not next.is_before_in_block(prev)
+
+    # Detaching operations keeps the order valid
+    block.detach_op(c)
+    assert block.is_op_order_valid
+    assert b.is_before_in_block(d)
+
+    block.insert_op_before(c, a)
+    assert c.is_before_in_block(a)
+
+    with pytest.raises(ValueError):
+        c.is_before_in_block(Constant.from_int_and_width(0, i32))
+
+
+def test_block_ops_len():
+    ops = [Constant.from_int_and_width(i, i32) for i in range(4)]
+    block = Block()
+    assert len(block.ops) == 0
+    block.add_ops(ops)
+    assert len(block.ops) == 4
+    block.insert_op_after(Constant.from_int_and_width(4, i32), ops[1])
+    block.insert_op_before(Constant.from_int_and_width(5, i32), ops[0])
+    assert len(block.ops) == 6
+    block.erase_op(ops[2])
+    block.detach_op(ops[0])
+    assert len(block.ops) == 4
+    assert len(block.ops) == len(list(block.ops))
+
+    new_block = pickle.loads(pickle.dumps(block))
+    assert len(new_block.ops) == 4
+    first, *_, last = new_block.ops
+    assert first.is_before_in_block(last)
+
+
+def test_record_modified_operations():
+    a = Constant.from_int_and_width(1, i32)
+    b = Constant.from_int_and_width(2, i32)
+    add = Addi(a, b)
+    module = ModuleOp([a, b, add])
+
+    with record_modified_operations() as modified_ops:
+        c = Constant.from_int_and_width(3, i32)
+        module.body.block.insert_op_before(c, add)
+        add.operands = [c.result, b.result]
+        module.body.block.detach_op(b)
+    assert list(modified_ops) == [c, add, module]
+
+    # Moving an operation records its users.
+    with record_modified_operations() as modified_ops:
+        module.body.block.detach_op(c)
+        module.body.block.insert_op_before(c, a)
+    assert list(modified_ops) == [module, c, add]
+
+
+def test_incremental_verify():
+    a = Constant.from_int_and_width(1, i32)
+    b = Constant.from_int_and_width(2, i64)
+    invalid = Addi.create(operands=[a.result, b.result], result_types=[i32])
+    module = ModuleOp([a, b, invalid])
+    with pytest.raises(VerifyException):
+        module.verify()
+
+    with record_modified_operations() as modified_ops:
+        c = Constant.from_int_and_width(3, i32)
+        module.body.block.add_op(c)
+    # Only the new operation and its ancestors are verified.
+    module.verify(modified_ops=modified_ops)
+
+    with record_modified_operations() as modified_ops:
+        new_add = Addi.create(operands=[c.result, b.result], result_types=[i32])
+        module.body.block.add_op(new_add)
+    with pytest.raises(VerifyException):
+        module.verify(modified_ops=modified_ops)
+
+    # Operations outside of the verified operation are ignored.
+    with record_modified_operations() as modified_ops:
+        Block([Addi.create(operands=[c.result, b.result], result_types=[i32])])
+    a.verify(modified_ops=modified_ops)
@@ -1,6 +1,8 @@
 import pytest
 
-from xdsl.utils.lexer import Input, Lexer, Token
+from io import StringIO
+
+from xdsl.utils.lexer import Input, Lexer, StreamingLexer, Token
 from xdsl.utils.exceptions import ParseError
 
 
@@ -196,6 +198,44 @@ def test_eof(text: str):
     assert_single_token(text, Token.Kind.EOF, "")
 
 
+def test_many_comment_lines():
+    """Check that long runs of comments are skipped without recursing."""
+    assert_single_token("// Comment\n" * 100000 + "0", Token.Kind.INTEGER_LIT, "0")
+
+
+def test_token_sequence():
+    file = Input('%0 = "test.op"(%1) {"a" = 0x1f : i32} : (f32) -> !t.i<4xf32>', "")
+    lexer = Lexer(file)
+    tokens: list[tuple[Token.Kind, str]] = []
+    while (token := lexer.lex()).kind is not Token.Kind.EOF:
+        tokens.append((token.kind, token.text))
+    assert tokens == [
+        (Token.Kind.PERCENT_IDENT, "%0"),
+        (Token.Kind.EQUAL, "="),
+        (Token.Kind.STRING_LIT, '"test.op"'),
+        (Token.Kind.L_PAREN, "("),
+        (Token.Kind.PERCENT_IDENT, "%1"),
+        (Token.Kind.R_PAREN, ")"),
+        (Token.Kind.L_BRACE, "{"),
+        (Token.Kind.STRING_LIT, '"a"'),
+        (Token.Kind.EQUAL, "="),
+        (Token.Kind.INTEGER_LIT, "0x1f"),
+        (Token.Kind.COLON, ":"),
+        (Token.Kind.BARE_IDENT, "i32"),
+        (Token.Kind.R_BRACE, "}"),
+        (Token.Kind.COLON, ":"),
+        (Token.Kind.L_PAREN, "("),
+        (Token.Kind.BARE_IDENT, "f32"),
+        (Token.Kind.R_PAREN, ")"),
+        (Token.Kind.ARROW, "->"),
+        (Token.Kind.EXCLAMATION_IDENT, "!t.i"),
+        (Token.Kind.LESS, "<"),
+        (Token.Kind.INTEGER_LIT, "4"),
+        (Token.Kind.BARE_IDENT, "xf32"),
+        (Token.Kind.GREATER, ">"),
+    ]
+
+
 @pytest.mark.parametrize(
     "text, expected",
     [
@@ -229,3 +269,29 @@ def test_token_get_float_value(text: str, expected: float):
     token = get_token(text)
     assert token.kind == Token.Kind.FLOAT_LIT
     assert token.get_float_value() == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1024])
+def test_streaming_lexer(chunk_size: int):
+    text = '%0 = "test.op"() : () -> i32\n\n// Comment\n  "test.op"(%0) : (i32) -> ()\n'
+    lexer = Lexer(Input(text, "<unknown>"))
+    streaming_lexer = StreamingLexer(StringIO(text), chunk_size=chunk_size)
+    while (token := lexer.lex()).kind is not Token.Kind.EOF:
+        streaming_token = streaming_lexer.lex()
+        assert streaming_token.kind == token.kind
+        assert streaming_token.text == token.text
+    assert streaming_lexer.lex().kind is Token.Kind.EOF
+
+
+def test_streaming_lexer_discard():
+    lexer = StreamingLexer(StringIO("a\nb c\nd"), chunk_size=1)
+    assert lexer.lex().text == "a"
+    token = lexer.lex()
+    assert token.text == "b"
+    assert lexer.discard_before(token.span.start) == 2
+    assert lexer.input.content.startswith("b c\n")
+    assert lexer.input.line_offset == 1
+    assert lexer.lex().text == "c"
+    token = lexer.lex()
+    assert token.text == "d"
+    assert token.span.get_line_col() == (3, 0)
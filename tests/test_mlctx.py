@@ -1,8 +1,22 @@
 import pytest
-from xdsl.dialects.builtin import UnregisteredAttr, UnregisteredOp
-
+from xdsl.dialects.builtin import (
+    ArrayAttr,
+    FloatData,
+    IntAttr,
+    IntegerType,
+    Signedness,
+    SignednessAttr,
+    StringAttr,
+    UnregisteredAttr,
+    UnregisteredOp,
+    i32,
+    i64,
+)
+
+from xdsl.dialects.arith import Addi
 from xdsl.ir import MLContext, TypeAttribute, ParametrizedAttribute, Operation
 from xdsl.irdl import irdl_attr_definition
+from xdsl.traits import Pure
 
 
 class DummyOp(Operation):
@@ -101,3 +115,86 @@ def test_get_attr_unregistered(is_type: bool):
     )
     if is_type:
         assert issubclass(attr, TypeAttribute)
+
+
+def test_get_unique_attribute():
+    """Test that `get_unique_attribute` returns a single instance per structure."""
+    ctx = MLContext(unique_attributes=True)
+
+    width = ctx.get_unique_attribute(IntAttr, 32)
+    assert width == IntAttr(32)
+    assert ctx.get_unique_attribute(IntAttr, 32) is width
+    assert ctx.get_unique_attribute(IntAttr, 64) is not width
+
+    signless = ctx.get_unique_attribute(SignednessAttr, Signedness.SIGNLESS)
+    int_type = ctx.get_unique_attribute(IntegerType, [width, signless])
+    assert int_type == i32
+    assert ctx.get_unique_attribute(IntegerType, [width, signless]) is int_type
+    assert ctx.get_unique_attribute(IntegerType, [IntAttr(32), signless]) is int_type
+
+    # Values that compare equal but have different types are not uniqued.
+    assert ctx.get_unique_attribute(FloatData, 0.0) is not ctx.get_unique_attribute(
+        FloatData, -0.0
+    )
+
+
+def test_get_unique_instance():
+    """Test that `get_unique_instance` returns the first registered instance."""
+    ctx = MLContext(unique_attributes=True)
+
+    attr = ArrayAttr([IntegerType(32), StringAttr("foo")])
+    assert ctx.get_unique_instance(attr) is attr
+    assert ctx.get_unique_instance(ArrayAttr([i32, StringAttr("foo")])) is attr
+    assert ctx.get_unique_instance(ArrayAttr([i64, StringAttr("foo")])) is not attr
+
+
+def test_get_unique_nested_instance():
+    """
+    Test that `get_unique_nested_instance` also uniques the attributes nested
+    in the parameters of new attributes.
+    """
+    ctx = MLContext(unique_attributes=True)
+
+    int_type = ctx.get_unique_instance(IntegerType(32))
+    attr = ctx.get_unique_nested_instance(ArrayAttr([IntegerType(32), i64]))
+    assert attr.data[0] is int_type
+    assert attr.data[1] is ctx.get_unique_instance(IntegerType(64))
+    assert ctx.get_unique_nested_instance(ArrayAttr([i32, i64])) is attr
+    assert ctx.get_unique_instance(ArrayAttr([i32, i64])) is attr
+
+
+def test_clear_unique_attributes():
+    """Test that `clear_unique_attributes` forgets the uniqued attributes."""
+    ctx = MLContext(unique_attributes=True)
+
+    attr = ctx.get_unique_instance(IntegerType(32))
+    ctx.clear_unique_attributes()
+    new_attr = ctx.get_unique_instance(IntegerType(32))
+    assert new_attr is not attr
+    assert ctx.get_unique_attribute(IntegerType, [IntAttr(32), i32.signedness]) is (
+        new_attr
+    )
+
+
+def test_get_unique_attribute_disabled():
+    """Test that attributes are not uniqued by default."""
+    ctx = MLContext()
+
+    assert ctx.get_unique_attribute(IntAttr, 32) is not ctx.get_unique_attribute(
+        IntAttr, 32
+    )
+    assert ctx.get_unique_instance(i32) is i32
+    assert ctx.get_unique_instance(IntegerType(32)) is not i32
+
+
+def test_get_ops_with_trait():
+    """Test that `get_ops_with_trait` is updated when operations are registered."""
+    ctx = MLContext()
+    ctx.register_op(DummyOp)
+    assert ctx.get_ops_with_trait(Pure) == ()
+    assert ctx.get_ops_with_trait(Pure) is ctx.get_ops_with_trait(Pure)
+
+    ctx.register_op(Addi)
+    ctx.register_op(DummyOp2)
+    assert ctx.get_ops_with_trait(Pure) == (Addi,)
+    assert ctx.get_ops_with_trait(Pure, 0) == ()
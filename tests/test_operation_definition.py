@@ -198,6 +198,61 @@ def test_opresult_accessors():
     assert len(op.var_result) == 0
 
 
+@irdl_op_definition
+class SingleVariadicOp(IRDLOperation):
+    name = "test.single_variadic_op"
+
+    first: Operand
+    var_operand: VarOperand
+    last: Operand
+
+    opt_result: OptOpResult
+
+
+def test_single_variadic_accessors():
+    """Test accessors around a single variadic definition."""
+    operands = [OpResult(i32, None, None) for _ in range(4)]  # type: ignore
+
+    op = SingleVariadicOp.build(
+        operands=[operands[0], operands[1:3], operands[3]], result_types=[[]]
+    )
+    assert op.first is operands[0]
+    assert op.var_operand == tuple(operands[1:3])
+    assert op.last is operands[3]
+    assert op.opt_result is None
+
+    op = SingleVariadicOp.build(
+        operands=[operands[0], [], operands[3]], result_types=[[i32]]
+    )
+    assert op.var_operand == ()
+    assert op.last is operands[3]
+    assert op.opt_result is op.results[0]
+
+    # Accessing an operation with too few operands raises a verification error.
+    op = SingleVariadicOp.create(operands=operands[:1])
+    with pytest.raises(VerifyException):
+        op.first
+
+
+def test_segment_sizes_accessors():
+    """Test that accessors use the current segment sizes attribute."""
+    operands = [OpResult(i32, None, None) for _ in range(3)]  # type: ignore
+    op = OperandOp.build(operands=[operands[0], [operands[1]], [operands[2]]])
+    other_op = OperandOp.build(operands=[operands[0], [], operands[1:]])
+    assert op.opt_operand is operands[1]
+    assert other_op.opt_operand is None
+
+    op.attributes["operand_segment_sizes"] = other_op.attributes[
+        "operand_segment_sizes"
+    ]
+    assert op.opt_operand is None
+    assert op.var_operand == tuple(operands[1:])
+
+    del op.attributes["operand_segment_sizes"]
+    with pytest.raises(VerifyException):
+        op.var_operand
+
+
 @irdl_op_definition
 class AttributeOp(IRDLOperation):
     name = "test.attribute_op"
@@ -1,6 +1,9 @@
+import re
+
 import pytest
 
 from io import StringIO
+from pathlib import Path
 
 from xdsl.dialects.builtin import (
     IntAttr,
@@ -9,7 +12,12 @@ from xdsl.dialects.builtin import (
     ArrayAttr,
     Builtin,
     SymbolRefAttr,
+    i32,
 )
+from xdsl.dialects.arith import Arith
+from xdsl.dialects.func import Func
+from xdsl.dialects.memref import MemRefType
+from xdsl.dialects.test import Test
 from xdsl.ir import MLContext, Attribute, Region, ParametrizedAttribute
 from xdsl.irdl import irdl_attr_definition, irdl_op_definition, IRDLOperation
 from xdsl.parser import Parser
@@ -306,10 +314,8 @@ def test_get_punctuation_kind(punctuation: Token.Kind):
 def test_parse_punctuation(punctuation: Token.PunctuationSpelling):
     parser = Parser(MLContext(), punctuation)
 
-    parser._synchronize_lexer_and_tokenizer()
     res = parser.parse_punctuation(punctuation)
     assert res == punctuation
-    parser._synchronize_lexer_and_tokenizer()
     assert parser._parse_token(Token.Kind.EOF, "").kind == Token.Kind.EOF
 
 
@@ -318,7 +324,6 @@ def test_parse_punctuation(punctuation: Token.PunctuationSpelling):
 )
 def test_parse_punctuation_fail(punctuation: Token.PunctuationSpelling):
     parser = Parser(MLContext(), "e +")
-    parser._synchronize_lexer_and_tokenizer()
     with pytest.raises(ParseError) as e:
         parser.parse_punctuation(punctuation, " in test")
     assert e.value.span.text == "e"
@@ -330,10 +335,8 @@ def test_parse_punctuation_fail(punctuation: Token.PunctuationSpelling):
 )
 def test_parse_optional_punctuation(punctuation: Token.PunctuationSpelling):
     parser = Parser(MLContext(), punctuation)
-    parser._synchronize_lexer_and_tokenizer()
     res = parser.parse_optional_punctuation(punctuation)
     assert res == punctuation
-    parser._synchronize_lexer_and_tokenizer()
     assert parser._parse_token(Token.Kind.EOF, "").kind == Token.Kind.EOF
 
 
@@ -342,7 +345,6 @@ def test_parse_optional_punctuation(punctuation: Token.PunctuationSpelling):
 )
 def test_parse_optional_punctuation_fail(punctuation: Token.PunctuationSpelling):
     parser = Parser(MLContext(), "e +")
-    parser._synchronize_lexer_and_tokenizer()
     assert parser.parse_optional_punctuation(punctuation) is None
 
 
@@ -500,3 +502,312 @@ def test_parse_number_error(text: str):
     parser = Parser(MLContext(), text)
     with pytest.raises(ParseError):
         parser.parse_number()
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "i32",
+        "memref<4x?xf32, strided<[?, 1], offset: ?>>",
+        '"foo"',
+        "[1 : i64, f32, @foo::@bar]",
+        "{a = 1.0 : f64, b = (i32) -> index}",
+        "dense<[1, 2]> : tensor<2xi32>",
+    ],
+)
+def test_memoized_attribute(text: str):
+    """
+    Test that attributes parsed with memoization enabled are the same as
+    attributes parsed without it, and that memoized results are reused.
+    """
+    ctx = MLContext()
+    ctx.register_dialect(Builtin)
+    expected = Parser(ctx, text).parse_attribute()
+
+    parser = Parser(ctx, f"{text}, {text},", memoize_attributes=True)
+    first = parser.try_parse_attribute()
+    assert first == expected
+    parser.parse_punctuation(",")
+    assert parser.try_parse_attribute() is first
+    parser.parse_punctuation(",")
+    assert parser._current_token.kind == Token.Kind.EOF
+
+
+def test_memoized_attribute_prefix():
+    """
+    Test that memoized results are not reused when the text following the
+    examined tokens changes how they are lexed.
+    """
+    ctx = MLContext()
+    ctx.register_dialect(Builtin)
+    parser = Parser(ctx, "i32 x, i32 xy", memoize_attributes=True)
+    assert parser.try_parse_type() == i32
+    parser.resume_from(7)
+    assert parser.try_parse_type() == i32
+    assert parser._current_token.text == "xy"
+    assert parser._memo is not None
+    assert len(parser._memo[("_try_parse_type", "i32")]) == 2
+
+
+def _get_failed_type_error(memoize_attributes: bool) -> list[str]:
+    parser = Parser(
+        MLContext(),
+        "vector<4xi32, vector<4xi32,",
+        memoize_attributes=memoize_attributes,
+    )
+    messages: list[str] = []
+    for _ in range(2):
+        assert parser.try_parse_type() is None
+        with pytest.raises(ParseError) as e:
+            parser.raise_error("Expected a type")
+        messages.append(str(e.value))
+        parser.resume_from(parser.lexer.input.content.index(",") + 2)
+    if memoize_attributes:
+        # The second failure is reused from the first one
+        assert parser._memo is not None
+        assert len(parser._memo[("_try_parse_type", "vector")]) == 1
+    return messages
+
+
+def test_memoized_failed_backtracking_history():
+    """
+    Test that the history of failed backtracking attempts is the same when a
+    memoized failure is reused at another position.
+    """
+    assert _get_failed_type_error(True) == _get_failed_type_error(False)
+
+
+def test_unique_attributes():
+    """
+    Test that structurally equal attributes are parsed as a single instance
+    when attributes are uniqued by the context.
+    """
+    ctx = MLContext(unique_attributes=True)
+    ctx.register_dialect(Builtin)
+    ctx.register_dialect(Test)
+    text = """
+    "builtin.module"() ({
+      %0 = "test.op"() {"a" = [1 : i64], "b" = [1 : i64]} : () -> memref<2xi32>
+      %1 = "test.op"(%0) : (memref<2xi32>) -> memref<2xi32>
+    }) : () -> ()
+    """
+    first, second = Parser(ctx, text).parse_module().ops
+
+    assert first.attributes["a"] is first.attributes["b"]
+    assert first.results[0].typ is second.results[0].typ
+    assert second.operands[0].typ is second.results[0].typ
+    assert first.results[0].typ == MemRefType.from_element_type_and_shape(i32, [2])
+
+
+def test_failed_backtracking_history():
+    """
+    Test that the history of failed backtracking attempts is reported.
+    """
+    parser = Parser(MLContext(), "vector<4xi32")
+    assert parser.try_parse_type() is None
+    assert parser.history is not None
+    with pytest.raises(ParseError) as e:
+        parser.raise_error("Expected a type")
+    assert e.value.history is parser.history
+
+
+@pytest.mark.parametrize("from_stream", [False, True])
+def test_iter_top_level_ops(from_stream: bool):
+    text = """"builtin.module"() ({
+  %0 = "test.op"() : () -> i32
+  "test.op"() ({
+  ^0(%1 : i32):
+    "test.op"(%0, %1) : (i32, i32) -> ()
+  }) : () -> ()
+}) {"sym_name" = "module"} : () -> ()
+"""
+    ctx = MLContext()
+    ctx.register_dialect(Builtin)
+    parser = Parser(
+        ctx, StringIO(text) if from_stream else text, allow_unregistered_dialect=True
+    )
+    first_op, second_op = parser.iter_top_level_ops()
+    assert first_op.parent is None
+    assert second_op.parent is None
+    nested_op = second_op.regions[0].block.first_op
+    assert nested_op is not None
+    assert nested_op.operands[0] is first_op.results[0]
+
+
+def test_iter_top_level_ops_compact_spans():
+    """
+    Test that the block spans of operations parsed from a stream only keep
+    the lines they refer to, with their original line numbers and columns.
+    """
+    ops = "\n".join(
+        f'  "test.op"() ({{\n  ^{i}:\n    "test.op"() : () -> ()\n  }}) : () -> ()'
+        for i in range(10)
+    )
+    text = f'"builtin.module"() ({{\n{ops}\n}}) : () -> ()\n'
+    parser = Parser(MLContext(), StringIO(text), allow_unregistered_dialect=True)
+    for i, op in enumerate(parser.iter_top_level_ops()):
+        span = op.regions[0].block.declared_at
+        assert span is not None
+        assert span.text == f"^{i}"
+        assert span.input.content == f"  ^{i}:"
+        assert span.get_line_col() == (4 * i + 3, 2)
+
+
+def test_iter_top_level_ops_trailing_input():
+    parser = Parser(
+        MLContext(),
+        '"builtin.module"() ({}) : () -> () "test.op"() : () -> ()',
+        allow_unregistered_dialect=True,
+    )
+    with pytest.raises(ParseError) as e:
+        list(parser.iter_top_level_ops())
+    assert e.value.msg == "Expected end of input after builtin.module!"
+
+
+def test_parse_module_from_stream():
+    text = """"builtin.module"() ({
+  %0 = "test.op"() : () -> i32
+  "test.op"(%0) : (i32) -> ()
+}) {"sym_name" = "module"} : () -> ()
+"""
+    ctx = MLContext()
+    ctx.register_dialect(Builtin)
+    module = Parser(ctx, StringIO(text), allow_unregistered_dialect=True).parse_module()
+    first_op, second_op = module.ops
+    assert second_op.operands[0] is first_op.results[0]
+    assert module.attributes["sym_name"] == StringAttr("module")
+
+    # Parsing in parallel requires the whole input.
+    parser = Parser(ctx, StringIO(text), allow_unregistered_dialect=True)
+    with pytest.raises(ValueError):
+        parser.parse_module(jobs=2)
+
+
+@pytest.mark.parametrize("num_ops", [0, 1, 20])
+def test_parse_module_parallel(num_ops: int):
+    ops = "\n".join(
+        f'  "test.op"() ({{\n    %{i} = "test.op"() : () -> i32\n  }}) : () -> ()'
+        for i in range(num_ops)
+    )
+    text = f'"builtin.module"() ({{\n{ops}\n}}) {{"sym_name" = "m"}} : () -> ()'
+    ctx = MLContext()
+    ctx.register_dialect(Builtin)
+    ctx.register_dialect(Test)
+
+    expected = Parser(ctx, text).parse_module()
+    parser = Parser(ctx, text)
+    module = parser._parse_module_in_parallel(2)
+    assert module is not None
+    assert str(module) == str(expected)
+
+
+def test_parse_module_parallel_unique_attributes():
+    """
+    Test that the attributes of operations parsed in worker processes are
+    uniqued in the context of the main process.
+    """
+    ops = "\n".join(
+        f'  "test.op"() ({{\n    %{i} = "test.op"() {{"a" = [i32]}} : () -> i32\n'
+        "  }) : () -> ()"
+        for i in range(20)
+    )
+    text = f'"builtin.module"() ({{\n{ops}\n}}) : () -> ()'
+    ctx = MLContext(unique_attributes=True)
+    ctx.register_dialect(Builtin)
+    ctx.register_dialect(Test)
+
+    module = Parser(ctx, text)._parse_module_in_parallel(2)
+    assert module is not None
+    nested_ops = [op for op in module.walk() if op.results]
+    assert len(nested_ops) == 20
+    typ = nested_ops[0].results[0].typ
+    array_attr = nested_ops[0].attributes["a"]
+    assert isinstance(array_attr, ArrayAttr)
+    assert array_attr.data[0] is typ
+    for op in nested_ops:
+        assert op.results[0].typ is typ
+        assert op.attributes["a"] is array_attr
+
+
+def test_parse_module_parallel_fallback():
+    """
+    Test that modules whose top-level operations cannot be parsed separately
+    are parsed sequentially.
+    """
+    ops = "\n".join(
+        f'  %{i} = "test.op"(%{i - 1}) : (i32) -> i32' for i in range(1, 20)
+    )
+    text = (
+        f'"builtin.module"() ({{\n  %0 = "test.op"() : () -> i32\n{ops}\n}}) : () -> ()'
+    )
+    ctx = MLContext()
+    ctx.register_dialect(Builtin)
+    ctx.register_dialect(Test)
+
+    parser = Parser(ctx, text)
+    assert parser._parse_module_in_parallel(2) is None
+    parser = Parser(ctx, text)
+    module = parser.parse_module(2)
+    assert len(module.ops) == 20
+
+
+def test_parse_module_parallel_file():
+    """Test that the top-level operations of the lit test are parsed in parallel."""
+    path = Path(__file__).parent / "filecheck/parser-printer/parallel_parsing.mlir"
+    ctx = MLContext()
+    ctx.register_dialect(Builtin)
+    ctx.register_dialect(Arith)
+    ctx.register_dialect(Func)
+
+    text = path.read_text()
+    module = Parser(ctx, text)._parse_module_in_parallel(2)
+    assert module is not None
+    assert str(module) == str(Parser(ctx, text).parse_module())
+
+
+@pytest.mark.parametrize(
+    "ops",
+    [
+        ['%0 = "test.op"() : () -> i32', '%0 = "test.op"() : () -> i32'],
+        [
+            '%0 = "test.op"() : () -> i32',
+            '"test.op"() ({\n    %0 = "test.op"() : () -> i32\n  }) : () -> ()',
+        ],
+    ],
+)
+def test_parse_module_parallel_redefinition(ops: list[str]):
+    """Test that values redefined in other chunks are rejected."""
+    body = "\n".join(f"  {op}" for op in ops)
+    text = f'"builtin.module"() ({{\n{body}\n}}) : () -> ()'
+    ctx = MLContext()
+    ctx.register_dialect(Builtin)
+    ctx.register_dialect(Test)
+
+    assert Parser(ctx, text)._parse_module_in_parallel(2) is None
+    with pytest.raises(ParseError, match="SSA value %0 is already defined"):
+        Parser(ctx, text).parse_module(2)
+
+
+def test_parse_regex_wrappers():
+    """Test the parsing methods matching the input text with a pattern."""
+    parser = Parser(MLContext(), "12 true a.b$c 3x4x?xi32 !test.type<1>")
+    decimal = parser.try_parse_decimal_literal()
+    assert decimal is not None and decimal.text == "12"
+    boolean = parser.try_parse_boolean_literal()
+    assert boolean is not None and boolean.text == "true"
+    assert parser.try_parse_decimal_literal() is None
+    suffix_id = parser.try_parse_suffix_id()
+    assert suffix_id is not None and suffix_id.text == "a.b$c"
+    assert list(parser.try_parse_numerical_dims()) == [3, 4, -1]
+    assert parser.parse_optional_shape_delimiter() is None
+    assert parser.parse_optional_keyword("i32") == "i32"
+
+
+def test_parse_list_of_separator_pattern():
+    parser = Parser(MLContext(), "1::2::3 4 5")
+    assert parser.parse_list_of(
+        parser.parse_optional_integer, "Expected integer", re.compile("::")
+    ) == [1, 2, 3]
+    assert parser.parse_list_of(
+        parser.parse_optional_integer, "Expected integer", re.compile("")
+    ) == [4, 5]
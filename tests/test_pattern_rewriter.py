@@ -11,12 +11,19 @@ from xdsl.pattern_rewriter import (
     PatternRewriter,
     AnonymousRewritePattern,
     GreedyRewritePatternApplier,
+    GreedyPatternRewriteDriver,
+    FrozenRewritePatternSet,
+    PatternRewriterInstrumentation,
 )
 from xdsl.parser import Parser
 from xdsl.utils.hints import isa
 
 
-def rewrite_and_compare(prog: str, expected_prog: str, walker: PatternRewriteWalker):
+def rewrite_and_compare(
+    prog: str,
+    expected_prog: str,
+    walker: PatternRewriteWalker | GreedyPatternRewriteDriver,
+):
     ctx = MLContext()
     ctx.register_dialect(Builtin)
     ctx.register_dialect(Arith)
@@ -910,3 +917,226 @@ def test_move_region_contents_to_new_regions():
             AnonymousRewritePattern(match_and_rewrite), apply_recursively=False
         ),
     )
+
+
+def test_greedy_driver_folds_users():
+    """
+    Test that the greedy driver revisits the users of replaced values, and the
+    definitions of the operands of erased operations.
+    """
+
+    prog = """"builtin.module"() ({
+  %0 = "arith.constant"() {"value" = 1 : i32} : () -> i32
+  %1 = "arith.constant"() {"value" = 2 : i32} : () -> i32
+  %2 = "arith.addi"(%0, %1) : (i32, i32) -> i32
+  %3 = "arith.addi"(%2, %1) : (i32, i32) -> i32
+  %4 = "arith.addi"(%3, %3) : (i32, i32) -> i32
+  "test.op"(%4) : (i32) -> ()
+}) : () -> ()"""
+
+    expected = """"builtin.module"() ({
+  %0 = "arith.constant"() {"value" = 10 : i32} : () -> i32
+  "test.op"(%0) : (i32) -> ()
+}) : () -> ()"""
+
+    @op_type_rewrite_pattern
+    def fold_addi(op: Addi, rewriter: PatternRewriter):
+        if not isinstance(lhs := op.lhs.owner, Constant) or not isinstance(
+            rhs := op.rhs.owner, Constant
+        ):
+            return
+        assert isa(lhs.value, IntegerAttr) and isa(rhs.value, IntegerAttr)
+        value = lhs.value.value.data + rhs.value.value.data
+        rewriter.replace_matched_op(Constant.from_int_and_width(value, i32))
+
+    @op_type_rewrite_pattern
+    def erase_unused_constant(op: Constant, rewriter: PatternRewriter):
+        if not op.result.uses:
+            rewriter.erase_matched_op()
+
+    driver = GreedyPatternRewriteDriver(
+        GreedyRewritePatternApplier(
+            [
+                AnonymousRewritePattern(fold_addi),
+                AnonymousRewritePattern(erase_unused_constant),
+            ]
+        )
+    )
+    rewrite_and_compare(prog, expected, driver)
+
+
+def test_greedy_driver_folding():
+    """Test that the greedy driver folds operations before applying patterns."""
+
+    prog = """"builtin.module"() ({
+  %0 = "arith.constant"() {"value" = 2 : i32} : () -> i32
+  %1 = "arith.muli"(%0, %0) : (i32, i32) -> i32
+  %2 = "arith.addi"(%1, %0) : (i32, i32) -> i32
+  "test.op"(%2) : (i32) -> ()
+}) : () -> ()"""
+
+    expected = """"builtin.module"() ({
+  %0 = "arith.constant"() {"value" = 2 : i32} : () -> i32
+  %1 = "arith.constant"() {"value" = 4 : i32} : () -> i32
+  %2 = "arith.constant"() {"value" = 6 : i32} : () -> i32
+  "test.op"(%2) : (i32) -> ()
+}) : () -> ()"""
+
+    driver = GreedyPatternRewriteDriver(GreedyRewritePatternApplier([]))
+    rewrite_and_compare(prog, expected, driver)
+
+    driver = GreedyPatternRewriteDriver(GreedyRewritePatternApplier([]), fold=False)
+    rewrite_and_compare(prog, prog, driver)
+
+
+def test_greedy_driver_convergence():
+    """Test that the greedy driver reports whether the rewrite converged."""
+
+    ctx = MLContext()
+    ctx.register_dialect(Builtin)
+    ctx.register_dialect(Arith)
+    prog = """"builtin.module"() ({
+  %0 = "arith.constant"() {"value" = 0 : i32} : () -> i32
+}) : () -> ()"""
+
+    def increment_up_to(limit: int):
+        @op_type_rewrite_pattern
+        def increment(op: Constant, rewriter: PatternRewriter):
+            assert isa(op.value, IntegerAttr)
+            if (value := op.value.value.data) < limit:
+                rewriter.replace_matched_op(Constant.from_int_and_width(value + 1, i32))
+
+        return AnonymousRewritePattern(increment)
+
+    module = Parser(ctx, prog).parse_module()
+    assert GreedyPatternRewriteDriver(increment_up_to(20)).rewrite_module(module)
+    assert "20 : i32" in str(module)
+
+    module = Parser(ctx, prog).parse_module()
+    driver = GreedyPatternRewriteDriver(increment_up_to(20), max_num_rewrites=5)
+    assert not driver.rewrite_module(module)
+    assert "5 : i32" in str(module)
+
+    module = Parser(ctx, prog).parse_module()
+    driver = GreedyPatternRewriteDriver(increment_up_to(20), max_iterations=0)
+    assert not driver.rewrite_module(module)
+    assert "0 : i32" in str(module)
+
+
+def test_expected_types():
+    """Test that patterns expose the operation types they match."""
+
+    class AddiPattern(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: Addi, rewriter: PatternRewriter):
+            pass
+
+    @op_type_rewrite_pattern
+    def match_arith(op: Addi | Muli, rewriter: PatternRewriter):
+        pass
+
+    def match_any(op: Operation, rewriter: PatternRewriter):
+        pass
+
+    assert AddiPattern().expected_types == (Addi,)
+    assert AnonymousRewritePattern(match_arith).expected_types == (Addi, Muli)
+    assert AnonymousRewritePattern(match_any).expected_types is None
+    assert GreedyRewritePatternApplier(
+        [AddiPattern(), AnonymousRewritePattern(match_arith)]
+    ).expected_types == (Addi, Addi, Muli)
+    assert (
+        GreedyRewritePatternApplier(
+            [AddiPattern(), AnonymousRewritePattern(match_any)]
+        ).expected_types
+        is None
+    )
+
+
+def test_frozen_pattern_set():
+    """
+    Test that the frozen pattern set only dispatches operations to the patterns
+    that can match them, ordered by benefit.
+    """
+
+    class AddiPattern(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: Addi, rewriter: PatternRewriter):
+            pass
+
+    class ArithPattern(RewritePattern):
+        benefit = 2
+
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: Addi | Muli, rewriter: PatternRewriter):
+            pass
+
+    class AnyPattern(RewritePattern):
+        def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter):
+            pass
+
+    class SubAddi(Addi):
+        pass
+
+    addi, arith, any_op = AddiPattern(), ArithPattern(), AnyPattern()
+    patterns = FrozenRewritePatternSet([addi, any_op, arith])
+    assert patterns.get_patterns(Addi) == (arith, addi, any_op)
+    assert patterns.get_patterns(SubAddi) == (arith, addi, any_op)
+    assert patterns.get_patterns(Muli) == (arith, any_op)
+    assert patterns.get_patterns(Constant) == (any_op,)
+
+
+def test_pattern_instrumentation():
+    """
+    Test that the instrumentation is called around each pattern of a greedy
+    applier, and is picked up from the active instrumentation context.
+    """
+
+    ctx = MLContext()
+    ctx.register_dialect(Builtin)
+    ctx.register_dialect(Arith)
+    prog = """"builtin.module"() ({
+  %0 = "arith.constant"() {"value" = 1 : i32} : () -> i32
+  %1 = "arith.addi"(%0, %0) : (i32, i32) -> i32
+}) : () -> ()"""
+
+    events: list[tuple[str, str, bool | None]] = []
+
+    class RecordingInstrumentation(PatternRewriterInstrumentation):
+        def run_before_pattern(self, pattern: RewritePattern, op: Operation):
+            events.append((type(pattern).__name__, op.name, None))
+
+        def run_after_pattern(
+            self, pattern: RewritePattern, op: Operation, rewriter: PatternRewriter
+        ):
+            events.append((type(pattern).__name__, op.name, rewriter.has_done_action))
+
+    class AddiToMuli(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: Addi, rewriter: PatternRewriter):
+            rewriter.replace_matched_op(Muli.get(op.lhs, op.rhs))
+
+    class MatchAny(RewritePattern):
+        def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter):
+            pass
+
+    module = Parser(ctx, prog).parse_module()
+    walker = PatternRewriteWalker(
+        GreedyRewritePatternApplier([AddiToMuli(), MatchAny()]),
+        apply_recursively=False,
+        instrumentation=RecordingInstrumentation(),
+    )
+    walker.rewrite_module(module)
+
+    assert events == [
+        ("MatchAny", "builtin.module", None),
+        ("MatchAny", "builtin.module", False),
+        ("MatchAny", "arith.constant", None),
+        ("MatchAny", "arith.constant", False),
+        ("AddiToMuli", "arith.addi", None),
+        ("AddiToMuli", "arith.addi", True),
+    ]
+
+    # Walkers are not instrumented by default
+    events.clear()
+    PatternRewriteWalker(MatchAny()).rewrite_module(module)
+    assert events == []
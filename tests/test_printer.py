@@ -1,13 +1,22 @@
 from __future__ import annotations
 
-import re
 import pytest
 from io import StringIO
 from typing import Annotated
 
 from xdsl.dialects.arith import Arith, Addi, Constant
-from xdsl.dialects.builtin import Builtin, IntAttr, IntegerType, ModuleOp, UnitAttr, i32
+from xdsl.dialects.builtin import (
+    Builtin,
+    DenseIntOrFPElementsAttr,
+    IntAttr,
+    IntegerType,
+    ModuleOp,
+    TensorType,
+    UnitAttr,
+    i32,
+)
 from xdsl.dialects.func import Func
+from xdsl.dialects.test import TestOp
 from xdsl.ir import (
     Attribute,
     MLContext,
@@ -33,6 +42,8 @@ from xdsl.utils.diagnostic import Diagnostic
 from conftest import assert_print_op
 from xdsl.utils.exceptions import ParseError
 
+# pyright: reportPrivateUsage=false
+
 
 def test_simple_forgotten_op():
     """Test that the parsing of an undefined operand raises an exception."""
@@ -158,6 +169,36 @@ def test_op_message():
     assert_print_op(module, expected, diagnostic)
 
 
+@pytest.mark.parametrize("max_buffered_fragments", [1, 1 << 16])
+def test_op_message_after_flush(max_buffered_fragments: int):
+    """
+    Test that messages are correctly placed when text was printed before the
+    operation, and when the buffer is flushed while printing.
+    """
+    lit = Constant.from_int_and_width(42, 32)
+    add = Addi(lit, lit)
+    module = ModuleOp([lit, add])
+
+    diagnostic = Diagnostic()
+    diagnostic.add_message(add, "Test message")
+
+    io = StringIO()
+    printer = Printer(stream=io, diagnostic=diagnostic)
+    printer._max_buffered_fragments = max_buffered_fragments
+    printer.print_string("  ")
+    printer.print_op(module)
+
+    assert io.getvalue() == (
+        """  "builtin.module"() ({
+  %0 = "arith.constant"() {"value" = 42 : i32} : () -> i32
+  %1 = "arith.addi"(%0, %0) : (i32, i32) -> i32
+  ^^^^^^^^^^^^^^^^^
+  | Test message
+  -----------------
+}) : () -> ()"""
+    )
+
+
 def test_two_different_op_messages():
     """Test that an operation message can be printed."""
     prog = """\
@@ -364,6 +405,30 @@ def test_print_custom_block_arg_name():
     assert io.getvalue() == """\n^0(%test : i32, %0 : i32):"""
 
 
+def test_print_result_name_collision():
+    """
+    Test that a result is not given a name already allocated to a block
+    argument, even if the name is suffixed.
+    """
+    block = Block(arg_types=[i32, i32])
+    block.args[0].name_hint = "test_1"
+    block.args[1].name_hint = "test_1"
+    ops = [TestOp.create(result_types=[i32]) for _ in range(3)]
+    for op in ops:
+        op.results[0].name_hint = "test"
+    block.add_ops(ops)
+
+    io = StringIO()
+    p = Printer(stream=io)
+    p.print_block(block)
+    assert io.getvalue() == (
+        "\n^0(%test_1 : i32, %0 : i32):"
+        '\n  %test = "test.op"() : () -> i32'
+        '\n  %test_2 = "test.op"() : () -> i32'
+        '\n  %test_3 = "test.op"() : () -> i32'
+    )
+
+
 #   ____          _                  _____                          _
 #  / ___|   _ ___| |_ ___  _ __ ___ |  ___|__  _ __ _ __ ___   __ _| |_
 # | |  | | | / __| __/ _ \| '_ ` _ \| |_ / _ \| '__| '_ ` _ \ / _` | __|
@@ -517,7 +582,7 @@ class CustomFormatAttr(ParametrizedAttribute):
     @staticmethod
     def parse_parameters(parser: Parser) -> list[Attribute]:
         parser.parse_char("<")
-        value = parser.tokenizer.next_token_of_pattern(re.compile("(zero|one)"))
+        value = parser.try_parse_bare_id()
         if value and value.text == "zero":
             parser.parse_char(">")
             return [IntAttr(0)]
@@ -576,3 +641,25 @@ def test_dictionary_attr():
     parsed = parser.parse_op()
 
     assert_print_op(parsed, prog, None)
+
+
+@pytest.mark.parametrize(
+    "threshold, expected",
+    [
+        (None, "dense<[[1, -2], [3, 4]]> : tensor<2x2xi16>"),
+        (4, "dense<[[1, -2], [3, 4]]> : tensor<2x2xi16>"),
+        (3, 'dense<"0x0100FEFF03000400"> : tensor<2x2xi16>'),
+    ],
+)
+def test_print_dense_hex(threshold: int | None, expected: str):
+    """Test that large dense attributes can be printed in hexadecimal form."""
+    typ = TensorType.from_type_and_list(IntegerType(16), [2, 2])
+    attr = DenseIntOrFPElementsAttr.from_list(typ, [1, -2, 3, 4])
+
+    io = StringIO()
+    Printer(stream=io, print_dense_with_hex_if_larger=threshold).print_attribute(attr)
+    assert io.getvalue() == expected
+
+    ctx = MLContext()
+    ctx.register_dialect(Builtin)
+    assert Parser(ctx, io.getvalue()).parse_attribute() == attr
@@ -0,0 +1,153 @@
+import pytest
+
+from xdsl.dialects import gpu
+from xdsl.dialects.builtin import ModuleOp, StringAttr, SymbolRefAttr, i32
+from xdsl.dialects.func import Call, FuncOp, Return
+from xdsl.dialects.test import TestOp
+from xdsl.ir import BlockArgument, Operation
+from xdsl.pattern_rewriter import (
+    PatternRewriter,
+    PatternRewriteWalker,
+    RewritePattern,
+    op_type_rewrite_pattern,
+)
+from xdsl.symbol_table import (
+    SymbolTable,
+    SymbolTableCollection,
+    get_symbol_uses,
+    is_public_symbol,
+)
+from xdsl.transforms.symbol_dce import symbol_dce
+
+
+def build_module() -> tuple[ModuleOp, FuncOp, FuncOp, gpu.ModuleOp]:
+    """
+    Build a module with a public function `main` calling a private function
+    `callee`, and a GPU module `kernels` defining a function `kernel`.
+    """
+
+    def callee_body(*args: BlockArgument) -> list[Operation]:
+        return []
+
+    def main_body(*args: BlockArgument) -> list[Operation]:
+        return [Call.get("callee", [], [i32]), Return.get()]
+
+    callee = FuncOp.from_callable("callee", [], [i32], callee_body)
+    main = FuncOp.from_callable("main", [], [], main_body)
+    del main.attributes["sym_visibility"]
+    kernel = FuncOp.external("kernel", [], [])
+    kernels = gpu.ModuleOp.build(
+        attributes={"sym_name": StringAttr("kernels")},
+        regions=[[kernel, gpu.ModuleEndOp.get()]],
+    )
+    return ModuleOp([main, callee, kernels]), main, callee, kernels
+
+
+def test_symbol_table_lookup():
+    module, main, callee, kernels = build_module()
+    table = SymbolTable(module)
+
+    assert len(table) == 3
+    assert table.lookup("main") is main
+    assert table.lookup(StringAttr("callee")) is callee
+    assert table.lookup("kernels") is kernels
+    assert table.lookup("kernel") is None
+    assert is_public_symbol(main)
+    assert not is_public_symbol(callee)
+
+    with pytest.raises(ValueError, match="is not a symbol table"):
+        SymbolTable(main)
+
+
+def test_nested_symbol_lookup():
+    module, main, _, kernels = build_module()
+    symbol_tables = SymbolTableCollection()
+    kernel = kernels.body.block.first_op
+
+    assert (
+        symbol_tables.lookup_symbol_in(module, SymbolRefAttr("kernels", ["kernel"]))
+        is kernel
+    )
+    assert symbol_tables.lookup_symbol_in(module, SymbolRefAttr("main")) is main
+    assert symbol_tables.lookup_symbol_in(module, SymbolRefAttr("main", ["x"])) is None
+    call = main.body.block.first_op
+    assert call is not None
+    assert symbol_tables.lookup_nearest_symbol_from(call, "callee") is not None
+    assert symbol_tables.lookup_nearest_symbol_from(kernels, "kernel") is kernel
+
+
+def test_symbol_table_updates():
+    module, main, callee, _ = build_module()
+    table = SymbolTable(module)
+
+    other = FuncOp.external("other", [], [])
+    table.insert(other, before=callee)
+    assert table.lookup("other") is other
+    assert callee.prev_op is other
+    with pytest.raises(ValueError, match="'other' is already defined"):
+        table.insert(FuncOp.external("other", [], []))
+
+    table.erase(other)
+    assert table.lookup("other") is None
+    table.remove(callee)
+    assert callee.parent is None
+    assert table.lookup("callee") is None
+
+    # Renamed symbols are detected when looked up.
+    main.attributes["sym_name"] = StringAttr("renamed")
+    assert table.lookup("main") is None
+    assert table.lookup("renamed") is main
+
+
+def test_symbol_table_rewriter_updates():
+    module, main, callee, _ = build_module()
+    symbol_tables = SymbolTableCollection()
+    assert symbol_tables.lookup_symbol_in(module, "callee") is callee
+
+    class ReplaceCallee(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: FuncOp, rewriter: PatternRewriter):
+            if op.sym_name.data == "callee":
+                rewriter.replace_matched_op(FuncOp.external("new_callee", [], [i32]))
+
+    PatternRewriteWalker(
+        ReplaceCallee(), apply_recursively=False, listener=symbol_tables
+    ).rewrite_module(module)
+
+    assert symbol_tables.lookup_symbol_in(module, "callee") is None
+    new_callee = symbol_tables.lookup_symbol_in(module, "new_callee")
+    assert isinstance(new_callee, FuncOp)
+    assert new_callee.parent is module.body.block
+    assert symbol_tables.lookup_symbol_in(module, "main") is main
+
+
+def test_symbol_uses():
+    call = Call.get("callee", [], [i32])
+    assert get_symbol_uses(call) == [SymbolRefAttr("callee")]
+    assert get_symbol_uses(TestOp.create()) == []
+
+
+def test_symbol_dce():
+    module, main, callee, kernels = build_module()
+    kernel = kernels.body.block.first_op
+    assert kernel is not None
+    kernel.attributes["sym_visibility"] = StringAttr("private")
+    unused = FuncOp.external("unused", [], [])
+    module.body.block.add_op(unused)
+    kernels.attributes["sym_visibility"] = StringAttr("private")
+
+    # The private GPU module is erased with its symbols.
+    assert symbol_dce(module) == 2
+    assert list(module.ops) == [main, callee]
+
+    module, main, callee, kernels = build_module()
+    kernels.attributes["sym_visibility"] = StringAttr("private")
+    kernel = kernels.body.block.first_op
+    assert kernel is not None
+    kernel.attributes["sym_visibility"] = StringAttr("private")
+    use: Operation = TestOp.create(
+        attributes={"kernel": SymbolRefAttr("kernels", ["kernel"])}
+    )
+    module.body.block.add_op(use)
+    assert symbol_dce(module) == 0
+    assert list(module.ops) == [main, callee, kernels, use]
@@ -1,5 +1,5 @@
-from xdsl.dialects.test import Test
-from xdsl.dialects.builtin import ModuleOp, Builtin
+from xdsl.dialects.test import Test, TestOp
+from xdsl.dialects.builtin import ModuleOp, Builtin, i32
 from xdsl.ir import MLContext, Use
 from xdsl.parser import Parser
 
@@ -23,7 +23,63 @@ def test_main():
     assert isinstance(module, ModuleOp)
 
     op1, op2 = list(module.ops)
-    assert op1.results[0].uses == {Use(op2, 0), Use(op2, 1)}
-    assert op2.results[0].uses == set()
+    assert list(op1.results[0].uses) == [Use(op2, 1), Use(op2, 0)]
+    assert len(op1.results[0].uses) == 2
+    assert not op2.results[0].uses
+    assert Use(op2, 0) in op1.results[0].uses
+    assert Use(op2, 1) in op1.results[0].uses
+    assert Use(op2, 2) not in op1.results[0].uses
+    assert Use(op1, 0) not in op1.results[0].uses
+    assert Use(op2, 0) not in op2.results[0].uses
 
     print("Done")
+
+
+def test_operand_uses_are_reused():
+    ctx = MLContext()
+    ctx.register_dialect(Builtin)
+    ctx.register_dialect(Test)
+
+    module = Parser(ctx, test_prog).parse_module()
+    op1, op2 = list(module.ops)
+    new_op = TestOp.create(result_types=[i32])
+    old_value, new_value = op1.results[0], new_op.results[0]
+    use0, use1 = op2._operand_uses  # pyright: ignore[reportPrivateUsage]
+
+    # Replacing a value moves the uses owned by the operands to the new value
+    old_value.replace_by(new_value)
+    assert op2.operands == (new_value, new_value)
+    assert not old_value.uses
+    assert list(new_value.uses) == [use0, use1]
+    assert [use.index for use in new_value.uses] == [0, 1]
+
+    # Setting the operands only moves the uses of the changed operands
+    op2.operands = [new_value, old_value]
+    assert op2._operand_uses == (use0, use1)  # pyright: ignore[reportPrivateUsage]
+    assert list(new_value.uses) == [use0]
+    assert list(old_value.uses) == [use1]
+
+    # Removing operands removes their uses
+    op2.operands = [old_value]
+    assert not new_value.uses
+    assert list(old_value.uses) == [use0]
+
+    op2.drop_all_references()
+    assert not old_value.uses
+
+
+def test_remove_use_while_iterating():
+    ctx = MLContext()
+    ctx.register_dialect(Builtin)
+    ctx.register_dialect(Test)
+
+    module = Parser(ctx, test_prog).parse_module()
+    op1, op2 = list(module.ops)
+    value = op1.results[0]
+    new_op = TestOp.create(result_types=[i32])
+
+    for use in value.uses:
+        use.operation.replace_operand(use.index, new_op.results[0])
+    assert not value.uses
+    assert len(new_op.results[0].uses) == 2
+    assert op2.operands == (new_op.results[0], new_op.results[0])
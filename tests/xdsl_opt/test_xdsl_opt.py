@@ -1,4 +1,5 @@
-from contextlib import redirect_stdout
+import json
+from contextlib import redirect_stderr, redirect_stdout
 from io import StringIO
 
 import pytest
@@ -21,6 +22,10 @@ def test_opt():
         "stencil-to-local-2d-horizontal",
         "frontend-desymrefy",
         "dce",
+        "constant-fold",
+        "cse",
+        "symbol-dce",
+        "inline",
         "riscv-allocate-registers",
     ]
 
@@ -122,3 +127,71 @@ def test_operation_deletion():
         expected = file.read()
 
     assert f.getvalue().strip() == expected.strip()
+
+
+def test_pass_statistics():
+    filename = "tests/xdsl_opt/simple_program.mlir"
+    opt = xDSLOptMain(
+        args=[
+            filename,
+            "-p",
+            "dce",
+            "--timing",
+            "--pass-statistics",
+            "--statistics-format",
+            "json",
+        ]
+    )
+
+    out, err = StringIO(""), StringIO("")
+    with redirect_stdout(out), redirect_stderr(err):
+        opt.run()
+
+    statistics = json.loads(err.getvalue())
+    assert list(statistics["phases"].keys()) == ["Parse", "Verifier", "Output"]
+    [dce_statistics] = statistics["passes"]
+    assert dce_statistics["name"] == "dce"
+    assert dce_statistics["num_ops_before"] == 2
+    assert dce_statistics["num_ops_after"] == 2
+    assert dce_statistics["num_ops_delta"] == 0
+    [pattern_statistics] = dce_statistics["patterns"]
+    assert pattern_statistics["name"] == "RemoveUnusedOperations"
+    assert pattern_statistics["num_match_attempts"] == 2
+    assert pattern_statistics["num_rewrites"] == 0
+
+
+def test_timing_report():
+    filename = "tests/xdsl_opt/simple_program.mlir"
+    opt = xDSLOptMain(args=[filename, "-p", "dce", "--timing"])
+
+    out, err = StringIO(""), StringIO("")
+    with redirect_stdout(out), redirect_stderr(err):
+        opt.run()
+
+    report = err.getvalue()
+    assert "Execution time report" in report
+    names = [line.split(")")[-1].strip() for line in report.splitlines()[6:]]
+    assert names == ["Parse", "Verifier", "dce", "Output", "Total"]
+    assert "Pass statistics report" not in report
+
+
+def test_timing_without_statistics():
+    """
+    Test that operations and patterns are not counted without
+    `--pass-statistics`.
+    """
+    filename = "tests/xdsl_opt/simple_program.mlir"
+    opt = xDSLOptMain(
+        args=[filename, "-p", "dce", "--timing", "--statistics-format", "json"]
+    )
+    assert opt.ctx.pattern_rewriter_instrumentation is None
+
+    out, err = StringIO(""), StringIO("")
+    with redirect_stdout(out), redirect_stderr(err):
+        opt.run()
+
+    statistics = json.loads(err.getvalue())
+    [dce_statistics] = statistics["passes"]
+    assert dce_statistics["num_ops_before"] is None
+    assert dce_statistics["num_ops_after"] is None
+    assert dce_statistics["patterns"] == []
@@ -0,0 +1,151 @@
+"""
+The call graph of the functions of a module, built from the `func.call`
+operations they contain.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from xdsl.dialects.func import Call, FuncOp
+from xdsl.ir import Operation
+from xdsl.symbol_table import SymbolTableCollection
+
+
+@dataclass(eq=False)
+class CallGraphNode:
+    """A function of the call graph."""
+
+    func: FuncOp
+    """The function."""
+
+    calls: list[Call] = field(default_factory=list)
+    """The calls in the body of the function that resolve to a function."""
+
+    uses: list[Call] = field(default_factory=list)
+    """The calls to the function."""
+
+    callees: list[CallGraphNode] = field(default_factory=list)
+    """The functions called by the function, without duplicates."""
+
+    callers: list[CallGraphNode] = field(default_factory=list)
+    """The functions calling the function, without duplicates."""
+
+    def __repr__(self) -> str:
+        return f"CallGraphNode(@{self.func.sym_name.data})"
+
+
+@dataclass(eq=False)
+class CallGraph:
+    """
+    The call graph of the functions of an operation. Calls are resolved with
+    symbol tables, so that building the graph is linear in the size of the
+    operation.
+    The graph is not updated when the IR is modified.
+    """
+
+    nodes: dict[FuncOp, CallGraphNode] = field(default_factory=dict)
+    """The nodes of the graph, in program order of the functions."""
+
+    unresolved_calls: list[Call] = field(default_factory=list)
+    """The calls whose callee is not a function of the operation."""
+
+    symbol_tables: SymbolTableCollection = field(default_factory=SymbolTableCollection)
+    """The symbol tables used to resolve the callees."""
+
+    @staticmethod
+    def build(
+        op: Operation, symbol_tables: SymbolTableCollection | None = None
+    ) -> CallGraph:
+        """Build the call graph of the functions nested in an operation."""
+        graph = CallGraph(symbol_tables=symbol_tables or SymbolTableCollection())
+        calls: list[Call] = []
+        for nested_op in op.walk():
+            if isinstance(nested_op, FuncOp):
+                graph.nodes[nested_op] = CallGraphNode(nested_op)
+            elif isinstance(nested_op, Call):
+                calls.append(nested_op)
+
+        edges: set[tuple[CallGraphNode, CallGraphNode]] = set()
+        for call in calls:
+            callee = graph.resolve_call(call)
+            if callee is None:
+                graph.unresolved_calls.append(call)
+                continue
+            callee.uses.append(call)
+            if (caller := graph.get_caller(call)) is None:
+                continue
+            caller.calls.append(call)
+            if (caller, callee) not in edges:
+                edges.add((caller, callee))
+                caller.callees.append(callee)
+                callee.callers.append(caller)
+        return graph
+
+    def get_node(self, func: FuncOp) -> CallGraphNode | None:
+        """Get the node of a function, or None if it is not in the graph."""
+        return self.nodes.get(func)
+
+    def resolve_call(self, call: Call) -> CallGraphNode | None:
+        """Get the node of the function called by a call, if it is in the graph."""
+        callee = self.symbol_tables.lookup_nearest_symbol_from(call, call.callee)
+        if not isinstance(callee, FuncOp):
+            return None
+        return self.nodes.get(callee)
+
+    def get_caller(self, call: Call) -> CallGraphNode | None:
+        """Get the node of the function containing a call, if there is one."""
+        parent = call.parent_op()
+        while parent is not None and not isinstance(parent, FuncOp):
+            parent = parent.parent_op()
+        return None if parent is None else self.nodes.get(parent)
+
+    def get_sccs(self) -> list[list[CallGraphNode]]:
+        """
+        Get the strongly connected components of the graph, in bottom-up order:
+        the functions of a component are only called by the functions of the
+        same component or of the following components.
+        """
+        # Iterative version of Tarjan's algorithm, which finds the components
+        # in reverse topological order.
+        index: dict[CallGraphNode, int] = {}
+        low_link: dict[CallGraphNode, int] = {}
+        stack: list[CallGraphNode] = []
+        on_stack: set[CallGraphNode] = set()
+        sccs: list[list[CallGraphNode]] = []
+
+        for root in self.nodes.values():
+            if root in index:
+                continue
+            index[root] = low_link[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            dfs_stack: list[tuple[CallGraphNode, int]] = [(root, 0)]
+            while dfs_stack:
+                node, child_index = dfs_stack[-1]
+                if child_index < len(node.callees):
+                    dfs_stack[-1] = (node, child_index + 1)
+                    callee = node.callees[child_index]
+                    if callee not in index:
+                        index[callee] = low_link[callee] = len(index)
+                        stack.append(callee)
+                        on_stack.add(callee)
+                        dfs_stack.append((callee, 0))
+                    elif callee in on_stack:
+                        low_link[node] = min(low_link[node], index[callee])
+                    continue
+
+                dfs_stack.pop()
+                if dfs_stack:
+                    parent = dfs_stack[-1][0]
+                    low_link[parent] = min(low_link[parent], low_link[node])
+                if low_link[node] == index[node]:
+                    scc: list[CallGraphNode] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.remove(member)
+                        scc.append(member)
+                        if member is node:
+                            break
+                    sccs.append(scc)
+        return sccs
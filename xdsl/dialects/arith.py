@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import functools
+import math
+import struct
 from dataclasses import dataclass
 from enum import Enum
-from typing import Annotated, TypeVar, Union, Set, Optional
+from typing import Annotated, Callable, Sequence, TypeVar, Union, Set, Optional, cast
 
 from xdsl.dialects.builtin import (
     ContainerOf,
@@ -17,7 +19,9 @@ from xdsl.dialects.builtin import (
     FloatAttr,
     Attribute,
     AnyFloat,
+    AnyFloatAttr,
     AnyIntegerAttr,
+    Signedness,
 )
 from xdsl.ir import Operation, SSAValue, Dialect, OpResult, Data
 from xdsl.irdl import (
@@ -32,7 +36,7 @@ from xdsl.irdl import (
 )
 from xdsl.parser import Parser
 from xdsl.printer import Printer
-from xdsl.traits import Pure
+from xdsl.traits import ConstantLike, Pure
 from xdsl.utils.exceptions import VerifyException
 
 signlessIntegerLike = ContainerOf(AnyOf([IntegerType, IndexType]))
@@ -109,6 +113,8 @@ class Constant(IRDLOperation):
     result: Annotated[OpResult, AnyAttr()]
     value: OpAttr[Attribute]
 
+    traits = frozenset([ConstantLike(), Pure()])
+
     @staticmethod
     def from_attr(attr: Attribute, typ: Attribute) -> Constant:
         return Constant.create(result_types=[typ], attributes={"value": attr})
@@ -133,9 +139,258 @@ class Constant(IRDLOperation):
         return Constant.create(result_types=[typ], attributes={"value": val})
 
 
-class BinaryOperation(IRDLOperation):
+def _get_constant(value: SSAValue) -> Attribute | None:
+    """Get the value of an SSA value defined by a constant operation."""
+    if isinstance(value, OpResult) and value.op.has_trait(ConstantLike):
+        return value.op.attributes.get("value")
+    return None
+
+
+def _get_int_constants(op: Operation) -> list[int] | None:
+    """
+    Get the values of the operands of an operation, if they are all integer
+    constants.
+    """
+    values: list[int] = []
+    for operand in op.operands:
+        constant = _get_constant(operand)
+        if not isinstance(constant, IntegerAttr):
+            return None
+        values.append(cast(AnyIntegerAttr, constant).value.data)
+    return values
+
+
+def _get_float_constants(op: Operation) -> list[float] | None:
+    """
+    Get the values of the operands of an operation, if they are all float
+    constants.
+    """
+    values: list[float] = []
+    for operand in op.operands:
+        constant = _get_constant(operand)
+        if not isinstance(constant, FloatAttr):
+            return None
+        values.append(cast(FloatAttr[AnyFloat], constant).value.data)
+    return values
+
+
+def _get_int_width(typ: Attribute) -> int | None:
+    """Get the bitwidth of an integer-like type, with 64 bits for `index`."""
+    if isinstance(typ, IntegerType):
+        return typ.width.data
+    if isinstance(typ, IndexType):
+        return 64
+    return None
+
+
+def _to_unsigned(value: int, width: int) -> int:
+    """Interpret the bits of an integer as an unsigned integer."""
+    return value & ((1 << width) - 1)
+
+
+def _to_signed(value: int, width: int) -> int:
+    """Interpret the bits of an integer as a two's complement integer."""
+    value = _to_unsigned(value, width)
+    if value >> (width - 1):
+        value -= 1 << width
+    return value
+
+
+def _int_attr(value: int, typ: Attribute) -> AnyIntegerAttr | None:
+    """
+    Create an integer attribute, wrapping the value around the width of its
+    type. Values of unsigned integers and of signless `i1` are represented in
+    `[0, 2^width)`, and values of other integers in two's complement.
+    """
+    width = _get_int_width(typ)
+    if width is None:
+        return None
+    typ = cast(IntegerType | IndexType, typ)
+    if isinstance(typ, IntegerType) and (
+        typ.signedness.data == Signedness.UNSIGNED
+        or (typ.signedness.data == Signedness.SIGNLESS and width == 1)
+    ):
+        return IntegerAttr(_to_unsigned(value, width), typ)
+    return IntegerAttr(_to_signed(value, width), typ)
+
+
+def _fold_int_binary_op(
+    op: Operation,
+    fold_fn: Callable[[int, int, int], int | None],
+    unsigned: bool = False,
+) -> Sequence[Attribute | SSAValue] | None:
+    """
+    Fold an integer operation with two operands of the type of its result.
+    The folding function gets the operand values, either as two's complement or
+    as unsigned integers, and the bitwidth, and returns None if the operation
+    cannot be folded.
+    """
+    values = _get_int_constants(op)
+    typ = op.results[0].typ
+    if values is None or (width := _get_int_width(typ)) is None:
+        return None
+    convert = _to_unsigned if unsigned else _to_signed
+    lhs, rhs = (convert(value, width) for value in values)
+    result = fold_fn(lhs, rhs, width)
+    if result is None or (attr := _int_attr(result, typ)) is None:
+        return None
+    return [attr]
+
+
+def _round_float(value: float, typ: Attribute) -> float | None:
+    """
+    Round a float to the precision of a float type. Return None if the type
+    is not supported.
+    """
+    if isinstance(typ, Float64Type):
+        return value
+    if isinstance(typ, Float32Type):
+        fmt = "f"
+    elif isinstance(typ, Float16Type):
+        fmt = "e"
+    else:
+        return None
+    try:
+        return struct.unpack(fmt, struct.pack(fmt, value))[0]
+    except OverflowError:
+        return math.copysign(math.inf, value)
+
+
+def _float_attr(value: float, typ: Attribute) -> FloatAttr[AnyFloat] | None:
+    """
+    Create a float attribute, rounding the value to its type precision.
+    Return None if the rounded value is infinite or NaN, as these cannot be
+    printed as attributes.
+    """
+    rounded = _round_float(value, typ)
+    if rounded is None or not math.isfinite(rounded):
+        return None
+    return FloatAttr(rounded, cast(AnyFloat, typ))
+
+
+def _fold_float_binary_op(
+    op: Operation, fold_fn: Callable[[float, float], float]
+) -> Sequence[Attribute | SSAValue] | None:
+    """
+    Fold a float operation with two operands of the type of its result.
+    The folding function gets the operand values.
+    """
+    values = _get_float_constants(op)
+    if values is None:
+        return None
+    lhs, rhs = values
+    attr = _float_attr(fold_fn(lhs, rhs), op.results[0].typ)
+    return None if attr is None else [attr]
+
+
+def _fold_float_unary_op(
+    op: Operation, fold_fn: Callable[[float], float]
+) -> Sequence[Attribute | SSAValue] | None:
+    """
+    Fold a float operation with one operand of the type of its result.
+    The folding function gets the operand value.
+    """
+    values = _get_float_constants(op)
+    if values is None:
+        return None
+    (operand,) = values
+    attr = _float_attr(fold_fn(operand), op.results[0].typ)
+    return None if attr is None else [attr]
+
+
+def _divide_floats(lhs: float, rhs: float) -> float:
+    """
+    Divide two floats. Divisions by zero give NaN, as their infinite or NaN
+    results are not folded anyway.
+    """
+    if rhs == 0:
+        return math.nan
+    return lhs / rhs
+
+
+def _divide_towards_zero(lhs: int, rhs: int) -> int:
+    """Divide two integers, rounding towards zero."""
+    quotient = abs(lhs) // abs(rhs)
+    return quotient if (lhs < 0) == (rhs < 0) else -quotient
+
+
+def _fold_signed_division(
+    fold_fn: Callable[[int, int], int]
+) -> Callable[[int, int, int], int | None]:
+    """
+    Wrap a signed division, that is not folded if the divisor is zero or if it
+    overflows.
+    """
+
+    def fold(lhs: int, rhs: int, width: int) -> int | None:
+        if rhs == 0 or (rhs == -1 and lhs == -(1 << (width - 1))):
+            return None
+        return fold_fn(lhs, rhs)
+
+    return fold
+
+
+def _fold_shift(
+    fold_fn: Callable[[int, int], int]
+) -> Callable[[int, int, int], int | None]:
+    """Wrap a shift, that is not folded if the shift amount is out of bounds."""
+
+    def fold(lhs: int, rhs: int, width: int) -> int | None:
+        if not 0 <= rhs < width:
+            return None
+        return fold_fn(lhs, rhs)
+
+    return fold
+
+
+def _is_int_constant(value: SSAValue, expected: int) -> bool:
+    """Check if an SSA value is an integer constant with the given value."""
+    constant = _get_constant(value)
+    return (
+        isinstance(constant, IntegerAttr)
+        and cast(AnyIntegerAttr, constant).value.data == expected
+    )
+
+
+def _max_floats(lhs: float, rhs: float) -> float:
+    """Get the maximum of two floats, propagating NaNs, with `-0.0 < +0.0`."""
+    if math.isnan(lhs) or math.isnan(rhs):
+        return math.nan
+    if lhs == rhs:
+        return lhs if math.copysign(1.0, lhs) > 0 else rhs
+    return max(lhs, rhs)
+
+
+def _min_floats(lhs: float, rhs: float) -> float:
+    """Get the minimum of two floats, propagating NaNs, with `-0.0 < +0.0`."""
+    if math.isnan(lhs) or math.isnan(rhs):
+        return math.nan
+    if lhs == rhs:
+        return lhs if math.copysign(1.0, lhs) < 0 else rhs
+    return min(lhs, rhs)
+
+
+class ConstantMaterializer:
+    """
+    Materialize the constants folded by arith operations as `arith.constant`
+    operations. Operation definitions inherit this class.
+    """
+
+    # Operations inheriting this class do not need a per-instance `__dict__`.
+    __slots__ = ()
+
+    @classmethod
+    def materialize_constant(cls, value: Attribute, typ: Attribute) -> Operation | None:
+        if not isinstance(value, IntegerAttr | FloatAttr):
+            return None
+        return Constant.from_attr(cast(AnyIntegerAttr | AnyFloatAttr, value), typ)
+
+
+class BinaryOperation(ConstantMaterializer, IRDLOperation):
     """A generic operation. Operation definitions inherit this class."""
 
+    traits = frozenset([Pure()])
+
     # TODO replace with trait
     def verify_(self) -> None:
         if len(self.operands) != 2 or len(self.results) != 1:
@@ -167,6 +422,11 @@ class Addi(BinaryOperation):
             result_type = SSAValue.get(operand1).typ
         super().__init__(operands=[operand1, operand2], result_types=[result_type])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        if _is_int_constant(self.rhs, 0):
+            return [self.lhs]
+        return _fold_int_binary_op(self, lambda lhs, rhs, _: lhs + rhs)
+
 
 @irdl_op_definition
 class Muli(BinaryOperation):
@@ -182,6 +442,11 @@ class Muli(BinaryOperation):
         operand1 = SSAValue.get(operand1)
         return Muli.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        if _is_int_constant(self.rhs, 1):
+            return [self.lhs]
+        return _fold_int_binary_op(self, lambda lhs, rhs, _: lhs * rhs)
+
 
 @irdl_op_definition
 class Subi(BinaryOperation):
@@ -197,6 +462,11 @@ class Subi(BinaryOperation):
         operand1 = SSAValue.get(operand1)
         return Subi.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        if _is_int_constant(self.rhs, 0):
+            return [self.lhs]
+        return _fold_int_binary_op(self, lambda lhs, rhs, _: lhs - rhs)
+
 
 @irdl_op_definition
 class DivUI(BinaryOperation):
@@ -218,6 +488,11 @@ class DivUI(BinaryOperation):
         operand1 = SSAValue.get(operand1)
         return DivUI.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_int_binary_op(
+            self, lambda lhs, rhs, _: lhs // rhs if rhs else None, unsigned=True
+        )
+
 
 @irdl_op_definition
 class DivSI(BinaryOperation):
@@ -238,6 +513,9 @@ class DivSI(BinaryOperation):
         operand1 = SSAValue.get(operand1)
         return DivSI.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_int_binary_op(self, _fold_signed_division(_divide_towards_zero))
+
 
 @irdl_op_definition
 class FloorDivSI(BinaryOperation):
@@ -259,6 +537,11 @@ class FloorDivSI(BinaryOperation):
             operands=[operand1, operand2], result_types=[operand1.typ]
         )
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_int_binary_op(
+            self, _fold_signed_division(lambda lhs, rhs: lhs // rhs)
+        )
+
 
 @irdl_op_definition
 class CeilDivSI(BinaryOperation):
@@ -276,6 +559,11 @@ class CeilDivSI(BinaryOperation):
             operands=[operand1, operand2], result_types=[operand1.typ]
         )
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_int_binary_op(
+            self, _fold_signed_division(lambda lhs, rhs: -(-lhs // rhs))
+        )
+
 
 @irdl_op_definition
 class CeilDivUI(BinaryOperation):
@@ -293,6 +581,11 @@ class CeilDivUI(BinaryOperation):
             operands=[operand1, operand2], result_types=[operand1.typ]
         )
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_int_binary_op(
+            self, lambda lhs, rhs, _: -(-lhs // rhs) if rhs else None, unsigned=True
+        )
+
 
 @irdl_op_definition
 class RemUI(BinaryOperation):
@@ -308,6 +601,11 @@ class RemUI(BinaryOperation):
         operand1 = SSAValue.get(operand1)
         return RemUI.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_int_binary_op(
+            self, lambda lhs, rhs, _: lhs % rhs if rhs else None, unsigned=True
+        )
+
 
 @irdl_op_definition
 class RemSI(BinaryOperation):
@@ -323,6 +621,14 @@ class RemSI(BinaryOperation):
         operand1 = SSAValue.get(operand1)
         return RemSI.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_int_binary_op(
+            self,
+            lambda lhs, rhs, _: lhs - rhs * _divide_towards_zero(lhs, rhs)
+            if rhs
+            else None,
+        )
+
 
 @irdl_op_definition
 class MinUI(BinaryOperation):
@@ -338,6 +644,11 @@ class MinUI(BinaryOperation):
         operand1 = SSAValue.get(operand1)
         return MinUI.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_int_binary_op(
+            self, lambda lhs, rhs, _: min(lhs, rhs), unsigned=True
+        )
+
 
 @irdl_op_definition
 class MaxUI(BinaryOperation):
@@ -353,6 +664,11 @@ class MaxUI(BinaryOperation):
         operand1 = SSAValue.get(operand1)
         return MaxUI.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_int_binary_op(
+            self, lambda lhs, rhs, _: max(lhs, rhs), unsigned=True
+        )
+
 
 @irdl_op_definition
 class MinSI(BinaryOperation):
@@ -368,6 +684,9 @@ class MinSI(BinaryOperation):
         operand1 = SSAValue.get(operand1)
         return MinSI.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_int_binary_op(self, lambda lhs, rhs, _: min(lhs, rhs))
+
 
 @irdl_op_definition
 class MaxSI(BinaryOperation):
@@ -383,6 +702,9 @@ class MaxSI(BinaryOperation):
         operand1 = SSAValue.get(operand1)
         return MaxSI.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_int_binary_op(self, lambda lhs, rhs, _: max(lhs, rhs))
+
 
 @irdl_op_definition
 class AndI(BinaryOperation):
@@ -398,6 +720,9 @@ class AndI(BinaryOperation):
         operand1 = SSAValue.get(operand1)
         return AndI.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_int_binary_op(self, lambda lhs, rhs, _: lhs & rhs)
+
 
 @irdl_op_definition
 class OrI(BinaryOperation):
@@ -413,6 +738,11 @@ class OrI(BinaryOperation):
         operand1 = SSAValue.get(operand1)
         return OrI.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        if _is_int_constant(self.rhs, 0):
+            return [self.lhs]
+        return _fold_int_binary_op(self, lambda lhs, rhs, _: lhs | rhs)
+
 
 @irdl_op_definition
 class XOrI(BinaryOperation):
@@ -428,9 +758,14 @@ class XOrI(BinaryOperation):
         operand1 = SSAValue.get(operand1)
         return XOrI.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        if _is_int_constant(self.rhs, 0):
+            return [self.lhs]
+        return _fold_int_binary_op(self, lambda lhs, rhs, _: lhs ^ rhs)
+
 
 @irdl_op_definition
-class ShLI(IRDLOperation):
+class ShLI(ConstantMaterializer, IRDLOperation):
     """
     The `shli` operation shifts an integer value to the left by a variable
     amount. The low order bits are filled with zeros.
@@ -441,6 +776,8 @@ class ShLI(IRDLOperation):
     rhs: Annotated[Operand, IntegerType]
     result: Annotated[OpResult, IntegerType]
 
+    traits = frozenset([Pure()])
+
     # TODO replace with trait
     def verify_(self) -> None:
         if self.lhs.typ != self.rhs.typ or self.rhs.typ != self.result.typ:
@@ -453,9 +790,12 @@ class ShLI(IRDLOperation):
         operand1 = SSAValue.get(operand1)
         return ShLI.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_int_binary_op(self, _fold_shift(lambda lhs, rhs: lhs << rhs))
+
 
 @irdl_op_definition
-class ShRUI(IRDLOperation):
+class ShRUI(ConstantMaterializer, IRDLOperation):
     """
     The `shrui` operation shifts an integer value to the right by a variable
     amount. The integer is interpreted as unsigned. The high order bits are
@@ -467,6 +807,8 @@ class ShRUI(IRDLOperation):
     rhs: Annotated[Operand, signlessIntegerLike]
     result: Annotated[OpResult, signlessIntegerLike]
 
+    traits = frozenset([Pure()])
+
     # TODO replace with trait
     def verify_(self) -> None:
         if self.lhs.typ != self.rhs.typ or self.rhs.typ != self.result.typ:
@@ -479,9 +821,14 @@ class ShRUI(IRDLOperation):
         operand1 = SSAValue.get(operand1)
         return ShRUI.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_int_binary_op(
+            self, _fold_shift(lambda lhs, rhs: lhs >> rhs), unsigned=True
+        )
+
 
 @irdl_op_definition
-class ShRSI(IRDLOperation):
+class ShRSI(ConstantMaterializer, IRDLOperation):
     """
     The `shrsi` operation shifts an integer value to the right by a variable
     amount. The integer is interpreted as signed. The high order bits in the
@@ -494,6 +841,8 @@ class ShRSI(IRDLOperation):
     rhs: Annotated[Operand, IntegerType]
     result: Annotated[OpResult, IntegerType]
 
+    traits = frozenset([Pure()])
+
     # TODO replace with trait
     def verify_(self) -> None:
         if self.lhs.typ != self.rhs.typ or self.rhs.typ != self.result.typ:
@@ -506,6 +855,9 @@ class ShRSI(IRDLOperation):
         operand1 = SSAValue.get(operand1)
         return ShRSI.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_int_binary_op(self, _fold_shift(lambda lhs, rhs: lhs >> rhs))
+
 
 @dataclass
 class ComparisonOperation:
@@ -527,6 +879,9 @@ class ComparisonOperation:
     -   unsigned greater than or equal (mnemonic: `"uge"`; integer value: `9`)
     """
 
+    # Operations inheriting this class do not need a per-instance `__dict__`.
+    __slots__ = ()
+
     @staticmethod
     def _get_comparison_predicate(
         mnemonic: str, comparison_operations: dict[str, int]
@@ -546,7 +901,7 @@ class ComparisonOperation:
 
 
 @irdl_op_definition
-class Cmpi(IRDLOperation, ComparisonOperation):
+class Cmpi(ConstantMaterializer, IRDLOperation, ComparisonOperation):
     """
     The cmpi operation is a generic comparison for integer-like types. Its two
     arguments can be integers, vectors or tensors thereof as long as their types
@@ -580,6 +935,8 @@ class Cmpi(IRDLOperation, ComparisonOperation):
     rhs: Annotated[Operand, IntegerType]
     result: Annotated[OpResult, IntegerType(1)]
 
+    traits = frozenset([Pure()])
+
     @staticmethod
     def get(
         operand1: Union[Operation, SSAValue],
@@ -611,9 +968,33 @@ class Cmpi(IRDLOperation, ComparisonOperation):
             attributes={"predicate": IntegerAttr.from_int_and_width(arg, 64)},
         )
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        values = _get_int_constants(self)
+        width = _get_int_width(self.lhs.typ)
+        if values is None or width is None:
+            return None
+        lhs, rhs = (_to_signed(value, width) for value in values)
+        ulhs, urhs = (_to_unsigned(value, width) for value in values)
+        predicates = [
+            lhs == rhs,
+            lhs != rhs,
+            lhs < rhs,
+            lhs <= rhs,
+            lhs > rhs,
+            lhs >= rhs,
+            ulhs < urhs,
+            ulhs <= urhs,
+            ulhs > urhs,
+            ulhs >= urhs,
+        ]
+        predicate = self.predicate.value.data
+        if not 0 <= predicate < len(predicates):
+            return None
+        return [IntegerAttr(int(predicates[predicate]), IntegerType(1))]
+
 
 @irdl_op_definition
-class Cmpf(IRDLOperation, ComparisonOperation):
+class Cmpf(ConstantMaterializer, IRDLOperation, ComparisonOperation):
     """
     The cmpf operation compares its two operands according to the float
     comparison rules and the predicate specified by the respective attribute.
@@ -644,6 +1025,8 @@ class Cmpf(IRDLOperation, ComparisonOperation):
     rhs: Annotated[Operand, floatingPointLike]
     result: Annotated[OpResult, IntegerType(1)]
 
+    traits = frozenset([Pure()])
+
     @staticmethod
     def get(
         operand1: SSAValue | Operation, operand2: SSAValue | Operation, arg: int | str
@@ -680,9 +1063,28 @@ class Cmpf(IRDLOperation, ComparisonOperation):
             attributes={"predicate": IntegerAttr.from_int_and_width(arg, 64)},
         )
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        values = _get_float_constants(self)
+        if values is None:
+            return None
+        lhs, rhs = values
+        unordered = math.isnan(lhs) or math.isnan(rhs)
+        comparisons = [lhs == rhs, lhs > rhs, lhs >= rhs, lhs < rhs, lhs <= rhs]
+        comparisons.append(not unordered and lhs != rhs)
+        predicates = [False]
+        predicates.extend(not unordered and cmp for cmp in comparisons)
+        predicates.append(not unordered)
+        predicates.extend(unordered or cmp for cmp in comparisons)
+        predicates.append(unordered)
+        predicates.append(True)
+        predicate = self.predicate.value.data
+        if not 0 <= predicate < len(predicates):
+            return None
+        return [IntegerAttr(int(predicates[predicate]), IntegerType(1))]
+
 
 @irdl_op_definition
-class Select(IRDLOperation):
+class Select(ConstantMaterializer, IRDLOperation):
     """
     The `arith.select` operation chooses one value based on a binary condition
     supplied as its first operand. If the value of the first operand is `1`,
@@ -696,6 +1098,8 @@ class Select(IRDLOperation):
     rhs: Annotated[Operand, Attribute]
     result: Annotated[OpResult, Attribute]
 
+    traits = frozenset([Pure()])
+
     # TODO replace with trait
     def verify_(self) -> None:
         if self.cond.typ != IntegerType(1):
@@ -714,6 +1118,14 @@ class Select(IRDLOperation):
             operands=[operand1, operand2, operand3], result_types=[operand2.typ]
         )
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        if self.lhs is self.rhs:
+            return [self.lhs]
+        cond = _get_constant(self.cond)
+        if not isinstance(cond, IntegerAttr):
+            return None
+        return [self.lhs if cast(AnyIntegerAttr, cond).value.data else self.rhs]
+
 
 @irdl_op_definition
 class Addf(BinaryOperation):
@@ -729,6 +1141,9 @@ class Addf(BinaryOperation):
         operand1 = SSAValue.get(operand1)
         return Addf.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_float_binary_op(self, lambda lhs, rhs: lhs + rhs)
+
 
 @irdl_op_definition
 class Subf(BinaryOperation):
@@ -744,6 +1159,9 @@ class Subf(BinaryOperation):
         operand1 = SSAValue.get(operand1)
         return Subf.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_float_binary_op(self, lambda lhs, rhs: lhs - rhs)
+
 
 @irdl_op_definition
 class Mulf(BinaryOperation):
@@ -759,6 +1177,9 @@ class Mulf(BinaryOperation):
         operand1 = SSAValue.get(operand1)
         return Mulf.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_float_binary_op(self, lambda lhs, rhs: lhs * rhs)
+
 
 @irdl_op_definition
 class Divf(BinaryOperation):
@@ -774,14 +1195,19 @@ class Divf(BinaryOperation):
         operand1 = SSAValue.get(operand1)
         return Divf.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_float_binary_op(self, _divide_floats)
+
 
 @irdl_op_definition
-class Negf(IRDLOperation):
+class Negf(ConstantMaterializer, IRDLOperation):
     name: str = "arith.negf"
     fastmath: OptOpAttr[FastMathFlagsAttr]
     operand: Annotated[Operand, floatingPointLike]
     result: Annotated[OpResult, floatingPointLike]
 
+    traits = frozenset([Pure()])
+
     @staticmethod
     def get(
         operand: Union[Operation, SSAValue], fastmath: FastMathFlagsAttr | None = None
@@ -793,6 +1219,9 @@ class Negf(IRDLOperation):
             result_types=[operand.typ],
         )
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_float_unary_op(self, lambda operand: -operand)
+
 
 @irdl_op_definition
 class Maxf(BinaryOperation):
@@ -808,6 +1237,9 @@ class Maxf(BinaryOperation):
         operand1 = SSAValue.get(operand1)
         return Maxf.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_float_binary_op(self, _max_floats)
+
 
 @irdl_op_definition
 class Minf(BinaryOperation):
@@ -823,67 +1255,122 @@ class Minf(BinaryOperation):
         operand1 = SSAValue.get(operand1)
         return Minf.build(operands=[operand1, operand2], result_types=[operand1.typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        return _fold_float_binary_op(self, _min_floats)
+
 
 @irdl_op_definition
-class IndexCastOp(IRDLOperation):
+class IndexCastOp(ConstantMaterializer, IRDLOperation):
     name = "arith.index_cast"
 
     input: Operand
 
     result: OpResult
 
+    traits = frozenset([Pure()])
+
     @staticmethod
     def get(input_arg: SSAValue | Operation, target_type: Attribute):
         return IndexCastOp.build(operands=[input_arg], result_types=[target_type])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        values = _get_int_constants(self)
+        width = _get_int_width(self.input.typ)
+        if values is None or width is None:
+            return None
+        attr = _int_attr(_to_signed(values[0], width), self.result.typ)
+        return None if attr is None else [attr]
+
 
 @irdl_op_definition
-class FPToSIOp(IRDLOperation):
+class FPToSIOp(ConstantMaterializer, IRDLOperation):
     name = "arith.fptosi"
 
     input: Annotated[Operand, AnyFloat]
     result: Annotated[OpResult, IntegerType]
 
+    traits = frozenset([Pure()])
+
     @staticmethod
     def get(op: SSAValue | Operation, target_typ: IntegerType):
         return FPToSIOp.build(operands=[op], result_types=[target_typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        values = _get_float_constants(self)
+        width = _get_int_width(self.result.typ)
+        if values is None or width is None or not math.isfinite(values[0]):
+            return None
+        value = math.trunc(values[0])
+        # The conversion of out of range values is undefined.
+        if not -(1 << (width - 1)) <= value < (1 << (width - 1)):
+            return None
+        attr = _int_attr(value, self.result.typ)
+        return None if attr is None else [attr]
+
 
 @irdl_op_definition
-class SIToFPOp(IRDLOperation):
+class SIToFPOp(ConstantMaterializer, IRDLOperation):
     name = "arith.sitofp"
 
     input: Annotated[Operand, IntegerType]
     result: Annotated[OpResult, AnyFloat]
 
+    traits = frozenset([Pure()])
+
     @staticmethod
     def get(op: SSAValue | Operation, target_typ: AnyFloat):
         return SIToFPOp.build(operands=[op], result_types=[target_typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        values = _get_int_constants(self)
+        width = _get_int_width(self.input.typ)
+        if values is None or width is None:
+            return None
+        attr = _float_attr(float(_to_signed(values[0], width)), self.result.typ)
+        return None if attr is None else [attr]
+
 
 @irdl_op_definition
-class ExtFOp(IRDLOperation):
+class ExtFOp(ConstantMaterializer, IRDLOperation):
     name = "arith.extf"
 
     input: Annotated[Operand, AnyFloat]
     result: Annotated[OpResult, AnyFloat]
 
+    traits = frozenset([Pure()])
+
     @staticmethod
     def get(op: SSAValue | Operation, target_typ: AnyFloat):
         return ExtFOp.build(operands=[op], result_types=[target_typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        values = _get_float_constants(self)
+        if values is None:
+            return None
+        attr = _float_attr(values[0], self.result.typ)
+        return None if attr is None else [attr]
+
 
 @irdl_op_definition
-class TruncFOp(IRDLOperation):
+class TruncFOp(ConstantMaterializer, IRDLOperation):
     name = "arith.truncf"
 
     input: Annotated[Operand, AnyFloat]
     result: Annotated[OpResult, AnyFloat]
 
+    traits = frozenset([Pure()])
+
     @staticmethod
     def get(op: SSAValue | Operation, target_typ: AnyFloat):
         return ExtFOp.build(operands=[op], result_types=[target_typ])
 
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        values = _get_float_constants(self)
+        if values is None:
+            return None
+        attr = _float_attr(values[0], self.result.typ)
+        return None if attr is None else [attr]
+
 
 Arith = Dialect(
     [
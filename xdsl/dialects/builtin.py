@@ -1,5 +1,12 @@
 from __future__ import annotations
+import math
+import struct
+import sys
 from abc import ABC
+from array import array
+from multiprocessing import get_all_start_methods, get_context
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
 
 from dataclasses import dataclass
 from enum import Enum
@@ -30,6 +37,7 @@ from xdsl.ir import (
     SSAValue,
     AttributeCovT,
     AttributeInvT,
+    ModifiedOperations,
 )
 
 from xdsl.irdl import (
@@ -51,6 +59,7 @@ from xdsl.irdl import (
     AnyAttr,
     IRDLOperation,
 )
+from xdsl.traits import HasGraphRegions, IsolatedFromAbove, SymbolTableOp
 from xdsl.utils.deprecation import deprecated_constructor
 from xdsl.utils.exceptions import VerifyException
 
@@ -788,6 +797,126 @@ class VectorBaseTypeAndRankConstraint(AttrConstraint):
         constraint.verify(attr)
 
 
+@irdl_data_definition
+class DenseElementsData(Data[Sequence[int] | Sequence[float]]):
+    """
+    The elements of a dense attribute, stored in a compact buffer.
+    Integers are stored as 64-bit integers, and floats as doubles, in a
+    read-only `memoryview`, as attributes may be shared. Integers that do not
+    fit in 64 bits are stored in a tuple.
+    An `array.array` given as data is copied in a read-only buffer.
+    """
+
+    name = "dense_elements"
+
+    def __post_init__(self):
+        # Arrays of other typecodes are kept as is, and rejected by `verify`.
+        if isinstance(self.data, array) and self.data.typecode in ("q", "Q", "d"):
+            typecode = self.data.typecode
+            buffer = memoryview(self.data.tobytes()).cast(typecode)
+            object.__setattr__(self, "data", buffer)
+        super().__post_init__()
+
+    @staticmethod
+    def from_ints(values: Sequence[int]) -> DenseElementsData:
+        for typecode in ("q", "Q"):
+            try:
+                return DenseElementsData(array(typecode, values))
+            except OverflowError:
+                continue
+            except TypeError:
+                break
+        return DenseElementsData(tuple(values))
+
+    @staticmethod
+    def from_floats(values: Sequence[int | float]) -> DenseElementsData:
+        return DenseElementsData(array("d", values))
+
+    @property
+    def is_float(self) -> bool:
+        """Check if the elements are floats."""
+        return isinstance(self.data, memoryview) and self.data.format == "d"
+
+    @staticmethod
+    def parse_parameter(parser: Parser) -> Sequence[int] | Sequence[float]:
+        parser.parse_punctuation("[")
+        values = parser.parse_list_of(
+            parser.parse_optional_number, "Expected integer or float literal"
+        )
+        parser.parse_punctuation("]")
+        if all(isinstance(value, int) for value in values):
+            return DenseElementsData.from_ints(cast(list[int], values)).data
+        return DenseElementsData.from_floats(values).data
+
+    def print_parameter(self, printer: Printer) -> None:
+        printer.print_string("[")
+        printer.print_string(", ".join(map(str, self.data)))
+        printer.print_string("]")
+
+    def verify(self) -> None:
+        if isinstance(self.data, memoryview):
+            if self.data.format not in ("q", "Q", "d"):
+                raise VerifyException(
+                    "dense elements should be stored in an array of 64-bit "
+                    f"integers or doubles, got typecode '{self.data.format}'"
+                )
+            if not self.data.readonly:
+                raise VerifyException("dense elements should be read-only")
+        elif not isinstance(self.data, tuple) or not all(
+            isinstance(value, int) for value in self.data
+        ):
+            raise VerifyException(
+                f"dense elements should be integers or floats, got {self.data!r}"
+            )
+
+    def __len__(self):
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[int | float]:
+        return iter(self.data)
+
+    def __eq__(self, other: object) -> bool:
+        # Buffers are compared bitwise with their format, consistently with
+        # `__hash__`, as memory views of different formats compare their values.
+        if not isinstance(other, DenseElementsData):
+            return NotImplemented
+        if isinstance(self.data, memoryview) and isinstance(other.data, memoryview):
+            return (
+                self.data.format == other.data.format
+                and self.data.tobytes() == other.data.tobytes()
+            )
+        return self.data == other.data
+
+    def __hash__(self) -> int:
+        if isinstance(self.data, memoryview):
+            return hash((self.data.format, self.data.tobytes()))
+        return hash(self.data)
+
+    def __reduce__(self):
+        # Memory views cannot be pickled, so the buffer is pickled as an array.
+        if isinstance(self.data, memoryview):
+            return (DenseElementsData, (array(self.data.format, self.data.tobytes()),))
+        return (DenseElementsData, (self.data,))
+
+
+def _get_raw_element_size(element_type: Attribute) -> int | None:
+    """
+    Get the size in bytes of an element of the given type in the raw (hex)
+    encoding of dense attributes, or None if the encoding is not supported.
+    """
+    if isinstance(element_type, IndexType):
+        return 8
+    if isinstance(element_type, IntegerType):
+        width = element_type.width.data
+        return (width + 7) // 8 if width > 1 else None
+    float_sizes: dict[type[Attribute], int] = {
+        Float16Type: 2,
+        Float32Type: 4,
+        Float64Type: 8,
+    }
+    return float_sizes.get(type(element_type))
+
+
 @irdl_attr_definition
 class DenseIntOrFPElementsAttr(ParametrizedAttribute):
     name = "dense"
@@ -796,7 +925,20 @@ class DenseIntOrFPElementsAttr(ParametrizedAttribute):
         | RankedVectorOrTensorOf[IndexType]
         | RankedVectorOrTensorOf[AnyFloat]
     ]
-    data: ParameterDef[ArrayAttr[AnyIntegerAttr] | ArrayAttr[AnyFloatAttr]]
+    data: ParameterDef[DenseElementsData]
+
+    def verify(self) -> None:
+        if isinstance(self.type.element_type, AnyFloat):
+            if not self.data.is_float:
+                raise VerifyException(
+                    "dense attribute of float element type "
+                    "should only contain floats"
+                )
+        elif self.data.is_float:
+            raise VerifyException(
+                "dense attribute of integer element type "
+                "should only contain integers"
+            )
 
     # The type stores the shape data
     @property
@@ -821,49 +963,144 @@ class DenseIntOrFPElementsAttr(ParametrizedAttribute):
         # Product of dimensions needs to equal length
         return n == len(self.data.data)
 
+    def as_tuple(self) -> tuple[int, ...] | tuple[float, ...]:
+        """Get the element values as a tuple."""
+        return tuple(self.data.data)
+
+    def iter_attrs(self) -> Iterator[AnyIntegerAttr | AnyFloatAttr]:
+        """
+        Iterate over the elements as `IntegerAttr` or `FloatAttr`, which are
+        created on demand.
+        """
+        element_type = self.type.element_type
+        if isinstance(element_type, AnyFloat):
+            return (FloatAttr(float(value), element_type) for value in self.data.data)
+        return (IntegerAttr(int(value), element_type) for value in self.data.data)
+
+    def as_array_attr(self) -> ArrayAttr[AnyIntegerAttr] | ArrayAttr[AnyFloatAttr]:
+        """
+        Get the elements as an `ArrayAttr` of `IntegerAttr` or `FloatAttr`, which
+        is how `data` used to store them. This creates an attribute per element,
+        prefer `as_tuple` or `iter_attrs` when possible.
+        """
+        element_type = self.type.element_type
+        if isinstance(element_type, AnyFloat):
+            return ArrayAttr(
+                [FloatAttr(float(value), element_type) for value in self.data.data]
+            )
+        return ArrayAttr(
+            [IntegerAttr(int(value), element_type) for value in self.data.data]
+        )
+
+    def get_raw_data(self) -> bytes | None:
+        """
+        Get the elements in the raw encoding used by the hex form of dense
+        attributes: each element is stored in little-endian order on the
+        smallest number of bytes that holds its bitwidth.
+        Return None if the element type has no raw encoding.
+        """
+        element_type = self.type.element_type
+        size = _get_raw_element_size(element_type)
+        if size is None:
+            return None
+        data = self.data.data
+        if isinstance(element_type, AnyFloat):
+            typecode = {2: "e", 4: "f", 8: "d"}[size]
+            return struct.pack(f"<{len(data)}{typecode}", *data)
+        width = element_type.width.data if isinstance(element_type, IntegerType) else 64
+        if width == 64 and isinstance(data, memoryview):
+            # The buffer already holds the elements on 64 bits.
+            buffer = array(data.format, data.tobytes())
+            if sys.byteorder == "big":
+                buffer.byteswap()
+            return buffer.tobytes()
+        mask = (1 << width) - 1
+        return b"".join((int(value) & mask).to_bytes(size, "little") for value in data)
+
+    @staticmethod
+    def from_raw_data(
+        type: RankedVectorOrTensorOf[AnyFloat | IntegerType | IndexType],
+        raw_data: bytes,
+    ) -> DenseIntOrFPElementsAttr:
+        """
+        Create a dense attribute from elements in the raw encoding used by the
+        hex form of dense attributes. If the data holds a single element, it is
+        used for all elements of the type.
+        """
+        element_type = type.element_type
+        size = _get_raw_element_size(element_type)
+        if size is None:
+            raise ValueError(f"Unsupported element type {element_type} for raw data")
+        num_elements = math.prod(type.get_shape())
+        if len(raw_data) == size and num_elements != 1:
+            raw_data = raw_data * num_elements
+        if len(raw_data) != size * num_elements:
+            raise ValueError(
+                f"Expected {size * num_elements} bytes of raw data for type "
+                f"{type}, got {len(raw_data)}"
+            )
+
+        if isinstance(element_type, AnyFloat):
+            typecode = {2: "e", 4: "f", 8: "d"}[size]
+            values = struct.unpack(f"<{num_elements}{typecode}", raw_data)
+            return DenseIntOrFPElementsAttr(
+                [type, DenseElementsData.from_floats(values)]
+            )
+
+        is_signed = not (
+            isinstance(element_type, IntegerType)
+            and element_type.signedness.data == Signedness.UNSIGNED
+        )
+        width = element_type.width.data if isinstance(element_type, IntegerType) else 64
+        if width == 8 * size and size in (1, 2, 4, 8):
+            # The elements can be read directly in a buffer of the same size.
+            typecode = {1: "b", 2: "h", 4: "i", 8: "q"}[size]
+            buffer = array(typecode if is_signed else typecode.upper(), raw_data)
+            if sys.byteorder == "big":
+                buffer.byteswap()
+            return DenseIntOrFPElementsAttr([type, DenseElementsData.from_ints(buffer)])
+
+        mask = (1 << width) - 1
+        ints = [
+            int.from_bytes(raw_data[i : i + size], "little") & mask
+            for i in range(0, len(raw_data), size)
+        ]
+        if is_signed:
+            sign_bit = 1 << (width - 1)
+            ints = [(value ^ sign_bit) - sign_bit for value in ints]
+        return DenseIntOrFPElementsAttr([type, DenseElementsData.from_ints(ints)])
+
     @staticmethod
     def create_dense_index(
         type: RankedVectorOrTensorOf[IndexType],
         data: Sequence[int] | Sequence[IntegerAttr[IndexType]],
     ) -> DenseIntOrFPElementsAttr:
-        if len(data) and isinstance(data[0], int):
-            attr_list = [
-                IntegerAttr.from_index_int_value(d) for d in cast(Sequence[int], data)
-            ]
-        else:
-            attr_list = cast(Sequence[IntegerAttr[IndexType]], data)
-
-        return DenseIntOrFPElementsAttr([type, ArrayAttr(attr_list)])
+        if len(data) and isinstance(data[0], IntegerAttr):
+            data = [d.value.data for d in cast(Sequence[IntegerAttr[IndexType]], data)]
+        values = DenseElementsData.from_ints(cast(Sequence[int], data))
+        return DenseIntOrFPElementsAttr([type, values])
 
     @staticmethod
     def create_dense_int(
         type: RankedVectorOrTensorOf[IntegerType],
         data: Sequence[int] | Sequence[IntegerAttr[IntegerType]],
     ) -> DenseIntOrFPElementsAttr:
-        if len(data) and isinstance(data[0], int):
-            attr_list = [
-                IntegerAttr[IntegerType](d, type.element_type)
-                for d in cast(Sequence[int], data)
+        if len(data) and isinstance(data[0], IntegerAttr):
+            data = [
+                d.value.data for d in cast(Sequence[IntegerAttr[IntegerType]], data)
             ]
-        else:
-            attr_list = cast(Sequence[IntegerAttr[IntegerType]], data)
-
-        return DenseIntOrFPElementsAttr([type, ArrayAttr(attr_list)])
+        values = DenseElementsData.from_ints(cast(Sequence[int], data))
+        return DenseIntOrFPElementsAttr([type, values])
 
     @staticmethod
     def create_dense_float(
         type: RankedVectorOrTensorOf[AnyFloat],
         data: Sequence[int | float] | Sequence[AnyFloatAttr],
     ) -> DenseIntOrFPElementsAttr:
-        if len(data) and isinstance(data[0], int | float):
-            attr_list = [
-                FloatAttr(float(d), type.element_type)
-                for d in cast(Sequence[int | float], data)
-            ]
-        else:
-            attr_list = cast(Sequence[AnyFloatAttr], data)
-
-        return DenseIntOrFPElementsAttr([type, ArrayAttr(attr_list)])
+        if len(data) and isinstance(data[0], FloatAttr):
+            data = [d.value.data for d in cast(Sequence[AnyFloatAttr], data)]
+        values = DenseElementsData.from_floats(cast(Sequence[int | float], data))
+        return DenseIntOrFPElementsAttr([type, values])
 
     @overload
     @staticmethod
@@ -945,45 +1182,37 @@ class DenseArrayBase(ParametrizedAttribute):
     name = "array"
 
     elt_type: ParameterDef[IntegerType | AnyFloat]
-    data: ParameterDef[ArrayAttr[IntAttr] | ArrayAttr[FloatData]]
+    data: ParameterDef[DenseElementsData]
 
     def verify(self):
         if isinstance(self.elt_type, IntegerType):
-            for d in self.data.data:
-                if isinstance(d, FloatData):
-                    raise VerifyException(
-                        "dense array of integer element type "
-                        "should only contain integers"
-                    )
-        else:
-            for d in self.data.data:
-                if isinstance(d, IntAttr):
-                    raise VerifyException(
-                        "dense array of float element type "
-                        "should only contain floats"
-                    )
+            if self.data.is_float:
+                raise VerifyException(
+                    "dense array of integer element type "
+                    "should only contain integers"
+                )
+        elif not self.data.is_float:
+            raise VerifyException(
+                "dense array of float element type " "should only contain floats"
+            )
 
     @staticmethod
     def create_dense_int_or_index(
         typ: IntegerType | IndexType, data: Sequence[int] | Sequence[IntAttr]
     ) -> DenseArrayBase:
-        if len(data) and isinstance(data[0], int):
-            attr_list = [IntAttr(d) for d in cast(Sequence[int], data)]
-        else:
-            attr_list = cast(Sequence[IntAttr], data)
-
-        return DenseArrayBase([typ, ArrayAttr(attr_list)])
+        if len(data) and isinstance(data[0], IntAttr):
+            data = [d.data for d in cast(Sequence[IntAttr], data)]
+        values = DenseElementsData.from_ints(cast(Sequence[int], data))
+        return DenseArrayBase([typ, values])
 
     @staticmethod
     def create_dense_float(
         typ: AnyFloat, data: Sequence[int | float] | Sequence[FloatData]
     ) -> DenseArrayBase:
-        if len(data) and isinstance(data[0], int | float):
-            attr_list = [FloatData(float(d)) for d in cast(Sequence[int | float], data)]
-        else:
-            attr_list = cast(Sequence[FloatData], data)
-
-        return DenseArrayBase([typ, ArrayAttr(attr_list)])
+        if len(data) and isinstance(data[0], FloatData):
+            data = [d.data for d in cast(Sequence[FloatData], data)]
+        values = DenseElementsData.from_floats(cast(Sequence[int | float], data))
+        return DenseArrayBase([typ, values])
 
     @overload
     @staticmethod
@@ -1025,7 +1254,7 @@ class DenseArrayBase(ParametrizedAttribute):
         e.g. given a dense<i8: 99999999, 255, 256>, as_tuple()
         would return 1234567, 255, 256 and not 135, 255, 0 (mod 256)
         """
-        return tuple(x.data for x in self.data.data)
+        return tuple(self.data.data)
 
 
 @irdl_attr_definition
@@ -1236,6 +1465,8 @@ class ModuleOp(IRDLOperation):
 
     body: SingleBlockRegion
 
+    traits = frozenset([IsolatedFromAbove(), SymbolTableOp(), HasGraphRegions()])
+
     def __init__(self, ops: List[Operation] | Region):
         if isinstance(ops, Region):
             region = ops
@@ -1247,6 +1478,121 @@ class ModuleOp(IRDLOperation):
     def ops(self) -> BlockOps:
         return self.body.ops
 
+    def verify(
+        self,
+        verify_nested_ops: bool = True,
+        modified_ops: ModifiedOperations | None = None,
+        jobs: int = 1,
+    ) -> None:
+        """
+        Verify the module, see `Operation.verify`.
+        With more than one job, the top-level operations are verified in parallel
+        in `jobs` processes. If several of them are invalid, the exception of the
+        first one is raised, with the errors of the others appended to its
+        message.
+        """
+        if (
+            jobs > 1
+            and verify_nested_ops
+            and modified_ops is None
+            and self._verify_in_parallel(jobs)
+        ):
+            return
+        super().verify(verify_nested_ops, modified_ops)
+
+    def _verify_in_parallel(self, jobs: int) -> bool:
+        """
+        Verify the top-level operations in `jobs` forked processes, then the
+        module itself. Return False if processes cannot be forked, in which case
+        the module should be verified sequentially.
+        """
+        if "fork" not in get_all_start_methods():
+            return False
+        block = self.body.block
+        ops = list(block.ops)
+        if len(ops) < 2:
+            return False
+        for op in ops:
+            if op.parent is not block:
+                raise Exception(
+                    "Parent pointer of operation does not refer to containing region"
+                )
+
+        # Split the operations into a few chunks per job, which are interleaved
+        # between the jobs to balance the load.
+        chunk_size = max(len(ops) // (jobs * 4), 1)
+        chunk_starts = range(0, len(ops), chunk_size)
+        jobs = min(jobs, len(chunk_starts))
+
+        def verify_chunks(job: int, connection: Connection) -> None:
+            # The operations are inherited from the parent process by the fork,
+            # and only the errors are sent back.
+            errors: list[tuple[int, str]] = []
+            for start in chunk_starts[job::jobs]:
+                errors += _verify_ops(ops, start, min(start + chunk_size, len(ops)))
+            connection.send(errors)
+            connection.close()
+
+        context = get_context("fork")
+        processes: list[BaseProcess] = []
+        receivers: list[Connection] = []
+        try:
+            for job in range(jobs):
+                receiver, sender = context.Pipe(duplex=False)
+                process = context.Process(target=verify_chunks, args=(job, sender))
+                process.start()
+                sender.close()
+                processes.append(process)
+                receivers.append(receiver)
+            job_errors: list[list[tuple[int, str]]] = [
+                receiver.recv() for receiver in receivers
+            ]
+        except (OSError, EOFError):
+            # A process could not be forked, or died before sending its errors.
+            return False
+        finally:
+            for process in processes:
+                process.join()
+            for receiver in receivers:
+                receiver.close()
+        errors = sorted(error for errors in job_errors for error in errors)
+
+        if errors:
+            # Verify the first invalid operation again to raise its exception.
+            first_index, first_message = errors[0]
+            try:
+                ops[first_index].verify()
+            except Exception as e:
+                if len(errors) == 1:
+                    raise
+                others = "\n".join(
+                    f"Top-level operation #{index} is invalid: {message}"
+                    for index, message in errors[1:]
+                )
+                if e.args and isinstance(e.args[0], str):
+                    e.args = (f"{e.args[0]}\n\n{others}", *e.args[1:])
+                    raise
+                raise VerifyException(f"{e}\n\n{others}") from e
+            raise VerifyException(first_message)
+
+        super().verify(verify_nested_ops=False)
+        return True
+
+
+def _verify_ops(ops: list[Operation], start: int, end: int) -> list[tuple[int, str]]:
+    """
+    Verify the operations between the `start` and `end` indices, in a worker
+    process.
+    Return the index and error message of the invalid operations.
+    """
+    errors: list[tuple[int, str]] = []
+    for index, op in enumerate(ops[start:end], start):
+        try:
+            op.verify()
+        except Exception as e:
+            errors.append((index, str(e)))
+    return errors
+
 
 # FloatXXType shortcuts
 bf16 = BFloat16Type()
@@ -1273,6 +1619,7 @@ Builtin = Dialect(
         ArrayAttr,
         DictionaryAttr,
         DenseIntOrFPElementsAttr,
+        DenseElementsData,
         DenseResourceAttr,
         UnitAttr,
         FloatData,
@@ -20,6 +20,7 @@ from xdsl.irdl import (
     OptOpAttr,
     IRDLOperation,
 )
+from xdsl.traits import IsolatedFromAbove, SymbolOpInterface
 from xdsl.utils.exceptions import VerifyException
 
 
@@ -32,6 +33,8 @@ class FuncOp(IRDLOperation):
     function_type: OpAttr[FunctionType]
     sym_visibility: OptOpAttr[StringAttr]
 
+    traits = frozenset([IsolatedFromAbove(), SymbolOpInterface()])
+
     def verify_(self) -> None:
         # TODO: how to verify that there is a terminator?
         entry_block: Block = self.body.blocks[0]
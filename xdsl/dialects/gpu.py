@@ -29,6 +29,7 @@ from xdsl.dialects.builtin import IndexType, StringAttr, SymbolRefAttr, UnitAttr
 from xdsl.dialects import memref
 from xdsl.parser import Parser
 from xdsl.printer import Printer
+from xdsl.traits import IsolatedFromAbove, SymbolOpInterface, SymbolTableOp
 from xdsl.utils.exceptions import VerifyException
 
 
@@ -72,11 +73,13 @@ class _GPUAttr(ParametrizedAttribute, Generic[T]):
             "<",
             f"Expected <. gpu attributes currently have the #gpu<name value> syntax.",
         )
-        ntok = parser.tokenizer.next_token()
+        ntok = parser.expect(
+            parser.try_parse_bare_id, "Unexpected token. Expected dim or all_reduce_op"
+        )
 
         if ntok.text == "dim":
             attrtype = _DimensionAttr
-            vtok = parser.tokenizer.next_token()
+            vtok = parser.expect(parser.try_parse_bare_id, "Expected a gpu dim")
             if vtok.text not in ["x", "y", "z"]:
                 parser.raise_error(
                     f"Unexpected dim {vtok.text}. A gpu dim can only be x, y, or z",
@@ -85,7 +88,9 @@ class _GPUAttr(ParametrizedAttribute, Generic[T]):
 
         elif ntok.text == "all_reduce_op":
             attrtype = _AllReduceOperationAttr
-            vtok = parser.tokenizer.next_token()
+            vtok = parser.expect(
+                parser.try_parse_bare_id, "Expected a gpu all_reduce_op"
+            )
             if vtok.text not in ["add", "and", "max", "min", "mul", "or", "xor"]:
                 parser.raise_error(
                     f"Unexpected op {vtok.text}. A gpu all_reduce_op can only be add, "
@@ -338,6 +343,8 @@ class ModuleOp(IRDLOperation):
     body: SingleBlockRegion
     sym_name: OpAttr[StringAttr]
 
+    traits = frozenset([IsolatedFromAbove(), SymbolOpInterface(), SymbolTableOp()])
+
     @staticmethod
     def get(name: SymbolRefAttr, ops: Sequence[Operation]) -> ModuleOp:
         op = ModuleOp.build(attributes={"sym_name": name}, regions=[ops])
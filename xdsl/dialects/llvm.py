@@ -39,6 +39,7 @@ from xdsl.irdl import (
     IRDLOperation,
 )
 
+from xdsl.traits import Pure, SymbolOpInterface
 from xdsl.utils.exceptions import VerifyException
 
 if TYPE_CHECKING:
@@ -107,16 +108,14 @@ class LLVMPointerType(ParametrizedAttribute, TypeAttribute):
 
     @staticmethod
     def parse_parameters(parser: Parser) -> list[Attribute]:
-        if not parser.tokenizer.starts_with("<"):
+        if parser.parse_optional_punctuation("<") is None:
             return [NoneAttr(), NoneAttr()]
-        parser.parse_characters("<", "llvm.ptr parameters expected")
         type = parser.try_parse_type()
         if type is None:
             parser.raise_error("Expected first parameter of llvm.ptr to be a type!")
-        if not parser.tokenizer.starts_with(","):
+        if parser.parse_optional_punctuation(",") is None:
             parser.parse_characters(">", "End of llvm.ptr parameters expected!")
             return [type, NoneAttr()]
-        parser.parse_characters(",", "llvm.ptr args must be separated by `,`")
         addr_space = parser.parse_integer()
         parser.parse_characters(">", "End of llvm.ptr parameters expected!")
         return [type, IntegerAttr.from_params(addr_space, IndexType())]
@@ -149,16 +148,12 @@ class LLVMArrayType(ParametrizedAttribute, TypeAttribute):
 
     @staticmethod
     def parse_parameters(parser: Parser) -> list[Attribute]:
-        if not parser.tokenizer.starts_with("<"):
+        if parser.parse_optional_punctuation("<") is None:
             return [NoneAttr(), NoneAttr()]
-        parser.parse_characters("<", "llvm.array parameters expected")
         size = IntAttr(parser.parse_integer())
-        if not parser.tokenizer.starts_with("x"):
+        if parser.parse_optional_shape_delimiter() is None:
             parser.parse_characters(">", "End of llvm.array type expected!")
             return [size, NoneAttr()]
-        parser.parse_characters(
-            "x", "llvm.array size and type must be separated by `x`"
-        )
         type = parser.try_parse_type()
         if type is None:
             parser.raise_error("Expected second parameter of llvm.array to be a type!")
@@ -198,7 +193,9 @@ class LinkageAttr(ParametrizedAttribute):
         if linkage_str is not None:
             linkage_str = linkage_str.string_contents
         else:
-            linkage_str = parser.tokenizer.next_token().text
+            linkage_str = parser.expect(
+                parser.try_parse_bare_id, "Expected llvm.linkage parameter!"
+            ).text
         linkage = StringAttr(linkage_str)
         parser.parse_characters(">", "End of llvm.linkage parameter expected!")
         return [linkage]
@@ -343,6 +340,8 @@ class GEPOp(IRDLOperation):
     rawConstantIndices: OpAttr[DenseArrayBase]
     inbounds: OptOpAttr[UnitAttr]
 
+    traits = frozenset([Pure()])
+
     @staticmethod
     def get(
         ptr: SSAValue | Operation,
@@ -614,6 +613,8 @@ class GlobalOp(IRDLOperation):
     # This always needs an empty region as it is in the top level module definition
     body: Region
 
+    traits = frozenset([SymbolOpInterface()])
+
     @staticmethod
     def get(
         global_type: Attribute,
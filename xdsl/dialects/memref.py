@@ -50,6 +50,7 @@ from xdsl.irdl import (
     OpAttr,
     IRDLOperation,
 )
+from xdsl.traits import Pure, SymbolOpInterface
 from xdsl.utils.exceptions import VerifyException
 from xdsl.utils.hints import isa
 
@@ -111,7 +112,6 @@ class MemRefType(Generic[_MemRefTypeElement], ParametrizedAttribute, TypeAttribu
 
     @staticmethod
     def parse_parameters(parser: Parser) -> list[Attribute]:
-        parser._synchronize_lexer_and_tokenizer()  # pyright: ignore[reportPrivateUsage]
         parser.parse_punctuation("<", " in memref attribute")
         shape = parser.parse_attribute()
         parser.parse_punctuation(",", " between shape and element type parameters")
@@ -124,7 +124,6 @@ class MemRefType(Generic[_MemRefTypeElement], ParametrizedAttribute, TypeAttribu
         parser.parse_punctuation(",", " between layout and memory space")
         memory_space = parser.parse_attribute()
         parser.parse_punctuation(">", " at end of memref attribute")
-        parser._synchronize_lexer_and_tokenizer()  # pyright: ignore[reportPrivateUsage]
 
         return [shape, type, layout, memory_space]
 
@@ -334,6 +333,8 @@ class Global(IRDLOperation):
     type: OpAttr[Attribute]
     initial_value: OpAttr[Attribute]
 
+    traits = frozenset([SymbolOpInterface()])
+
     def verify_(self) -> None:
         if not isinstance(self.type, MemRefType):
             raise Exception("Global expects a MemRefType")
@@ -370,6 +371,8 @@ class Dim(IRDLOperation):
 
     result: Annotated[OpResult, IndexType]
 
+    traits = frozenset([Pure()])
+
     @staticmethod
     def from_source_and_index(
         source: SSAValue | Operation, index: SSAValue | Operation
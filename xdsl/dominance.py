@@ -0,0 +1,447 @@
+"""
+Dominance and post-dominance analyses over the control-flow graphs of regions.
+
+A block `a` dominates a block `b` if every path from the entry block of their
+region to `b` goes through `a`. A block `a` post-dominates a block `b` if every
+path from `b` to an exit block of their region goes through `a`. The dominator
+trees are computed with the algorithm of Cooper, Harvey and Kennedy, described in
+"A Simple, Fast Dominance Algorithm".
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterator, Sequence
+
+from xdsl.ir import Block, BlockArgument, Operation, OpResult, Region, SSAValue
+from xdsl.traits import HasGraphRegions
+from xdsl.utils.exceptions import VerifyException
+
+
+def _get_successors(block: Block) -> Sequence[Block]:
+    """Get the successors of a block, as given by its terminator."""
+    terminator = block.last_op
+    if terminator is None:
+        return ()
+    return terminator.successors
+
+
+def _has_ssa_dominance(block: Block) -> bool:
+    """
+    Whether the operations of a block are ordered by dominance, which is not the
+    case in the graph regions of operations with the `HasGraphRegions` trait.
+    """
+    region = block.parent
+    if region is None or region.parent is None:
+        return True
+    return not region.parent.has_trait(HasGraphRegions)
+
+
+def _find_ancestor_op(block: Block, op: Operation) -> Operation | None:
+    """
+    Get the ancestor of `op`, or `op` itself, that is in `block` or in another
+    block of the region of `block`. Returns `None` if there is no such ancestor.
+    """
+    region = block.parent
+    while True:
+        op_block = op.parent
+        if op_block is None:
+            return None
+        if op_block is block or (region is not None and op_block.parent is region):
+            return op
+        parent_region = op_block.parent
+        if parent_region is None or parent_region.parent is None:
+            return None
+        op = parent_region.parent
+
+
+def _find_ancestor_block(block: Block, other: Block) -> Block | None:
+    """
+    Get the ancestor of `other`, or `other` itself, that is `block` or another
+    block of the region of `block`. Returns `None` if there is no such ancestor.
+    """
+    region = block.parent
+    while other is not block and (region is None or other.parent is not region):
+        parent_region = other.parent
+        if parent_region is None or parent_region.parent is None:
+            return None
+        parent_block = parent_region.parent.parent
+        if parent_block is None:
+            return None
+        other = parent_block
+    return other
+
+
+@dataclass(eq=False)
+class DominatorTree:
+    """
+    The dominator tree, or the post-dominator tree, of the blocks of a region.
+    Blocks that are not reachable from the entry block, or that cannot reach an
+    exit block in the case of post-dominance, are not part of the tree.
+    """
+
+    region: Region
+    """The region whose blocks are in the tree."""
+
+    is_post_dominator: bool
+    """Whether this is a post-dominator tree."""
+
+    cfg_version: int
+    """The version of the region control-flow graph the tree was computed for."""
+
+    _idoms: dict[Block, Block | None] = field(
+        default_factory=dict[Block, Block | None], repr=False
+    )
+    """
+    The immediate dominator of each block of the tree. It is `None` for the entry
+    block, or for the exit blocks in the case of post-dominance.
+    """
+
+    _intervals: dict[Block, tuple[int, int]] = field(
+        default_factory=dict[Block, tuple[int, int]], repr=False
+    )
+    """
+    The preorder and postorder indices of each block in the tree. A block
+    dominates another block if its interval contains the interval of the other
+    block.
+    """
+
+    @staticmethod
+    def compute(region: Region, is_post_dominator: bool = False) -> DominatorTree:
+        """Compute the dominator or post-dominator tree of a region."""
+        tree = DominatorTree(region, is_post_dominator, region.cfg_version)
+        blocks = region.blocks
+        if not blocks:
+            return tree
+
+        # The graph is represented with block indices, and has an additional
+        # virtual root node that is the predecessor of the entry block, or of all
+        # exit blocks in the case of post-dominance.
+        num_blocks = len(blocks)
+        root = num_blocks
+        block_indices = {block: index for index, block in enumerate(blocks)}
+        succs: list[list[int]] = [[] for _ in range(num_blocks + 1)]
+        preds: list[list[int]] = [[] for _ in range(num_blocks + 1)]
+        for index, block in enumerate(blocks):
+            for successor in _get_successors(block):
+                successor_index = block_indices.get(successor)
+                if successor_index is None:
+                    continue
+                succs[index].append(successor_index)
+                preds[successor_index].append(index)
+        # Post-dominance is computed as the dominance of the reversed graph.
+        graph_succs: list[list[int]] = preds if is_post_dominator else succs
+        graph_preds: list[list[int]] = succs if is_post_dominator else preds
+        if is_post_dominator:
+            roots = [index for index in range(num_blocks) if not graph_preds[index]]
+        else:
+            roots = [0]
+        graph_succs[root] = roots
+        for index in roots:
+            graph_preds[index].append(root)
+
+        # Compute the postorder of the nodes reachable from the root.
+        postorder_indices = [-1] * (num_blocks + 1)
+        postorder: list[int] = []
+        visited = [False] * (num_blocks + 1)
+        visited[root] = True
+        stack: list[tuple[int, Iterator[int]]] = [(root, iter(graph_succs[root]))]
+        while stack:
+            node, node_succs = stack[-1]
+            for child in node_succs:
+                if not visited[child]:
+                    visited[child] = True
+                    stack.append((child, iter(graph_succs[child])))
+                    break
+            else:
+                stack.pop()
+                postorder_indices[node] = len(postorder)
+                postorder.append(node)
+
+        # Iterate over the nodes in reverse postorder until a fixpoint is reached.
+        idoms = [-1] * (num_blocks + 1)
+        idoms[root] = root
+        reverse_postorder = postorder[-2::-1]
+        changed = True
+        while changed:
+            changed = False
+            for node in reverse_postorder:
+                new_idom = -1
+                for pred in graph_preds[node]:
+                    if idoms[pred] == -1:
+                        continue
+                    if new_idom == -1:
+                        new_idom = pred
+                        continue
+                    # Intersect the dominators of `pred` and `new_idom`.
+                    finger1, finger2 = pred, new_idom
+                    while finger1 != finger2:
+                        while postorder_indices[finger1] < postorder_indices[finger2]:
+                            finger1 = idoms[finger1]
+                        while postorder_indices[finger2] < postorder_indices[finger1]:
+                            finger2 = idoms[finger2]
+                    new_idom = finger1
+                if idoms[node] != new_idom:
+                    idoms[node] = new_idom
+                    changed = True
+
+        # Number the nodes of the tree in preorder and postorder.
+        children: list[list[int]] = [[] for _ in range(num_blocks + 1)]
+        for node in reverse_postorder:
+            children[idoms[node]].append(node)
+        preorder_index = 0
+        postorder_index = 0
+        preorder_indices = [0] * (num_blocks + 1)
+        tree_stack: list[tuple[int, Iterator[int]]] = [(root, iter(children[root]))]
+        while tree_stack:
+            node, node_children = tree_stack[-1]
+            child = next(node_children, None)
+            if child is not None:
+                preorder_index += 1
+                preorder_indices[child] = preorder_index
+                tree_stack.append((child, iter(children[child])))
+                continue
+            tree_stack.pop()
+            if node != root:
+                tree._intervals[blocks[node]] = (
+                    preorder_indices[node],
+                    postorder_index,
+                )
+                idom = idoms[node]
+                tree._idoms[blocks[node]] = None if idom == root else blocks[idom]
+            postorder_index += 1
+
+        return tree
+
+    def is_reachable(self, block: Block) -> bool:
+        """
+        Whether the block is in the tree, that is if it is reachable from the
+        entry block, or if it reaches an exit block in the case of post-dominance.
+        """
+        return block in self._intervals
+
+    def get_immediate_dominator(self, block: Block) -> Block | None:
+        """
+        Get the immediate dominator, or post-dominator, of a block of the tree.
+        Returns `None` for the roots of the tree, and for blocks outside the tree.
+        """
+        return self._idoms.get(block)
+
+    def dominates(self, a: Block, b: Block) -> bool:
+        """
+        Whether the block `a` dominates the block `b`, with both blocks in the
+        region of the tree. Blocks outside of the tree are dominated by all
+        blocks, and only dominate themselves.
+        """
+        if a is b:
+            return True
+        b_interval = self._intervals.get(b)
+        if b_interval is None:
+            return True
+        a_interval = self._intervals.get(a)
+        if a_interval is None:
+            return False
+        return a_interval[0] <= b_interval[0] and b_interval[1] <= a_interval[1]
+
+
+@dataclass(eq=False)
+class _DominanceInfoBase:
+    """
+    Common implementation of dominance and post-dominance queries.
+    The dominator trees are computed lazily for each region, and are cached until
+    the control-flow graph of their region changes.
+    """
+
+    _trees: dict[int, DominatorTree] = field(
+        default_factory=dict[int, DominatorTree], repr=False
+    )
+    """The cached dominator trees, indexed by the id of their region."""
+
+    _IS_POST_DOMINATOR = False
+
+    def get_tree(self, region: Region) -> DominatorTree:
+        """Get the dominator tree of a region, computing it if necessary."""
+        tree = self._trees.get(id(region))
+        if tree is None or tree.cfg_version != region.cfg_version:
+            tree = DominatorTree.compute(region, self._IS_POST_DOMINATOR)
+            self._trees[id(region)] = tree
+        return tree
+
+    def invalidate(self, region: Region | None = None) -> None:
+        """
+        Invalidate the dominator tree of a region, or of all regions.
+        Trees are invalidated automatically when a block is added to or removed
+        from their region, or when the terminator of a block is replaced. This
+        should only be called after the successors of a terminator are modified
+        in place.
+        """
+        if region is None:
+            self._trees.clear()
+        else:
+            self._trees.pop(id(region), None)
+
+    def _block_dominates(self, a: Block, b: Block) -> bool:
+        if a is b:
+            return True
+        b_ancestor = _find_ancestor_block(a, b)
+        if b_ancestor is None:
+            return False
+        if b_ancestor is a:
+            return True
+        assert a.parent is not None
+        return self.get_tree(a.parent).dominates(a, b_ancestor)
+
+    def _properly_dominates_op(
+        self, a: Operation, b: Operation, enclosing_op_ok: bool
+    ) -> bool:
+        """
+        Whether `a` properly dominates `b`. If `enclosing_op_ok` is set, `a`
+        properly dominates the operations nested in its regions.
+        """
+        if a is b:
+            return False
+        a_block = a.parent
+        if a_block is None:
+            return False
+        b_ancestor = _find_ancestor_op(a_block, b)
+        if b_ancestor is None:
+            return False
+        if b_ancestor is a:
+            return enclosing_op_ok
+        if not _has_ssa_dominance(a_block):
+            return True
+        b_block = b_ancestor.parent
+        if b_block is not a_block:
+            assert a_block.parent is not None and b_block is not None
+            return self.get_tree(a_block.parent).dominates(a_block, b_block)
+        if self._IS_POST_DOMINATOR:
+            return b_ancestor.is_before_in_block(a)
+        return a.is_before_in_block(b_ancestor)
+
+
+@dataclass(eq=False)
+class DominanceInfo(_DominanceInfoBase):
+    """
+    Dominance queries between operations, values and blocks, across nested
+    regions. An operation dominates the operations nested in its regions, but its
+    results do not.
+    """
+
+    def dominates(self, a: SSAValue | Operation, b: Operation) -> bool:
+        """
+        Whether `a` dominates `b`. An operation dominates itself, and a value
+        dominates its defining operation.
+        """
+        if isinstance(a, OpResult) and a.op is b:
+            return True
+        return a is b or self.properly_dominates(a, b)
+
+    def properly_dominates(self, a: SSAValue | Operation, b: Operation) -> bool:
+        """
+        Whether `a` dominates `b`, where `a` is not `b` or a result of `b`.
+        A value properly dominates an operation if it can be used by it.
+        """
+        if isinstance(a, Operation):
+            return self._properly_dominates_op(a, b, True)
+        if isinstance(a, OpResult):
+            return self._properly_dominates_op(a.op, b, False)
+        if isinstance(a, BlockArgument):
+            b_block = b.parent
+            return b_block is not None and self._block_dominates(a.block, b_block)
+        return False
+
+    def block_dominates(self, a: Block, b: Block) -> bool:
+        """
+        Whether the block `a` dominates the block `b`, or a block containing `b`
+        in the region of `a`. A block dominates itself.
+        """
+        return self._block_dominates(a, b)
+
+    def block_properly_dominates(self, a: Block, b: Block) -> bool:
+        """Whether the block `a` dominates the block `b`, and is not `b`."""
+        return a is not b and self._block_dominates(a, b)
+
+    def get_immediate_dominator(self, block: Block) -> Block | None:
+        """
+        Get the immediate dominator of a block in its region, or `None` for entry
+        blocks and unreachable blocks.
+        """
+        if block.parent is None:
+            return None
+        return self.get_tree(block.parent).get_immediate_dominator(block)
+
+    def verify_operand_dominance(self, op: Operation) -> None:
+        """
+        Check that the operands of an operation dominate it.
+        Raise a `VerifyException` otherwise. Operations that are not in a block,
+        and values defined outside of a block, are not checked. In graph regions,
+        values can be used before their definition.
+        """
+        block = op.parent
+        if block is None:
+            return
+        block._update_op_order()  # pyright: ignore[reportPrivateUsage]
+        order_index = op._order_index  # pyright: ignore[reportPrivateUsage]
+        for index, operand in enumerate(op.operands):
+            if isinstance(operand, OpResult):
+                owner = operand.op
+                # Fast path for the common case of a value defined in the same block.
+                if owner.parent is block:
+                    if owner._order_index < order_index:  # pyright: ignore
+                        continue
+                    if not _has_ssa_dominance(block):
+                        continue
+                # Values defined outside of a block are not part of the IR, and
+                # are not checked.
+                elif owner.parent is None or self.properly_dominates(operand, op):
+                    continue
+            elif isinstance(operand, BlockArgument):
+                if (
+                    operand.block is block
+                    or operand.block.parent is None
+                    or self.properly_dominates(operand, op)
+                ):
+                    continue
+            else:
+                continue
+            raise VerifyException(
+                f"operand #{index} of '{op.name}' does not dominate this use"
+            )
+
+
+@dataclass(eq=False)
+class PostDominanceInfo(_DominanceInfoBase):
+    """Post-dominance queries between operations and blocks."""
+
+    _IS_POST_DOMINATOR = True
+
+    def post_dominates(self, a: Operation, b: Operation) -> bool:
+        """
+        Whether `a` post-dominates `b`. An operation post-dominates itself and the
+        operations nested in its regions.
+        """
+        return a is b or self._properly_dominates_op(a, b, True)
+
+    def properly_post_dominates(self, a: Operation, b: Operation) -> bool:
+        """Whether `a` post-dominates `b`, and is not `b`."""
+        return self._properly_dominates_op(a, b, True)
+
+    def block_post_dominates(self, a: Block, b: Block) -> bool:
+        """
+        Whether the block `a` post-dominates the block `b`, or a block containing
+        `b` in the region of `a`. A block post-dominates itself.
+        """
+        return self._block_dominates(a, b)
+
+    def block_properly_post_dominates(self, a: Block, b: Block) -> bool:
+        """Whether the block `a` post-dominates the block `b`, and is not `b`."""
+        return a is not b and self._block_dominates(a, b)
+
+    def get_immediate_post_dominator(self, block: Block) -> Block | None:
+        """
+        Get the immediate post-dominator of a block in its region, or `None` for
+        exit blocks and blocks that do not reach an exit block.
+        """
+        if block.parent is None:
+            return None
+        return self.get_tree(block.parent).get_immediate_dominator(block)
@@ -133,19 +133,14 @@ def lower_positional_bound(
 
     Pre-condition: list `writes` is sorted based on operation indices.
     """
-    block = read.parent_block()
-    assert block is not None
-
-    idx = block.get_operation_index(read)
     low_idx = -1
     high_idx = len(writes) - 1
 
     # Binary search to find the right write.
     while low_idx < high_idx:
         mid_idx = (high_idx - low_idx + 1) // 2 + low_idx
-        user_idx = block.get_operation_index(writes[mid_idx])
 
-        if user_idx < idx:
+        if writes[mid_idx].is_before_in_block(read):
             low_idx = mid_idx
         else:
             high_idx = mid_idx - 1
@@ -350,9 +345,7 @@ class Desymrefier:
                     continue
 
                 # sets of reads and writes are disjoint.
-                last_read_idx = block.get_operation_index(reads[-1])
-                first_write_idx = block.get_operation_index(writes[0])
-                if last_read_idx < first_write_idx:
+                if reads[-1].is_before_in_block(writes[0]):
                     for read in reads[1:]:
                         Rewriter.replace_op(read, [], [reads[0].results[0]])
                     for write in writes[:-1]:
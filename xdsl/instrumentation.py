@@ -0,0 +1,283 @@
+"""
+Instrumentation collecting timings and statistics of pass pipelines and of the
+rewrite patterns they apply.
+"""
+
+from __future__ import annotations
+
+import json
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Iterator
+
+from xdsl.dialects.builtin import ModuleOp
+from xdsl.ir import Operation
+from xdsl.passes import ModulePass, PassInstrumentation
+from xdsl.pattern_rewriter import (
+    AnonymousRewritePattern,
+    PatternRewriter,
+    PatternRewriterInstrumentation,
+    RewritePattern,
+)
+
+
+def get_pattern_name(pattern: RewritePattern) -> str:
+    """
+    Get the name used to report statistics of a pattern.
+    This is the name of the pattern class, or the name of the function of an
+    anonymous pattern.
+    """
+    if isinstance(pattern, AnonymousRewritePattern):
+        return pattern.func.__name__
+    return type(pattern).__name__
+
+
+@dataclass
+class PatternStatistics:
+    """Statistics about the applications of a rewrite pattern."""
+
+    name: str
+    """The name of the pattern."""
+
+    num_match_attempts: int = field(default=0)
+    """The number of times the pattern was matched against an operation."""
+
+    num_rewrites: int = field(default=0)
+    """The number of times the pattern rewrote the IR."""
+
+    time: float = field(default=0.0)
+    """
+    The wall time spent in the pattern, in seconds.
+    This includes the time spent in patterns applied by this pattern.
+    """
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "num_match_attempts": self.num_match_attempts,
+            "num_rewrites": self.num_rewrites,
+            "time": self.time,
+        }
+
+
+@dataclass
+class PassStatistics:
+    """Statistics about one application of a pass."""
+
+    name: str
+    """The name of the pass."""
+
+    time: float = field(default=0.0)
+    """The wall time spent in the pass, in seconds."""
+
+    num_ops_before: int | None = field(default=None)
+    """
+    The number of operations in the module before the pass, if they are
+    counted.
+    """
+
+    num_ops_after: int | None = field(default=None)
+    """
+    The number of operations in the module after the pass, if they are
+    counted.
+    """
+
+    patterns: dict[str, PatternStatistics] = field(default_factory=dict)
+    """The statistics of the patterns applied by the pass, indexed by name."""
+
+    @property
+    def num_ops_delta(self) -> int | None:
+        """The number of operations added by the pass, if positive."""
+        if self.num_ops_before is None or self.num_ops_after is None:
+            return None
+        return self.num_ops_after - self.num_ops_before
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "time": self.time,
+            "num_ops_before": self.num_ops_before,
+            "num_ops_after": self.num_ops_after,
+            "num_ops_delta": self.num_ops_delta,
+            "patterns": [pattern.to_json() for pattern in self.patterns.values()],
+        }
+
+
+_REPORT_SEPARATOR = "===" + "-" * 73 + "==="
+
+
+def _report_header(title: str) -> list[str]:
+    return [
+        _REPORT_SEPARATOR,
+        f"... {title} ...".center(len(_REPORT_SEPARATOR)).rstrip(),
+        _REPORT_SEPARATOR,
+    ]
+
+
+@dataclass(eq=False)
+class StatisticsInstrumentation(PassInstrumentation, PatternRewriterInstrumentation):
+    """
+    Collect the wall time and statistics of the passes of a pipeline, and of the
+    patterns applied during these passes.
+    Patterns are only instrumented when this instrumentation is set as the
+    `pattern_rewriter_instrumentation` of the context given to the passes.
+    """
+
+    count_ops: bool = field(default=True)
+    """
+    Count the operations of the module before and after each pass, which
+    walks the whole module twice per pass.
+    """
+
+    phases: dict[str, float] = field(default_factory=dict)
+    """The wall time of the phases that are not passes, such as parsing."""
+
+    passes: list[PassStatistics] = field(default_factory=list)
+    """The statistics of each pass application, in order."""
+
+    patterns: dict[str, PatternStatistics] = field(default_factory=dict)
+    """The statistics of the patterns applied outside of a pass."""
+
+    _num_phases_before_passes: int | None = field(default=None, init=False)
+    """The number of phases started before the first pass, to order reports."""
+
+    _current_pass: PassStatistics | None = field(default=None, init=False)
+    _pass_start: float = field(default=0.0, init=False)
+    _pattern_starts: list[float] = field(default_factory=list, init=False)
+
+    @contextmanager
+    def time_phase(self, name: str) -> Iterator[None]:
+        """Accumulate the wall time spent in this context in a named phase."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + perf_counter() - start
+
+    @property
+    def total_time(self) -> float:
+        """The total wall time of the phases and passes."""
+        return sum(self.phases.values()) + sum(p.time for p in self.passes)
+
+    def run_before_pass(self, module_pass: ModulePass, op: ModuleOp) -> None:
+        if self._num_phases_before_passes is None:
+            self._num_phases_before_passes = len(self.phases)
+        self._current_pass = PassStatistics(module_pass.name)
+        if self.count_ops:
+            self._current_pass.num_ops_before = _count_ops(op)
+        self._pass_start = perf_counter()
+
+    def run_after_pass(self, module_pass: ModulePass, op: ModuleOp) -> None:
+        time = perf_counter() - self._pass_start
+        assert self._current_pass is not None
+        self._current_pass.time = time
+        if self.count_ops:
+            self._current_pass.num_ops_after = _count_ops(op)
+        self.passes.append(self._current_pass)
+        self._current_pass = None
+
+    def run_before_pattern(self, pattern: RewritePattern, op: Operation) -> None:
+        self._pattern_starts.append(perf_counter())
+
+    def run_after_pattern(
+        self, pattern: RewritePattern, op: Operation, rewriter: PatternRewriter
+    ) -> None:
+        time = perf_counter() - self._pattern_starts.pop()
+        patterns = self.patterns
+        if self._current_pass is not None:
+            patterns = self._current_pass.patterns
+        name = get_pattern_name(pattern)
+        if (statistics := patterns.get(name)) is None:
+            statistics = patterns[name] = PatternStatistics(name)
+        statistics.num_match_attempts += 1
+        statistics.num_rewrites += rewriter.has_done_action
+        statistics.time += time
+
+    def to_json(self) -> dict[str, Any]:
+        """Get the collected timings and statistics as a JSON object."""
+        return {
+            "total_time": self.total_time,
+            "phases": dict(self.phases),
+            "passes": [p.to_json() for p in self.passes],
+            "patterns": [p.to_json() for p in self.patterns.values()],
+        }
+
+    def json_report(self) -> str:
+        """Get the collected timings and statistics as a JSON string."""
+        return json.dumps(self.to_json(), indent=2)
+
+    def timing_report(self) -> str:
+        """
+        Get the wall time of each phase and pass, in the format of MLIR's
+        `-mlir-timing` report.
+        """
+        total_time = self.total_time
+        lines = _report_header("Execution time report")
+        lines.append(f"  Total Execution Time: {total_time:.4f} seconds")
+        lines.append("")
+        lines.append("  ----Wall Time----  ----Name----")
+
+        def add_line(time: float, name: str):
+            percent = 100 * time / total_time if total_time else 0.0
+            lines.append(f"  {time:8.4f} ({percent:5.1f}%)  {name}")
+
+        phases = list(self.phases.items())
+        num_phases_before_passes = self._num_phases_before_passes
+        if num_phases_before_passes is None:
+            num_phases_before_passes = len(phases)
+        for name, time in phases[:num_phases_before_passes]:
+            add_line(time, name)
+        for pass_statistics in self.passes:
+            add_line(pass_statistics.time, pass_statistics.name)
+        for name, time in phases[num_phases_before_passes:]:
+            add_line(time, name)
+        add_line(total_time, "Total")
+        return "\n".join(lines)
+
+    def statistics_report(self) -> str:
+        """
+        Get the operation counts of each pass, and the statistics of the
+        patterns they applied, slowest first.
+        """
+        lines = _report_header("Pass statistics report")
+
+        def add_patterns(patterns: dict[str, PatternStatistics], indent: str):
+            for pattern in sorted(patterns.values(), key=lambda p: -p.time):
+                lines.append(f"{indent}{pattern.name}")
+                lines.append(
+                    f"{indent}  (S) {pattern.num_match_attempts} num-match-attempts"
+                    " - Number of times the pattern was matched"
+                )
+                lines.append(
+                    f"{indent}  (S) {pattern.num_rewrites} num-rewrites"
+                    " - Number of times the pattern rewrote the IR"
+                )
+                lines.append(
+                    f"{indent}  (T) {pattern.time:.4f} wall-time"
+                    " - Seconds spent in the pattern"
+                )
+
+        for pass_statistics in self.passes:
+            lines.append(pass_statistics.name)
+            lines.append(
+                f"  (S) {pass_statistics.num_ops_before} num-ops-before"
+                " - Number of operations before the pass"
+            )
+            lines.append(
+                f"  (S) {pass_statistics.num_ops_after} num-ops-after"
+                " - Number of operations after the pass"
+            )
+            lines.append(
+                f"  (T) {pass_statistics.time:.4f} wall-time"
+                " - Seconds spent in the pass"
+            )
+            add_patterns(pass_statistics.patterns, "  ")
+        if self.patterns:
+            lines.append("<no pass>")
+            add_patterns(self.patterns, "  ")
+        return "\n".join(lines)
+
+
+def _count_ops(op: Operation) -> int:
+    return sum(1 for _ in op.walk())
@@ -1,7 +1,10 @@
 from __future__ import annotations
 import re
+import struct
 
-from abc import ABC, abstractmethod
+from abc import ABC, ABCMeta, abstractmethod
+from array import array
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from io import StringIO
 from itertools import chain
@@ -9,6 +12,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Generic,
+    Hashable,
     Iterable,
     Protocol,
     Sequence,
@@ -25,8 +29,34 @@ if TYPE_CHECKING:
     from xdsl.printer import Printer
     from xdsl.irdl import ParamAttrDef
     from xdsl.utils.lexer import Span
+    from xdsl.dominance import DominanceInfo
+    from xdsl.pattern_rewriter import PatternRewriterInstrumentation
 
 OpT = TypeVar("OpT", bound="Operation")
+AttrT = TypeVar("AttrT", bound="Attribute")
+
+
+def _get_slots_state(obj: object, excluded: Iterable[str] = ()) -> dict[str, Any]:
+    """
+    Get the state of an object with `__slots__` for pickling, as a dictionary
+    mapping the set attributes to their values.
+    """
+    state: dict[str, Any] = {}
+    for cls in type(obj).__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
+            if name not in ("__dict__", "__weakref__") and hasattr(obj, name):
+                state[name] = getattr(obj, name)
+    if hasattr(obj, "__dict__"):
+        state.update(obj.__dict__)
+    for name in excluded:
+        state.pop(name, None)
+    return state
+
+
+def _set_slots_state(obj: object, state: dict[str, Any]) -> None:
+    """Restore the state returned by `_get_slots_state`."""
+    for name, value in state.items():
+        object.__setattr__(obj, name, value)
 
 
 @dataclass
@@ -56,6 +86,51 @@ class MLContext:
     _registeredOps: dict[str, type[Operation]] = field(default_factory=dict)
     _registeredAttrs: dict[str, type[Attribute]] = field(default_factory=dict)
 
+    unique_attributes: bool = field(default=False, kw_only=True)
+    """
+    Unique attributes created through this context, so that structurally
+    equal attributes are represented by a single instance, that is verified
+    only once.
+    Only the attributes created by the parser, by `get_unique_attribute`, or
+    passed to `get_unique_instance` are uniqued. Attributes created by their
+    constructors or by `Attribute.new`, for instance in passes, are not.
+    The uniqued attributes are kept alive until `clear_unique_attributes` is
+    called.
+    """
+
+    pattern_rewriter_instrumentation: PatternRewriterInstrumentation | None = field(
+        default=None, kw_only=True
+    )
+    """
+    The instrumentation called around the rewrite patterns applied by passes
+    using this context.
+    """
+
+    _unique_attrs: dict[Hashable, Attribute] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    """
+    The uniqued attributes, indexed by their structural key. They are kept
+    alive as long as the context, see `clear_unique_attributes`.
+    """
+
+    _unique_attr_keys: dict[int, Hashable] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    """
+    The structural key of each uniqued attribute, indexed by the attribute
+    id. The uniqued attributes are kept alive by `_unique_attrs`, so their
+    ids are never reused.
+    """
+
+    _ops_with_trait: dict[
+        tuple[type[OpTrait], Any], tuple[type[Operation], ...]
+    ] = field(default_factory=dict, init=False, repr=False)
+    """
+    The registered operations implementing a trait, indexed by trait type and
+    parameters. It is cleared whenever an operation is registered.
+    """
+
     def register_dialect(self, dialect: Dialect):
         """Register a dialect. Operation and Attribute names should be unique"""
         for op in dialect.operations:
@@ -69,6 +144,7 @@ class MLContext:
         if op.name in self._registeredOps:
             raise Exception(f"Operation {op.name} has already been registered")
         self._registeredOps[op.name] = op
+        self._ops_with_trait.clear()
 
     def register_attr(self, attr: type[Attribute]) -> None:
         """Register an attribute definition. Attribute names should be unique."""
@@ -76,6 +152,26 @@ class MLContext:
             raise Exception(f"Attribute {attr.name} has already been registered")
         self._registeredAttrs[attr.name] = attr
 
+    def get_ops_with_trait(
+        self, trait: type[OpTrait], parameters: Any = None
+    ) -> tuple[type[Operation], ...]:
+        """
+        Get the registered operations implementing a trait with the given
+        parameters, in registration order.
+        The result is computed once per trait, until another operation is
+        registered.
+        """
+        key = (trait, parameters)
+        ops = self._ops_with_trait.get(key)
+        if ops is None:
+            ops = tuple(
+                op
+                for op in self._registeredOps.values()
+                if op.has_trait(trait, parameters)
+            )
+            self._ops_with_trait[key] = ops
+        return ops
+
     def get_optional_op(
         self, name: str, allow_unregistered: bool = False
     ) -> type[Operation] | None:
@@ -151,10 +247,169 @@ class MLContext:
             return attr_type
         raise Exception(f"Attribute {name} is not registered")
 
+    def get_unique_attribute(self, attr_type: type[AttrT], params: Any) -> AttrT:
+        """
+        Create an attribute given its parameters, using its `new` method.
+        If attributes are uniqued, return the existing instance of a
+        structurally equal attribute instead, without creating or verifying
+        a new one.
+        """
+        if not self.unique_attributes:
+            return attr_type.new(params)  # type: ignore
+        try:
+            key = (attr_type, self._get_parameters_key(params))
+            unique_attr = self._unique_attrs.get(key)
+        except TypeError:
+            # Parameters that cannot be hashed are not uniqued.
+            return attr_type.new(params)  # type: ignore
+        if unique_attr is not None:
+            # Keys start with the attribute type.
+            return cast(AttrT, unique_attr)
+        attr = cast(AttrT, attr_type.new(params))  # type: ignore
+        self._unique_attrs[key] = attr
+        self._unique_attr_keys[id(attr)] = key
+        return attr
 
-@dataclass(frozen=True)
+    def clear_unique_attributes(self) -> None:
+        """
+        Forget the uniqued attributes, which are otherwise kept alive as long
+        as the context. This should be called when a context is reused for
+        unrelated inputs, once the IR of the previous ones is discarded.
+        Attributes created afterwards are not uniqued with the previous ones.
+        """
+        self._unique_attrs.clear()
+        self._unique_attr_keys.clear()
+
+    def get_unique_instance(self, attr: AttrT) -> AttrT:
+        """
+        Get the unique instance of a structurally equal attribute, registering
+        the given attribute as unique instance if there is none.
+        Return the attribute itself if attributes are not uniqued.
+        """
+        if not self.unique_attributes or id(attr) in self._unique_attr_keys:
+            return attr
+        try:
+            key = self._get_attribute_key(attr)
+            if (unique_attr := self._unique_attrs.get(key)) is not None:
+                return cast(AttrT, unique_attr)
+        except TypeError:
+            # Parameters that cannot be hashed are not uniqued.
+            return attr
+        self._unique_attrs[key] = attr
+        self._unique_attr_keys[id(attr)] = key
+        return attr
+
+    def get_unique_nested_instance(self, attr: AttrT) -> AttrT:
+        """
+        Get the unique instance of a structurally equal attribute, like
+        `get_unique_instance`, but also unique the attributes nested in its
+        parameters. This is used for attributes that were not created through
+        this context, such as attributes created by their constructors, or
+        received from another process.
+        """
+        if not self.unique_attributes or id(attr) in self._unique_attr_keys:
+            return attr
+        try:
+            key = self._get_attribute_key(attr)
+            if (unique_attr := self._unique_attrs.get(key)) is not None:
+                return cast(AttrT, unique_attr)
+        except TypeError:
+            # Parameters that cannot be hashed are not uniqued.
+            return attr
+        if isinstance(attr, ParametrizedAttribute):
+            params = self._get_unique_parameters(attr.parameters)
+            if params is not attr.parameters:
+                attr = type(attr).new(params)
+        elif isinstance(attr, Data):
+            data = self._get_unique_parameters(cast(Any, attr.data))
+            if data is not attr.data:
+                attr = type(attr).new(data)
+        self._unique_attrs[key] = attr
+        self._unique_attr_keys[id(attr)] = key
+        return attr
+
+    def _get_unique_parameters(self, params: Any) -> Any:
+        """
+        Unique the attributes nested in attribute parameters. Return the
+        parameters themselves if they are already uniqued.
+        """
+        if isinstance(params, Attribute):
+            return self.get_unique_nested_instance(params)
+        if isinstance(params, (list, tuple)):
+            unique_params = [self._get_unique_parameters(param) for param in params]
+            if all(new is old for new, old in zip(unique_params, params)):
+                return params
+            return type(params)(unique_params)
+        if isinstance(params, dict):
+            unique_dict = {
+                name: self._get_unique_parameters(param)
+                for name, param in params.items()  # pyright: ignore
+            }
+            if all(unique_dict[name] is param for name, param in params.items()):
+                return params
+            return unique_dict
+        return params
+
+    def _get_attribute_key(self, attr: Attribute) -> Hashable:
+        """
+        Get a hashable key of an attribute, such that two attributes have equal
+        keys if and only if they are structurally equal.
+        """
+        if (key := self._unique_attr_keys.get(id(attr))) is not None:
+            return key
+        if isinstance(attr, ParametrizedAttribute):
+            return (type(attr), self._get_parameters_key(attr.parameters))
+        if isinstance(attr, Data):
+            return (type(attr), self._get_parameters_key(cast(Any, attr.data)))
+        raise TypeError(f"Cannot unique attribute {attr}")
+
+    def _get_parameters_key(self, params: Any) -> Hashable:
+        """
+        Get a hashable key of attribute parameters.
+        Raise a `TypeError` if the parameters cannot be hashed.
+        """
+        # Dispatch on the exact type first, as `isinstance` checks on abstract
+        # classes are slow.
+        params_type = type(params)
+        if params_type is list or params_type is tuple:
+            return (
+                params_type,
+                tuple([self._get_parameters_key(param) for param in params]),
+            )
+        if params_type is int or params_type is str or params_type is bool:
+            # Distinguish values of different types that compare equal, such as
+            # `1`, `1.0`, and `True`.
+            return (params_type, params)
+        if (key := self._unique_attr_keys.get(id(params))) is not None:
+            return key
+        if isinstance(params, Attribute):
+            return self._get_attribute_key(params)
+        if isinstance(params, dict):
+            return (
+                dict,
+                tuple(
+                    (name, self._get_parameters_key(param))
+                    for name, param in params.items()  # pyright: ignore
+                ),
+            )
+        if isinstance(params, float):
+            # Distinguish 0.0 from -0.0, which compare equal.
+            return (float, params.hex())
+        if isinstance(params, array):
+            return (array, params.typecode, params.tobytes())
+        if isinstance(params, memoryview):
+            return (memoryview, params.format, params.tobytes())
+        hash(params)
+        return (params_type, params)
+
+
+@dataclass(eq=False, slots=True)
 class Use:
-    """The use of a SSA value."""
+    """
+    The use of a SSA value.
+    Each operand of an operation owns a single `Use`, which is linked in the
+    intrusive use-list of the value it currently refers to.
+    """
 
     operation: Operation
     """The operation using the value."""
@@ -162,8 +417,60 @@ class Use:
     index: int
     """The index of the operand using the value in the operation."""
 
+    _prev_use: Use | None = field(default=None, init=False, repr=False)
+    """The previous use in the use-list of the value."""
 
-@dataclass
+    _next_use: Use | None = field(default=None, init=False, repr=False)
+    """The next use in the use-list of the value."""
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, Use)
+            and self.operation is other.operation
+            and self.index == other.index
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self.operation), self.index))
+
+
+class UseList:
+    """
+    A view over the uses of a SSA value.
+    Uses are iterated from the most recently added one. The current use can be
+    removed from the list while iterating.
+    """
+
+    __slots__ = ("_value",)
+
+    _value: SSAValue
+
+    def __init__(self, value: SSAValue):
+        self._value = value
+
+    def __len__(self) -> int:
+        return self._value._num_uses  # pyright: ignore[reportPrivateUsage]
+
+    def __iter__(self) -> Iterator[Use]:
+        use = self._value._first_use  # pyright: ignore[reportPrivateUsage]
+        while use is not None:
+            next_use = use._next_use  # pyright: ignore[reportPrivateUsage]
+            yield use
+            use = next_use
+
+    def __contains__(self, use: object) -> bool:
+        if not isinstance(use, Use):
+            return False
+        # A use is equal to the use owned by the same operand, which is in the
+        # use-list of the value if and only if the operand refers to it.
+        operands = use.operation._operands  # pyright: ignore[reportPrivateUsage]
+        return 0 <= use.index < len(operands) and operands[use.index] is self._value
+
+    def __repr__(self) -> str:
+        return f"UseList({list(self)})"
+
+
+@dataclass(slots=True)
 class SSAValue(ABC):
     """
     A reference to an SSA variable.
@@ -173,8 +480,11 @@ class SSAValue(ABC):
     typ: Attribute
     """Each SSA variable is associated to a type."""
 
-    uses: set[Use] = field(init=False, default_factory=set, repr=False)
-    """All uses of the value."""
+    _first_use: Use | None = field(init=False, default=None, repr=False, compare=False)
+    """The first use of the intrusive use-list of the value."""
+
+    _num_uses: int = field(init=False, default=0, repr=False, compare=False)
+    """The number of uses of the value."""
 
     _name: str | None = field(init=False, default=None)
 
@@ -226,23 +536,47 @@ class SSAValue(ABC):
             f"Expected SSAValue or Operation for SSAValue.get, but got {arg}"
         )
 
+    @property
+    def uses(self) -> UseList:
+        """All uses of the value."""
+        return UseList(self)
+
     def add_use(self, use: Use):
         """Add a new use of the value."""
-        self.uses.add(use)
+        assert (
+            use._prev_use is None  # pyright: ignore[reportPrivateUsage]
+            and use._next_use is None  # pyright: ignore[reportPrivateUsage]
+        ), "use to be added is already in a use list"
+        if (first_use := self._first_use) is not None:
+            first_use._prev_use = use  # pyright: ignore[reportPrivateUsage]
+            use._next_use = first_use  # pyright: ignore[reportPrivateUsage]
+        self._first_use = use
+        self._num_uses += 1
 
     def remove_use(self, use: Use):
         """Remove a use of the value."""
-        assert use in self.uses, "use to be removed was not in use list"
-        self.uses.remove(use)
+        prev_use = use._prev_use  # pyright: ignore[reportPrivateUsage]
+        next_use = use._next_use  # pyright: ignore[reportPrivateUsage]
+        if prev_use is None:
+            assert self._first_use is use, "use to be removed was not in use list"
+            self._first_use = next_use
+        else:
+            prev_use._next_use = next_use  # pyright: ignore[reportPrivateUsage]
+        if next_use is not None:
+            next_use._prev_use = prev_use  # pyright: ignore[reportPrivateUsage]
+        use._prev_use = None  # pyright: ignore[reportPrivateUsage]
+        use._next_use = None  # pyright: ignore[reportPrivateUsage]
+        self._num_uses -= 1
 
     def replace_by(self, value: SSAValue) -> None:
         """Replace the value by another value in all its uses."""
-        for use in self.uses.copy():
-            use.operation.replace_operand(use.index, value)
+        if value is not self:
+            for use in self.uses:
+                use.operation._set_operand(use, value)  # pyright: ignore
         # carry over name if possible
         if value.name_hint is None:
             value.name_hint = self.name_hint
-        assert len(self.uses) == 0, "unexpected error in xdsl"
+        assert value is self or self._num_uses == 0, "unexpected error in xdsl"
 
     def erase(self, safe_erase: bool = True) -> None:
         """
@@ -257,8 +591,26 @@ class SSAValue(ABC):
             )
         self.replace_by(ErasedSSAValue(self.typ, self))
 
+    def _init_uses(self) -> None:
+        """
+        Initialize the use-list of an unpickled value, unless an operation using
+        it was already unpickled.
+        """
+        if not hasattr(self, "_num_uses"):
+            self._first_use = None
+            self._num_uses = 0
 
-@dataclass
+    def __getstate__(self) -> dict[str, Any]:
+        # Uses are not pickled, they are added back when unpickling the
+        # operations using the value.
+        return _get_slots_state(self, ("_first_use", "_num_uses"))
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._init_uses()
+        _set_slots_state(self, state)
+
+
+@dataclass(slots=True)
 class OpResult(SSAValue):
     """A reference to an SSA variable defined by an operation result."""
 
@@ -284,12 +636,12 @@ class OpResult(SSAValue):
     def __eq__(self, other: object) -> bool:
         return self is other
 
-    # This might be problematic, as the superclass is not hashable ...
-    def __hash__(self) -> int:  # type: ignore
-        return id(self)
+    # Values are hashed by identity, with the hash function of `object` rather
+    # than a Python method, as values are the keys of the value mappers.
+    __hash__ = object.__hash__  # type: ignore
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockArgument(SSAValue):
     """A reference to an SSA variable defined by a basic block argument."""
 
@@ -314,11 +666,10 @@ class BlockArgument(SSAValue):
     def __eq__(self, other: object) -> bool:
         return self is other
 
-    def __hash__(self) -> int:  # type: ignore
-        return id(self)
+    __hash__ = object.__hash__  # type: ignore
 
 
-@dataclass
+@dataclass(slots=True)
 class ErasedSSAValue(SSAValue):
     """
     An erased SSA variable.
@@ -416,7 +767,8 @@ class Data(Generic[DataElement], Attribute, ABC):
         attr = cls.__new__(cls)
 
         # Call the __init__ of Data, which will set the parameters field.
-        Data[Any].__init__(attr, params)
+        # `Data[Any].__init__` would be the `__init__` of the generic alias.
+        Data.__init__(attr, params)  # pyright: ignore[reportUnknownMemberType]
         return attr
 
     @staticmethod
@@ -478,7 +830,7 @@ class ParametrizedAttribute(Attribute):
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class IRNode(ABC):
     parent: IRNode | None
 
@@ -513,6 +865,88 @@ class IRNode(ABC):
         ...
 
 
+_STRUCTURAL_HASH_KINDS: dict[type, int] = {}
+"""
+Whether values of a type are parametrized attributes (1), data attributes (2),
+or other values (0), to avoid slow `isinstance` checks on abstract classes.
+"""
+
+
+def _structural_hash(value: Any) -> int:
+    """
+    Hash an attribute or attribute parameter, such that equal values have equal
+    hashes. Attributes are not hashable in general, as the parameters of
+    parametrized attributes are stored in lists. Values that cannot be hashed
+    are only hashed by type.
+    """
+    value_type = type(value)
+    if value_type is list or value_type is tuple:
+        return hash(tuple([_structural_hash(element) for element in value]))
+    if (kind := _STRUCTURAL_HASH_KINDS.get(value_type)) is None:
+        kind = (
+            1
+            if issubclass(value_type, ParametrizedAttribute)
+            else 2
+            if issubclass(value_type, Data)
+            else 0
+        )
+        _STRUCTURAL_HASH_KINDS[value_type] = kind
+    if kind == 1:
+        return hash((value_type, _structural_hash(value.parameters)))
+    if kind == 2:
+        return hash((value_type, _structural_hash(value.data)))
+    if value_type is float:
+        return hash(_FLOAT_STRUCT.pack(value))
+    if value_type is array:
+        return hash((value.typecode, value.tobytes()))
+    if value_type is memoryview:
+        return hash((value.format, value.tobytes()))
+    try:
+        return hash(value)
+    except TypeError:
+        return hash(value_type)
+
+
+_FLOAT_STRUCT = struct.Struct("<d")
+"""The encoding used to compare floats bitwise."""
+
+
+def _structurally_equal(lhs: Any, rhs: Any) -> bool:
+    """
+    Check if two attributes or attribute parameters are equal, such that
+    `_structural_hash` is consistent with it. Unlike `==`, floats are compared
+    bitwise, so that `0.0` and `-0.0` differ, and NaNs are equal to themselves.
+    """
+    if lhs is rhs:
+        return True
+    value_type = type(lhs)
+    if value_type is not type(rhs):
+        return False
+    if value_type is list or value_type is tuple:
+        return len(lhs) == len(rhs) and all(
+            _structurally_equal(lhs_element, rhs_element)
+            for lhs_element, rhs_element in zip(lhs, rhs)
+        )
+    if value_type is float:
+        return _FLOAT_STRUCT.pack(lhs) == _FLOAT_STRUCT.pack(rhs)
+    if value_type is array:
+        return lhs.typecode == rhs.typecode and lhs.tobytes() == rhs.tobytes()
+    if value_type is memoryview:
+        return lhs.format == rhs.format and lhs.tobytes() == rhs.tobytes()
+    if value_type is dict:
+        return lhs.keys() == rhs.keys() and all(
+            _structurally_equal(value, rhs[name]) for name, value in lhs.items()
+        )
+    if (kind := _STRUCTURAL_HASH_KINDS.get(value_type)) is None:
+        _structural_hash(lhs)
+        kind = _STRUCTURAL_HASH_KINDS[value_type]
+    if kind == 1:
+        return _structurally_equal(lhs.parameters, rhs.parameters)
+    if kind == 2:
+        return _structurally_equal(lhs.data, rhs.data)
+    return lhs == rhs
+
+
 @dataclass(frozen=True)
 class OpTrait:
     """
@@ -534,30 +968,156 @@ class OpTrait:
 OpTraitInvT = TypeVar("OpTraitInvT", bound=OpTrait)
 
 
-@dataclass
-class Operation(IRNode):
+@dataclass(frozen=True)
+class _TraitLookup:
+    """
+    Lookup tables of the traits of an operation definition, so that checking
+    for a trait does not scan all the traits of the operation.
+    Each trait is indexed by all the trait classes it is an instance of.
+    """
+
+    traits: frozenset[OpTrait]
+    """The traits the tables were computed from."""
+
+    by_key: dict[tuple[type[OpTrait], Any], OpTrait]
+    """The traits indexed by trait class and parameters."""
+
+    by_type: dict[type[OpTrait], tuple[OpTrait, ...]]
+    """The traits indexed by trait class."""
+
+    @staticmethod
+    def compute(traits: frozenset[OpTrait]) -> _TraitLookup:
+        by_key: dict[tuple[type[OpTrait], Any], OpTrait] = {}
+        by_type: dict[type[OpTrait], list[OpTrait]] = {}
+        for trait in traits:
+            for trait_type in type(trait).__mro__:
+                if not issubclass(trait_type, OpTrait):
+                    continue
+                by_type.setdefault(trait_type, []).append(trait)
+                by_key.setdefault((trait_type, trait.parameters), trait)
+        return _TraitLookup(
+            traits, by_key, {key: tuple(value) for key, value in by_type.items()}
+        )
+
+
+class _OperationMeta(ABCMeta):
+    """
+    Metaclass of operations.
+    Operation subclasses get an empty `__slots__` by default, so operations do
+    not carry a per-instance `__dict__`. Subclasses storing additional instance
+    attributes should declare them in `__slots__`.
+    """
+
+    def __new__(
+        mcs,
+        name: str,
+        bases: tuple[type, ...],
+        namespace: dict[str, Any],
+        **kwargs: Any,
+    ):
+        if any(isinstance(base, _OperationMeta) for base in bases):
+            namespace.setdefault("__slots__", ())
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
+@dataclass(eq=False)
+class ModifiedOperations:
+    """
+    The operations created or modified while recording, see
+    `record_modified_operations`. It is used to only re-verify the operations
+    that changed, see `Operation.verify`.
+    Operations are recorded when they are inserted in a block, when their
+    operands, regions, or block arguments change, and when an in-place
+    modification is reported with `notify_operation_modified`, as done by the
+    rewriters. In-place modifications of attributes, result types or successors
+    that are not reported are not recorded.
+    """
+
+    operations: dict[Operation, None] = field(default_factory=dict)
+    """The recorded operations, in recording order."""
+
+    def add(self, op: Operation) -> None:
+        """Record an operation."""
+        self.operations[op] = None
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+    def __iter__(self) -> Iterator[Operation]:
+        return iter(self.operations)
+
+    def __contains__(self, op: Operation) -> bool:
+        return op in self.operations
+
+
+_active_modified_operations: list[ModifiedOperations] = []
+
+
+@contextmanager
+def record_modified_operations(
+    modified_ops: ModifiedOperations | None = None,
+) -> Iterator[ModifiedOperations]:
+    """
+    Record the operations created or modified in this context in
+    `modified_ops`, or in a new record if none is given.
+    """
+    if modified_ops is None:
+        modified_ops = ModifiedOperations()
+    _active_modified_operations.append(modified_ops)
+    try:
+        yield modified_ops
+    finally:
+        _active_modified_operations.remove(modified_ops)
+
+
+def notify_operation_modified(op: Operation) -> None:
+    """
+    Record an operation in the active `ModifiedOperations` records.
+    This should be called after modifying an operation in place outside of a
+    rewriter.
+    """
+    for modified_ops in _active_modified_operations:
+        modified_ops.add(op)
+
+
+@dataclass(slots=True)
+class Operation(IRNode, metaclass=_OperationMeta):
     """A generic operation. Operation definitions inherit this class."""
 
-    name: str = field(default="", init=False)
+    # Not annotated, so that it is not a dataclass field stored in each
+    # operation, while definitions can still declare `name: str = "..."`.
+    name = ""
     """The operation name. Should be a static member of the class"""
 
     _operands: tuple[SSAValue, ...] = field(default_factory=lambda: ())
     """The operation operands."""
 
-    results: list[OpResult] = field(default_factory=list)
-    """The results created by the operation."""
+    _operand_uses: tuple[Use, ...] = field(default_factory=lambda: (), repr=False)
+    """The uses owned by the operands, in the same order as the operands."""
+
+    _results: list[OpResult] | None = field(default=None)
+    """
+    The results created by the operation, or None if the operation has no
+    results and the list was not allocated yet.
+    """
 
-    successors: list[Block] = field(default_factory=list)
+    _successors: list[Block] | None = field(default=None)
     """
-    The basic blocks that the operation may give control to.
-    This list should be empty for non-terminator operations.
+    The basic blocks that the operation may give control to, or None if the
+    operation has no successors and the list was not allocated yet.
     """
 
-    attributes: dict[str, Attribute] = field(default_factory=dict)
-    """The attributes attached to the operation."""
+    _attributes: dict[str, Attribute] | None = field(default=None)
+    """
+    The attributes attached to the operation, or None if the operation has no
+    attributes and the dictionary was not allocated yet.
+    """
 
-    regions: list[Region] = field(default_factory=list)
-    """Regions arguments of the operation."""
+    _regions: list[Region] | None = field(default=None)
+    """
+    Regions arguments of the operation, or None if the operation has no regions
+    and the list was not allocated yet.
+    """
 
     parent: Block | None = field(default=None, repr=False)
     """The block containing this operation."""
@@ -568,11 +1128,24 @@ class Operation(IRNode):
     _prev_op: Operation | None = field(default=None, repr=False)
     """Previous operation in block containing this operation."""
 
-    traits: ClassVar[frozenset[OpTrait]] = field(init=False)
+    _order_index: int = field(default=0, repr=False)
+    """
+    The position of the operation in its parent block, relative to the other
+    operations of the block. Indices are sparse, and are only meaningful while
+    the block order is valid, see `Block.is_op_order_valid`.
+    """
+
+    traits: ClassVar[frozenset[OpTrait]] = frozenset()
     """
     Traits attached to an operation definition.
-    This is a static field, and is made empty by default by PyRDL if not set
-    by the operation definition.
+    This is a static field, and is empty by default if not set by the
+    operation definition.
+    """
+
+    _trait_lookup: ClassVar[_TraitLookup | None] = None
+    """
+    The traits of the operation definition indexed by their types and
+    parameters, see `_get_trait_lookup`.
     """
 
     def parent_op(self) -> Operation | None:
@@ -588,6 +1161,22 @@ class Operation(IRNode):
     def parent_block(self) -> Block | None:
         return self.parent
 
+    def is_before_in_block(self, other: Operation) -> bool:
+        """
+        Return True if this operation is before `other` in their parent block.
+        Both operations should be in the same block.
+        This is done in amortized constant time, using the cached operation order
+        of the block.
+        """
+        block = self.parent
+        if block is None or other.parent is not block:
+            raise ValueError(
+                "Expected both operations to be in the same block to compare "
+                "their positions."
+            )
+        block._update_op_order()  # pyright: ignore[reportPrivateUsage]
+        return self._order_index < other._order_index
+
     @property
     def next_op(self) -> Operation | None:
         """
@@ -634,6 +1223,63 @@ class Operation(IRNode):
         # update self
         self._prev_op = new_op
 
+    @property
+    def attributes(self) -> dict[str, Attribute]:
+        """
+        The attributes attached to the operation.
+        The dictionary is allocated on first access.
+        """
+        if (attributes := self._attributes) is None:
+            attributes = self._attributes = {}
+        return attributes
+
+    @attributes.setter
+    def attributes(self, attributes: dict[str, Attribute]) -> None:
+        self._attributes = attributes
+
+    @property
+    def results(self) -> list[OpResult]:
+        """
+        The results created by the operation.
+        The list is allocated on first access for operations without results.
+        """
+        if (results := self._results) is None:
+            results = self._results = []
+        return results
+
+    @results.setter
+    def results(self, results: list[OpResult]) -> None:
+        self._results = results
+
+    @property
+    def successors(self) -> list[Block]:
+        """
+        The basic blocks that the operation may give control to.
+        This list should be empty for non-terminator operations. It is allocated
+        on first access for operations without successors.
+        """
+        if (successors := self._successors) is None:
+            successors = self._successors = []
+        return successors
+
+    @successors.setter
+    def successors(self, successors: list[Block]) -> None:
+        self._successors = successors
+
+    @property
+    def regions(self) -> list[Region]:
+        """
+        Regions arguments of the operation.
+        The list is allocated on first access for operations without regions.
+        """
+        if (regions := self._regions) is None:
+            regions = self._regions = []
+        return regions
+
+    @regions.setter
+    def regions(self, regions: list[Region]) -> None:
+        self._regions = regions
+
     @property
     def operands(self) -> tuple[SSAValue, ...]:
         return self._operands
@@ -642,16 +1288,56 @@ class Operation(IRNode):
     def operands(self, new: list[SSAValue] | tuple[SSAValue, ...]):
         if isinstance(new, list):
             new = tuple(new)
-        for idx, operand in enumerate(self._operands):
-            operand.remove_use(Use(self, idx))
-        for idx, operand in enumerate(new):
-            operand.add_use(Use(self, idx))
+        old, uses = self._operands, self._operand_uses
+        num_kept = min(len(old), len(new))
+        # Operand slots that are kept reuse their `Use`, which only needs to be
+        # moved to another use-list if the operand changes.
+        for idx in range(num_kept):
+            if (old_operand := old[idx]) is not (new_operand := new[idx]):
+                old_operand.remove_use(uses[idx])
+                new_operand.add_use(uses[idx])
+        for idx in range(num_kept, len(old)):
+            old[idx].remove_use(uses[idx])
+        if len(new) != len(uses):
+            new_uses = [Use(self, idx) for idx in range(num_kept, len(new))]
+            for operand, use in zip(new[num_kept:], new_uses):
+                operand.add_use(use)
+            self._operand_uses = uses[:num_kept] + tuple(new_uses)
         self._operands = new
+        if _active_modified_operations:
+            notify_operation_modified(self)
+
+    def _set_operand(self, use: Use, new_operand: SSAValue) -> None:
+        """Set the operand owning `use` to another value."""
+        idx = use.index
+        operands = self._operands
+        operands[idx].remove_use(use)
+        new_operand.add_use(use)
+        self._operands = operands[:idx] + (new_operand,) + operands[idx + 1 :]
+        if _active_modified_operations:
+            notify_operation_modified(self)
 
     def __post_init__(self):
         assert self.name != ""
         assert isinstance(self.name, str)
 
+    def __getstate__(self) -> dict[str, Any]:
+        # Sibling operations are not pickled with the operation, as following
+        # them recursively would overflow the stack on large blocks.
+        # They are linked back when unpickling the parent block.
+        # Uses are not pickled either, as they are linked to the uses of other
+        # operations. They are added back when unpickling the operation.
+        return _get_slots_state(self, ("_next_op", "_prev_op", "_operand_uses"))
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._next_op = None
+        self._prev_op = None
+        _set_slots_state(self, state)
+        self._operand_uses = tuple(Use(self, idx) for idx in range(len(self._operands)))
+        for operand, use in zip(self._operands, self._operand_uses):
+            operand._init_uses()  # pyright: ignore[reportPrivateUsage]
+            operand.add_use(use)
+
     def __init__(
         self,
         operands: Sequence[SSAValue] | None = None,
@@ -671,16 +1357,24 @@ class Operation(IRNode):
         if regions is None:
             regions = []
 
+        self.parent = None
+        self._next_op = None
+        self._prev_op = None
+        self._order_index = 0
+
         # This is assumed to exist by Operation.operand setter.
         self._operands = tuple()
+        self._operand_uses = tuple()
         self.operands = tuple(operands)
 
-        self.results = [
-            OpResult(typ, self, idx) for (idx, typ) in enumerate(result_types)
-        ]
-        self.attributes = attributes
-        self.successors = list(successors)
-        self.regions = []
+        self._results = (
+            [OpResult(typ, self, idx) for (idx, typ) in enumerate(result_types)]
+            if result_types
+            else None
+        )
+        self._attributes = attributes if attributes else None
+        self._successors = list(successors) if successors else None
+        self._regions = None
         for region in regions:
             self.add_region(region)
 
@@ -715,11 +1409,7 @@ class Operation(IRNode):
         else:
             operand_idx = operand
 
-        self.operands = (
-            list(self._operands[:operand_idx])
-            + [new_operand]
-            + list(self._operands[operand_idx + 1 :])
-        )
+        self._set_operand(self._operand_uses[operand_idx], new_operand)
 
     def add_region(self, region: Region) -> None:
         """Add an unattached region to the operation."""
@@ -729,6 +1419,8 @@ class Operation(IRNode):
             )
         self.regions.append(region)
         region.parent = self
+        if _active_modified_operations:
+            notify_operation_modified(self)
 
     def get_region_index(self, region: Region) -> int:
         """Get the region position in the operation."""
@@ -761,9 +1453,9 @@ class Operation(IRNode):
         This function is called prior to deleting an operation.
         """
         self.parent = None
-        for idx, operand in enumerate(self.operands):
-            operand.remove_use(Use(self, idx))
-        for region in self.regions:
+        for operand, use in zip(self._operands, self._operand_uses):
+            operand.remove_use(use)
+        for region in self._regions or ():
             region.drop_all_references()
 
     def walk(self) -> Iterator[Operation]:
@@ -771,17 +1463,60 @@ class Operation(IRNode):
         Call a function on all operations contained in the operation (including this one)
         """
         yield self
-        for region in self.regions:
+        for region in self._regions or ():
             yield from region.walk()
 
-    def verify(self, verify_nested_ops: bool = True) -> None:
+    def verify(
+        self,
+        verify_nested_ops: bool = True,
+        modified_ops: ModifiedOperations | None = None,
+    ) -> None:
+        """
+        Verify the operation, and its nested operations if `verify_nested_ops` is
+        set. Raise an exception if the IR is invalid.
+        If `modified_ops` is given, the verification is incremental: only the
+        recorded operations contained in this operation, and their ancestors, are
+        verified, without their other nested operations.
+        """
+        from xdsl.dominance import DominanceInfo
+
+        dominance = DominanceInfo()
+        if modified_ops is None:
+            self._verify(verify_nested_ops, dominance)
+            return
+
+        verified_ops: set[Operation] = set()
+        for op in modified_ops:
+            # Collect the ancestors of the operation that are not verified yet,
+            # stopping at this operation.
+            ancestors: list[Operation] = []
+            current: Operation | None = op
+            while (
+                current is not None
+                and current is not self
+                and current not in verified_ops
+            ):
+                ancestors.append(current)
+                current = current.parent_op()
+            if current is None:
+                # The operation is not contained in this operation.
+                continue
+            if current is self and self not in verified_ops:
+                ancestors.append(self)
+            for ancestor in ancestors:
+                verified_ops.add(ancestor)
+                ancestor._verify(False, dominance)
+
+    def _verify(self, verify_nested_ops: bool, dominance: DominanceInfo) -> None:
         for operand in self.operands:
             if isinstance(operand, ErasedSSAValue):
                 raise Exception("Erased SSA value is used by the operation")
 
+        dominance.verify_operand_dominance(self)
+
         if verify_nested_ops:
-            for region in self.regions:
-                region.verify()
+            for region in self._regions or ():
+                region._verify(dominance)  # pyright: ignore[reportPrivateUsage]
 
         # Custom verifier
         self.verify_()
@@ -808,27 +1543,7 @@ class Operation(IRNode):
             value_mapper = {}
         if block_mapper is None:
             block_mapper = {}
-        operands = [
-            (value_mapper[operand] if operand in value_mapper else operand)
-            for operand in self.operands
-        ]
-        result_types = [res.typ for res in self.results]
-        attributes = self.attributes.copy()
-        successors = [
-            (block_mapper[successor] if successor in block_mapper else successor)
-            for successor in self.successors
-        ]
-        regions = [Region() for _ in self.regions]
-        cloned_op = self.create(
-            operands=operands,
-            result_types=result_types,
-            attributes=attributes,
-            successors=successors,
-            regions=regions,
-        )
-        for idx, result in enumerate(cloned_op.results):
-            value_mapper[self.results[idx]] = result
-        return cloned_op
+        return self._clone(value_mapper, block_mapper, False)
 
     def clone(
         self: OpT,
@@ -840,17 +1555,92 @@ class Operation(IRNode):
             value_mapper = {}
         if block_mapper is None:
             block_mapper = {}
-        op = self.clone_without_regions(value_mapper, block_mapper)
-        for idx, region in enumerate(self.regions):
-            region.clone_into(op.regions[idx], 0, value_mapper, block_mapper)
+        return self._clone(value_mapper, block_mapper, True)
+
+    def _clone(
+        self: OpT,
+        value_mapper: dict[SSAValue, SSAValue],
+        block_mapper: dict[Block, Block],
+        clone_regions: bool,
+    ) -> OpT:
+        """
+        Clone an operation, and map its results in `value_mapper`.
+        The fields of the clone are set directly rather than through the
+        generic constructor, as the operands, results, successors and
+        attributes of the operation are already known to be valid.
+        """
+        cls = type(self)
+        op = cls.__new__(cls)
+        op.parent = None
+        op._next_op = None
+        op._prev_op = None
+        op._order_index = 0
+
+        get_value = value_mapper.get
+        operands = tuple([get_value(operand, operand) for operand in self._operands])
+        op._operands = operands
+        if operands:
+            uses = tuple([Use(op, idx) for idx in range(len(operands))])
+            for operand, use in zip(operands, uses):
+                operand.add_use(use)
+            op._operand_uses = uses
+        else:
+            op._operand_uses = ()
+
+        if results := self._results:
+            new_results = [OpResult(result.typ, op, result.index) for result in results]
+            for result, new_result in zip(results, new_results):
+                value_mapper[result] = new_result
+            op._results = new_results
+        else:
+            op._results = None
+
+        op._attributes = self._attributes.copy() if self._attributes else None
+        if successors := self._successors:
+            get_block = block_mapper.get
+            op._successors = [
+                get_block(successor, successor) for successor in successors
+            ]
+        else:
+            op._successors = None
+
+        if regions := self._regions:
+            new_regions: list[Region] = []
+            op._regions = new_regions
+            for region in regions:
+                new_region = Region()
+                new_region.parent = op
+                new_regions.append(new_region)
+                if clone_regions:
+                    region.clone_into(new_region, 0, value_mapper, block_mapper)
+        else:
+            op._regions = None
+
+        op.__post_init__()
         return op
 
+    @classmethod
+    def _get_trait_lookup(cls) -> _TraitLookup:
+        """
+        Get the lookup tables of the traits of the operation definition.
+        They are computed once per definition, and recomputed only if `traits`
+        is replaced.
+        """
+        lookup = cls._trait_lookup
+        if lookup is None or lookup.traits is not cls.traits:
+            lookup = _TraitLookup.compute(cls.traits)
+            cls._trait_lookup = lookup
+        return lookup
+
     @classmethod
     def has_trait(cls, trait: type[OpTrait], parameters: Any = None) -> bool:
         """
         Check if the operation implements a trait with the given parameters.
         """
-        return cls.get_trait(trait, parameters) is not None
+        lookup = cls._trait_lookup
+        if lookup is None or lookup.traits is not cls.traits:
+            lookup = cls._get_trait_lookup()
+        return (trait, parameters) in lookup.by_key
 
     @classmethod
     def get_trait(
@@ -859,17 +1649,37 @@ class Operation(IRNode):
         """
         Return a trait with the given type and parameters, if it exists.
         """
-        for t in cls.traits:
-            if isinstance(t, trait) and t.parameters == parameters:
-                return t
-        return None
+        lookup = cls._trait_lookup
+        if lookup is None or lookup.traits is not cls.traits:
+            lookup = cls._get_trait_lookup()
+        return lookup.by_key.get((trait, parameters))  # type: ignore
 
     @classmethod
     def get_traits_of_type(cls, trait_type: type[OpTraitInvT]) -> list[OpTraitInvT]:
         """
         Get all the traits of the given type satisfied by this operation.
         """
-        return [t for t in cls.traits if isinstance(t, trait_type)]
+        traits = cls._get_trait_lookup().by_type.get(trait_type, ())
+        return list(traits)  # type: ignore
+
+    def fold(self) -> Sequence[Attribute | SSAValue] | None:
+        """
+        Try to compute the results of the operation at compile time, given the
+        values of its operands that are constants.
+        Return None if the operation cannot be folded, or otherwise the value
+        of each result, either as a constant attribute or as an existing SSA
+        value. Folders should not modify the IR.
+        """
+        return None
+
+    @classmethod
+    def materialize_constant(cls, value: Attribute, typ: Attribute) -> Operation | None:
+        """
+        Create a constant operation with a single result of the given type and
+        value, for an attribute returned by `fold`.
+        Return None if the constant cannot be created.
+        """
+        return None
 
     def erase(self, safe_erase: bool = True, drop_references: bool = True) -> None:
         """
@@ -912,7 +1722,7 @@ class Operation(IRNode):
             or len(self.results) != len(other.results)
             or len(self.regions) != len(other.regions)
             or len(self.successors) != len(other.successors)
-            or self.attributes != other.attributes
+            or (self._attributes or {}) != (other._attributes or {})
         ):
             return False
         if self.parent and other.parent and context.get(self.parent) != other.parent:
@@ -938,6 +1748,52 @@ class Operation(IRNode):
 
         return True
 
+    def structural_hash(self) -> int:
+        """
+        Compute a hash of the operation name, operands, attributes, and result
+        types. Operands are hashed by identity, and regions and successors are
+        ignored. Operations that are `is_structurally_identical` have the same
+        hash.
+        """
+        attributes_hash = 0
+        if self._attributes:
+            # Combine the attribute hashes independently of their order.
+            for name, attr in self._attributes.items():
+                attributes_hash ^= hash((name, _structural_hash(attr)))
+        return hash(
+            (
+                self.name,
+                tuple(self.operands),
+                attributes_hash,
+                tuple([_structural_hash(result.typ) for result in self._results or ()]),
+            )
+        )
+
+    def is_structurally_identical(self, other: Operation) -> bool:
+        """
+        Check if two operations have the same name, the same operands, the
+        same attributes, and the same result types. Float parameters of
+        attributes are compared bitwise.
+        Unlike `is_structurally_equivalent`, operands are compared by identity,
+        and regions and successors are ignored.
+        """
+        if self is other:
+            return True
+        if (
+            self.name != other.name
+            or len(self.operands) != len(other.operands)
+            or len(self._results or ()) != len(other._results or ())
+            or not _structurally_equal(self._attributes or {}, other._attributes or {})
+        ):
+            return False
+        return all(
+            operand is other_operand
+            for operand, other_operand in zip(self.operands, other.operands)
+        ) and all(
+            _structurally_equal(result.typ, other_result.typ)
+            for result, other_result in zip(self._results or (), other._results or ())
+        )
+
     def __eq__(self, other: object) -> bool:
         return self is other
 
@@ -998,10 +1854,7 @@ class BlockOps:
         return _BlockOpsIterator(self.first)
 
     def __len__(self):
-        result = 0
-        for _ in self:
-            result += 1
-        return result
+        return self.block._num_ops  # pyright: ignore[reportPrivateUsage]
 
     @property
     def first(self) -> Operation | None:
@@ -1025,7 +1878,7 @@ class BlockOps:
         return self.block.is_empty
 
 
-@dataclass(init=False)
+@dataclass(init=False, slots=True)
 class Block(IRNode):
     """A sequence of operations"""
 
@@ -1037,9 +1890,21 @@ class Block(IRNode):
     _first_op: Operation | None = field(repr=False)
     _last_op: Operation | None = field(repr=False)
 
+    _num_ops: int = field(repr=False)
+    """The number of operations in the block."""
+
+    _is_op_order_valid: bool = field(repr=False)
+    """
+    Whether the `_order_index` of the operations in the block are increasing.
+    The order is recomputed lazily when it is invalidated by an insertion.
+    """
+
     parent: Region | None
     """Parent region containing the block."""
 
+    _ORDER_STRIDE: ClassVar[int] = 5
+    """The distance between the order indices of consecutive operations."""
+
     def __init__(
         self,
         ops: Iterable[Operation] = (),
@@ -1048,13 +1913,14 @@ class Block(IRNode):
         parent: Region | None = None,
         declared_at: Span | None = None,
     ):
-        super().__init__(self)
         self.declared_at = declared_at
         self._args = tuple(
             BlockArgument(typ, self, index) for index, typ in enumerate(arg_types)
         )
         self._first_op = None
         self._last_op = None
+        self._num_ops = 0
+        self._is_op_order_valid = True
         self.parent = parent
 
         self.add_ops(ops)
@@ -1064,6 +1930,26 @@ class Block(IRNode):
         """Returns a multi-pass Iterable of this block's operations."""
         return BlockOps(self)
 
+    def __getstate__(self) -> dict[str, Any]:
+        # Operations are pickled as a list rather than as a linked list.
+        state = _get_slots_state(
+            self, ("_first_op", "_last_op", "_num_ops", "_is_op_order_valid")
+        )
+        state["_ops"] = list(self.ops)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        state = state.copy()
+        ops: list[Operation] = state.pop("_ops")
+        _set_slots_state(self, state)
+        self._first_op = ops[0] if ops else None
+        self._last_op = ops[-1] if ops else None
+        self._num_ops = len(ops)
+        self._is_op_order_valid = False
+        for prev_op, next_op in zip(ops, ops[1:]):
+            prev_op._next_op = next_op  # pyright: ignore[reportPrivateUsage]
+            next_op._prev_op = prev_op  # pyright: ignore[reportPrivateUsage]
+
     def parent_op(self) -> Operation | None:
         return self.parent.parent if self.parent else None
 
@@ -1122,6 +2008,8 @@ class Block(IRNode):
         for arg in self._args[index:]:
             arg.index += 1
         self._args = tuple(chain(self._args[:index], [new_arg], self._args[index:]))
+        if _active_modified_operations and (parent_op := self.parent_op()):
+            notify_operation_modified(parent_op)
         return new_arg
 
     def erase_arg(self, arg: BlockArgument, safe_erase: bool = True) -> None:
@@ -1136,6 +2024,8 @@ class Block(IRNode):
             block_arg.index -= 1
         self._args = tuple(chain(self._args[: arg.index], self._args[arg.index + 1 :]))
         arg.erase(safe_erase=safe_erase)
+        if _active_modified_operations and (parent_op := self.parent_op()):
+            notify_operation_modified(parent_op)
 
     def _attach_op(self, operation: Operation) -> None:
         """Attach an operation to the block, and check that it has no parents."""
@@ -1148,6 +2038,88 @@ class Block(IRNode):
                 "Can't add an operation to a block contained in the operation."
             )
         operation.parent = self
+        if _active_modified_operations:
+            # The users of a moved operation are recorded to check that the
+            # operation still dominates them.
+            notify_operation_modified(operation)
+            for result in operation.results:
+                for use in result.uses:
+                    notify_operation_modified(use.operation)
+
+    def _link_new_ops(self, ops: list[Operation]) -> None:
+        """
+        Link operations in this empty block, in order.
+        This is a fast path for freshly created operations, which are not
+        attached to a block and do not contain this block, so that the checks
+        and the order updates of `add_op` are skipped.
+        """
+        assert self._first_op is None, "Expected an empty block"
+        if not ops:
+            return
+        stride = self._ORDER_STRIDE
+        prev_op: Operation | None = None
+        for index, op in enumerate(ops):
+            op.parent = self
+            op._prev_op = prev_op  # pyright: ignore[reportPrivateUsage]
+            op._order_index = index * stride  # pyright: ignore[reportPrivateUsage]
+            if prev_op is not None:
+                prev_op._next_op = op  # pyright: ignore[reportPrivateUsage]
+            prev_op = op
+        ops[-1]._next_op = None  # pyright: ignore[reportPrivateUsage]
+        self._first_op = ops[0]
+        self._last_op = ops[-1]
+        self._num_ops = len(ops)
+        self._is_op_order_valid = True
+        if self.parent is not None:
+            # The terminator of the block changed.
+            self.parent._cfg_version += 1  # pyright: ignore[reportPrivateUsage]
+
+    def _on_op_linked(self, op: Operation) -> None:
+        """
+        Update the number of operations and the operation order after `op` was
+        linked in the block.
+        The new operation gets an order index between the indices of its
+        neighbors. If there is no such index, the block order is invalidated, and
+        will be recomputed on the next query.
+        """
+        self._num_ops += 1
+        prev_op, next_op = op.prev_op, op.next_op
+        if next_op is None and self.parent is not None:
+            # The terminator of the block changed.
+            self.parent._cfg_version += 1  # pyright: ignore[reportPrivateUsage]
+        if not self._is_op_order_valid:
+            return
+        prev_index = prev_op._order_index if prev_op else None  # pyright: ignore
+        next_index = next_op._order_index if next_op else None  # pyright: ignore
+        if next_index is None:
+            index = 0 if prev_index is None else prev_index + self._ORDER_STRIDE
+        elif prev_index is None:
+            index = next_index - self._ORDER_STRIDE
+        elif next_index - prev_index > 1:
+            index = (prev_index + next_index) // 2
+        else:
+            self._is_op_order_valid = False
+            return
+        op._order_index = index  # pyright: ignore[reportPrivateUsage]
+
+    @property
+    def is_op_order_valid(self) -> bool:
+        """
+        Whether the cached order of the operations is valid. It is invalidated
+        when an operation is inserted between two operations with consecutive
+        order indices.
+        """
+        return self._is_op_order_valid
+
+    def _update_op_order(self) -> None:
+        """Renumber the operations of the block if the order is invalid."""
+        if self._is_op_order_valid:
+            return
+        order_index = 0
+        for op in self.ops:
+            op._order_index = order_index  # pyright: ignore[reportPrivateUsage]
+            order_index += self._ORDER_STRIDE
+        self._is_op_order_valid = True
 
     @property
     def is_empty(self) -> bool:
@@ -1181,6 +2153,7 @@ class Block(IRNode):
         if next_op is None:
             # No `next_op`, means `prev_op` is the last op in the block.
             self._last_op = new_op
+        self._on_op_linked(new_op)
 
     def insert_op_before(self, new_op: Operation, existing_op: Operation) -> None:
         """
@@ -1199,6 +2172,7 @@ class Block(IRNode):
         if prev_op is None:
             # No `prev_op`, means `next_op` is the first op in the block.
             self._first_op = new_op
+        self._on_op_linked(new_op)
 
     def add_op(self, operation: Operation) -> None:
         """
@@ -1209,6 +2183,7 @@ class Block(IRNode):
             self._attach_op(operation)
             self._first_op = operation
             self._last_op = operation
+            self._on_op_linked(operation)
         else:
             self.insert_op_after(operation, self._last_op)
 
@@ -1274,7 +2249,13 @@ class Block(IRNode):
             # reattach linked list if op is last op in this block
             assert self._last_op is op
             self._last_op = prev_op
+            if self.parent is not None:
+                self.parent._cfg_version += 1  # pyright: ignore[reportPrivateUsage]
 
+        # Removing an operation keeps the order of the other operations valid.
+        self._num_ops -= 1
+        if _active_modified_operations and (parent_op := self.parent_op()):
+            notify_operation_modified(parent_op)
         return op
 
     def erase_op(self, op: Operation, safe_erase: bool = True) -> None:
@@ -1291,12 +2272,17 @@ class Block(IRNode):
             yield from op.walk()
 
     def verify(self) -> None:
+        from xdsl.dominance import DominanceInfo
+
+        self._verify(DominanceInfo())
+
+    def _verify(self, dominance: DominanceInfo) -> None:
         for operation in self.ops:
             if operation.parent != self:
                 raise Exception(
                     "Parent pointer of operation does not refer to containing region"
                 )
-            operation.verify()
+            operation._verify(True, dominance)  # pyright: ignore[reportPrivateUsage]
 
     def drop_all_references(self) -> None:
         """
@@ -1354,11 +2340,12 @@ class Block(IRNode):
     def __eq__(self, other: object) -> bool:
         return self is other
 
-    def __hash__(self) -> int:
-        return id(self)
+    # Blocks are hashed by identity, with the hash function of `object` rather
+    # than a Python method, as blocks are the keys of the block mappers.
+    __hash__ = object.__hash__  # type: ignore
 
 
-@dataclass(init=False)
+@dataclass(init=False, slots=True)
 class Region(IRNode):
     """A region contains a CFG of blocks. Regions are contained in operations."""
 
@@ -1368,12 +2355,18 @@ class Region(IRNode):
     parent: Operation | None = field(default=None, repr=False)
     """Operation containing the region."""
 
+    _cfg_version: int = field(default=0, repr=False, compare=False)
+    """
+    A counter incremented when the control-flow graph of the region may have
+    changed, see `cfg_version`.
+    """
+
     def __init__(
         self, blocks: Block | Iterable[Block] = (), parent: Operation | None = None
     ):
-        super().__init__(self)
         self.parent = parent
         self.blocks = []
+        self._cfg_version = 0
         if isinstance(blocks, Block):
             blocks = (blocks,)
         for block in blocks:
@@ -1388,6 +2381,16 @@ class Region(IRNode):
     def parent_region(self) -> Region | None:
         return self.parent.parent.parent if self.parent and self.parent.parent else None
 
+    @property
+    def cfg_version(self) -> int:
+        """
+        The version of the control-flow graph of the region. It changes when a
+        block is added to or removed from the region, or when the last operation
+        of one of its blocks changes. Modifying the successors of an operation in
+        place does not change the version.
+        """
+        return self._cfg_version
+
     def __repr__(self) -> str:
         return f"Region(num_blocks={len(self.blocks)})"
 
@@ -1467,6 +2470,12 @@ class Region(IRNode):
         if block.is_ancestor(self):
             raise ValueError("Can't add a block to a region contained in the block.")
         block.parent = self
+        self._cfg_version += 1
+        if _active_modified_operations:
+            if self.parent is not None:
+                notify_operation_modified(self.parent)
+            for op in block.ops:
+                notify_operation_modified(op)
 
     def add_block(self, block: Block) -> None:
         """Add a block to the region."""
@@ -1510,6 +2519,9 @@ class Region(IRNode):
             block = self.blocks[block_idx]
         block.parent = None
         self.blocks = self.blocks[:block_idx] + self.blocks[block_idx + 1 :]
+        self._cfg_version += 1
+        if _active_modified_operations and self.parent is not None:
+            notify_operation_modified(self.parent)
         return block
 
     def erase_block(self, block: int | Block, safe_erase: bool = True) -> None:
@@ -1538,16 +2550,29 @@ class Region(IRNode):
         if block_mapper is None:
             block_mapper = {}
 
+        # Create all blocks first, so that successors are mapped even when they
+        # appear after the branches referring to them.
+        new_blocks: list[Block] = []
         for block in self.blocks:
-            new_block = Block()
+            args = block._args  # pyright: ignore[reportPrivateUsage]
+            new_block = Block(arg_types=[arg.typ for arg in args])
             block_mapper[block] = new_block
-            for idx, block_arg in enumerate(block.args):
-                new_block.insert_arg(block_arg.typ, idx)
-                value_mapper[block_arg] = new_block.args[idx]
-            for op in block.ops:
-                new_block.add_op(op.clone(value_mapper, block_mapper))
-            dest.insert_block(new_block, insert_index)
-            insert_index += 1
+            for arg, new_arg in zip(args, new_block._args):  # pyright: ignore
+                value_mapper[arg] = new_arg
+            new_blocks.append(new_block)
+
+        for block, new_block in zip(self.blocks, new_blocks):
+            new_ops: list[Operation] = []
+            op = block._first_op  # pyright: ignore[reportPrivateUsage]
+            while op is not None:
+                new_ops.append(
+                    op._clone(  # pyright: ignore[reportPrivateUsage]
+                        value_mapper, block_mapper, True
+                    )
+                )
+                op = op._next_op  # pyright: ignore[reportPrivateUsage]
+            new_block._link_new_ops(new_ops)  # pyright: ignore[reportPrivateUsage]
+        dest.insert_block(new_blocks, insert_index)
 
     def walk(self) -> Iterator[Operation]:
         """Call a function on all operations contained in the region."""
@@ -1555,8 +2580,13 @@ class Region(IRNode):
             yield from block.walk()
 
     def verify(self) -> None:
+        from xdsl.dominance import DominanceInfo
+
+        self._verify(DominanceInfo())
+
+    def _verify(self, dominance: DominanceInfo) -> None:
         for block in self.blocks:
-            block.verify()
+            block._verify(dominance)  # pyright: ignore[reportPrivateUsage]
             if block.parent != self:
                 raise Exception(
                     "Parent pointer of block does not refer to containing region"
@@ -5,9 +5,12 @@ from dataclasses import dataclass, field
 from enum import Enum
 from functools import reduce
 from inspect import isclass
+from operator import attrgetter
 from typing import (
     Annotated,
     Any,
+    Callable,
+    ClassVar,
     Generic,
     Literal,
     Mapping,
@@ -21,7 +24,7 @@ from typing import (
     get_type_hints,
     overload,
 )
-from types import UnionType, GenericAlias, FunctionType
+from types import UnionType, GenericAlias, FunctionType, MemberDescriptorType
 
 from xdsl.ir import (
     Attribute,
@@ -666,7 +669,10 @@ class OpDef:
         for field_name, value in clsdict.items():
             if field_name in opdict:
                 continue
-            if field_name in ["irdl_options", "traits"]:
+            if field_name in ["irdl_options", "traits", "__dict__", "__weakref__"]:
+                continue
+            # Instance attributes declared in `__slots__`
+            if isinstance(value, MemberDescriptorType):
                 continue
             if isinstance(
                 value, (FunctionType, PropertyType, classmethod, staticmethod)
@@ -683,7 +689,9 @@ class OpDef:
 
         op_def = OpDef(clsdict["name"])
         for field_name, field_type in type_hints.items():
-            if field_name in operation_fields:
+            # The operation name is not annotated in Operation, as it is not
+            # stored in the operations.
+            if field_name in operation_fields or field_name == "name":
                 continue
 
             # If the field type is an Annotated, separate the origin
@@ -913,7 +921,7 @@ def get_variadic_sizes_from_attr(
             f"{size_attribute_name} attribute is expected to "
             "be a DenseArrayBase of i32"
         )
-    def_sizes = cast(list[int], [size_attr.data for size_attr in attribute.data.data])
+    def_sizes = cast(tuple[int, ...], attribute.as_tuple())
 
     if len(def_sizes) != len(defs):
         raise VerifyException(
@@ -1283,19 +1291,179 @@ def irdl_op_init(
     )
 
 
+@dataclass(eq=False)
+class _SegmentBounds:
+    """
+    Decode the segment sizes attribute of operations into the bounds of each of
+    their operands, results, or regions definitions.
+    The bounds are cached for each attribute object, as attributes are immutable,
+    and as operations built or cloned from each other share their attributes.
+    """
+
+    op_def: OpDef
+    construct: VarIRConstruct
+    attribute_name: str
+
+    _bounds: dict[int, tuple[Attribute, tuple[tuple[int, int], ...]]] = field(
+        default_factory=dict, init=False
+    )
+    """
+    The bounds decoded from each attribute, indexed by the attribute id. The
+    attribute is kept alive so that its id is not reused.
+    """
+
+    _MAX_CACHE_SIZE: ClassVar[int] = 1024
+
+    def get(self, op: Operation) -> tuple[tuple[int, int], ...]:
+        """
+        Get the start and end index of each definition.
+        Raise a VerifyException if the segment sizes attribute is invalid.
+        """
+        attribute = op.attributes.get(self.attribute_name)
+        cached = self._bounds.get(id(attribute))
+        if cached is not None:
+            return cached[1]
+
+        defs = get_construct_defs(self.op_def, self.construct)
+        variadic_sizes = iter(
+            get_variadic_sizes_from_attr(op, defs, self.construct, self.attribute_name)
+        )
+        bounds_list: list[tuple[int, int]] = []
+        start = 0
+        for _, arg_def in defs:
+            size = next(variadic_sizes) if isinstance(arg_def, VariadicDef) else 1
+            bounds_list.append((start, start + size))
+            start += size
+        bounds = tuple(bounds_list)
+
+        assert attribute is not None
+        if len(self._bounds) >= self._MAX_CACHE_SIZE:
+            self._bounds.clear()
+        self._bounds[id(attribute)] = (attribute, bounds)
+        return bounds
+
+
+_CONSTRUCT_FIELDS = {
+    VarIRConstruct.OPERAND: "_operands",
+    VarIRConstruct.RESULT: "results",
+    VarIRConstruct.REGION: "regions",
+}
+"""The name of the operation field containing each construct."""
+
+
+def irdl_op_arg_accessor(
+    op_def: OpDef,
+    construct: VarIRConstruct,
+    arg_idx: int,
+    previous_vars: int,
+    segment_bounds: _SegmentBounds | None,
+) -> Callable[[Operation], Any]:
+    """
+    Get the accessor of an operand, result, or region definition.
+    The position of the definition is precomputed from the layout of the
+    definitions, so accessing it takes constant time. If the operation does not
+    have the expected number of operands, results or regions, the accessor
+    falls back to `get_operand_result_or_region`, which raises the error.
+    """
+    defs = get_construct_defs(op_def, construct)
+    num_defs = len(defs)
+    arg_def = defs[arg_idx][1]
+    get_arg_list = attrgetter(_CONSTRUCT_FIELDS[construct])
+
+    def get_generic(op: Operation) -> Any:
+        return get_operand_result_or_region(
+            op, op_def, arg_idx, previous_vars, construct
+        )
+
+    # The bounds of the definitions are given by an attribute.
+    if segment_bounds is not None:
+        get_bounds = segment_bounds.get
+        if isinstance(arg_def, OptionalDef):
+
+            def get_optional_segment(op: Operation) -> Any:
+                start, end = get_bounds(op)[arg_idx]
+                return get_arg_list(op)[start] if end != start else None
+
+            return get_optional_segment
+        if isinstance(arg_def, VariadicDef):
+
+            def get_variadic_segment(op: Operation) -> Any:
+                start, end = get_bounds(op)[arg_idx]
+                return get_arg_list(op)[start:end]
+
+            return get_variadic_segment
+
+        def get_segment(op: Operation) -> Any:
+            return get_arg_list(op)[get_bounds(op)[arg_idx][0]]
+
+        return get_segment
+
+    variadic_idx = next(
+        (idx for idx, (_, d) in enumerate(defs) if isinstance(d, VariadicDef)), None
+    )
+
+    # There is no variadic definition, all positions are fixed.
+    if variadic_idx is None:
+
+        def get_fixed(op: Operation) -> Any:
+            args = get_arg_list(op)
+            if len(args) != num_defs:
+                return get_generic(op)
+            return args[arg_idx]
+
+        return get_fixed
+
+    # There is a single variadic definition. The definitions after it are
+    # indexed from the end.
+    if arg_idx != variadic_idx:
+        index = arg_idx if arg_idx < variadic_idx else arg_idx - num_defs
+
+        def get_around_variadic(op: Operation) -> Any:
+            args = get_arg_list(op)
+            if len(args) < num_defs - 1:
+                return get_generic(op)
+            return args[index]
+
+        return get_around_variadic
+
+    if isinstance(arg_def, OptionalDef):
+
+        def get_optional(op: Operation) -> Any:
+            args = get_arg_list(op)
+            size = len(args) - num_defs + 1
+            if size < 0:
+                return get_generic(op)
+            return args[arg_idx] if size else None
+
+        return get_optional
+
+    def get_variadic(op: Operation) -> Any:
+        args = get_arg_list(op)
+        size = len(args) - num_defs + 1
+        if size < 0:
+            return get_generic(op)
+        return args[arg_idx : arg_idx + size]
+
+    return get_variadic
+
+
 def irdl_op_arg_definition(
     new_attrs: dict[str, Any], construct: VarIRConstruct, op_def: OpDef
 ) -> None:
     previous_variadics = 0
     defs = get_construct_defs(op_def, construct)
+    attr_size_option = get_attr_size_option(construct)
+    segment_bounds = None
+    if attr_size_option in op_def.options:
+        segment_bounds = _SegmentBounds(
+            op_def, construct, attr_size_option.attribute_name
+        )
     for arg_idx, (arg_name, arg_def) in enumerate(defs):
-
-        def fun(self: Any, idx: int = arg_idx, previous_vars: int = previous_variadics):
-            return get_operand_result_or_region(
-                self, op_def, idx, previous_vars, construct
+        new_attrs[arg_name] = property(
+            irdl_op_arg_accessor(
+                op_def, construct, arg_idx, previous_variadics, segment_bounds
             )
-
-        new_attrs[arg_name] = property(fun)
+        )
         if isinstance(arg_def, VariadicDef):
             previous_variadics += 1
 
@@ -1379,9 +1547,16 @@ def irdl_op_definition(cls: type[_OpT]) -> type[_OpT]:
 
     new_attrs["verify_"] = verify_
 
-    return type(
-        cls.__name__, cls.__mro__, {**cls.__dict__, **new_attrs}
-    )  # type: ignore
+    # The slots of the class are inherited from the decorated class.
+    namespace = {**cls.__dict__, **new_attrs, "__slots__": ()}
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    for slot in cls.__dict__.get("__slots__", ()):
+        namespace.pop(slot, None)
+    new_cls = type(cls.__name__, cls.__mro__, namespace)
+    # Index the traits once, so that trait queries are dictionary lookups.
+    new_cls._get_trait_lookup()  # pyright: ignore[reportPrivateUsage]
+    return new_cls  # type: ignore
 
 
 #  ____        _
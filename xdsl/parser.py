@@ -4,28 +4,40 @@ import contextlib
 import functools
 import itertools
 import math
+import pickle
 import re
 import sys
 import traceback
 from abc import ABC
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from io import StringIO
 from typing import (
     Any,
     NoReturn,
     TypeVar,
     Iterable,
+    Iterator,
     IO,
     cast,
     Literal,
     Sequence,
     Callable,
+    TypeAlias,
 )
 
 from xdsl.utils.exceptions import ParseError, MultipleSpansParseError
-from xdsl.utils.lexer import Input, Lexer, Position, Span, StringLiteral, Token
+from xdsl.utils.lexer import (
+    Input,
+    Lexer,
+    Position,
+    Span,
+    StreamingLexer,
+    StringLiteral,
+    Token,
+)
 from xdsl.dialects.memref import AnyIntegerAttr, MemRefType, UnrankedMemrefType
 from xdsl.dialects.builtin import (
     AnyArrayAttr,
@@ -45,8 +57,10 @@ from xdsl.dialects.builtin import (
     FloatAttr,
     FunctionType,
     IndexType,
+    IntAttr,
     IntegerType,
     Signedness,
+    SignednessAttr,
     StringAttr,
     IntegerAttr,
     ArrayAttr,
@@ -140,264 +154,165 @@ class BacktrackingHistory:
         return id(self)
 
 
-save_t = Position
-
-
-@dataclass
-class Tokenizer:
-    """
-    This class is used to tokenize an Input.
-
-    It provides an interface for backtracking, so you can use:
-
-    with tokenizer.backtracking():
-        # Try stuff
-        raise ParseError(...)
-
-    and not worry about manually resetting the input position. Backtracking will also
-    record errors that happen during backtracking to provide a richer error reporting
-    experience.
-
-    It also provides the following methods to inspect the input:
-
-     - next_token(peek) is used to get the next token
-        (which just breaks the input as per the rules defined in break_on)
-        peek=True doesn't advance the position in the file.
-     - next_token_of_pattern(pattern, peek) can be used to get a next token if it
-        conforms to a specific pattern. If a literal string is given, it'll check
-        if the next characters match. If a regex is given, it will check
-        the regex.
-     - starts_with(pattern) checks if the input starts with a literal string or
-        regex pattern
+@dataclass(frozen=True)
+class _AttemptError:
     """
-
-    input: Input
-
-    pos: Position = field(init=False, default=0)
-    """
-    The position in the input. Points to the first unconsumed character.
-    """
-
-    _break_on: tuple[str, ...] = (
-        ".",
-        "%",
-        " ",
-        "(",
-        ")",
-        "[",
-        "]",
-        "{",
-        "}",
-        "<",
-        ">",
-        ":",
-        "=",
-        "@",
-        "?",
-        "|",
-        "->",
-        "-",
-        "//",
-        "\n",
-        "\t",
-        "#",
-        '"',
-        "'",
-        ",",
-        "!",
-        "+",
-        "*",
-    )
-    """
-    characters the tokenizer should break on
+    The error of a failed backtracking attempt. Only its span and message are
+    kept, so that the exception and its traceback can be freed.
     """
 
-    history: BacktrackingHistory | None = field(init=False, default=None, repr=False)
-
-    last_token: Span | None = field(init=False, default=None, repr=False)
-
-    def __post_init__(self):
-        self.last_token = self.next_token(peek=True)
+    span: Span
+    msg: str
+    refs: tuple[str | None, list[tuple[Span, str | None]]] | None = None
+    """The reference text and spans of a `MultipleSpansParseError`."""
 
-    def save(self) -> save_t:
+    @staticmethod
+    def from_exception(ex: Exception, span: Span) -> _AttemptError:
         """
-        Create a checkpoint in the parsing process, useful for backtracking
+        Get the error of an exception raised on the given span. If an
+        unexpected exception type was encountered, its traceback is included
+        in the error message.
         """
-        return self.pos
-
-    def resume_from(self, save: save_t):
-        """
-        Resume from a previously saved position.
-
-        Restores the state of the tokenizer to the exact previous position
-        """
-        self.pos = save
-
-    def _history_entry_from_exception(
-        self, ex: Exception, region: str | None, pos: Position
-    ) -> BacktrackingHistory:
-        """
-        Given an exception generated inside a backtracking attempt,
-        generate a BacktrackingHistory object with the relevant information in it.
-
-        If an unexpected exception type is encountered, print a traceback to stderr
-        """
-        assert self.last_token is not None
+        if isinstance(ex, MultipleSpansParseError):
+            return _AttemptError(ex.span, ex.msg, (ex.ref_text, ex.refs))
         if isinstance(ex, ParseError):
-            return BacktrackingHistory(ex, self.history, region, pos)
-        elif isinstance(ex, AssertionError):
+            return _AttemptError(ex.span, ex.msg)
+        if isinstance(ex, AssertionError):
             reason = [
                 "Generic assertion failure",
                 *(reason for reason in ex.args if isinstance(reason, str)),
             ]
-            # We assume that assertions fail because of the last read-in token
+            # We assume that assertions fail because of the current token
             if len(reason) == 1:
-                tb = StringIO()
-                traceback.print_exc(file=tb)
-                reason[0] += "\n" + tb.getvalue()
-
-            return BacktrackingHistory(
-                ParseError(self.last_token, reason[-1], self.history),
-                self.history,
-                region,
-                pos,
-            )
-        elif isinstance(ex, EOFError):
-            return BacktrackingHistory(
-                ParseError(self.last_token, "Encountered EOF", self.history),
-                self.history,
-                region,
-                pos,
+                reason[0] += "\n" + "".join(traceback.format_exception(ex))
+            return _AttemptError(span, reason[-1])
+        if isinstance(ex, EOFError):
+            return _AttemptError(span, "Encountered EOF")
+        return _AttemptError(span, "Unexpected exception: {}".format(ex))
+
+    def shifted(self, offset: int, input: Input) -> _AttemptError:
+        """Move the error by an offset in the given input."""
+        span = Span(self.span.start + offset, self.span.end + offset, input)
+        return _AttemptError(span, self.msg)
+
+    def to_parse_error(self, history: BacktrackingHistory | None) -> ParseError:
+        if self.refs is not None:
+            ref_text, refs = self.refs
+            return MultipleSpansParseError(
+                self.span, self.msg, ref_text or "", refs, history
             )
+        return ParseError(self.span, self.msg, history)
 
-        print("Warning: Unexpected error in backtracking:", file=sys.stderr)
-        traceback.print_exception(ex, file=sys.stderr)
 
-        return BacktrackingHistory(
-            ParseError(
-                self.last_token, "Unexpected exception: {}".format(ex), self.history
-            ),
-            self.history,
-            region,
-            pos,
-        )
+@dataclass(eq=False)
+class _FailedAttempt:
+    """
+    A failed backtracking attempt.
+    It is only converted to a BacktrackingHistory when the history is requested,
+    so that no error message is formatted for attempts that are never reported.
+    """
 
-    def next_token(self, peek: bool = False) -> Span:
-        """
-        Return a Span of the next token, according to the self.break_on rules.
+    error: _AttemptError
+    region_name: str | None
+    pos: Position
+    parent: _FailedAttempt | None
+    farthest_point: Position = field(init=False)
+    _history: BacktrackingHistory | None = field(default=None, init=False)
 
-        Can be modified using:
-         - peek: don't advance the position, only "peek" at the input
+    def __post_init__(self):
+        self.farthest_point = self.pos
+        if self.parent is not None:
+            self.farthest_point = max(self.pos, self.parent.farthest_point)
 
-        This will skip over line comments. Meaning it will skip the entire line if
-        it encounters '//'
-        """
-        i = self.next_pos()
-        # Construct the span:
-        span = Span(i, self._find_token_end(i), self.input)
-        # Advance pointer if not peeking
-        if not peek:
-            self.pos = span.end
+    def get_history(self) -> BacktrackingHistory:
+        """Generate the BacktrackingHistory corresponding to this attempt."""
+        if self._history is not None:
+            return self._history
 
-        # Save last token
-        self.last_token = span
-        return span
+        parent = self.parent.get_history() if self.parent is not None else None
+        error = self.error.to_parse_error(parent)
+        self._history = BacktrackingHistory(error, parent, self.region_name, self.pos)
+        return self._history
 
-    def next_token_of_pattern(
-        self, pattern: re.Pattern[str] | str, peek: bool = False
-    ) -> Span | None:
-        """
-        Return a span that matched the pattern, or nothing.
-        You can choose not to consume the span.
-        """
-        try:
-            start = self.next_pos()
-        except EOFError:
-            return None
 
-        # Handle search for string literal
-        if isinstance(pattern, str):
-            if self.starts_with(pattern):
-                if not peek:
-                    self.pos = start + len(pattern)
-                return Span(start, start + len(pattern), self.input)
-            return None
+_HistoryEvent: TypeAlias = "tuple[_AttemptError, str | None, Position, Position] | None"
+"""
+A change of the failed attempts history: either a failed attempt, with its
+error, region name, farthest position and starting position, or None if the
+history was cleared.
+"""
 
-        # Handle regex logic
-        match = pattern.match(self.input.content, start)
-        if match is None:
-            return None
 
-        if not peek:
-            self.pos = match.end()
+@dataclass(eq=False, slots=True)
+class _MemoEntry:
+    """
+    The result of a memoized parsing rule, which only depends on the input
+    text that the rule examined. Positions are relative to the start of the
+    rule.
+    """
 
-        # Save last token
-        self.last_token = Span(start, match.end(), self.input)
-        return self.last_token
+    text: str
+    """
+    The input text examined by the rule, up to the end of the farthest token it
+    lexed, including its lookahead.
+    """
 
-    def consume_peeked(self, peeked_span: Span):
-        if peeked_span.start != self.next_pos():
-            raise ParseError(peeked_span, "This is not the peeked span!")
-        self.pos = peeked_span.end
+    last_token_start: int
+    """
+    The start of the farthest token, which should be lexed again to check that
+    it ends at the same position, as the lexer may look at the characters
+    following a token.
+    """
 
-    def _find_token_end(self, start: Position | None = None) -> Position:
-        """
-        Find the point (optionally starting from start) where the token ends
-        """
-        i = self.next_pos() if start is None else start
-        # Search for literal breaks
-        for part in self._break_on:
-            if self.input.content.startswith(part, i):
-                return i + len(part)
-        # Otherwise return the start of the next break
-        break_pos = list(
-            filter(
-                lambda x: x >= 0,
-                (self.input.content.find(part, i) for part in self._break_on),
-            )
-        )
-        # Make sure that we break at some point
-        break_pos.append(self.input.len)
-        return min(break_pos)
+    result: Any
+    """The result of the rule."""
 
-    def next_pos(self, i: Position | None = None) -> Position:
-        """
-        Find the next starting position (optionally starting from i)
+    end: int
+    """The parser position after the rule."""
 
-        This will skip line comments!
-        """
-        i = self.pos if i is None else i
-        # Skip whitespaces
-        while (c := self.input.at(i)) is not None and c.isspace():
-            i += 1
-        if c is None:
-            raise EOFError()
+    events: list[_HistoryEvent]
+    """The changes of the failed attempts history made by the rule."""
 
-        # Skip comments as well
-        if self.input.content.startswith("//", i):
-            i = self.input.content.find("\n", i) + 1
-            return self.next_pos(i)
 
-        return i
+_MAX_MEMO_ENTRIES_PER_KEY = 16
+"""
+The maximum number of memoized results starting with the same token, so that
+looking them up stays cheap. The oldest results are dropped first.
+"""
 
-    def is_eof(self):
-        """
-        Check if the end of the input was reached.
-        """
-        try:
-            self.next_pos()
-            return False
-        except EOFError:
-            return True
 
-    def starts_with(self, text: str | re.Pattern[str]) -> bool:
-        try:
-            start = self.next_pos()
-            if isinstance(text, re.Pattern):
-                return text.match(self.input.content, start) is None
-            return self.input.content.startswith(text, start)
-        except EOFError:
-            return False
+_top_level_scan_regex = re.compile(
+    r'"(?:[^"\\\n]|\\.)*"|//[^\n]*|[(){}\[\]]|\n[ \t]*(?=[%"])'
+)
+
+
+def _scan_top_level_ops(
+    content: str, start: Position
+) -> tuple[list[Position], Position] | None:
+    """
+    Find the operations of a region in a single pass, without parsing them,
+    by only looking at brackets, string literals and comments.
+    `start` is the position of the first operation of the region.
+
+    Return the positions of the starts of the lines on which the region
+    operations begin, and the position of the closing brace of the region.
+    Only operations starting a line with a result or a string literal name are
+    found, so operations in custom format stay in the same chunk as the
+    preceding operation.
+    """
+    op_starts = [start]
+    depth = 0
+    for match in _top_level_scan_regex.finditer(content, start):
+        char = content[match.start()]
+        if char in "({[":
+            depth += 1
+        elif char in ")}]":
+            depth -= 1
+            if depth < 0:
+                return op_starts, match.start()
+        elif char == "\n" and depth == 0:
+            op_starts.append(match.start() + 1)
+    return None
 
 
 class ParserCommons:
@@ -406,21 +321,13 @@ class ParserCommons:
 
     """
 
-    integer_literal = re.compile(r"[+-]?([0-9]+|0x[0-9A-Fa-f]+)")
     decimal_literal = re.compile(r"[+-]?([1-9][0-9]*)")
-    string_literal = re.compile(r'"(\\[nfvtr"\\]|[^\n\f\v\r"\\])*"')
-    float_literal = re.compile(r"[-+]?[0-9]+\.[0-9]*([eE][-+]?[0-9]+)?")
-    bare_id = re.compile(r"[A-Za-z_][\w$.]*")
-    value_id = re.compile(r"%([0-9]+|([A-Za-z_$.-][\w$.-]*))")
     suffix_id = re.compile(r"([0-9]+|([A-Za-z_$.-][\w$.-]*))")
     """
     suffix-id ::= (digit+ | ((letter|id-punct) (letter|id-punct|digit)*))
     id-punct  ::= [$._-]
     """
-    block_id = re.compile(r"\^([0-9]+|([A-Za-z_$.-][\w$.-]*))")
-    type_alias = re.compile(r"![A-Za-z_][\w$.]+")
-    attribute_alias = re.compile(r"#[A-Za-z_][\w$.]+")
-    boolean_literal = re.compile(r"(true|false)")
+    comma = re.compile(",")
     # A list of names that are builtin types
     _builtin_type_names = (
         r"[su]?i\d+",
@@ -446,9 +353,6 @@ class ParserCommons:
         "sparse",
     )
     builtin_type = re.compile("(({}))".format(")|(".join(_builtin_type_names)))
-    builtin_type_xdsl = re.compile("!(({}))".format(")|(".join(_builtin_type_names)))
-    double_colon = re.compile("::")
-    comma = re.compile(",")
 
 
 class Parser(ABC):
@@ -481,11 +385,28 @@ class Parser(ABC):
     """
 
     lexer: Lexer
-    tokenizer: Tokenizer
 
     _current_token: Token
     """Token at the current location"""
 
+    _failed_attempts: _FailedAttempt | None
+    """Failed backtracking attempts of the last cascade of failures."""
+
+    _memo: dict[tuple[str, str], list[_MemoEntry]] | None
+    """
+    Results of memoized rules, indexed by rule name and text of the first
+    token they examined. None if memoization is disabled.
+    """
+
+    _history_events: list[_HistoryEvent] | None
+    """The history changes recorded for the memoized rule being applied."""
+
+    _farthest_token: tuple[Position, Position]
+    """
+    The start and end of the farthest token lexed in the memoized rule being
+    applied, not counting the current lookahead token.
+    """
+
     T_ = TypeVar("T_")
     """
     Type var used for handling function that return single or multiple Spans.
@@ -494,30 +415,194 @@ class Parser(ABC):
 
     allow_unregistered_dialect: bool
 
+    _defined_ssa_names: set[str] | None
+    """
+    The names of all the SSA values defined so far, in any region.
+    Only recorded when parsing chunks of a module in parallel, as None
+    otherwise.
+    """
+
     def __init__(
         self,
         ctx: MLContext,
-        input: str,
+        input: str | IO[str],
         name: str = "<unknown>",
         allow_unregistered_dialect: bool = False,
+        memoize_attributes: bool = False,
     ):
-        self.tokenizer = Tokenizer(Input(input, name))
-        self.lexer = Lexer(Input(input, name))
+        if isinstance(input, str):
+            self.lexer = Lexer(Input(input, name))
+        else:
+            self.lexer = StreamingLexer(input, name)
         self._current_token = self.lexer.lex()
+        self._failed_attempts = None
+        self._memo = dict() if memoize_attributes else None
+        self._history_events = None
+        self._farthest_token = (0, 0)
         self.ctx = ctx
         self.ssa_values = dict()
         self.blocks = dict()
         self.forward_block_references = dict()
         self.allow_unregistered_dialect = allow_unregistered_dialect
+        self._defined_ssa_names = None
 
     def resume_from(self, pos: Position):
         """
         Resume parsing from a given position.
         """
-        self.tokenizer.pos = pos
+        self._record_farthest_token()
         self.lexer.pos = pos
         self._current_token = self.lexer.lex()
 
+    def _save(self) -> tuple[Token, Position]:
+        """
+        Create a checkpoint in the parsing process, useful for backtracking.
+        The lookahead token is saved alongside the lexer position, so that
+        restoring a checkpoint does not require lexing the input again.
+        """
+        return self._current_token, self.lexer.pos
+
+    def _restore(self, save: tuple[Token, Position]) -> None:
+        """Restore the parser to a checkpoint created with `_save`."""
+        self._record_farthest_token()
+        self._current_token, self.lexer.pos = save
+
+    def _record_farthest_token(self) -> None:
+        """Record the lookahead token before moving the lexer back."""
+        if self.lexer.pos > self._farthest_token[1]:
+            self._farthest_token = (self._current_token.span.start, self.lexer.pos)
+
+    @property
+    def history(self) -> BacktrackingHistory | None:
+        """
+        Errors recorded during the last cascade of failed backtracking attempts.
+        The history is only built when it is requested, as most failed attempts
+        are never reported.
+        """
+        if self._failed_attempts is None:
+            return None
+        return self._failed_attempts.get_history()
+
+    def _memoized(self, rule: Callable[[], T_ | None]) -> T_ | None:
+        """
+        Apply a parsing rule, memoizing its result by the input text it examined
+        when the parser was created with `memoize_attributes`.
+        When the rule is applied again on the same text, at any position, the
+        parser moves to where the first application stopped, the changes to the
+        error history are replayed, and the same result is returned. This is
+        only valid for rules that do not depend on the parser state other than
+        the input, such as attribute and type parsing.
+        """
+        if self._memo is None:
+            return rule()
+        start = self.pos
+        input = self.lexer.input
+        key = (rule.__name__, self._current_token.text)
+        entries = self._memo.get(key)
+        if entries is not None:
+            save = self._save()
+            for entry in entries:
+                if not input.content.startswith(entry.text, start):
+                    continue
+                self.resume_from(start + entry.last_token_start)
+                if self.lexer.pos != start + len(entry.text):
+                    self._restore(save)
+                    continue
+                for event in entry.events:
+                    if event is not None:
+                        error, region_name, pos, starting_pos = event
+                        event = (
+                            error.shifted(start, input),
+                            region_name,
+                            pos + start,
+                            starting_pos + start,
+                        )
+                    self._record_history_event(event)
+                self.resume_from(start + entry.end)
+                return entry.result
+
+        outer_events = self._history_events
+        outer_farthest_token = self._farthest_token
+        events: list[_HistoryEvent] = []
+        self._history_events = events
+        self._farthest_token = (start, start)
+        try:
+            result = rule()
+        finally:
+            self._record_farthest_token()
+            last_token_start, examined = self._farthest_token
+            self._history_events = outer_events
+            if outer_farthest_token[1] > examined:
+                self._farthest_token = outer_farthest_token
+            if outer_events is not None:
+                outer_events.extend(events)
+
+        # Errors outside of the examined text, or referring to other spans,
+        # cannot be moved to another position.
+        relative_events: list[_HistoryEvent] = []
+        for event in events:
+            if event is not None:
+                error, region_name, pos, starting_pos = event
+                if (
+                    error.refs is not None
+                    or error.span.start < start
+                    or error.span.end > examined
+                ):
+                    return result
+                event = (
+                    error.shifted(-start, input),
+                    region_name,
+                    pos - start,
+                    starting_pos - start,
+                )
+            relative_events.append(event)
+        entry = _MemoEntry(
+            input.content[start:examined],
+            last_token_start - start,
+            result,
+            self.pos - start,
+            relative_events,
+        )
+        entries = self._memo.setdefault(key, [])
+        if len(entries) == _MAX_MEMO_ENTRIES_PER_KEY:
+            del entries[0]
+        entries.append(entry)
+        return result
+
+    def _record_history_event(self, event: _HistoryEvent) -> None:
+        """
+        Update the failed attempts history, and record the change for the
+        memoized rule being applied.
+        """
+        if self._history_events is not None:
+            self._history_events.append(event)
+        if event is None:
+            self._failed_attempts = None
+            return
+        error, region_name, how_far_we_got, starting_position = event
+
+        # If we have no error history, start recording!
+        if self._failed_attempts is None:
+            self._failed_attempts = _FailedAttempt(
+                error, region_name, how_far_we_got, None
+            )
+
+        # If we got further than on previous attempts
+        elif how_far_we_got > self._failed_attempts.farthest_point:
+            # Throw away history, and generate new history entry
+            self._failed_attempts = _FailedAttempt(
+                error, region_name, how_far_we_got, None
+            )
+
+        # Otherwise, add to exception, if we are in a named region
+        elif region_name is not None and how_far_we_got - starting_position > 0:
+            self._failed_attempts = _FailedAttempt(
+                error,
+                region_name,
+                how_far_we_got,
+                self._failed_attempts,
+            )
+
     @contextlib.contextmanager
     def backtracking(self, region_name: str | None = None):
         """
@@ -536,69 +621,28 @@ class Parser(ABC):
         Any other error will be printed to stderr, but backtracking will continue
         as normal.
         """
-        self._synchronize_lexer_and_tokenizer()
-        save = self.tokenizer.save()
-        starting_position = self.tokenizer.pos
+        save = self._save()
+        starting_position = self.pos
         try:
             yield
             # Clear error history when something doesn't fail
             # This is because we are only interested in the last "cascade" of failures.
             # If a backtracking() completes without failure,
             # something has been parsed (we assume)
-            if (
-                self.tokenizer.pos > starting_position
-                and self.tokenizer.history is not None
-            ):
-                self.tokenizer.history = None
+            if self.pos > starting_position:
+                self._failed_attempts = None
         except Exception as ex:
-            how_far_we_got = self.tokenizer.pos
+            how_far_we_got = self.pos
 
-            # If we have no error history, start recording!
-            if not self.tokenizer.history:
-                self.tokenizer.history = (
-                    self.tokenizer._history_entry_from_exception(  # type: ignore
-                        ex, region_name, how_far_we_got
-                    )
-                )
+            if not isinstance(ex, (ParseError, AssertionError, EOFError)):
+                print("Warning: Unexpected error in backtracking:", file=sys.stderr)
+                traceback.print_exception(ex, file=sys.stderr)
 
-            # If we got further than on previous attempts
-            elif how_far_we_got > self.tokenizer.history.get_farthest_point():
-                # Throw away history
-                self.tokenizer.history = None
-                # Generate new history entry,
-                self.tokenizer.history = (
-                    self.tokenizer._history_entry_from_exception(  # type: ignore
-                        ex, region_name, how_far_we_got
-                    )
-                )
-
-            # Otherwise, add to exception, if we are in a named region
-            elif region_name is not None and how_far_we_got - starting_position > 0:
-                self.tokenizer.history = (
-                    self.tokenizer._history_entry_from_exception(  # type: ignore
-                        ex, region_name, how_far_we_got
-                    )
-                )
-
-            self.resume_from(save)
-
-    def _synchronize_lexer_and_tokenizer(self):
-        """
-        Advance the lexer and the tokenizer to the same position,
-        which is the maximum of the two.
-        This is used to allow using both the tokenizer and the lexer,
-        to deprecate slowly the tokenizer.
-        """
-        lexer_pos = self._current_token.span.start
-        tokenizer_pos = self.tokenizer.save()
-        pos = max(lexer_pos, tokenizer_pos)
-        self.lexer.pos = pos
-        self.tokenizer.pos = pos
-        self._current_token = self.lexer.lex()
-        # Make sure both point to the same position,
-        # to avoid having problems with `backtracking`.
-        if self._current_token.span.start > self.tokenizer.pos:
-            self.tokenizer.pos = self._current_token.span.start
+            error = _AttemptError.from_exception(ex, self._current_token.span)
+            self._record_history_event(
+                (error, region_name, how_far_we_got, starting_position)
+            )
+            self._restore(save)
 
     @property
     def pos(self) -> Position:
@@ -649,7 +693,29 @@ class Parser(ABC):
             return None
         return self._consume_token()
 
-    def parse_module(self) -> ModuleOp:
+    def parse_module(self, jobs: int = 1) -> ModuleOp:
+        """
+        Parse a module.
+        With more than one job, the top-level operations of a module in generic
+        form are parsed in parallel in `jobs` processes. This requires the input
+        to be given as a string.
+        When parsing from a stream, the top-level operations of a module in
+        generic form are parsed one at a time, see `iter_top_level_ops`.
+        """
+        if isinstance(self.lexer, StreamingLexer):
+            if jobs > 1:
+                raise ValueError(
+                    "Parsing in parallel requires the input as a string, "
+                    "not as a stream"
+                )
+            if self._current_token.text == '"builtin.module"':
+                return self._parse_module_from_stream()
+        elif jobs > 1:
+            if (module := self._parse_module_in_parallel(jobs)) is not None:
+                return module
+            self.resume_from(0)
+            self._failed_attempts = None
+
         op = self.try_parse_operation()
 
         if op is None:
@@ -658,10 +724,245 @@ class Parser(ABC):
         if isinstance(op, ModuleOp):
             return op
         else:
-            self.tokenizer.pos = 0
-            self.raise_error(
-                "Expected ModuleOp at top level!", self.tokenizer.next_token()
-            )
+            self.resume_from(0)
+            self.raise_error("Expected ModuleOp at top level!")
+
+    def iter_top_level_ops(self) -> Iterator[Operation]:
+        """
+        Parse a module in generic form, and yield its operations one by one
+        instead of returning the whole module.
+        Only the generic form `"builtin.module"() ({ ... }) : () -> ()` of the
+        module is supported, while its operations can use any format.
+        The yielded operations are not attached to a block. When parsing from a
+        stream, the text of the operations already yielded is discarded, so only
+        the text of one top-level operation is kept in memory at a time. The
+        spans of the yielded operations then only keep the lines they refer to.
+        """
+        self._parse_generic_module_start()
+        yield from self._iter_generic_module_ops()
+        self._parse_generic_module_end()
+
+    def _iter_generic_module_ops(self) -> Iterator[Operation]:
+        """
+        Parse the operations of a builtin.module in generic form one by one,
+        up to the end of its region, see `iter_top_level_ops`.
+        """
+        while self._current_token.kind != Token.Kind.R_BRACE:
+            self._discard_parsed_input()
+            op = self.parse_operation()
+            if isinstance(self.lexer, StreamingLexer):
+                self._compact_spans(op)
+            yield op
+
+    def _parse_module_from_stream(self) -> ModuleOp:
+        """
+        Parse a builtin.module in generic form from a stream, keeping only the
+        text of one top-level operation in memory at a time.
+        """
+        self._parse_generic_module_start()
+        ops = list(self._iter_generic_module_ops())
+        attributes = self._parse_generic_module_end()
+        return ModuleOp.create(attributes=attributes, regions=[Region(Block(ops))])
+
+    @staticmethod
+    def _compact_spans(op: Operation) -> None:
+        """
+        Make the spans of the blocks nested in an operation refer to copies of
+        the lines they span, so that the input they were parsed from can be
+        freed. Line numbers and columns are preserved.
+        """
+        # Blocks are mostly walked in the order of the input, so newlines are
+        # counted from the previous block.
+        input, pos, line_offset = None, 0, 0
+        for nested_op in op.walk():
+            for region in nested_op.regions:
+                for block in region.blocks:
+                    if (span := block.declared_at) is None:
+                        continue
+                    content = span.input.content
+                    if span.input is not input or span.start < pos:
+                        input, pos, line_offset = span.input, 0, span.input.line_offset
+                    line_start = content.rfind("\n", 0, span.start) + 1
+                    line_end = content.find("\n", span.end)
+                    if line_end == -1:
+                        line_end = len(content)
+                    line_offset += content.count("\n", pos, line_start)
+                    pos = line_start
+                    lines = Input(
+                        content[line_start:line_end], span.input.name, line_offset
+                    )
+                    block.declared_at = Span(
+                        span.start - line_start, span.end - line_start, lines
+                    )
+
+    def _parse_generic_module_start(self) -> None:
+        """
+        Parse the beginning of a builtin.module in generic form, up to its
+        first operation.
+        """
+        self.parse_characters(
+            '"builtin.module"', "Expected a builtin.module in generic form!"
+        )
+        self._parse_token(Token.Kind.L_PAREN, "Expected '(' in builtin.module!")
+        self._parse_token(Token.Kind.R_PAREN, "Expected ')' in builtin.module!")
+        self._parse_token(Token.Kind.L_PAREN, "Expected region list!")
+        self._parse_token(Token.Kind.L_BRACE, "Expected region!")
+        if self._current_token.kind == Token.Kind.CARET_IDENT:
+            self.raise_error("Expected an operation, got a block label!")
+
+    def _parse_generic_module_end(self) -> dict[str, Attribute]:
+        """
+        Parse the end of a builtin.module in generic form, after its last
+        operation, and return the module attributes.
+        """
+        self._parse_token(Token.Kind.R_BRACE, "Expected '}' at the end of region!")
+        self._parse_token(Token.Kind.R_PAREN, "Expected ')' after region list!")
+        attributes = self.parse_optional_attr_dict()
+        self._parse_token(Token.Kind.COLON, "Expected ':' after builtin.module!")
+        self.parse_function_type()
+        if self._current_token.kind != Token.Kind.EOF:
+            self.raise_error("Expected end of input after builtin.module!")
+        return attributes
+
+    def _parse_module_in_parallel(self, jobs: int) -> ModuleOp | None:
+        """
+        Parse a builtin.module in generic form by splitting it into chunks of
+        top-level operations, and parsing the chunks in `jobs` processes.
+        Return None if the module could not be parsed this way, for instance
+        if a chunk uses or redefines values of other chunks, or if the worker
+        processes fail. It should then be parsed sequentially, which also
+        reports errors properly.
+        """
+        try:
+            self._parse_generic_module_start()
+        except ParseError:
+            return None
+        input = self.lexer.input
+        scan = _scan_top_level_ops(input.content, self.pos)
+        if scan is None:
+            return None
+        op_starts, body_end = scan
+
+        try:
+            self.resume_from(body_end)
+            attributes = self._parse_generic_module_end()
+        except ParseError:
+            return None
+
+        # Group consecutive operations into chunks of similar sizes, with a few
+        # chunks per job to balance the load.
+        chunk_size = max((body_end - op_starts[0]) // (jobs * 4), 1)
+        chunks: list[Input] = []
+        chunk_start = op_starts[0]
+        line_offset = input.content.count("\n", 0, chunk_start)
+        for chunk_end in (*op_starts[1:], body_end):
+            if chunk_end - chunk_start < chunk_size and chunk_end != body_end:
+                continue
+            # Pad the first line so that columns in diagnostics are preserved
+            line_start = input.content.rfind("\n", 0, chunk_start) + 1
+            content = " " * (chunk_start - line_start)
+            content += input.content[chunk_start:chunk_end]
+            chunks.append(Input(content, input.name, line_offset))
+            line_offset += content.count("\n")
+            chunk_start = chunk_end
+
+        try:
+            with ProcessPoolExecutor(jobs) as executor:
+                results = [
+                    executor.submit(
+                        Parser._parse_operations,
+                        self.ctx,
+                        chunk,
+                        self.allow_unregistered_dialect,
+                    )
+                    for chunk in chunks
+                ]
+                chunk_results = [result.result() for result in results]
+        except (BrokenProcessPool, pickle.PicklingError):
+            # The worker processes died, or a chunk could not be sent to them
+            # or back.
+            return None
+
+        # A value may not be defined with the name of a top-level value of a
+        # previous chunk, which the chunks cannot check on their own.
+        top_level_names: set[str] = set()
+        ops: list[Operation] = []
+        for chunk_result in chunk_results:
+            if chunk_result is None:
+                # Chunks may not be parsable on their own, for instance if they
+                # use values defined in other chunks.
+                return None
+            chunk_ops, chunk_top_level_names, chunk_defined_names = chunk_result
+            if not top_level_names.isdisjoint(chunk_defined_names):
+                return None
+            top_level_names |= chunk_top_level_names
+            ops.extend(chunk_ops)
+
+        if self.ctx.unique_attributes:
+            # Attributes received from the worker processes are copies of the
+            # ones uniqued there.
+            for op in ops:
+                self._unique_nested_attributes(op)
+
+        return ModuleOp.create(attributes=attributes, regions=[Region(Block(ops))])
+
+    def _unique_nested_attributes(self, op: Operation) -> None:
+        """
+        Replace the attributes and types of an operation and of its nested
+        operations and blocks by their unique instances in the context.
+        """
+        for nested_op in op.walk():
+            for name, attr in nested_op.attributes.items():
+                nested_op.attributes[name] = self.ctx.get_unique_nested_instance(attr)
+            for result in nested_op.results:
+                result.typ = self.ctx.get_unique_nested_instance(result.typ)
+            for region in nested_op.regions:
+                for block in region.blocks:
+                    for arg in block.args:
+                        arg.typ = self.ctx.get_unique_nested_instance(arg.typ)
+
+    @staticmethod
+    def _parse_operations(
+        ctx: MLContext, input: Input, allow_unregistered_dialect: bool
+    ) -> tuple[list[Operation], set[str], set[str]] | None:
+        """
+        Parse a sequence of operations spanning the whole input.
+        This is used to parse chunks of a module in worker processes.
+        Return the operations, the names of the values they define, and the
+        names of all the values defined in the chunk, including in regions.
+        Return None if the chunk cannot be parsed, as parse errors cannot be
+        sent back from the worker processes.
+        """
+        parser = Parser(ctx, "", allow_unregistered_dialect=allow_unregistered_dialect)
+        parser.lexer = Lexer(input)
+        parser.resume_from(0)
+        parser._defined_ssa_names = set()
+        ops: list[Operation] = []
+        try:
+            while parser._current_token.kind != Token.Kind.EOF:
+                ops.append(parser.parse_operation())
+        except ParseError:
+            return None
+        return ops, set(parser.ssa_values), parser._defined_ssa_names
+
+    def _discard_parsed_input(self) -> None:
+        """
+        Drop the already parsed input when parsing from a stream.
+        This is only valid when there are no backtracking checkpoints, as they
+        would refer to the discarded input.
+        """
+        if not isinstance(self.lexer, StreamingLexer):
+            return
+        start = self.pos
+        shift = self.lexer.discard_before(start)
+        if shift == 0:
+            return
+        self.resume_from(start - shift)
+        # Failed attempts refer to the previous positions. Memoized results do
+        # not, but are cleared so that their memory stays bounded.
+        self._failed_attempts = None
+        if self._memo is not None:
+            self._memo.clear()
 
     def _get_block_from_name(self, block_name: Span) -> Block:
         """
@@ -679,7 +980,7 @@ class Parser(ABC):
         block_id, args = self._parse_optional_block_label()
 
         if block_id is None:
-            block = Block(declared_at=self.tokenizer.last_token)
+            block = Block(declared_at=self._current_token.span)
         elif self.forward_block_references.pop(block_id.text, None) is not None:
             block = self.blocks[block_id.text]
             block.declared_at = block_id
@@ -692,7 +993,7 @@ class Parser(ABC):
                     "Re-declaration of block {}".format(block_id.text),
                     "Originally declared here:",
                     [(block.declared_at, None)],
-                    self.tokenizer.history,
+                    self.history,
                 )
             block = Block(declared_at=block_id)
             self.blocks[block_id.text] = block
@@ -702,6 +1003,8 @@ class Parser(ABC):
         for i, (name, type) in enumerate(args):
             arg = BlockArgument(type, block, i)
             self.ssa_values[name.text[1:]] = (arg,)
+            if self._defined_ssa_names is not None:
+                self._defined_ssa_names.add(name.text[1:])
             # store ssa val name if valid
             if SSAValue.is_valid_name(name.text[1:]):
                 arg.name_hint = name.text[1:]
@@ -724,7 +1027,7 @@ class Parser(ABC):
         arg_list = list[tuple[Span, Attribute]]()
 
         if block_id is not None:
-            if self.tokenizer.starts_with("("):
+            if self._current_token.kind == Token.Kind.L_PAREN:
                 arg_list = self._parse_block_arg_list()
 
             self.parse_characters(":", "Block label must end in a `:`!")
@@ -743,23 +1046,46 @@ class Parser(ABC):
         return args
 
     def try_parse_single_reference(self) -> Span | None:
-        with self.backtracking("part of a reference"):
-            self.parse_characters("@", "references must start with `@`")
-            if (reference := self.try_parse_string_literal()) is not None:
-                return reference
-            if (reference := self.try_parse_suffix_id()) is not None:
-                return reference
-            self.raise_error(
-                "References must conform to `@` (string-literal | suffix-id)"
-            )
+        """
+        Parse a reference with format `@` (bare-id | string-literal), if present.
+        Returns the span of the reference, without the leading `@`.
+        """
+        if (token := self._parse_optional_token(Token.Kind.AT_IDENT)) is None:
+            return None
+        span = token.span
+        if span.text[1] == '"':
+            return StringLiteral(span.start + 1, span.end, span.input)
+        return Span(span.start + 1, span.end, span.input)
+
+    def _parse_optional_double_colon(self) -> Span | None:
+        """
+        Parse a `::` separator, if present. The lexer splits `::` into two
+        consecutive colon tokens, so a single colon is left untouched.
+        """
+        if self._current_token.kind != Token.Kind.COLON:
+            return None
+        save = self._save()
+        first = self._consume_token(Token.Kind.COLON)
+        if (second := self._parse_optional_token(Token.Kind.COLON)) is None:
+            self._restore(save)
+            return None
+        return Span(first.span.start, second.span.end, first.span.input)
 
     def parse_reference(self) -> list[Span]:
-        return self.parse_list_of(
-            self.try_parse_single_reference,
-            "Expected reference here in the format of `@` (suffix-id | string-literal)",
-            ParserCommons.double_colon,
-            allow_empty=False,
+        error_msg = (
+            "Expected reference here in the format of `@` (suffix-id | string-literal)"
         )
+        refs = [self.expect(self.try_parse_single_reference, error_msg)]
+        while (separator := self._parse_optional_double_colon()) is not None:
+            if (ref := self.try_parse_single_reference()) is None:
+                self.raise_error(
+                    error_msg
+                    + " because was able to match next separator {}".format(
+                        separator.text
+                    )
+                )
+            refs.append(ref)
+        return refs
 
     class Delimiter(Enum):
         """
@@ -781,39 +1107,30 @@ class Parser(ABC):
         closed, or when an error is produced. If no delimiter is specified, at
         least one element is expected to be parsed.
         """
-        self._synchronize_lexer_and_tokenizer()
         if delimiter == self.Delimiter.NONE:
             pass
         elif delimiter == self.Delimiter.PAREN:
             self._parse_token(Token.Kind.L_PAREN, "Expected '('" + context_msg)
             if self._parse_optional_token(Token.Kind.R_PAREN) is not None:
-                self._synchronize_lexer_and_tokenizer()
                 return []
         elif delimiter == self.Delimiter.ANGLE:
             self._parse_token(Token.Kind.LESS, "Expected '<'" + context_msg)
             if self._parse_optional_token(Token.Kind.GREATER) is not None:
-                self._synchronize_lexer_and_tokenizer()
                 return []
         elif delimiter == self.Delimiter.SQUARE:
             self._parse_token(Token.Kind.L_SQUARE, "Expected '['" + context_msg)
             if self._parse_optional_token(Token.Kind.R_SQUARE) is not None:
-                self._synchronize_lexer_and_tokenizer()
                 return []
         elif delimiter == self.Delimiter.BRACES:
             self._parse_token(Token.Kind.L_BRACE, "Expected '{'" + context_msg)
             if self._parse_optional_token(Token.Kind.R_BRACE) is not None:
-                self._synchronize_lexer_and_tokenizer()
                 return []
         else:
             assert False, "Unknown delimiter"
 
-        self._synchronize_lexer_and_tokenizer()
         elems = [parse()]
-        self._synchronize_lexer_and_tokenizer()
         while self._parse_optional_token(Token.Kind.COMMA) is not None:
-            self._synchronize_lexer_and_tokenizer()
             elems.append(parse())
-            self._synchronize_lexer_and_tokenizer()
 
         if delimiter == self.Delimiter.NONE:
             pass
@@ -828,7 +1145,6 @@ class Parser(ABC):
         else:
             assert False, "Unknown delimiter"
 
-        self._synchronize_lexer_and_tokenizer()
         return elems
 
     def parse_list_of(
@@ -849,11 +1165,13 @@ class Parser(ABC):
         This means, that the setup will not accept the input and instead raise an error:
 
             try_parse = parse_integer_literal
-            separator = 'x'
-            input = 3x4x4xi32
+            input = 3, 4, 4, i32
 
         as it will read [3,4,4], then see another separator, and expects the next
         `try_parse` call to succeed (which won't as i32 is not a valid integer literal)
+
+        Comma-separated lists are parsed from tokens, other separators are
+        matched against the input text.
         """
         first_item = try_parse()
         if first_item is None:
@@ -863,14 +1181,18 @@ class Parser(ABC):
 
         items = [first_item]
 
+        if separator_pattern.pattern == "":
+            while (next_item := try_parse()) is not None:
+                items.append(next_item)
+            return items
+
         while (
-            match := self.tokenizer.next_token_of_pattern(separator_pattern)
+            match := self._parse_optional_token(Token.Kind.COMMA)
+            if separator_pattern is ParserCommons.comma
+            else self._try_parse_pattern(separator_pattern)
         ) is not None:
             next_item = try_parse()
             if next_item is None:
-                # If the separator is emtpy, we are good here
-                if separator_pattern.pattern == "":
-                    return items
                 self.raise_error(
                     error_msg
                     + " because was able to match next separator {}".format(match.text)
@@ -883,15 +1205,12 @@ class Parser(ABC):
         """
         Parse a boolean, if present, with the format `true` or `false`.
         """
-        self._synchronize_lexer_and_tokenizer()
         if self._current_token.kind == Token.Kind.BARE_IDENT:
             if self._current_token.text == "true":
                 self._consume_token(Token.Kind.BARE_IDENT)
-                self._synchronize_lexer_and_tokenizer()
                 return True
             elif self._current_token.text == "false":
                 self._consume_token(Token.Kind.BARE_IDENT)
-                self._synchronize_lexer_and_tokenizer()
                 return False
         return None
 
@@ -912,7 +1231,6 @@ class Parser(ABC):
         decimal or hexadecimal.
         Optionally allow parsing of 'true' or 'false' into 1 and 0.
         """
-        self._synchronize_lexer_and_tokenizer()
         # Parse true and false if needed
         if allow_boolean:
             if (boolean := self.parse_optional_boolean()) is not None:
@@ -927,14 +1245,12 @@ class Parser(ABC):
         if (int_token := self._parse_optional_token(Token.Kind.INTEGER_LIT)) is None:
             if is_negative:
                 self.raise_error("Expected integer literal after '-'")
-            self._synchronize_lexer_and_tokenizer()
             return None
 
         # Get the value and optionally negate it
         value = int_token.get_int_value()
         if is_negative:
             value = -value
-        self._synchronize_lexer_and_tokenizer()
         return value
 
     def parse_optional_number(self) -> int | float | None:
@@ -985,25 +1301,65 @@ class Parser(ABC):
             "Expected integer literal" + context_msg,
         )
 
-    def try_parse_integer_literal(self) -> Span | None:
-        return self.tokenizer.next_token_of_pattern(ParserCommons.integer_literal)
+    def _try_parse_signed_literal(self, kind: Token.Kind) -> Span | None:
+        """
+        Parse a literal token of the given kind, optionally preceded by a sign.
+        Returns the span covering both the sign and the literal.
+        """
+        save = self._save()
+        start = self.pos
+        self._parse_optional_token_in((Token.Kind.MINUS, Token.Kind.PLUS))
+        if (token := self._parse_optional_token(kind)) is None:
+            self._restore(save)
+            return None
+        return Span(start, token.span.end, token.span.input)
 
-    def try_parse_decimal_literal(self) -> Span | None:
-        return self.tokenizer.next_token_of_pattern(ParserCommons.decimal_literal)
+    def try_parse_integer_literal(self) -> Span | None:
+        return self._try_parse_signed_literal(Token.Kind.INTEGER_LIT)
 
     def try_parse_string_literal(self) -> StringLiteral | None:
-        return StringLiteral.from_span(
-            self.tokenizer.next_token_of_pattern(ParserCommons.string_literal)
-        )
+        if (token := self._parse_optional_token(Token.Kind.STRING_LIT)) is None:
+            return None
+        return StringLiteral.from_span(token.span)
 
     def try_parse_float_literal(self) -> Span | None:
-        return self.tokenizer.next_token_of_pattern(ParserCommons.float_literal)
+        return self._try_parse_signed_literal(Token.Kind.FLOAT_LIT)
+
+    def try_parse_decimal_literal(self) -> Span | None:
+        return self._try_parse_pattern(ParserCommons.decimal_literal)
 
     def try_parse_bare_id(self) -> Span | None:
-        return self.tokenizer.next_token_of_pattern(ParserCommons.bare_id)
+        if (token := self._parse_optional_token(Token.Kind.BARE_IDENT)) is None:
+            return None
+        return token.span
 
     def try_parse_value_id(self) -> Span | None:
-        return self.tokenizer.next_token_of_pattern(ParserCommons.value_id)
+        if (token := self._parse_optional_token(Token.Kind.PERCENT_IDENT)) is None:
+            return None
+        return token.span
+
+    def try_parse_suffix_id(self) -> Span | None:
+        return self._try_parse_pattern(ParserCommons.suffix_id)
+
+    def try_parse_boolean_literal(self) -> Span | None:
+        if self._current_token.kind != Token.Kind.BARE_IDENT or (
+            self._current_token.text not in ("true", "false")
+        ):
+            return None
+        return self._consume_token().span
+
+    def _try_parse_pattern(self, pattern: re.Pattern[str]) -> Span | None:
+        """
+        Parse the text matching a regular expression at the start of the next
+        token, and return its span. Otherwise, return None without consuming
+        anything. The match may end in the middle of a token.
+        """
+        input = self.lexer.input
+        match = pattern.match(input.content, self.pos)
+        if match is None or match.end() == match.start():
+            return None
+        self.resume_from(match.end())
+        return Span(match.start(), match.end(), input)
 
     _decimal_integer_regex = re.compile(r"[0-9]+")
 
@@ -1011,7 +1367,6 @@ class Parser(ABC):
         """
         Parse an operand with format `%<value-id>(#<int-literal>)?`, if present.
         """
-        self._synchronize_lexer_and_tokenizer()
         name_token = self._parse_optional_token(Token.Kind.PERCENT_IDENT)
         if name_token is None:
             return None
@@ -1038,21 +1393,16 @@ class Parser(ABC):
                 index_token.span,
             )
 
-        self._synchronize_lexer_and_tokenizer()
         return self.ssa_values[name][index]
 
     def parse_operand(self, msg: str = "Expected an operand.") -> SSAValue:
         """Parse an operand with format `%<value-id>`."""
         return self.expect(self.parse_optional_operand, msg)
 
-    def try_parse_suffix_id(self) -> Span | None:
-        return self.tokenizer.next_token_of_pattern(ParserCommons.suffix_id)
-
     def try_parse_block_id(self) -> Span | None:
-        return self.tokenizer.next_token_of_pattern(ParserCommons.block_id)
-
-    def try_parse_boolean_literal(self) -> Span | None:
-        return self.tokenizer.next_token_of_pattern(ParserCommons.boolean_literal)
+        if (token := self._parse_optional_token(Token.Kind.CARET_IDENT)) is None:
+            return None
+        return token.span
 
     def try_parse_value_id_and_type(self) -> tuple[Span, Attribute] | None:
         with self.backtracking("value id and type"):
@@ -1061,7 +1411,9 @@ class Parser(ABC):
             if value_id is None:
                 self.raise_error("Invalid value-id format!")
 
-            self.parse_characters(":", "Expected expression (value-id `:` type)")
+            self._parse_token(
+                Token.Kind.COLON, "Expected expression (value-id `:` type)"
+            )
 
             type = self.try_parse_type()
 
@@ -1070,55 +1422,55 @@ class Parser(ABC):
             return value_id, type
 
     def try_parse_type(self) -> Attribute | None:
-        if self.tokenizer.starts_with("!"):
-            return self.try_parse_dialect_type()
+        return self._memoized(self._try_parse_type)
+
+    def _try_parse_type(self) -> Attribute | None:
+        if self._current_token.kind == Token.Kind.EXCLAMATION_IDENT:
+            type = self.try_parse_dialect_type()
         else:
-            return self.try_parse_builtin_type()
+            type = self.try_parse_builtin_type()
+        if type is None:
+            return None
+        return self.ctx.get_unique_instance(type)
 
     def try_parse_dialect_type_or_attribute(self) -> Attribute | None:
         """
         Parse a type or an attribute.
         """
-        kind = self.tokenizer.next_token_of_pattern(re.compile("[!#]"), peek=True)
-
-        if kind is None:
-            return None
-
-        with self.backtracking("dialect attribute or type"):
-            self.tokenizer.consume_peeked(kind)
-            if kind.text == "!":
-                return self._parse_dialect_type_or_attribute_inner("type")
-            else:
-                return self._parse_dialect_type_or_attribute_inner("attribute")
+        if (type := self.try_parse_dialect_type()) is not None:
+            return type
+        return self.try_parse_dialect_attr()
 
     def try_parse_dialect_type(self):
         """
         Parse a dialect type (something prefixed by `!`, defined by a dialect)
         """
-        if not self.tokenizer.starts_with("!"):
+        if self._current_token.kind != Token.Kind.EXCLAMATION_IDENT:
             return None
         with self.backtracking("dialect type"):
-            self.parse_characters("!", "Dialect type must start with a `!`")
-            return self._parse_dialect_type_or_attribute_inner("type")
+            name = self._consume_token(Token.Kind.EXCLAMATION_IDENT)
+            return self._parse_dialect_type_or_attribute_inner(name, "type")
 
     def try_parse_dialect_attr(self):
         """
         Parse a dialect attribute (something prefixed by `#`, defined by a dialect)
         """
-        if not self.tokenizer.starts_with("#"):
+        if self._current_token.kind != Token.Kind.HASH_IDENT:
             return None
         with self.backtracking("dialect attribute"):
-            self.parse_characters("#", "Dialect attribute must start with a `#`")
-            return self._parse_dialect_type_or_attribute_inner("attribute")
+            name = self._consume_token(Token.Kind.HASH_IDENT)
+            return self._parse_dialect_type_or_attribute_inner(name, "attribute")
 
     def _parse_dialect_type_or_attribute_inner(
-        self, kind: Literal["attribute"] | Literal["type"]
+        self, name: Token, kind: Literal["attribute"] | Literal["type"]
     ) -> Attribute:
+        """
+        Parse the parameters of a dialect type or attribute, given the token
+        holding its prefixed name (`!name` or `#name`).
+        """
         is_type = kind == "type"
-        type_name = self.tokenizer.next_token_of_pattern(ParserCommons.bare_id)
-
-        if type_name is None:
-            self.raise_error("Expected dialect {} name here!".format(kind))
+        # Drop the leading `!` or `#`
+        type_name = Span(name.span.start + 1, name.span.end, name.span.input)
 
         type_def = self.ctx.get_optional_attr(
             type_name.text,
@@ -1133,18 +1485,17 @@ class Parser(ABC):
         # Pass the task of parsing parameters on to the attribute/type definition
         if issubclass(type_def, UnregisteredAttr):
             body = self._parse_unregistered_attr_body()
-            self._synchronize_lexer_and_tokenizer()
             return type_def(type_name.text, is_type, body)
         if issubclass(type_def, ParametrizedAttribute):
             param_list = type_def.parse_parameters(self)
-            return type_def.new(param_list)
+            return self.ctx.get_unique_attribute(type_def, param_list)
         if issubclass(type_def, Data):
-            self.parse_characters("<", "This attribute must be parametrized!")
+            self._parse_token(Token.Kind.LESS, "This attribute must be parametrized!")
             param: Any = type_def.parse_parameter(self)
-            self.parse_characters(
-                ">", "Invalid attribute parametrization, expected `>`!"
+            self._parse_token(
+                Token.Kind.GREATER, "Invalid attribute parametrization, expected `>`!"
             )
-            return cast(Data[Any], type_def(param))
+            return self.ctx.get_unique_instance(cast(Data[Any], type_def(param)))
         assert False, "Attributes are either ParametrizedAttribute or Data."
 
     def _parse_unregistered_attr_body(self) -> str:
@@ -1152,7 +1503,6 @@ class Parser(ABC):
         Parse the body of an unregistered attribute, which is a balanced
         string for `<`, `(`, `[`, `{`, and may contain string literals.
         """
-        self._synchronize_lexer_and_tokenizer()
         start_token = self._parse_optional_token(Token.Kind.LESS)
         if start_token is None:
             return ""
@@ -1208,7 +1558,6 @@ class Parser(ABC):
 
         body = self.lexer.input.slice(start_pos, end_pos)
         assert body is not None
-        self._synchronize_lexer_and_tokenizer()
         return body
 
     def _parse_builtin_parametrized_type(self, name: Span) -> ParametrizedAttribute:
@@ -1228,12 +1577,10 @@ class Parser(ABC):
             "tuple": unimplemented,
         }
 
-        self.parse_characters("<", "Expected parameter list here!")
+        self._parse_token(Token.Kind.LESS, "Expected parameter list here!")
         # Get the parser for the type, falling back to the unimplemented warning
-        self._synchronize_lexer_and_tokenizer()
         res = builtin_parsers.get(name.text, unimplemented)()
-        self._synchronize_lexer_and_tokenizer()
-        self.parse_characters(">", "Expected end of parameter list here!")
+        self._parse_token(Token.Kind.GREATER, "Expected end of parameter list here!")
 
         return res
 
@@ -1293,6 +1640,52 @@ class Parser(ABC):
         # Move the lexer to the position after 'x'.
         self.resume_from(self._current_token.span.start + 1)
 
+    def parse_optional_shape_delimiter(self) -> str | None:
+        """
+        Parse 'x', a shape delimiter, if present. As in
+        `_parse_shape_delimiter`, a token starting with 'x' is split.
+        """
+        if (
+            self._current_token.kind != Token.Kind.BARE_IDENT
+            or self._current_token.text[0] != "x"
+        ):
+            return None
+        self._parse_shape_delimiter()
+        return "x"
+
+    def try_parse_numerical_dims(
+        self, accept_closing_bracket: bool = False, lower_bound: int = 1
+    ) -> Iterable[int]:
+        """
+        Parse the dimensions of a shape, with format `(dimension `x`)*`, where
+        `?` is interpreted as -1.
+        """
+        while (dim := self._try_parse_shape_element(lower_bound)) is not None:
+            yield dim
+            # Look out for the closing bracket for scalable vector dims
+            if (
+                accept_closing_bracket
+                and self._current_token.kind == Token.Kind.R_SQUARE
+            ):
+                break
+            self._parse_shape_delimiter()
+
+    def _try_parse_shape_element(self, lower_bound: int) -> int | None:
+        """
+        Parse a shape dimension if present, where `?` is interpreted as -1.
+        Static dimensions should be greater or equal to `lower_bound`.
+        """
+        if self._current_token.kind not in (
+            Token.Kind.INTEGER_LIT,
+            Token.Kind.QUESTION,
+        ):
+            return None
+        span = self._current_token.span
+        dim = self._parse_shape_dimension()
+        if dim != -1 and dim < lower_bound:
+            raise ParseError(span, "Shape element literal cannot be negative or zero!")
+        return dim
+
     def _parse_ranked_shape(self) -> tuple[list[int], Attribute]:
         """
         Parse a ranked shape with the following format:
@@ -1300,14 +1693,12 @@ class Parser(ABC):
           dimension ::= `?` | decimal-literal
         each dimension is also required to be non-negative.
         """
-        self._synchronize_lexer_and_tokenizer()
         dims: list[int] = []
         while self._current_token.kind in (Token.Kind.INTEGER_LIT, Token.Kind.QUESTION):
             dim = self._parse_shape_dimension()
             dims.append(dim)
             self._parse_shape_delimiter()
 
-        self._synchronize_lexer_and_tokenizer()
         type = self.expect(self.try_parse_type, "Expected shape type.")
         return dims, type
 
@@ -1322,14 +1713,11 @@ class Parser(ABC):
 
         each dimension is also required to be non-negative.
         """
-        self._synchronize_lexer_and_tokenizer()
         if self.parse_optional_punctuation("*") is not None:
             self._parse_shape_delimiter()
             type = self.expect(self.try_parse_type, "Expected shape type.")
-            self._synchronize_lexer_and_tokenizer()
             return None, type
         res = self._parse_ranked_shape()
-        self._synchronize_lexer_and_tokenizer()
         return res
 
     def parse_complex_attrs(self) -> ComplexType:
@@ -1348,26 +1736,19 @@ class Parser(ABC):
         # Unranked case
         if shape is None:
             if self.parse_optional_punctuation(",") is None:
-                self._synchronize_lexer_and_tokenizer()
                 return UnrankedMemrefType.from_type(type)
-            self._synchronize_lexer_and_tokenizer()
             memory_space = self.parse_attribute()
-            self._synchronize_lexer_and_tokenizer()
             return UnrankedMemrefType.from_type(type, memory_space)
 
         if self.parse_optional_punctuation(",") is None:
             return MemRefType.from_element_type_and_shape(type, shape)
 
-        self._synchronize_lexer_and_tokenizer()
         memory_or_layout = self.parse_attribute()
-        self._synchronize_lexer_and_tokenizer()
 
         # If there is both a memory space and a layout, we know that the
         # layout is the second one
         if self.parse_optional_punctuation(",") is not None:
-            self._synchronize_lexer_and_tokenizer()
             memory_space = self.parse_attribute()
-            self._synchronize_lexer_and_tokenizer()
             return MemRefType.from_element_type_and_shape(
                 type, shape, memory_or_layout, memory_space
             )
@@ -1395,19 +1776,7 @@ class Parser(ABC):
             "Cannot decide if the given attribute " "is a layout or a memory space!"
         )
 
-    def try_parse_numerical_dims(
-        self, accept_closing_bracket: bool = False, lower_bound: int = 1
-    ) -> Iterable[int]:
-        while (shape_arg := self._try_parse_shape_element(lower_bound)) is not None:
-            yield shape_arg
-            # Look out for the closing bracket for scalable vector dims
-            if accept_closing_bracket and self.tokenizer.starts_with("]"):
-                break
-            self.parse_characters("x", "Unexpected end of dimension parameters!")
-
     def parse_vector_attrs(self) -> AnyVectorType:
-        self._synchronize_lexer_and_tokenizer()
-
         dims: list[int] = []
         num_scalable_dims = 0
         # First, parse the static dimensions
@@ -1429,12 +1798,10 @@ class Parser(ABC):
             # Parse the `x` between the scalable dimensions and the type
             self._parse_shape_delimiter()
 
-        self._synchronize_lexer_and_tokenizer()
         type = self.try_parse_type()
         if type is None:
             self.raise_error("Expected the vector element types!")
 
-        self._synchronize_lexer_and_tokenizer()
         return VectorType.from_element_type_and_shape(type, dims, num_scalable_dims)
 
     def parse_tensor_attrs(self) -> AnyTensorType | AnyUnrankedTensorType:
@@ -1445,46 +1812,12 @@ class Parser(ABC):
                 self.raise_error("Unranked tensors don't have an encoding!")
             return UnrankedTensorType.from_type(type)
 
-        self._synchronize_lexer_and_tokenizer()
         if self.parse_optional_punctuation(",") is not None:
-            self._synchronize_lexer_and_tokenizer()
             encoding = self.parse_attribute()
             return TensorType.from_type_and_list(type, shape, encoding)
 
         return TensorType.from_type_and_list(type, shape)
 
-    def _try_parse_shape_element(self, lower_bound: int = 1) -> int | None:
-        """
-        Parse a shape element, either a decimal integer immediate or a `?`,
-        which evaluates to -1 immediate cannot be smaller than lower_bound
-        (defaults to 1, is 0 for tensors and memrefs)
-        """
-        int_lit = self.try_parse_decimal_literal()
-
-        if int_lit is not None:
-            value = int(int_lit.text)
-            if value < lower_bound:
-                # TODO: this is ugly, it's a raise inside a try_ type function, which
-                # should instead just give up
-                raise ParseError(
-                    int_lit, "Shape element literal cannot be negative or zero!"
-                )
-            return value
-
-        if self.tokenizer.next_token_of_pattern("?") is not None:
-            return -1
-        return None
-
-    def _parse_type_params(self) -> list[Attribute]:
-        # Consume opening bracket
-        self.parse_characters("<", "Type must be parameterized!")
-
-        params = self.parse_list_of(self.try_parse_type, "Expected a type here!")
-
-        self.parse_characters(">", "Expected end of type parameterization here!")
-
-        return params
-
     def expect(self, try_parse: Callable[[], T_ | None], error_message: str) -> T_:
         """
         Used to force completion of a try_parse function.
@@ -1501,14 +1834,29 @@ class Parser(ABC):
 
         This will, for example, include backtracking errors, if any occurred previously.
         """
-        self._synchronize_lexer_and_tokenizer()
         if at_position is None:
-            at_position = self.tokenizer.next_token(peek=True)
+            at_position = self._current_token.span
 
-        raise ParseError(at_position, msg, self.tokenizer.history)
+        raise ParseError(at_position, msg, self.history)
 
     def try_parse_characters(self, text: str) -> Span | None:
-        return self.tokenizer.next_token_of_pattern(text)
+        """
+        Parse the given text if the next tokens spell it exactly, and return the
+        span covering them. The text may be spread over multiple tokens, such as
+        `<(` or `::`. Otherwise, return None without consuming anything.
+        """
+        save = self._save()
+        start = self.pos
+        end = start
+        remaining = text
+        while remaining:
+            token = self._current_token
+            if token.kind == Token.Kind.EOF or not remaining.startswith(token.text):
+                self._restore(save)
+                return None
+            remaining = remaining[len(token.text) :]
+            end = self._consume_token().span.end
+        return Span(start, end, self.lexer.input)
 
     def parse_characters(self, text: str, msg: str) -> Span:
         if (match := self.try_parse_characters(text)) is None:
@@ -1520,15 +1868,15 @@ class Parser(ABC):
             return self.parse_operation()
 
     def parse_operation(self) -> Operation:
-        self._synchronize_lexer_and_tokenizer()
         if self._current_token.kind == Token.Kind.PERCENT_IDENT:
             results = self._parse_op_result_list()
         else:
             results = []
         ret_types = [result[2] for result in results]
         if len(results) > 0:
-            self.parse_characters(
-                "=", "Operation definitions expect an `=` after op-result-list!"
+            self._parse_token(
+                Token.Kind.EQUAL,
+                "Operation definitions expect an `=` after op-result-list!",
             )
 
         # Check for custom op format
@@ -1582,6 +1930,8 @@ class Parser(ABC):
             self.ssa_values[ssa_val_name] = tuple(
                 op.results[res_idx : res_idx + res_size]
             )
+            if self._defined_ssa_names is not None:
+                self._defined_ssa_names.add(ssa_val_name)
             res_idx += res_size
             # Carry over `ssa_val_name` for non-numeric names:
             if SSAValue.is_valid_name(ssa_val_name):
@@ -1615,18 +1965,20 @@ class Parser(ABC):
         region = Region()
 
         try:
-            self.parse_characters("{", "Regions begin with `{`")
-            if self.tokenizer.starts_with("}"):
+            self._parse_token(Token.Kind.L_BRACE, "Regions begin with `{`")
+            if self._current_token.kind == Token.Kind.R_BRACE:
                 region.add_block(Block())
             else:
                 # Parse first block
                 block = self.parse_block()
                 region.add_block(block)
 
-                while self.tokenizer.starts_with("^"):
+                while self._current_token.kind == Token.Kind.CARET_IDENT:
                     region.add_block(self.parse_block())
 
-            end = self.parse_characters("}", "Reached end of region, expected `}`!")
+            end = self._parse_token(
+                Token.Kind.R_BRACE, "Reached end of region, expected `}`!"
+            ).span
 
             if len(self.forward_block_references) > 0:
                 raise MultipleSpansParseError(
@@ -1646,7 +1998,7 @@ class Parser(ABC):
                             *self.forward_block_references.values()
                         )
                     ],
-                    self.tokenizer.history,
+                    self.history,
                 )
 
             return region
@@ -1655,11 +2007,6 @@ class Parser(ABC):
             self.blocks = oldBBNames
             self.forward_block_references = oldForwardRefs
 
-    def _try_parse_op_name(self) -> Span | None:
-        if (str_lit := self.try_parse_string_literal()) is not None:
-            return str_lit
-        return self.try_parse_bare_id()
-
     def _parse_attribute_entry(self) -> tuple[Span, Attribute]:
         """
         Parse entry in attribute dict. Of format:
@@ -1675,16 +2022,15 @@ class Parser(ABC):
                 "Expected bare-id or string-literal here as part of attribute entry!"
             )
 
-        if not self.tokenizer.starts_with("="):
+        if self._parse_optional_token(Token.Kind.EQUAL) is None:
             return name, UnitAttr()
 
-        self.parse_characters(
-            "=", "Attribute entries must be of format name `=` attribute!"
-        )
-
         return name, self.parse_attribute()
 
     def try_parse_attribute(self) -> Attribute | None:
+        return self._memoized(self._try_parse_attribute)
+
+    def _try_parse_attribute(self) -> Attribute | None:
         with self.backtracking("attribute"):
             return self.parse_attribute()
 
@@ -1692,8 +2038,8 @@ class Parser(ABC):
         """
         Parses `:` type and returns the type
         """
-        self.parse_characters(
-            ":", "Expected attribute type definition here ( `:` type )"
+        self._parse_token(
+            Token.Kind.COLON, "Expected attribute type definition here ( `:` type )"
         )
         return self.expect(
             self.try_parse_type, "Expected attribute type definition here ( `:` type )"
@@ -1703,18 +2049,24 @@ class Parser(ABC):
         """
         Tries to parse a builtin attribute, e.g. a string literal, int, array, etc..
         """
-        next_token = self.tokenizer.next_token(peek=True)
-        if next_token.text == '"':
+        return self._memoized(self._try_parse_builtin_attr)
+
+    def _try_parse_builtin_attr(self) -> Attribute | None:
+        next_token = self._current_token
+        if next_token.kind == Token.Kind.STRING_LIT:
             return self.try_parse_builtin_str_attr()
-        elif next_token.text == "[":
+        elif next_token.kind == Token.Kind.L_SQUARE:
             return self.try_parse_builtin_arr_attr()
-        elif next_token.text == "@":
+        elif next_token.kind == Token.Kind.AT_IDENT:
             return self.try_parse_ref_attr()
-        elif next_token.text == "{":
+        elif next_token.kind == Token.Kind.L_BRACE:
             return self.parse_builtin_dict_attr()
-        elif next_token.text == "(":
+        elif next_token.kind == Token.Kind.L_PAREN:
             return self.try_parse_function_type()
-        elif next_token.text in ParserCommons.builtin_attr_names:
+        elif (
+            next_token.kind == Token.Kind.BARE_IDENT
+            and next_token.text in ParserCommons.builtin_attr_names
+        ):
             return self.try_parse_builtin_named_attr()
 
         attrs = (
@@ -1726,17 +2078,14 @@ class Parser(ABC):
             if (val := attr_parser()) is not None:
                 return val
 
-        self._synchronize_lexer_and_tokenizer()
         if self._current_token.text == "strided":
             strided = self.parse_strided_layout_attr()
-            self._synchronize_lexer_and_tokenizer()
             return strided
 
         return None
 
     def _parse_int_or_question(self, context_msg: str = "") -> int | Literal["?"]:
         """Parse either an integer literal, or a '?'."""
-        self._synchronize_lexer_and_tokenizer()
         if self._parse_optional_token(Token.Kind.QUESTION) is not None:
             return "?"
         if (v := self.parse_optional_integer(allow_boolean=False)) is not None:
@@ -1799,9 +2148,11 @@ class Parser(ABC):
         return StridedLayoutAttr(strides, None if offset == "?" else offset)
 
     def try_parse_builtin_named_attr(self) -> Attribute | None:
-        name = self.tokenizer.next_token(peek=True)
+        if self._current_token.kind != Token.Kind.BARE_IDENT:
+            return None
+        name = self._current_token.span
         with self.backtracking("Builtin attribute {}".format(name.text)):
-            self.tokenizer.consume_peeked(name)
+            self._consume_token(Token.Kind.BARE_IDENT)
             parsers = {
                 "dense": self._parse_builtin_dense_attr,
                 "opaque": self._parse_builtin_opaque_attr,
@@ -1817,7 +2168,6 @@ class Parser(ABC):
             return parsers.get(name.text, not_implemented)(name)
 
     def _parse_builtin_dense_attr(self, _name: Span) -> DenseIntOrFPElementsAttr:
-        self._synchronize_lexer_and_tokenizer()
         self.parse_punctuation("<", " in dense attribute")
 
         # The flatten list of elements
@@ -1827,17 +2177,20 @@ class Parser(ABC):
         # If it is `[]`, then this is a splat attribute, meaning it has the same
         # value everywhere.
         shape: list[int] | None
+        # The raw data of the hex form, e.g. `dense<"0x0100000002000000">`.
+        raw_data: tuple[bytes, Span] | None = None
         if self._current_token.text == ">":
             values, shape = [], None
+        elif self._current_token.kind == Token.Kind.STRING_LIT:
+            values, shape = [], None
+            raw_data = self._parse_dense_hex_literal()
         else:
             values, shape = self._parse_tensor_literal()
         self.parse_punctuation(">", " in dense attribute")
 
         # Parse the dense type.
         self.parse_punctuation(":", " in dense attribute")
-        self._synchronize_lexer_and_tokenizer()
         type = self.expect(self.try_parse_type, "Dense attribute must be typed!")
-        self._synchronize_lexer_and_tokenizer()
 
         # Check that the type is correct.
         if not isa(
@@ -1854,6 +2207,14 @@ class Parser(ABC):
         type_shape = [dim.value.data for dim in type.shape.data]
         num_values = math.prod(type_shape)
 
+        if raw_data is not None:
+            if any(dim == -1 for dim in type_shape):
+                self.raise_error(f"Dense literal attribute should have a static shape.")
+            try:
+                return DenseIntOrFPElementsAttr.from_raw_data(type, raw_data[0])
+            except ValueError as e:
+                self.raise_error(str(e), raw_data[1])
+
         if shape is None and num_values != 0:
             self.raise_error(
                 "Expected at least one element in the " "dense literal, but got None"
@@ -1876,6 +2237,20 @@ class Parser(ABC):
 
         return DenseIntOrFPElementsAttr.from_list(type, data_values)
 
+    def _parse_dense_hex_literal(self) -> tuple[bytes, Span]:
+        """
+        Parse the hex form of the elements of a dense attribute, which is a
+        string literal starting with `0x`, and return the encoded bytes.
+        """
+        literal = self.expect(self.try_parse_string_literal, "Expected hex string")
+        contents = literal.string_contents
+        if not contents.startswith("0x"):
+            self.raise_error("Expected hex string starting with `0x`", literal)
+        try:
+            return bytes.fromhex(contents[2:]), literal
+        except ValueError:
+            self.raise_error("Malformed hex string in dense attribute", literal)
+
     def _parse_builtin_opaque_attr(self, _name: Span):
         self.parse_characters("<", "Opaque attribute must be parametrized")
         str_lit_list = self.parse_list_of(
@@ -1890,8 +2265,7 @@ class Parser(ABC):
         )
 
         type = NoneAttr()
-        if self.tokenizer.starts_with(":"):
-            self.parse_characters(":", "opaque attribute must be typed!")
+        if self._parse_optional_token(Token.Kind.COLON) is not None:
             type = self.expect(self.try_parse_type, "opaque attribute must be typed!")
 
         return OpaqueAttr.from_strings(
@@ -1932,15 +2306,8 @@ class Parser(ABC):
 
         self.parse_characters(":", err_msg)
 
-        def try_parse_dense_array_value() -> int | float | None:
-            if (v := self.try_parse_float_literal()) is not None:
-                return float(v.text)
-            if (v := self.try_parse_integer_literal()) is not None:
-                return int(v.text)
-            return None
-
         values = self.parse_list_of(
-            try_parse_dense_array_value, "Expected tensor literal here!"
+            self.parse_optional_number, "Expected tensor literal here!"
         )
         self.parse_characters(">", err_msg)
 
@@ -1964,7 +2331,6 @@ class Parser(ABC):
         # We then parse the attribute body. Affine attributes are closed by
         # `>`, so we can wait until we see this token. We just need to make
         # sure that we do not stop at a `>=`.
-        self._synchronize_lexer_and_tokenizer()
         start_pos = self._current_token.span.start
         end_pos = start_pos
         self.parse_punctuation("<", f" in {name.text} attribute")
@@ -1988,7 +2354,6 @@ class Parser(ABC):
         contents = self.lexer.input.slice(start_pos, end_pos)
         assert contents is not None, "Fatal error in parser"
 
-        self._synchronize_lexer_and_tokenizer()
         return attr_def(name.text, False, contents)
 
     @dataclass
@@ -2031,8 +2396,6 @@ class Parser(ABC):
                 )
             if not isinstance(self.value, bool | int):
                 parser.raise_error("Expected integer value", at_position=self.span)
-            if self.is_negative:
-                return -int(self.value)
             return int(self.value)
 
         def to_float(self, parser: Parser) -> float:
@@ -2042,8 +2405,6 @@ class Parser(ABC):
             """
             if not isinstance(self.value, int | float):
                 parser.raise_error("Expected float value", at_position=self.span)
-            if self.is_negative:
-                return -float(self.value)
             return float(self.value)
 
         def to_type(self, parser: Parser, type: AnyFloat | IntegerType | IndexType):
@@ -2119,45 +2480,16 @@ class Parser(ABC):
             element = self._parse_tensor_literal_element()
             return [element], []
 
-    def _parse_builtin_dense_attr_args(self) -> Iterable[int | float]:
-        """
-        Dense attribute params must be:
-
-        dense-attr-params           := float-literal | int-literal | list-of-dense-attrs-params
-        list-of-dense-attrs-params  := `[` dense-attr-params (`,` dense-attr-params)* `]`
-        """
-
-        def try_parse_int_or_float():
-            if (literal := self.try_parse_float_literal()) is not None:
-                return float(literal.text)
-            if (literal := self.try_parse_integer_literal()) is not None:
-                return int(literal.text)
-            self.raise_error("Expected int or float literal here!")
-
-        if not self.tokenizer.starts_with("["):
-            yield try_parse_int_or_float()
-            return
-
-        self.parse_characters("[", "")
-        while not self.tokenizer.starts_with("]"):
-            yield from self._parse_builtin_dense_attr_args()
-            if self.tokenizer.next_token_of_pattern(",") is None:
-                break
-        self.parse_characters("]", "")
-
     def try_parse_ref_attr(self) -> SymbolRefAttr | None:
-        if not self.tokenizer.starts_with("@"):
+        if self._current_token.kind != Token.Kind.AT_IDENT:
             return None
 
-        refs = self.parse_reference()
+        refs = [self._span_to_str(ref) for ref in self.parse_reference()]
 
-        if len(refs) >= 1:
-            return SymbolRefAttr(
-                StringAttr(refs[0].text),
-                ArrayAttr([StringAttr(ref.text) for ref in refs[1:]]),
-            )
-        else:
-            return None
+        return SymbolRefAttr(
+            StringAttr(refs[0]),
+            ArrayAttr([StringAttr(ref) for ref in refs[1:]]),
+        )
 
     def parse_optional_builtin_int_or_float_attr(
         self,
@@ -2166,13 +2498,10 @@ class Parser(ABC):
         if bool is not None:
             return bool
 
-        self._synchronize_lexer_and_tokenizer()
-
         # Parse the value
         if (value := self.parse_optional_number()) is None:
             return None
 
-        self._synchronize_lexer_and_tokenizer()
         # If no types are given, we take the default ones
         if self._current_token.kind != Token.Kind.COLON:
             if isinstance(value, float):
@@ -2181,7 +2510,6 @@ class Parser(ABC):
 
         # Otherwise, we parse the attribute type
         type = self._parse_attribute_type()
-        self._synchronize_lexer_and_tokenizer()
 
         if isinstance(type, AnyFloat):
             return FloatAttr(float(value), type)
@@ -2196,14 +2524,12 @@ class Parser(ABC):
     def try_parse_builtin_boolean_attr(
         self,
     ) -> IntegerAttr[IntegerType | IndexType] | None:
-        self._synchronize_lexer_and_tokenizer()
         if (value := self.parse_optional_boolean()) is not None:
-            self._synchronize_lexer_and_tokenizer()
             return IntegerAttr.from_params(1 if value else 0, IntegerType(1))
         return None
 
     def try_parse_builtin_str_attr(self):
-        if not self.tokenizer.starts_with('"'):
+        if self._current_token.kind != Token.Kind.STRING_LIT:
             return None
 
         with self.backtracking("string literal"):
@@ -2213,34 +2539,32 @@ class Parser(ABC):
             return StringAttr(literal.string_contents)
 
     def try_parse_builtin_arr_attr(self) -> AnyArrayAttr | None:
-        if not self.tokenizer.starts_with("["):
+        if self._current_token.kind != Token.Kind.L_SQUARE:
             return None
         with self.backtracking("array literal"):
-            self.parse_characters("[", "Array literals must start with `[`")
+            self._parse_token(Token.Kind.L_SQUARE, "Array literals must start with `[`")
             attrs = self.parse_list_of(
                 self.try_parse_attribute, "Expected array entry!"
             )
-            self.parse_characters(
-                "]", "Malformed array contents (expected end of array here!"
+            self._parse_token(
+                Token.Kind.R_SQUARE,
+                "Malformed array contents (expected end of array here!",
             )
             return ArrayAttr(attrs)
 
     def parse_optional_dictionary_attr_dict(self) -> dict[str, Attribute]:
-        if not self.tokenizer.starts_with("{"):
+        if self._parse_optional_token(Token.Kind.L_BRACE) is None:
             return dict()
 
-        self.parse_characters(
-            "{", "Attribute dictionary must be enclosed in curly brackets"
-        )
-
         attrs = []
-        if not self.tokenizer.starts_with("}"):
+        if self._current_token.kind != Token.Kind.R_BRACE:
             attrs = self.parse_list_of(
                 self._parse_attribute_entry, "Expected attribute entry"
             )
 
-        self.parse_characters(
-            "}", "Attribute dictionary must be enclosed in curly brackets"
+        self._parse_token(
+            Token.Kind.R_BRACE,
+            "Attribute dictionary must be enclosed in curly brackets",
         )
 
         return self._attr_dict_from_tuple_list(attrs)
@@ -2252,13 +2576,14 @@ class Parser(ABC):
         Convert a list of tuples (Span, Attribute) to a dictionary.
         This function converts the span to a string, trimming quotes from string literals
         """
+        return dict((self._span_to_str(span), attr) for span, attr in tuple_list)
 
-        def span_to_str(span: Span) -> str:
-            if isinstance(span, StringLiteral):
-                return span.string_contents
-            return span.text
-
-        return dict((span_to_str(span), attr) for span, attr in tuple_list)
+    @staticmethod
+    def _span_to_str(span: Span) -> str:
+        """Get the text of a span, trimming quotes from string literals."""
+        if isinstance(span, StringLiteral):
+            return span.string_contents
+        return span.text
 
     def parse_function_type(self) -> FunctionType:
         """
@@ -2275,17 +2600,20 @@ class Parser(ABC):
 
         Uses type-or-type-list-parens internally
         """
-        self.parse_characters("(", "First group of function args must start with a `(`")
+        self._parse_token(
+            Token.Kind.L_PAREN, "First group of function args must start with a `(`"
+        )
 
         args: list[Attribute] = self.parse_list_of(
             self.try_parse_type, "Expected type here!"
         )
 
-        self.parse_characters(
-            ")", "Malformed function type, expected closing brackets of argument types!"
+        self._parse_token(
+            Token.Kind.R_PAREN,
+            "Malformed function type, expected closing brackets of argument types!",
         )
 
-        self.parse_characters("->", "Malformed function type, expected `->`!")
+        self._parse_token(Token.Kind.ARROW, "Malformed function type, expected `->`!")
 
         return FunctionType.from_lists(args, self._parse_type_or_type_list_parens())
 
@@ -2297,9 +2625,11 @@ class Parser(ABC):
         type-list-parens         ::= `(` `)` | `(` type-list-no-parens `)`
         type-list-no-parens      ::=  type (`,` type)*
         """
-        if self.tokenizer.next_token_of_pattern("(") is not None:
+        if self._parse_optional_token(Token.Kind.L_PAREN) is not None:
             args = self.parse_list_of(self.try_parse_type, "Expected type here!")
-            self.parse_characters(")", "Unclosed function type argument list!")
+            self._parse_token(
+                Token.Kind.R_PAREN, "Unclosed function type argument list!"
+            )
         else:
             arg = self.expect(
                 self.try_parse_type,
@@ -2309,7 +2639,7 @@ class Parser(ABC):
         return args
 
     def try_parse_function_type(self) -> FunctionType | None:
-        if not self.tokenizer.starts_with("("):
+        if self._current_token.kind != Token.Kind.L_PAREN:
             return None
         with self.backtracking("function type"):
             return self.parse_function_type()
@@ -2319,17 +2649,21 @@ class Parser(ABC):
         Parses one of the builtin types like i42, vector, etc...
         """
         if name.text == "index":
-            return IndexType()
+            return self.ctx.get_unique_attribute(IndexType, [])
         if (re_match := re.match(r"^[su]?i(\d+)$", name.text)) is not None:
             signedness = {
                 "s": Signedness.SIGNED,
                 "u": Signedness.UNSIGNED,
                 "i": Signedness.SIGNLESS,
             }
-            return IntegerType(int(re_match.group(1)), signedness[name.text[0]])
+            width = self.ctx.get_unique_attribute(IntAttr, int(re_match.group(1)))
+            signedness_attr = self.ctx.get_unique_attribute(
+                SignednessAttr, signedness[name.text[0]]
+            )
+            return self.ctx.get_unique_attribute(IntegerType, [width, signedness_attr])
 
         if name.text == "bf16":
-            return BFloat16Type()
+            return self.ctx.get_unique_attribute(BFloat16Type, [])
 
         if (re_match := re.match(r"^f(\d+)$", name.text)) is not None:
             width = int(re_match.group(1))
@@ -2342,22 +2676,21 @@ class Parser(ABC):
             }.get(width, None)
             if type is None:
                 self.raise_error("Unsupported floating point width: {}".format(width))
-            return type()
+            return self.ctx.get_unique_attribute(type, [])
 
         return self._parse_builtin_parametrized_type(name)
 
     def parse_paramattr_parameters(
         self, skip_white_space: bool = True
     ) -> list[Attribute]:
-        opening_brackets = self.tokenizer.next_token_of_pattern("<")
-        if opening_brackets is None:
+        if self._parse_optional_token(Token.Kind.LESS) is None:
             return []
 
         res = self.parse_list_of(
             self.try_parse_attribute, "Expected another attribute here!"
         )
 
-        if self.tokenizer.next_token_of_pattern(">") is None:
+        if self._parse_optional_token(Token.Kind.GREATER) is None:
             self.raise_error(
                 "Malformed parameter list, expected either another parameter or `>`!"
             )
@@ -2395,11 +2728,9 @@ class Parser(ABC):
         dictionary, and usually correspond to the names of the attributes that are
         already passed through the operation custom assembly format.
         """
-        self._synchronize_lexer_and_tokenizer()
         begin_pos = self.lexer.pos
         if self.parse_optional_keyword("attributes") is None:
             return None
-        self._synchronize_lexer_and_tokenizer()
         attr = self.parse_builtin_dict_attr()
         for reserved_name in reserved_attr_names:
             if reserved_name in attr.data:
@@ -2417,7 +2748,6 @@ class Parser(ABC):
         Parse a punctuation, if it is present. Otherwise, return None.
         Punctuations are defined by `Token.PunctuationSpelling`.
         """
-        self._synchronize_lexer_and_tokenizer()
         # This check is only necessary to catch errors made by users that
         # are not using pyright.
         assert Token.Kind.is_spelling_of_punctuation(punctuation), (
@@ -2425,7 +2755,6 @@ class Parser(ABC):
         )
         kind = Token.Kind.get_punctuation_kind_from_spelling(punctuation)
         if self._parse_optional_token(kind) is not None:
-            self._synchronize_lexer_and_tokenizer()
             return punctuation
         return None
 
@@ -2436,7 +2765,6 @@ class Parser(ABC):
         Parse a punctuation. Punctuations are defined by
         `Token.PunctuationSpelling`.
         """
-        self._synchronize_lexer_and_tokenizer()
         # This check is only necessary to catch errors made by users that
         # are not using pyright.
         assert Token.Kind.is_spelling_of_punctuation(
@@ -2444,7 +2772,6 @@ class Parser(ABC):
         ), "'parse_punctuation' must be called with a valid punctuation"
         kind = Token.Kind.get_punctuation_kind_from_spelling(punctuation)
         self._parse_token(kind, f"Expected '{punctuation}'" + context_msg)
-        self._synchronize_lexer_and_tokenizer()
         return punctuation
 
     def try_parse_builtin_type(self) -> Attribute | None:
@@ -2454,15 +2781,18 @@ class Parser(ABC):
         with self.backtracking("builtin type"):
             # Check the function type separately, it is the only
             # case of a type starting with a symbol
-            next_token = self.tokenizer.next_token(peek=True)
-            if next_token.text == "(":
+            next_token = self._current_token
+            if next_token.kind == Token.Kind.L_PAREN:
                 return self.try_parse_function_type()
 
-            name = self.tokenizer.next_token_of_pattern(ParserCommons.builtin_type)
-            if name is None:
+            if (
+                next_token.kind != Token.Kind.BARE_IDENT
+                or ParserCommons.builtin_type.fullmatch(next_token.text) is None
+            ):
                 self.raise_error("Expected builtin name!")
 
-            return self._parse_builtin_type_with_name(name)
+            name = self._consume_token(Token.Kind.BARE_IDENT)
+            return self._parse_builtin_type_with_name(name.span)
 
     def parse_attribute(self) -> Attribute:
         """
@@ -2470,7 +2800,7 @@ class Parser(ABC):
         """
         # All dialect attrs must start with '#', so we check for that first
         # (as it's easier)
-        if self.tokenizer.starts_with("#"):
+        if self._current_token.kind == Token.Kind.HASH_IDENT:
             value = self.try_parse_dialect_attr()
 
             # No value => error
@@ -2479,7 +2809,7 @@ class Parser(ABC):
                     "`#` must be followed by a valid dialect attribute or type!"
                 )
 
-            return value
+            return self.ctx.get_unique_instance(value)
 
         # In MLIR, a type can be parsed at any attribute location.
         # While MLIR wraps the type in a `TypeAttr`, we do not require this
@@ -2495,7 +2825,7 @@ class Parser(ABC):
                 "Unknown attribute (neither builtin nor dialect could be parsed)!"
             )
 
-        return builtin_val
+        return self.ctx.get_unique_instance(builtin_val)
 
     def _parse_op_result(self) -> tuple[Span, int, Attribute | None]:
         value_token = self._parse_token(
@@ -2511,11 +2841,9 @@ class Parser(ABC):
         return (value_token.span, size, None)
 
     def _parse_op_result_list(self) -> list[tuple[Span, int, Attribute | None]]:
-        self._synchronize_lexer_and_tokenizer()
         res = self.parse_comma_separated_list(
             self.Delimiter.NONE, self._parse_op_result, " in operation result list"
         )
-        self._synchronize_lexer_and_tokenizer()
         return res
 
     def parse_optional_attr_dict(self) -> dict[str, Attribute]:
@@ -2544,28 +2872,31 @@ class Parser(ABC):
         succ = self._parse_optional_successor_list()
 
         regions = []
-        if self.tokenizer.starts_with("("):
-            self.parse_characters("(", "Expected brackets enclosing regions!")
+        if self._parse_optional_token(Token.Kind.L_PAREN) is not None:
             regions = self.parse_region_list()
-            self.parse_characters(")", "Expected brackets enclosing regions!")
+            self._parse_token(
+                Token.Kind.R_PAREN, "Expected brackets enclosing regions!"
+            )
 
         attrs = self.parse_optional_attr_dict()
 
-        self.parse_characters(
-            ":", "MLIR Operation definitions must end in a function type signature!"
+        self._parse_token(
+            Token.Kind.COLON,
+            "MLIR Operation definitions must end in a function type signature!",
         )
         func_type = self.parse_function_type()
 
         return args, succ, attrs, regions, func_type
 
     def _parse_optional_successor_list(self) -> list[Span]:
-        if not self.tokenizer.starts_with("["):
+        if self._parse_optional_token(Token.Kind.L_SQUARE) is None:
             return []
-        self.parse_characters("[", "Successor list is enclosed in square brackets")
         successors = self.parse_list_of(
             self.try_parse_block_id, "Expected a block-id", allow_empty=False
         )
-        self.parse_characters("]", "Successor list is enclosed in square brackets")
+        self._parse_token(
+            Token.Kind.R_SQUARE, "Successor list is enclosed in square brackets"
+        )
         return successors
 
     def _parse_op_args_list(self) -> list[SSAValue]:
@@ -2578,15 +2909,10 @@ class Parser(ABC):
         Parses a sequence of regions for as long as there is a `{` in the input.
         """
         regions: list[Region] = []
-        while not self.tokenizer.is_eof() and self.tokenizer.starts_with("{"):
+        while self._current_token.kind == Token.Kind.L_BRACE:
             regions.append(self.parse_region())
-            if self.tokenizer.starts_with(","):
-                self.parse_characters(
-                    ",",
-                    msg="This error should never be printed, please open "
-                    "an issue at github.com/xdslproject/xdsl",
-                )
-                if not self.tokenizer.starts_with("{"):
+            if self._parse_optional_token(Token.Kind.COMMA) is not None:
+                if self._current_token.kind != Token.Kind.L_BRACE:
                     self.raise_error(
                         "Expected next region (because of `,` after region end)!"
                     )
@@ -17,3 +17,16 @@ class ModulePass(ABC):
     @abstractmethod
     def apply(self, ctx: MLContext, op: builtin.ModuleOp) -> None:
         ...
+
+
+class PassInstrumentation:
+    """
+    Hooks called around each application of a pass in a pass pipeline.
+    The default implementation ignores all events.
+    """
+
+    def run_before_pass(self, module_pass: ModulePass, op: builtin.ModuleOp) -> None:
+        """Called before `module_pass` is applied to `op`."""
+
+    def run_after_pass(self, module_pass: ModulePass, op: builtin.ModuleOp) -> None:
+        """Called after `module_pass` was applied to `op`."""
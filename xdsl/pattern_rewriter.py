@@ -4,11 +4,72 @@ import inspect
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from types import UnionType
-from typing import Callable, TypeVar, Union, get_args, get_origin, Iterable, Sequence
+from typing import (
+    Callable,
+    ClassVar,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    Iterable,
+    Sequence,
+)
 
 from xdsl.dialects.builtin import ModuleOp
-from xdsl.ir import Operation, Region, Block, BlockArgument, Attribute, SSAValue
+from xdsl.ir import (
+    Operation,
+    OpResult,
+    Region,
+    Block,
+    BlockArgument,
+    Attribute,
+    SSAValue,
+    notify_operation_modified,
+)
 from xdsl.rewriter import Rewriter
+from xdsl.traits import ConstantLike
+
+
+class PatternRewriterListener:
+    """
+    A listener notified of the changes done to the IR by a `PatternRewriter`.
+    The default implementation ignores all notifications.
+    """
+
+    def notify_op_inserted(self, op: Operation) -> None:
+        """
+        Notify that an operation was inserted or moved. The operations nested
+        in it are not notified separately.
+        """
+
+    def notify_op_removed(self, op: Operation) -> None:
+        """Notify that an operation is about to be erased."""
+
+    def notify_op_replaced(self, op: Operation) -> None:
+        """Notify that the results of an operation are about to be replaced."""
+
+    def notify_op_modified(self, op: Operation) -> None:
+        """Notify that an operation was modified in place."""
+
+
+class PatternRewriterInstrumentation:
+    """
+    Hooks called around each application of a rewrite pattern on an operation.
+    Patterns grouped in a `GreedyRewritePatternApplier` are instrumented
+    individually, rather than the applier itself.
+    The default implementation ignores all events.
+    """
+
+    def run_before_pattern(self, pattern: RewritePattern, op: Operation) -> None:
+        """Called before `pattern` is matched against `op`."""
+
+    def run_after_pattern(
+        self, pattern: RewritePattern, op: Operation, rewriter: PatternRewriter
+    ) -> None:
+        """
+        Called after `pattern` was matched against `op`.
+        `rewriter.has_done_action` tells whether the pattern rewrote the IR.
+        """
 
 
 @dataclass(eq=False)
@@ -34,6 +95,79 @@ class PatternRewriter:
     has_done_action: bool = field(default=False, init=False)
     """Has the rewriter done any action during the current match."""
 
+    listener: PatternRewriterListener | None = field(default=None, kw_only=True)
+    """A listener notified of the changes done by this rewriter."""
+
+    instrumentation: PatternRewriterInstrumentation | None = field(
+        default=None, kw_only=True
+    )
+    """The instrumentation called around the patterns applied with this rewriter."""
+
+    def apply_pattern(self, pattern: RewritePattern) -> None:
+        """
+        Match the pattern against the matched operation, and optionally rewrite
+        it, while calling the instrumentation hooks.
+        """
+        op = self.current_operation
+        instrumentation = self.instrumentation
+        if instrumentation is None or isinstance(pattern, GreedyRewritePatternApplier):
+            pattern.match_and_rewrite(op, self)
+        else:
+            instrumentation.run_before_pattern(pattern, op)
+            pattern.match_and_rewrite(op, self)
+            instrumentation.run_after_pattern(pattern, op, self)
+        # Patterns may modify the matched operation in place.
+        if self.has_done_action and not self.has_erased_matched_operation:
+            self._notify_op_modified(op)
+
+    def fold_matched_op(self) -> bool:
+        """
+        Try to fold the matched operation with `Operation.fold`, and replace it
+        with the values it folds to. Constant values are materialized with
+        `Operation.materialize_constant`. Constant operations are not folded.
+        Return True if the operation was folded.
+        """
+        op = self.current_operation
+        if op.parent is None or op.has_trait(ConstantLike):
+            return False
+        values = op.fold()
+        if values is None:
+            return False
+        new_ops: list[Operation] = []
+        new_results: list[SSAValue] = []
+        for result, value in zip(op.results, values, strict=True):
+            if isinstance(value, SSAValue):
+                new_results.append(value)
+                continue
+            constant = op.materialize_constant(value, result.typ)
+            if constant is None:
+                return False
+            new_ops.append(constant)
+            new_results.append(constant.results[0])
+        self.replace_matched_op(new_ops, new_results)
+        return True
+
+    def _notify_ops_inserted(self, ops: Iterable[Operation]) -> None:
+        if self.listener is not None:
+            for op in ops:
+                self.listener.notify_op_inserted(op)
+
+    def _notify_op_removed(self, op: Operation) -> None:
+        if self.listener is not None:
+            self.listener.notify_op_removed(op)
+
+    def _notify_op_replaced(self, op: Operation) -> None:
+        if self.listener is not None:
+            self.listener.notify_op_replaced(op)
+            self.listener.notify_op_removed(op)
+
+    def _notify_op_modified(self, op: Operation | None) -> None:
+        if op is None:
+            return
+        notify_operation_modified(op)
+        if self.listener is not None:
+            self.listener.notify_op_modified(op)
+
     def _can_modify_op(self, op: Operation) -> bool:
         """Check if the operation and its children can be modified by this rewriter."""
         if op == self.current_operation:
@@ -65,6 +199,7 @@ class PatternRewriter:
             return
         block.insert_ops_before(op, self.current_operation)
         self.added_operations_before += op
+        self._notify_ops_inserted(op)
 
     def insert_op_after_matched_op(self, op: (Operation | list[Operation])):
         """Insert operations after the matched operation."""
@@ -77,6 +212,7 @@ class PatternRewriter:
             return
         block.insert_ops_after(op, self.current_operation)
         self.added_operations_after += op
+        self._notify_ops_inserted(op)
 
     def insert_op_at_end(self, op: Operation | list[Operation], block: Block):
         """Insert operations in a block contained in the matched operation."""
@@ -87,6 +223,7 @@ class PatternRewriter:
         if len(op) == 0:
             return
         block.add_ops(op)
+        self._notify_ops_inserted(op)
 
     def insert_op_at_start(self, op: Operation | list[Operation], block: Block):
         """Insert operations in a block contained in the matched operation."""
@@ -110,6 +247,7 @@ class PatternRewriter:
         if len(op) == 0:
             return
         target_block.insert_ops_before(op, target_op)
+        self._notify_ops_inserted(op)
 
     def insert_op_after(self, op: Operation | list[Operation], target_op: Operation):
         """Insert operations after an operation contained in the matched operation."""
@@ -123,6 +261,7 @@ class PatternRewriter:
         if len(ops) == 0:
             return
         target_block.insert_ops_after(ops, target_op)
+        self._notify_ops_inserted(ops)
 
     def erase_matched_op(self, safe_erase: bool = True):
         """
@@ -132,6 +271,7 @@ class PatternRewriter:
         """
         self.has_done_action = True
         self.has_erased_matched_operation = True
+        self._notify_op_removed(self.current_operation)
         Rewriter.erase_op(self.current_operation, safe_erase=safe_erase)
 
     def erase_op(self, op: Operation, safe_erase: bool = True):
@@ -148,6 +288,7 @@ class PatternRewriter:
                 "PatternRewriter can only erase operations that are the matched operation"
                 ", or that are contained in the matched operation."
             )
+        self._notify_op_removed(op)
         Rewriter.erase_op(op, safe_erase=safe_erase)
 
     def replace_matched_op(
@@ -166,10 +307,12 @@ class PatternRewriter:
         if not isinstance(new_ops, list):
             new_ops = [new_ops]
         self.has_erased_matched_operation = True
+        self._notify_op_replaced(self.current_operation)
         Rewriter.replace_op(
             self.current_operation, new_ops, new_results, safe_erase=safe_erase
         )
         self.added_operations_before += new_ops
+        self._notify_ops_inserted(new_ops)
 
     def replace_op(
         self,
@@ -193,7 +336,9 @@ class PatternRewriter:
                 "PatternRewriter can only replace operations that are the matched "
                 "operation, or that are contained in the matched operation."
             )
+        self._notify_op_replaced(op)
         Rewriter.replace_op(op, new_ops, new_results, safe_erase=safe_erase)
+        self._notify_ops_inserted(new_ops if isinstance(new_ops, list) else [new_ops])
 
     def modify_block_argument_type(self, arg: BlockArgument, new_type: Attribute):
         """
@@ -206,6 +351,9 @@ class PatternRewriter:
             )
         self.has_done_action = True
         arg.typ = new_type
+        self._notify_op_modified(arg.block.parent_op())
+        for use in arg.uses:
+            self._notify_op_modified(use.operation)
 
     def insert_block_argument(
         self, block: Block, index: int, typ: Attribute
@@ -219,7 +367,9 @@ class PatternRewriter:
                 "Cannot modify blocks that are not contained in the matched operation"
             )
         self.has_done_action = True
-        return block.insert_arg(typ, index)
+        arg = block.insert_arg(typ, index)
+        self._notify_op_modified(block.parent_op())
+        return arg
 
     def erase_block_argument(self, arg: BlockArgument, safe_erase: bool = True) -> None:
         """
@@ -233,7 +383,9 @@ class PatternRewriter:
                 "Cannot modify blocks that are not contained in the matched operation"
             )
         self.has_done_action = True
-        arg.block.erase_arg(arg, safe_erase=safe_erase)
+        block = arg.block
+        block.erase_arg(arg, safe_erase=safe_erase)
+        self._notify_op_modified(block.parent_op())
 
     def inline_block_at_end(self, block: Block, target_block: Block):
         """
@@ -247,7 +399,9 @@ class PatternRewriter:
             raise Exception(
                 "Cannot modify blocks that are not contained in the matched operation."
             )
+        moved_ops = list(block.ops)
         Rewriter.inline_block_at_end(block, target_block)
+        self._notify_ops_inserted(moved_ops)
 
     def inline_block_at_start(self, block: Block, target_block: Block):
         """
@@ -261,7 +415,9 @@ class PatternRewriter:
             raise Exception(
                 "Cannot modify blocks that are not contained in the matched operation."
             )
+        moved_ops = list(block.ops)
         Rewriter.inline_block_at_start(block, target_block)
+        self._notify_ops_inserted(moved_ops)
 
     def inline_block_before_matched_op(self, block: Block):
         """
@@ -274,8 +430,10 @@ class PatternRewriter:
             raise Exception(
                 "Cannot move blocks that are not contained in the matched operation."
             )
-        self.added_operations_before += list(block.ops)
+        moved_ops = list(block.ops)
+        self.added_operations_before += moved_ops
         Rewriter.inline_block_before(block, self.current_operation)
+        self._notify_ops_inserted(moved_ops)
 
     def inline_block_before(self, block: Block, op: Operation):
         """
@@ -296,7 +454,9 @@ class PatternRewriter:
                 "Cannot move block elsewhere than before the matched operation,"
                 " or before an operation child"
             )
+        moved_ops = list(block.ops)
         Rewriter.inline_block_before(block, op)
+        self._notify_ops_inserted(moved_ops)
 
     def inline_block_after_matched_op(self, block: Block):
         """
@@ -309,8 +469,10 @@ class PatternRewriter:
             raise Exception(
                 "Cannot move blocks that are not contained in the matched operation."
             )
-        self.added_operations_after += block.ops
+        moved_ops = list(block.ops)
+        self.added_operations_after += moved_ops
         Rewriter.inline_block_after(block, self.current_operation)
+        self._notify_ops_inserted(moved_ops)
 
     def inline_block_after(self, block: Block, op: Operation):
         """
@@ -328,7 +490,9 @@ class PatternRewriter:
             raise Exception(
                 "Cannot move blocks that are not contained in the matched operation."
             )
+        moved_ops = list(block.ops)
         Rewriter.inline_block_after(block, op)
+        self._notify_ops_inserted(moved_ops)
 
     def move_region_contents_to_new_regions(self, region: Region) -> Region:
         """
@@ -340,7 +504,9 @@ class PatternRewriter:
             raise Exception(
                 "Cannot move regions that are not children of the matched operation"
             )
-        return Rewriter.move_region_contents_to_new_regions(region)
+        new_region = Rewriter.move_region_contents_to_new_regions(region)
+        self._notify_op_modified(region.parent)
+        return new_region
 
     def iter_affected_ops(self) -> Iterable[Operation]:
         """
@@ -366,6 +532,21 @@ class RewritePattern(ABC):
     A side-effect free rewrite pattern matching on a DAG.
     """
 
+    benefit: ClassVar[int] = 1
+    """
+    The expected benefit of the pattern. When several patterns are grouped in a
+    `FrozenRewritePatternSet`, patterns with a higher benefit are tried first.
+    """
+
+    @property
+    def expected_types(self) -> tuple[type[Operation], ...] | None:
+        """
+        The operation types this pattern can match, or None if it can match any
+        operation. This is extracted from the type hint of a `match_and_rewrite`
+        method decorated with `op_type_rewrite_pattern`.
+        """
+        return getattr(type(self).match_and_rewrite, "expected_types", None)
+
     # The / in the function signature makes the previous arguments positional, see
     # https://peps.python.org/pep-0570/
     # This is used by the op_type_rewrite_pattern
@@ -398,9 +579,17 @@ class AnonymousRewritePattern(RewritePattern):
             ):
                 func(op, rewriter)  # type: ignore
 
+            # Keep the name of the function for instrumentation reports.
+            new_func.__name__ = func.__name__
+            new_func.__qualname__ = func.__qualname__
             self.func = new_func
         else:
             self.func = func  # type: ignore
+        self._expected_types = getattr(func, "expected_types", None)
+
+    @property
+    def expected_types(self) -> tuple[type[Operation], ...] | None:
+        return self._expected_types
 
     def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter) -> None:
         self.func(self, op, rewriter)
@@ -460,6 +649,11 @@ def op_type_rewrite_pattern(
                 return None
             func(op, rewriter)  # type: ignore
 
+        op_type_rewrite_pattern_static_wrapper.expected_types = expected_types  # type: ignore
+        # Keep the name of the decorated function for instrumentation reports.
+        # `functools.wraps` is not used, as it would also forward the signature.
+        op_type_rewrite_pattern_static_wrapper.__name__ = func.__name__
+        op_type_rewrite_pattern_static_wrapper.__qualname__ = func.__qualname__
         return op_type_rewrite_pattern_static_wrapper
 
     def op_type_rewrite_pattern_method_wrapper(
@@ -469,9 +663,46 @@ def op_type_rewrite_pattern(
             return None
         func(self, op, rewriter)  # type: ignore
 
+    op_type_rewrite_pattern_method_wrapper.expected_types = expected_types  # type: ignore
     return op_type_rewrite_pattern_method_wrapper
 
 
+class FrozenRewritePatternSet:
+    """
+    An immutable list of rewrite patterns, indexed by the operation types they
+    can match.
+    For each operation type, the patterns that can match it are computed once,
+    ordered by decreasing benefit, and then by their order in the list.
+    Patterns that do not declare their expected types are tried on every
+    operation.
+    """
+
+    patterns: tuple[RewritePattern, ...]
+    """The patterns of the set, in their original order."""
+
+    _patterns_by_type: dict[type[Operation], tuple[RewritePattern, ...]]
+    """Cache of the patterns that can match a given operation type."""
+
+    def __init__(self, patterns: Iterable[RewritePattern]):
+        self.patterns = tuple(patterns)
+        self._patterns_by_type = {}
+
+    def get_patterns(self, op_type: type[Operation]) -> tuple[RewritePattern, ...]:
+        """Get the patterns that can match operations of the given type."""
+        if (patterns := self._patterns_by_type.get(op_type)) is not None:
+            return patterns
+        matching = [
+            (-pattern.benefit, index, pattern)
+            for index, pattern in enumerate(self.patterns)
+            if (expected_types := pattern.expected_types) is None
+            or issubclass(op_type, expected_types)
+        ]
+        matching.sort(key=lambda entry: entry[:2])
+        patterns = tuple(pattern for _, _, pattern in matching)
+        self._patterns_by_type[op_type] = patterns
+        return patterns
+
+
 @dataclass(eq=False, repr=False)
 class GreedyRewritePatternApplier(RewritePattern):
     """
@@ -480,11 +711,32 @@ class GreedyRewritePatternApplier(RewritePattern):
     """
 
     rewrite_patterns: list[RewritePattern]
-    """The list of rewrites to apply in order."""
+    """
+    The list of rewrites to apply in order.
+    Patterns with a higher benefit are applied first.
+    """
 
-    def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter) -> None:
+    _frozen_patterns: FrozenRewritePatternSet = field(init=False)
+    """The patterns, indexed by the operation types they match."""
+
+    def __post_init__(self):
+        self._frozen_patterns = FrozenRewritePatternSet(self.rewrite_patterns)
+
+    @property
+    def expected_types(self) -> tuple[type[Operation], ...] | None:
+        expected_types: list[type[Operation]] = []
         for pattern in self.rewrite_patterns:
-            pattern.match_and_rewrite(op, rewriter)
+            if (pattern_types := pattern.expected_types) is None:
+                return None
+            expected_types.extend(pattern_types)
+        return tuple(expected_types)
+
+    def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter) -> None:
+        for pattern in self._frozen_patterns.get_patterns(type(op)):
+            if rewriter.instrumentation is None:
+                pattern.match_and_rewrite(op, rewriter)
+            else:
+                rewriter.apply_pattern(pattern)
             if rewriter.has_done_action:
                 return
         return
@@ -517,6 +769,14 @@ class PatternRewriteWalker:
     That way, all uses are replaced before the definitions.
     """
 
+    listener: PatternRewriterListener | None = field(default=None, kw_only=True)
+    """A listener notified of the changes done by the applied patterns."""
+
+    instrumentation: PatternRewriterInstrumentation | None = field(
+        default=None, kw_only=True
+    )
+    """The instrumentation called around each pattern application."""
+
     def rewrite_module(self, op: ModuleOp):
         """Rewrite an entire module operation."""
         self._rewrite_op(op)
@@ -534,8 +794,10 @@ class PatternRewriteWalker:
         next_op = op.next_op
 
         # We then match for a pattern in the current operation
-        rewriter = PatternRewriter(op)
-        self.pattern.match_and_rewrite(op, rewriter)
+        rewriter = PatternRewriter(
+            op, listener=self.listener, instrumentation=self.instrumentation
+        )
+        rewriter.apply_pattern(self.pattern)
 
         if rewriter.has_done_action:
             # If we produce new operations, we rewrite them recursively if requested
@@ -581,3 +843,154 @@ class PatternRewriteWalker:
                 iter_op = block.last_op if self.walk_reverse else block.first_op
                 while iter_op is not None:
                     iter_op = self._rewrite_op(iter_op)
+
+
+@dataclass(eq=False)
+class _Worklist(PatternRewriterListener):
+    """
+    A deduplicated worklist of operations, updated with the changes done by
+    pattern rewriters.
+    """
+
+    _ops: list[Operation | None] = field(default_factory=list)
+    """The operations in the worklist. Removed operations are set to None."""
+
+    _indices: dict[Operation, int] = field(default_factory=dict)
+    """The index of each operation in `_ops`."""
+
+    listener: PatternRewriterListener | None = field(default=None)
+    """A listener the notifications are forwarded to."""
+
+    def push(self, op: Operation) -> None:
+        """Add an operation to the worklist, if it is not already in it."""
+        if op not in self._indices:
+            self._indices[op] = len(self._ops)
+            self._ops.append(op)
+
+    def pop(self) -> Operation | None:
+        """Pop the last added operation, or return None if the worklist is empty."""
+        while self._ops:
+            op = self._ops.pop()
+            if op is not None:
+                del self._indices[op]
+                return op
+        return None
+
+    def remove(self, op: Operation) -> None:
+        """Remove an operation from the worklist, if it is in it."""
+        if (index := self._indices.pop(op, None)) is not None:
+            self._ops[index] = None
+
+    def notify_op_inserted(self, op: Operation) -> None:
+        for nested_op in op.walk():
+            self.push(nested_op)
+        if self.listener is not None:
+            self.listener.notify_op_inserted(op)
+
+    def notify_op_removed(self, op: Operation) -> None:
+        # The operations defining the operands may now be dead.
+        for operand in op.operands:
+            if isinstance(operand, OpResult):
+                self.push(operand.op)
+        for nested_op in op.walk():
+            self.remove(nested_op)
+        if self.listener is not None:
+            self.listener.notify_op_removed(op)
+
+    def notify_op_replaced(self, op: Operation) -> None:
+        # The users of the results will now use the new values.
+        for result in op.results:
+            for use in result.uses:
+                self.push(use.operation)
+        if self.listener is not None:
+            self.listener.notify_op_replaced(op)
+
+    def notify_op_modified(self, op: Operation) -> None:
+        self.push(op)
+        if self.listener is not None:
+            self.listener.notify_op_modified(op)
+
+
+@dataclass(eq=False, repr=False)
+class GreedyPatternRewriteDriver:
+    """
+    Rewrite the IR in place by applying a pattern until a fixpoint is reached.
+    Operations are processed from a worklist, initially filled with all
+    operations in program order. When the pattern rewrites an operation, the
+    operations affected by the rewrite are added back to the worklist: the new
+    operations, the users of replaced values, the operations defining the
+    operands of erased operations, and the matched operation itself.
+    Operations are folded before the pattern is applied.
+    Previous references to the rewritten operations are invalid after the
+    rewrite.
+    """
+
+    pattern: RewritePattern
+    """Pattern to apply to the operations."""
+
+    max_iterations: int = field(default=10)
+    """
+    The maximum number of times the worklist is filled with all operations.
+    The worklist is filled again after an iteration that changed the IR, to
+    catch changes that were not notified to the rewriter.
+    """
+
+    max_num_rewrites: int | None = field(default=None)
+    """The maximum number of rewrites, or None for no limit."""
+
+    fold: bool = field(default=True)
+    """
+    Fold the operations before applying the pattern, see
+    `PatternRewriter.fold_matched_op`. Folding counts as a rewrite.
+    """
+
+    listener: PatternRewriterListener | None = field(default=None, kw_only=True)
+    """A listener notified of the changes done by the applied patterns."""
+
+    instrumentation: PatternRewriterInstrumentation | None = field(
+        default=None, kw_only=True
+    )
+    """The instrumentation called around each pattern application."""
+
+    def rewrite_module(self, op: ModuleOp) -> bool:
+        """
+        Rewrite an entire module operation.
+        Return True if the rewrite converged, and False if it stopped because
+        of the iteration or rewrite limits.
+        """
+        num_rewrites = 0
+        for _ in range(self.max_iterations):
+            worklist = _Worklist(listener=self.listener)
+            for nested_op in reversed(list(op.walk())):
+                worklist.push(nested_op)
+
+            changed = False
+            while (current_op := worklist.pop()) is not None:
+                # Skip the operations that were detached from the module
+                # without notifying the worklist.
+                if current_op.parent is None and current_op is not op:
+                    continue
+
+                rewriter = PatternRewriter(
+                    current_op,
+                    listener=worklist,
+                    instrumentation=self.instrumentation,
+                )
+                if not (self.fold and rewriter.fold_matched_op()):
+                    rewriter.apply_pattern(self.pattern)
+                if not rewriter.has_done_action:
+                    continue
+
+                changed = True
+                num_rewrites += 1
+                if not rewriter.has_erased_matched_operation:
+                    worklist.push(current_op)
+                if (
+                    self.max_num_rewrites is not None
+                    and num_rewrites >= self.max_num_rewrites
+                ):
+                    return False
+
+            if not changed:
+                return True
+        return False
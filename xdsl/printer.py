@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import sys
 from dataclasses import dataclass, field
 from typing import (
     Iterable,
@@ -29,7 +30,6 @@ from xdsl.ir import (
 from xdsl.utils.diagnostic import Diagnostic
 from xdsl.dialects.builtin import (
     AnyIntegerAttr,
-    AnyFloatAttr,
     AnyUnrankedTensorType,
     AnyVectorType,
     BFloat16Type,
@@ -43,7 +43,6 @@ from xdsl.dialects.builtin import (
     Float64Type,
     Float80Type,
     FloatAttr,
-    FloatData,
     IndexType,
     IntegerType,
     NoneAttr,
@@ -68,23 +67,83 @@ from xdsl.dialects.builtin import (
 indentNumSpaces = 2
 
 
+@dataclass(eq=False)
+class _NameTable:
+    """
+    Names allocated to SSA values and blocks by a printer.
+    Allocating a name, looking it up, and checking for collisions all take
+    constant time.
+    """
+
+    values: dict[SSAValue, str] = field(default_factory=dict)
+    """The name allocated to each SSA value."""
+
+    used_names: set[str] = field(default_factory=set)
+    """The names that are already allocated to an SSA value."""
+
+    hint_counts: dict[str, int] = field(default_factory=dict)
+    """The number of SSA values that were named after each name hint."""
+
+    blocks: dict[Block, str] = field(default_factory=dict)
+    """The name allocated to each block."""
+
+    next_value_id: int = 0
+    """The next number used to name an SSA value without name hint."""
+
+    next_block_id: int = 0
+    """The next number used to name a block."""
+
+    def add_value(self, value: SSAValue, name_hint: str | None) -> str:
+        """
+        Allocate a name to an SSA value, based on a name hint if any.
+        The name hint is suffixed with a number if it is already in use.
+        """
+        if name_hint:
+            count = self.hint_counts.get(name_hint, 0)
+            name = f"{name_hint}_{count}" if count else name_hint
+            while name in self.used_names:
+                count += 1
+                name = f"{name_hint}_{count}"
+            self.hint_counts[name_hint] = count + 1
+        else:
+            name = str(self.next_value_id)
+            self.next_value_id += 1
+        self.values[value] = name
+        self.used_names.add(name)
+        return name
+
+    def get_block_name(self, block: Block) -> str:
+        """Get the name of a block, and allocate one if it has none."""
+        name = self.blocks.get(block)
+        if name is None:
+            name = str(self.next_block_id)
+            self.next_block_id += 1
+            self.blocks[block] = name
+        return name
+
+
 @dataclass(eq=False, repr=False)
 class Printer:
     stream: Optional[Any] = field(default=None)
     print_generic_format: bool = field(default=False)
     diagnostic: Diagnostic = field(default_factory=Diagnostic)
+    print_dense_with_hex_if_larger: int | None = field(default=None)
+    """
+    Print the elements of dense attributes with more elements than this number
+    in hexadecimal form, if their element type supports it.
+    """
 
     _indent: int = field(default=0, init=False)
-    _ssa_values: Dict[SSAValue, str] = field(default_factory=dict, init=False)
+    _names: _NameTable = field(default_factory=lambda: _NameTable(), init=False)
+    """Names allocated to the printed SSA values and blocks."""
+    _buffer: list[str] | None = field(default=None, init=False)
     """
-    maps SSA Values to their "allocated" names
+    Text printed but not yet written to the stream.
+    Text is only buffered while printing operations, blocks, or regions,
+    and is written to the stream when the outermost one is printed.
     """
-    _ssa_names: Dict[str, int] = field(default_factory=dict, init=False)
-    _block_names: Dict[Block, int] = field(default_factory=dict, init=False)
-    _next_valid_name_id: int = field(default=0, init=False)
-    _next_valid_block_id: int = field(default=0, init=False)
-    _current_line: int = field(default=0, init=False)
-    _current_column: int = field(default=0, init=False)
+    _flushed_column: int = field(default=0, init=False)
+    """Column at the end of the text written to the stream."""
     _next_line_callback: List[Callable[[], None]] = field(
         default_factory=list, init=False
     )
@@ -115,13 +174,52 @@ class Printer:
             self.print_string(text)
 
     def print_string(self, text: str) -> None:
-        lines = text.split("\n")
-        if len(lines) != 1:
-            self._current_line += len(lines) - 1
-            self._current_column = len(lines[-1])
+        if self._buffer is not None:
+            self._buffer.append(text)
+        else:
+            self._write(text)
+
+    _max_buffered_fragments = 1 << 16
+    """Number of buffered text fragments after which the buffer is flushed."""
+
+    def _write(self, text: str) -> None:
+        """Write text to the stream, and keep track of the current column."""
+        newline = text.rfind("\n")
+        if newline == -1:
+            self._flushed_column += len(text)
         else:
-            self._current_column += len(lines[-1])
-        print(text, end="", file=self.stream)
+            self._flushed_column = len(text) - newline - 1
+        (sys.stdout if self.stream is None else self.stream).write(text)
+
+    def _flush(self) -> None:
+        """Write the buffered text to the stream."""
+        if self._buffer:
+            self._write("".join(self._buffer))
+            self._buffer.clear()
+
+    def _print_buffered(self, print_fn: Callable[[], None]) -> None:
+        """Call a printing function, buffering all the text it prints."""
+        self._buffer = []
+        try:
+            print_fn()
+        finally:
+            self._flush()
+            self._buffer = None
+
+    @property
+    def _current_column(self) -> int:
+        """
+        Column at which the next text will be printed.
+        It is only computed when requested, which is only needed to print
+        diagnostics.
+        """
+        column = 0
+        for text in reversed(self._buffer or ()):
+            newline = text.rfind("\n")
+            if newline != -1:
+                return column + len(text) - newline - 1
+            column += len(text)
+        return self._flushed_column + column
 
     def _add_message_on_next_line(self, message: str, begin_pos: int, end_pos: int):
         """Add a message that will be displayed on the next line."""
@@ -188,36 +286,25 @@ class Printer:
         self, indent: int | None = None, print_message: bool = True
     ) -> None:
         indent = self._indent if indent is None else indent
-        self.print("\n")
-        if print_message:
+        self.print_string("\n")
+        if print_message and self._next_line_callback:
             for callback in self._next_line_callback:
                 callback()
             self._next_line_callback = []
-        self.print(" " * indent * indentNumSpaces)
-
-    def _get_new_valid_name_id(self) -> str:
-        self._next_valid_name_id += 1
-        return str(self._next_valid_name_id - 1)
-
-    def _get_new_valid_block_id(self) -> int:
-        self._next_valid_block_id += 1
-        return self._next_valid_block_id - 1
+        if (
+            self._buffer is not None
+            and len(self._buffer) >= self._max_buffered_fragments
+        ):
+            self._flush()
+        self.print_string(" " * indent * indentNumSpaces)
 
     def _print_result_value(self, op: Operation, idx: int) -> None:
         val = op.results[idx]
-        self.print("%")
-        if val in self._ssa_values:
-            name = self._ssa_values[val]
-        elif val.name_hint:
-            curr_ind = self._ssa_names.get(val.name_hint, 0)
-            suffix = f"_{curr_ind}" if curr_ind != 0 else ""
-            name = f"{val.name_hint}{suffix}"
-            self._ssa_values[val] = name
-            self._ssa_names[val.name_hint] = curr_ind + 1
-        else:
-            name = self._get_new_valid_name_id()
-            self._ssa_values[val] = name
-        self.print("%s" % name)
+        self.print_string("%")
+        name = self._names.values.get(val)
+        if name is None:
+            name = self._names.add_value(val, val.name_hint)
+        self.print_string(name)
 
     def _print_results(self, op: Operation) -> None:
         results = op.results
@@ -239,7 +326,7 @@ class Printer:
         self.print(" = ")
 
     def print_ssa_value(self, value: SSAValue) -> None:
-        if ssa_val := self._ssa_values.get(value):
+        if ssa_val := self._names.values.get(value):
             self.print(f"%{ssa_val}")
         else:
             begin_pos = self._current_column
@@ -256,14 +343,16 @@ class Printer:
         self.print_ssa_value(operand)
 
     def print_block_name(self, block: Block) -> None:
-        self.print("^")
-        if block not in self._block_names:
-            self._block_names[block] = self._get_new_valid_block_id()
-        self.print(self._block_names[block])
+        self.print_string("^")
+        self.print_string(self._names.get_block_name(block))
 
     def print_block(self, block: Block, print_block_name: bool = True) -> None:
         if not isinstance(block, Block):
             raise TypeError("Expected a Block; got %s" % type(block).__name__)
+        if self._buffer is None:
+            return self._print_buffered(
+                lambda: self.print_block(block, print_block_name)
+            )
 
         print_block_args = len(block.args) > 0
         if print_block_args or print_block_name:
@@ -283,19 +372,20 @@ class Printer:
         self._indent -= 1
 
     def _print_block_arg(self, arg: BlockArgument) -> None:
-        self.print("%")
-        if arg.name_hint and arg.name_hint not in self._ssa_values.values():
-            name = arg.name_hint
-            self._ssa_names[arg.name_hint] = self._ssa_names.get(arg.name_hint, 0) + 1
-        else:
-            name = self._get_new_valid_name_id()
-        self._ssa_values[arg] = name
-        self.print("%s : " % name)
+        self.print_string("%")
+        name_hint = arg.name_hint
+        if name_hint in self._names.used_names:
+            name_hint = None
+        name = self._names.add_value(arg, name_hint)
+        self.print_string(name)
+        self.print_string(" : ")
         self.print_attribute(arg.typ)
 
     def print_region(self, region: Region) -> None:
         if not isinstance(region, Region):
             raise TypeError("Expected a Region; got %s" % type(region).__name__)
+        if self._buffer is None:
+            return self._print_buffered(lambda: self.print_region(region))
 
         print_block_name = len(region.blocks) != 1
 
@@ -419,13 +509,13 @@ class Printer:
 
         if isinstance(attribute, DenseArrayBase):
             self.print("array<", attribute.elt_type)
-            data = cast(ArrayAttr[IntAttr | FloatData], attribute.data)
-            if len(data.data) == 0:
-                self.print(">")
+            data = attribute.data.data
+            if len(data) == 0:
+                self.print_string(">")
                 return
-            self.print(": ")
-            self.print_list(data.data, lambda x: self.print(x.data))
-            self.print(">")
+            self.print_string(": ")
+            self.print_string(", ".join(map(str, data)))
+            self.print_string(">")
             return
 
         if isinstance(attribute, DictionaryAttr):
@@ -451,21 +541,11 @@ class Printer:
 
         if isinstance(attribute, DenseIntOrFPElementsAttr):
 
-            def print_one_elem(val: Attribute):
-                if isinstance(val, IntegerAttr | FloatAttr):
-                    self.print(val.value.data)
-                else:
-                    raise Exception(
-                        "unexpected attribute type "
-                        "in DenseIntOrFPElementsAttr: "
-                        f"{type(val)}"
-                    )
-
             def print_dense_list(
-                array: Sequence[AnyIntegerAttr] | Sequence[AnyFloatAttr],
+                array: Sequence[int] | Sequence[float],
                 shape: List[int],
             ):
-                self.print("[")
+                self.print_string("[")
                 if len(shape) > 1:
                     k = len(array) // shape[0]
                     self.print_list(
@@ -473,20 +553,28 @@ class Printer:
                         lambda subarray: print_dense_list(subarray, shape[1:]),
                     )
                 else:
-                    self.print_list(array, print_one_elem)
-                self.print("]")
+                    # Format the innermost dimension directly from the buffer.
+                    self.print_string(", ".join(map(str, array)))
+                self.print_string("]")
 
-            self.print("dense<")
+            self.print_string("dense<")
             data = attribute.data.data
             shape = attribute.shape if attribute.shape_is_complete else [len(data)]
             assert shape is not None, "If shape is complete, then it cannot be None"
+            hex_threshold = self.print_dense_with_hex_if_larger
             if len(data) == 0:
                 pass
-            elif data.count(data[0]) == len(data):
-                print_one_elem(data[0])
+            elif all(value == data[0] for value in data):
+                self.print_string(str(data[0]))
+            elif (
+                hex_threshold is not None
+                and len(data) > hex_threshold
+                and (raw_data := attribute.get_raw_data()) is not None
+            ):
+                self.print_string(f'"0x{raw_data.hex().upper()}"')
             else:
                 print_dense_list(data, shape)
-            self.print("> : ")
+            self.print_string("> : ")
             self.print(attribute.type)
             return
 
@@ -677,7 +765,10 @@ class Printer:
     def print_op(self, op: Operation) -> None:
         if not isinstance(op, Operation):
             raise TypeError("Expected an Operation; got %s" % type(op).__name__)
-        begin_op_pos = self._current_column
+        if self._buffer is None:
+            return self._print_buffered(lambda: self.print_op(op))
+        messages = self.diagnostic.op_messages.get(op)
+        begin_op_pos = self._current_column if messages else 0
         self._print_results(op)
         use_custom_format = False
         if isinstance(op, UnregisteredOp):
@@ -689,9 +780,9 @@ class Printer:
         else:
             self.print(f"{op.name}")
             use_custom_format = True
-        end_op_pos = self._current_column
-        if op in self.diagnostic.op_messages:
-            for message in self.diagnostic.op_messages[op]:
+        if messages:
+            end_op_pos = self._current_column
+            for message in messages:
                 self._add_message_on_next_line(message, begin_op_pos, end_op_pos)
         if isinstance(op, UnregisteredOp):
             op_name = op.op_name
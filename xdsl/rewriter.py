@@ -1,6 +1,6 @@
 from typing import Sequence
 
-from xdsl.ir import SSAValue, BlockArgument
+from xdsl.ir import SSAValue, BlockArgument, notify_operation_modified
 from xdsl.irdl import Operation, Region, Block
 
 
@@ -186,4 +186,7 @@ class Rewriter:
             block.parent = None
             new_region.add_block(block)
         region.blocks = []
+        region._cfg_version += 1  # pyright: ignore[reportPrivateUsage]
+        if region.parent is not None:
+            notify_operation_modified(region.parent)
         return new_region
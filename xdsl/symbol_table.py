@@ -0,0 +1,235 @@
+"""
+Symbol tables, indexing by name the operations that define symbols in the
+region of a symbol table operation, such as `builtin.module`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from xdsl.dialects.builtin import ArrayAttr, DictionaryAttr, StringAttr, SymbolRefAttr
+from xdsl.ir import Attribute, Block, Operation
+from xdsl.pattern_rewriter import PatternRewriterListener
+from xdsl.traits import SymbolOpInterface, SymbolTableOp
+
+
+def get_symbol_name(op: Operation) -> StringAttr | None:
+    """Get the name of the symbol defined by an operation, if it defines one."""
+    if not op.has_trait(SymbolOpInterface):
+        return None
+    sym_name = op.attributes.get("sym_name")
+    return sym_name if isinstance(sym_name, StringAttr) else None
+
+
+def is_public_symbol(op: Operation) -> bool:
+    """
+    Check if a symbol may be referenced from outside of its symbol table.
+    Symbols are public unless their `sym_visibility` attribute says otherwise.
+    """
+    visibility = op.attributes.get("sym_visibility")
+    return not isinstance(visibility, StringAttr) or visibility.data == "public"
+
+
+def get_nearest_symbol_table(op: Operation) -> Operation | None:
+    """Get the closest symbol table operation containing an operation, or itself."""
+    current: Operation | None = op
+    while current is not None and not current.has_trait(SymbolTableOp):
+        current = current.parent_op()
+    return current
+
+
+def _collect_symbol_uses(attr: Attribute, uses: list[SymbolRefAttr]) -> None:
+    if isinstance(attr, SymbolRefAttr):
+        uses.append(attr)
+    elif isinstance(attr, ArrayAttr):
+        for element in attr.data:
+            _collect_symbol_uses(element, uses)
+    elif isinstance(attr, DictionaryAttr):
+        for element in attr.data.values():
+            _collect_symbol_uses(element, uses)
+
+
+def get_symbol_uses(op: Operation) -> list[SymbolRefAttr]:
+    """
+    Get the symbol references in the attributes of an operation, including the
+    references nested in array and dictionary attributes. The operations
+    nested in the regions of the operation are not considered.
+    """
+    uses: list[SymbolRefAttr] = []
+    for attr in op.attributes.values():
+        _collect_symbol_uses(attr, uses)
+    return uses
+
+
+class SymbolTable:
+    """
+    The symbols defined in the region of a symbol table operation, indexed by
+    name. If several symbols have the same name, the first one is indexed. The
+    symbols of the nested symbol tables are not indexed.
+    The table is updated by its `insert`, `remove` and `erase` methods, and by
+    the rewrites notified to the `SymbolTableCollection` owning it. Symbols
+    moved or renamed behind its back are detected when looked up, but symbols
+    inserted behind its back are only found once the table is rebuilt.
+    """
+
+    op: Operation
+    """The symbol table operation."""
+
+    _symbols: dict[str, Operation]
+    """The symbols of the table, indexed by name."""
+
+    def __init__(self, op: Operation):
+        if not op.has_trait(SymbolTableOp):
+            raise ValueError(f"Operation '{op.name}' is not a symbol table")
+        self.op = op
+        self._build()
+
+    def _build(self) -> None:
+        self._symbols = {}
+        if (block := self.block) is not None:
+            for symbol in block.ops:
+                self._add_symbol(symbol)
+
+    @property
+    def block(self) -> Block | None:
+        """The block containing the symbols, if the operation has one."""
+        blocks = self.op.regions[0].blocks
+        return blocks[0] if blocks else None
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def lookup(self, name: str | StringAttr) -> Operation | None:
+        """Get the symbol with the given name, or None if there is none."""
+        if isinstance(name, StringAttr):
+            name = name.data
+        symbol = self._symbols.get(name)
+        # Rebuild the table if the symbol was moved or renamed without
+        # notifying the table.
+        if symbol is not None and (
+            symbol.parent_op() is not self.op
+            or (sym_name := get_symbol_name(symbol)) is None
+            or sym_name.data != name
+        ):
+            self._build()
+            symbol = self._symbols.get(name)
+        return symbol
+
+    def insert(self, symbol: Operation, before: Operation | None = None) -> None:
+        """
+        Insert a symbol in the symbol table operation, before the given
+        operation, or at the end of its block.
+        """
+        sym_name = get_symbol_name(symbol)
+        if sym_name is None:
+            raise ValueError(f"Operation '{symbol.name}' does not define a symbol")
+        if sym_name.data in self._symbols:
+            raise ValueError(f"Symbol '{sym_name.data}' is already defined")
+        block = self.block
+        if block is None:
+            raise ValueError(f"Operation '{self.op.name}' has no block")
+        if before is None:
+            block.add_op(symbol)
+        else:
+            block.insert_op_before(symbol, before)
+        self._symbols[sym_name.data] = symbol
+
+    def remove(self, symbol: Operation) -> None:
+        """Detach a symbol from the symbol table operation."""
+        self._remove_symbol(symbol)
+        assert symbol.parent is not None
+        symbol.parent.detach_op(symbol)
+
+    def erase(self, symbol: Operation) -> None:
+        """Erase a symbol of the symbol table operation."""
+        self._remove_symbol(symbol)
+        assert symbol.parent is not None
+        symbol.parent.erase_op(symbol)
+
+    def _add_symbol(self, symbol: Operation) -> None:
+        if (sym_name := get_symbol_name(symbol)) is not None:
+            self._symbols.setdefault(sym_name.data, symbol)
+
+    def _remove_symbol(self, symbol: Operation) -> None:
+        if not symbol.has_trait(SymbolOpInterface):
+            return
+        sym_name = get_symbol_name(symbol)
+        if sym_name is not None and self._symbols.get(sym_name.data) is symbol:
+            del self._symbols[sym_name.data]
+            return
+        # The symbol may have been renamed since it was indexed.
+        for name, other in self._symbols.items():
+            if other is symbol:
+                del self._symbols[name]
+                return
+
+
+@dataclass(eq=False)
+class SymbolTableCollection(PatternRewriterListener):
+    """
+    The symbol tables of symbol table operations, built when first used.
+    Use it as the listener of the pattern rewriters to keep the tables up to
+    date with the rewrites.
+    """
+
+    _tables: dict[Operation, SymbolTable] = field(default_factory=dict)
+    """The symbol tables built so far, indexed by operation."""
+
+    def get_symbol_table(self, op: Operation) -> SymbolTable:
+        """Get the symbol table of a symbol table operation."""
+        if (table := self._tables.get(op)) is None:
+            table = self._tables[op] = SymbolTable(op)
+        return table
+
+    def invalidate(self, op: Operation) -> None:
+        """Drop the symbol table of an operation, to rebuild it when next used."""
+        self._tables.pop(op, None)
+
+    def lookup_symbol_in(
+        self, op: Operation, symbol: str | StringAttr | SymbolRefAttr
+    ) -> Operation | None:
+        """
+        Resolve a symbol reference in the symbol table of an operation. Nested
+        references are resolved in the symbol tables of the referenced symbols.
+        """
+        if not isinstance(symbol, SymbolRefAttr):
+            return self.get_symbol_table(op).lookup(symbol)
+        result = self.get_symbol_table(op).lookup(symbol.root_reference)
+        for nested in symbol.nested_references.data:
+            if result is None or not result.has_trait(SymbolTableOp):
+                return None
+            result = self.get_symbol_table(result).lookup(nested)
+        return result
+
+    def lookup_nearest_symbol_from(
+        self, op: Operation, symbol: str | StringAttr | SymbolRefAttr
+    ) -> Operation | None:
+        """
+        Resolve a symbol reference in the closest symbol table containing an
+        operation, or in the operation itself if it is a symbol table.
+        """
+        table_op = get_nearest_symbol_table(op)
+        if table_op is None:
+            return None
+        return self.lookup_symbol_in(table_op, symbol)
+
+    def _get_cached_parent_table(self, op: Operation) -> SymbolTable | None:
+        parent = op.parent_op()
+        return None if parent is None else self._tables.get(parent)
+
+    def notify_op_inserted(self, op: Operation) -> None:
+        if (table := self._get_cached_parent_table(op)) is not None:
+            table._add_symbol(op)  # pyright: ignore[reportPrivateUsage]
+
+    def notify_op_removed(self, op: Operation) -> None:
+        if (table := self._get_cached_parent_table(op)) is not None:
+            table._remove_symbol(op)  # pyright: ignore[reportPrivateUsage]
+        if op.regions:
+            for nested_op in op.walk():
+                self._tables.pop(nested_op, None)
+
+    def notify_op_modified(self, op: Operation) -> None:
+        # The symbol may have been renamed.
+        if (table := self._get_cached_parent_table(op)) is not None:
+            table._remove_symbol(op)  # pyright: ignore[reportPrivateUsage]
+            table._add_symbol(op)  # pyright: ignore[reportPrivateUsage]
@@ -3,3 +3,41 @@ from xdsl.ir import OpTrait
 
 class Pure(OpTrait):
     """A trait that signals that an operation has no side effects."""
+
+
+class ConstantLike(OpTrait):
+    """
+    A trait that signals that an operation is a constant. The operation has a
+    single result, whose value is the `value` attribute of the operation.
+    """
+
+
+class IsolatedFromAbove(OpTrait):
+    """
+    A trait that signals that the regions of an operation do not use values
+    defined outside of the operation.
+    """
+
+
+class SymbolOpInterface(OpTrait):
+    """
+    A trait that signals that an operation defines a symbol, named by its
+    `sym_name` attribute. Symbols are public, unless their `sym_visibility`
+    attribute is `"private"` or `"nested"`.
+    """
+
+
+class SymbolTableOp(OpTrait):
+    """
+    A trait that signals that an operation defines a symbol table: its symbols
+    are the operations defining a symbol in the first block of its single
+    region.
+    """
+
+
+class HasGraphRegions(OpTrait):
+    """
+    A trait that signals that the regions of an operation are graph regions:
+    their operations are not ordered by dominance, and can use values defined
+    after them in their region.
+    """
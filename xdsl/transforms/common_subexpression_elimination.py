@@ -0,0 +1,157 @@
+from dataclasses import dataclass, field
+
+from xdsl.dialects.builtin import ModuleOp
+from xdsl.dominance import DominanceInfo
+from xdsl.ir import Block, MLContext, Operation, Region
+from xdsl.passes import ModulePass
+from xdsl.rewriter import Rewriter
+from xdsl.traits import IsolatedFromAbove, Pure
+
+
+class _OperationInfo:
+    """
+    Wrap an operation so that it is hashed and compared structurally, see
+    `Operation.structural_hash`.
+    """
+
+    __slots__ = ("op", "_hash")
+
+    op: Operation
+    _hash: int
+
+    def __init__(self, op: Operation):
+        self.op = op
+        self._hash = op.structural_hash()
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _OperationInfo) and self.op.is_structurally_identical(
+            other.op
+        )
+
+
+@dataclass(eq=False)
+class _CSEDriver:
+    """
+    Eliminate the common subexpressions of a region, by walking its blocks in
+    dominance order. The known operations form a scoped hash table: the
+    operations of a block are only visible from the blocks and regions it
+    dominates.
+    """
+
+    dominance: DominanceInfo = field(default_factory=DominanceInfo)
+
+    known_ops: dict[_OperationInfo, Operation] = field(default_factory=dict)
+    """The operations that dominate the current operation, indexed by structure."""
+
+    num_erased_ops: int = field(default=0)
+    """The number of operations erased so far."""
+
+    def simplify_region(self, region: Region) -> None:
+        if not region.blocks:
+            return
+        if len(region.blocks) == 1:
+            self._close_scope(self._simplify_block(region.blocks[0]))
+            return
+
+        # Walk the dominator tree of the region. Unreachable blocks have no
+        # immediate dominator, and are walked in their own scope.
+        children: dict[Block, list[Block]] = {block: [] for block in region.blocks}
+        roots: list[Block] = []
+        for block in region.blocks:
+            idom = self.dominance.get_immediate_dominator(block)
+            if idom is None:
+                roots.append(block)
+            else:
+                children[idom].append(block)
+
+        # Iterative walk, to support deep dominator trees. Each block is
+        # visited a second time to close its scope.
+        worklist: list[tuple[Block, list[_OperationInfo] | None]] = [
+            (block, None) for block in reversed(roots)
+        ]
+        while worklist:
+            block, scope = worklist.pop()
+            if scope is not None:
+                self._close_scope(scope)
+                continue
+            scope = self._simplify_block(block)
+            worklist.append((block, scope))
+            worklist.extend((child, None) for child in reversed(children[block]))
+
+    def _close_scope(self, scope: list[_OperationInfo]) -> None:
+        for info in scope:
+            del self.known_ops[info]
+
+    def _simplify_block(self, block: Block) -> list[_OperationInfo]:
+        """
+        Eliminate the common subexpressions of a block, and return the
+        operations it added to the known operations.
+        """
+        scope: list[_OperationInfo] = []
+        op = block.first_op
+        while op is not None:
+            next_op = op.next_op
+            if op.regions:
+                self._simplify_nested_regions(op)
+            elif (
+                op.results
+                and not op.successors
+                and op.has_trait(Pure)
+                and self._simplify_operation(op, scope)
+            ):
+                self.num_erased_ops += 1
+            op = next_op
+        return scope
+
+    def _simplify_nested_regions(self, op: Operation) -> None:
+        # Values defined above cannot be used in isolated regions.
+        if op.has_trait(IsolatedFromAbove):
+            known_ops = self.known_ops
+            self.known_ops = {}
+            for region in op.regions:
+                self.simplify_region(region)
+            self.known_ops = known_ops
+        else:
+            for region in op.regions:
+                self.simplify_region(region)
+
+    def _simplify_operation(self, op: Operation, scope: list[_OperationInfo]) -> bool:
+        """
+        Replace an operation by a known identical operation, or add it to the
+        known operations. Return True if the operation was erased.
+        """
+        info = _OperationInfo(op)
+        existing = self.known_ops.get(info)
+        if existing is None:
+            self.known_ops[info] = op
+            scope.append(info)
+            return False
+        for result, existing_result in zip(op.results, existing.results):
+            if existing_result.name_hint is None:
+                existing_result.name_hint = result.name_hint
+        Rewriter.replace_op(op, [], existing.results)
+        return True
+
+
+def cse(op: Operation) -> int:
+    """
+    Eliminate the common subexpressions of an operation regions, by replacing
+    operations annotated with the `Pure` trait with an identical operation that
+    dominates them.
+    Modifies input operation in-place, and returns the number of erased
+    operations.
+    """
+    driver = _CSEDriver()
+    for region in op.regions:
+        driver.simplify_region(region)
+    return driver.num_erased_ops
+
+
+class CommonSubexpressionElimination(ModulePass):
+    name = "cse"
+
+    def apply(self, ctx: MLContext, op: ModuleOp) -> None:
+        cse(op)
@@ -0,0 +1,29 @@
+from xdsl.dialects.builtin import ModuleOp
+from xdsl.ir import MLContext
+from xdsl.passes import ModulePass
+from xdsl.pattern_rewriter import (
+    GreedyPatternRewriteDriver,
+    PatternRewriterInstrumentation,
+)
+from xdsl.transforms.dead_code_elimination import RemoveUnusedOperations
+
+
+def constant_fold(
+    op: ModuleOp, instrumentation: PatternRewriterInstrumentation | None = None
+):
+    """
+    Fold the operations of a module until a fixpoint is reached, and remove the
+    operations annotated with the `Pure` trait whose results have no uses, such
+    as the folded constants.
+    Modifies input module in-place.
+    """
+    GreedyPatternRewriteDriver(
+        RemoveUnusedOperations(), instrumentation=instrumentation
+    ).rewrite_module(op)
+
+
+class ConstantFolding(ModulePass):
+    name = "constant-fold"
+
+    def apply(self, ctx: MLContext, op: ModuleOp) -> None:
+        constant_fold(op, ctx.pattern_rewriter_instrumentation)
@@ -1,7 +1,12 @@
 from xdsl.dialects.builtin import ModuleOp
 from xdsl.ir import MLContext, Operation
 from xdsl.passes import ModulePass
-from xdsl.pattern_rewriter import RewritePattern, PatternRewriter, PatternRewriteWalker
+from xdsl.pattern_rewriter import (
+    PatternRewriterInstrumentation,
+    RewritePattern,
+    PatternRewriter,
+    PatternRewriteWalker,
+)
 from xdsl.traits import Pure
 
 
@@ -25,13 +30,16 @@ class RemoveUnusedOperations(RewritePattern):
         rewriter.erase_op(op)
 
 
-def dce(op: ModuleOp):
+def dce(op: ModuleOp, instrumentation: PatternRewriterInstrumentation | None = None):
     """
     Removes operations annotated with the `Pure` trait, where results have no uses.
     Modifies input module in-place.
     """
     walker = PatternRewriteWalker(
-        RemoveUnusedOperations(), apply_recursively=True, walk_reverse=True
+        RemoveUnusedOperations(),
+        apply_recursively=True,
+        walk_reverse=True,
+        instrumentation=instrumentation,
     )
     walker.rewrite_module(op)
 
@@ -40,4 +48,4 @@ class DeadCodeElimination(ModulePass):
     name = "dce"
 
     def apply(self, ctx: MLContext, op: ModuleOp) -> None:
-        dce(op)
+        dce(op, ctx.pattern_rewriter_instrumentation)
@@ -229,5 +229,6 @@ def Apply1DMpi(ctx: MLContext, module: builtin.ModuleOp):
             ]
         ),
         apply_recursively=True,
+        instrumentation=ctx.pattern_rewriter_instrumentation,
     )
     walker1.rewrite_module(module)
@@ -417,6 +417,7 @@ class ConvertStencilToGPUPass(ModulePass):
             GreedyRewritePatternApplier([StencilConversion(return_targets, gpu=True)]),
             apply_recursively=False,
             walk_reverse=True,
+            instrumentation=ctx.pattern_rewriter_instrumentation,
         )
         the_one_pass.rewrite_module(op)
 
@@ -433,6 +434,7 @@ class ConvertStencilToLLMLIRPass(ModulePass):
             GreedyRewritePatternApplier([StencilConversion(return_targets, gpu=False)]),
             apply_recursively=False,
             walk_reverse=True,
+            instrumentation=ctx.pattern_rewriter_instrumentation,
         )
         the_one_pass.rewrite_module(op)
         PatternRewriteWalker(
@@ -440,6 +442,7 @@ class ConvertStencilToLLMLIRPass(ModulePass):
                 [
                     LowerHaloExchangeToMpi(HorizontalSlices2D(2)),
                 ]
-            )
+            ),
+            instrumentation=ctx.pattern_rewriter_instrumentation,
         ).rewrite_module(op)
         MpiLoopInvariantCodeMotion().rewrite_module(op)
@@ -139,6 +139,9 @@ class StencilShapeInferencePass(ModulePass):
 
     def apply(self, ctx: MLContext, op: builtin.ModuleOp) -> None:
         inference_walker = PatternRewriteWalker(
-            ShapeInference, apply_recursively=False, walk_reverse=True
+            ShapeInference,
+            apply_recursively=False,
+            walk_reverse=True,
+            instrumentation=ctx.pattern_rewriter_instrumentation,
         )
         inference_walker.rewrite_module(op)
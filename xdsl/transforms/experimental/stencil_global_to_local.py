@@ -309,7 +309,11 @@ class GlobalStencilToLocalStencil2DHorizontal(ModulePass):
             [ChangeStoreOpSizes(strategy), AddHaloExchangeOps(strategy)]
         )
 
-        PatternRewriteWalker(gpra, apply_recursively=False).rewrite_module(op)
+        PatternRewriteWalker(
+            gpra,
+            apply_recursively=False,
+            instrumentation=ctx.pattern_rewriter_instrumentation,
+        ).rewrite_module(op)
 
 
 @dataclass
@@ -0,0 +1,197 @@
+from dataclasses import dataclass, field
+
+from xdsl.call_graph import CallGraph, CallGraphNode
+from xdsl.dialects.builtin import ModuleOp
+from xdsl.dialects.cf import Branch
+from xdsl.dialects.func import Call, FuncOp, Return
+from xdsl.ir import Block, MLContext, Operation, SSAValue
+from xdsl.passes import ModulePass
+from xdsl.rewriter import Rewriter
+from xdsl.symbol_table import is_public_symbol
+from xdsl.transforms.symbol_dce import get_live_symbols
+
+
+@dataclass(frozen=True)
+class InlineCostModel:
+    """Decide which calls are inlined, from the size of the called functions."""
+
+    max_num_ops: int = field(default=8)
+    """
+    The maximum number of operations of a function inlined at all its call
+    sites, not counting its returns.
+    """
+
+    inline_single_use: bool = field(default=True)
+    """Inline the private functions that are called once, whatever their size."""
+
+    def should_inline(self, num_ops: int, num_uses: int, is_public: bool) -> bool:
+        """Check if a function should be inlined at one of its call sites."""
+        if num_ops <= self.max_num_ops:
+            return True
+        return self.inline_single_use and num_uses == 1 and not is_public
+
+
+def _count_ops(func: FuncOp) -> int:
+    return sum(1 for op in func.body.walk() if not isinstance(op, Return))
+
+
+def can_inline(call: Call, callee: FuncOp) -> bool:
+    """
+    Check if a call can be replaced by the body of the function it calls.
+    Functions with several blocks can only be inlined in a function body, as
+    their returns are replaced by branches.
+    """
+    blocks = callee.body.blocks
+    if not blocks:
+        return False
+    if len(blocks) == 1:
+        # Declarations have an empty block.
+        return isinstance(blocks[0].last_op, Return)
+    block = call.parent
+    return (
+        block is not None
+        and block.parent is not None
+        and isinstance(block.parent.parent, FuncOp)
+    )
+
+
+def inline_call(call: Call, callee: FuncOp) -> None:
+    """
+    Replace a call by a copy of the body of the function it calls, see
+    `can_inline`.
+    """
+    block = call.parent
+    assert block is not None, "Cannot inline a call without a parent"
+
+    if len(callee.body.blocks) == 1:
+        # The returned values directly replace the results of the call.
+        value_mapper: dict[SSAValue, SSAValue] = dict(zip(callee.args, call.arguments))
+        *body_ops, return_op = callee.body.block.ops
+        block.insert_ops_before([op.clone(value_mapper) for op in body_ops], call)
+        Rewriter.replace_op(
+            call, [], [value_mapper.get(value, value) for value in return_op.operands]
+        )
+        return
+
+    region = block.parent
+    assert region is not None
+
+    # Move the operations following the call to a new block, whose arguments
+    # replace the results of the call.
+    continuation = Block(arg_types=[result.typ for result in call.results])
+    while (op := call.next_op) is not None:
+        continuation.add_op(block.detach_op(op))
+    for result, arg in zip(call.results, continuation.args):
+        result.replace_by(arg)
+    block_index = region.get_block_index(block)
+    region.insert_block(continuation, block_index + 1)
+
+    # Copy the body of the function between the two blocks, and replace its
+    # returns by branches to the continuation block.
+    callee.body.clone_into(region, block_index + 1)
+    inlined_blocks = region.blocks[
+        block_index + 1 : block_index + 1 + len(callee.body.blocks)
+    ]
+    for inlined_block in inlined_blocks:
+        return_op = inlined_block.last_op
+        if isinstance(return_op, Return):
+            Rewriter.replace_op(
+                return_op, Branch.get(continuation, *return_op.operands)
+            )
+
+    # Merge the entry block with the block of the call. The operations are
+    # moved by hand, as the call arguments may be arguments of the block.
+    entry = inlined_blocks[0]
+    for arg, operand in zip(entry.args, call.arguments):
+        arg.replace_by(operand)
+    block.erase_op(call)
+    while (op := entry.first_op) is not None:
+        block.add_op(entry.detach_op(op))
+    region.erase_block(entry)
+
+
+def inline_calls(op: Operation, cost_model: InlineCostModel | None = None) -> int:
+    """
+    Inline the calls to the functions selected by the cost model, in the
+    functions nested in an operation.
+    Functions are processed bottom-up in the call graph, so that the inlined
+    functions already had their own calls inlined. Recursive calls are not
+    inlined. The private functions that are no longer used once their calls
+    are inlined are erased.
+    Modifies input operation in-place, and returns the number of inlined
+    calls.
+    """
+    if cost_model is None:
+        cost_model = InlineCostModel()
+    graph = CallGraph.build(op)
+    sccs = graph.get_sccs()
+    scc_indices = {node: index for index, scc in enumerate(sccs) for node in scc}
+    num_uses = {node: len(node.uses) for node in graph.nodes.values()}
+    num_ops: dict[CallGraphNode, int] = {}
+    inlined_nodes: set[CallGraphNode] = set()
+
+    num_inlined_calls = 0
+    for scc_index, scc in enumerate(sccs):
+        for node in scc:
+            changed = False
+            for call in node.calls:
+                callee = graph.resolve_call(call)
+                if (
+                    callee is None
+                    or scc_indices[callee] == scc_index
+                    or not can_inline(call, callee.func)
+                ):
+                    continue
+                if callee not in num_ops:
+                    num_ops[callee] = _count_ops(callee.func)
+                if not cost_model.should_inline(
+                    num_ops[callee], num_uses[callee], is_public_symbol(callee.func)
+                ):
+                    continue
+                # The calls of the inlined function are copied.
+                for nested_call in callee.calls:
+                    if (nested_callee := graph.resolve_call(nested_call)) is not None:
+                        num_uses[nested_callee] += 1
+                inline_call(call, callee.func)
+                num_uses[callee] -= 1
+                inlined_nodes.add(callee)
+                num_inlined_calls += 1
+                changed = True
+            if changed:
+                node.calls = [
+                    nested_op
+                    for nested_op in node.func.walk()
+                    if isinstance(nested_op, Call)
+                    and graph.resolve_call(nested_op) is not None
+                ]
+
+    # Erase the private functions that were only used by the inlined calls.
+    dead_nodes = [
+        node
+        for node in inlined_nodes
+        if num_uses[node] == 0 and not is_public_symbol(node.func)
+    ]
+    if dead_nodes:
+        live_symbols = get_live_symbols(op, graph.symbol_tables)
+        for node in dead_nodes:
+            if node.func in live_symbols:
+                continue
+            table_op = node.func.parent_op()
+            assert table_op is not None
+            graph.symbol_tables.get_symbol_table(table_op).erase(node.func)
+    return num_inlined_calls
+
+
+@dataclass
+class InlineFunctions(ModulePass):
+    """
+    Inline the calls to small functions, and to private functions called once,
+    see `InlineCostModel`.
+    """
+
+    name = "inline"
+
+    cost_model: InlineCostModel = field(default_factory=InlineCostModel)
+
+    def apply(self, ctx: MLContext, op: ModuleOp) -> None:
+        inline_calls(op, self.cost_model)
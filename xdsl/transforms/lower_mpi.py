@@ -828,10 +828,14 @@ class LowerMPIPass(ModulePass):
                 ]
             ),
             apply_recursively=True,
+            instrumentation=ctx.pattern_rewriter_instrumentation,
         )
 
         # add func.func to declare external functions
-        walker2 = PatternRewriteWalker(MpiAddExternalFuncDefs())
+        walker2 = PatternRewriteWalker(
+            MpiAddExternalFuncDefs(),
+            instrumentation=ctx.pattern_rewriter_instrumentation,
+        )
 
         walker1.rewrite_module(op)
         walker2.rewrite_module(op)
@@ -0,0 +1,104 @@
+from xdsl.dialects.builtin import ModuleOp
+from xdsl.ir import MLContext, Operation
+from xdsl.passes import ModulePass
+from xdsl.symbol_table import (
+    SymbolTableCollection,
+    get_symbol_name,
+    get_symbol_uses,
+    is_public_symbol,
+)
+from xdsl.traits import SymbolTableOp
+
+
+def _is_symbol_in_table(op: Operation) -> bool:
+    parent = op.parent_op()
+    return (
+        parent is not None
+        and parent.has_trait(SymbolTableOp)
+        and get_symbol_name(op) is not None
+    )
+
+
+def get_live_symbols(
+    op: Operation, symbol_tables: SymbolTableCollection | None = None
+) -> set[Operation]:
+    """
+    Get the symbols nested in an operation that are referenced, directly or
+    through other referenced symbols, from the public symbols or from the
+    operations that are not symbols. The symbols containing a live symbol are
+    live. The returned set also contains operations that are not symbols.
+    """
+    if symbol_tables is None:
+        symbol_tables = SymbolTableCollection()
+
+    live: set[Operation] = {op}
+    worklist: list[Operation] = [op]
+
+    def mark_live(symbol: Operation) -> None:
+        current: Operation | None = symbol
+        while current is not None and current not in live:
+            live.add(current)
+            worklist.append(current)
+            current = current.parent_op()
+
+    while worklist:
+        live_op = worklist.pop()
+        stack = [live_op]
+        while stack:
+            current = stack.pop()
+            if current is not live_op and _is_symbol_in_table(current):
+                # Nested symbols are walked once they are known to be live.
+                if is_public_symbol(current):
+                    mark_live(current)
+                continue
+            for symbol_ref in get_symbol_uses(current):
+                symbol = symbol_tables.lookup_nearest_symbol_from(current, symbol_ref)
+                if symbol is not None:
+                    mark_live(symbol)
+            for region in current.regions:
+                for block in region.blocks:
+                    stack.extend(block.ops)
+    return live
+
+
+def symbol_dce(
+    op: Operation, symbol_tables: SymbolTableCollection | None = None
+) -> int:
+    """
+    Erase the private symbols that are not live, see `get_live_symbols`.
+    Modifies input operation in-place, and returns the number of erased
+    symbols.
+    """
+    if symbol_tables is None:
+        symbol_tables = SymbolTableCollection()
+    live = get_live_symbols(op, symbol_tables)
+
+    dead_symbols: list[Operation] = []
+    stack = [op]
+    while stack:
+        current = stack.pop()
+        for region in current.regions:
+            for block in region.blocks:
+                for nested_op in block.ops:
+                    if nested_op not in live and _is_symbol_in_table(nested_op):
+                        dead_symbols.append(nested_op)
+                    else:
+                        stack.append(nested_op)
+
+    for symbol in dead_symbols:
+        table_op = symbol.parent_op()
+        assert table_op is not None
+        symbol_tables.get_symbol_table(table_op).erase(symbol)
+    return len(dead_symbols)
+
+
+class SymbolDCE(ModulePass):
+    """
+    Erase the private symbols that are not referenced, such as the private
+    functions that are never called.
+    """
+
+    name = "symbol-dce"
+
+    def apply(self, ctx: MLContext, op: ModuleOp) -> None:
+        symbol_dce(op)
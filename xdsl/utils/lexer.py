@@ -6,7 +6,7 @@ import ast
 from dataclasses import dataclass, field
 from io import StringIO
 from enum import Enum
-from typing import ClassVar, Literal, TypeAlias, TypeGuard, cast
+from typing import IO, ClassVar, Literal, TypeAlias, TypeGuard, cast
 from string import hexdigits
 
 from xdsl.utils.exceptions import ParseError
@@ -26,6 +26,11 @@ class Input:
 
     content: str = field(repr=False)
     name: str
+    line_offset: int = field(default=0, repr=False)
+    """
+    Number of lines preceding the content in the original file.
+    This is non-zero when the content is a window in a larger file.
+    """
     len: int = field(init=False, repr=False)
 
     def __post_init__(self):
@@ -37,7 +42,7 @@ class Input:
     def get_lines_containing(self, span: Span) -> tuple[list[str], int, int] | None:
         # A pointer to the start of the first line
         start = 0
-        line_no = 0
+        line_no = self.line_offset
         source = self.content
         while True:
             next_start = source.find("\n", start)
@@ -368,7 +373,7 @@ class Lexer:
         self.pos = match.end()
         return match
 
-    _whitespace_regex = re.compile(r"((//[^\n]*(\n)?)|(\s+))*", re.ASCII)
+    _whitespace_regex = re.compile(r"(?://[^\n]*|\s+)*", re.ASCII)
 
     def _consume_whitespace(self) -> None:
         """
@@ -382,14 +387,69 @@ class Lexer:
         """
         return Token(kind, Span(start_pos, self.pos, self.input))
 
+    _token_regex = re.compile(
+        r"""
+        (?P<BARE_IDENT>[a-zA-Z_][a-zA-Z0-9_$.]*)
+        | (?P<PUNCTUATION>->|\{-\#|\#-\}|\.\.\.|[:,()}\[\]<>=+*?|{-])
+        | (?P<PREFIXED_IDENT>[\#%^!](?:[0-9]+|[a-zA-Z$._-][a-zA-Z0-9$._-]*))
+        | (?P<AT_IDENT>@(?:[a-zA-Z_][a-zA-Z0-9_$.]*|"(?:[^"\\\n\v\f]|\\["\\nt])*"))
+        | (?P<STRING_LIT>"(?:[^"\\\n\v\f]|\\["\\nt])*")
+        | (?P<HEX_INTEGER_LIT>0x[0-9a-fA-F]+)
+        | (?P<FLOAT_LIT>[0-9]+\.[0-9]*(?:[eE][+-]?[0-9]+)?)
+        | (?P<INTEGER_LIT>[0-9]+)
+        """,
+        re.VERBOSE,
+    )
+    """
+    Regular expression matching all well-formed tokens in a single pass.
+    Inputs it does not match are handled by the character-by-character lexer,
+    which also reports the errors.
+    """
+
+    _punctuation_to_kind: ClassVar[
+        dict[str, Token.Kind]
+    ] = Token.Kind.get_punctuation_spelling_to_kind_dict()
+
+    _prefix_to_kind: ClassVar[dict[str, Token.Kind]] = {
+        "#": Token.Kind.HASH_IDENT,
+        "%": Token.Kind.PERCENT_IDENT,
+        "^": Token.Kind.CARET_IDENT,
+        "!": Token.Kind.EXCLAMATION_IDENT,
+    }
+
+    _group_to_kind: ClassVar[dict[str | None, Token.Kind]] = {
+        "BARE_IDENT": Token.Kind.BARE_IDENT,
+        "AT_IDENT": Token.Kind.AT_IDENT,
+        "STRING_LIT": Token.Kind.STRING_LIT,
+        "HEX_INTEGER_LIT": Token.Kind.INTEGER_LIT,
+        "FLOAT_LIT": Token.Kind.FLOAT_LIT,
+        "INTEGER_LIT": Token.Kind.INTEGER_LIT,
+    }
+
     def lex(self) -> Token:
         """
         Lex a token from the input, and returns it.
+        Each character of the input is only visited a constant number of times,
+        so lexing a whole input takes linear time.
         """
         # First, skip whitespaces
         self._consume_whitespace()
 
         start_pos = self.pos
+
+        # Fast path: match the next token with a single regular expression
+        match = self._token_regex.match(self.input.content, start_pos)
+        if match is not None:
+            self.pos = match.end()
+            group = match.lastgroup
+            if group == "PUNCTUATION":
+                kind = self._punctuation_to_kind[match.group()]
+            elif group == "PREFIXED_IDENT":
+                kind = self._prefix_to_kind[self.input.content[start_pos]]
+            else:
+                kind = self._group_to_kind[group]
+            return self._form_token(kind, start_pos)
+
         current_char = self._get_chars()
 
         # Handle end of file
@@ -401,24 +461,10 @@ class Lexer:
             return self._lex_bare_identifier(start_pos)
 
         # single-char punctuation that are not part of a multi-char token
-        single_char_punctuation = {
-            ":": Token.Kind.COLON,
-            ",": Token.Kind.COMMA,
-            "(": Token.Kind.L_PAREN,
-            ")": Token.Kind.R_PAREN,
-            "}": Token.Kind.R_BRACE,
-            "[": Token.Kind.L_SQUARE,
-            "]": Token.Kind.R_SQUARE,
-            "<": Token.Kind.LESS,
-            ">": Token.Kind.GREATER,
-            "=": Token.Kind.EQUAL,
-            "+": Token.Kind.PLUS,
-            "*": Token.Kind.STAR,
-            "?": Token.Kind.QUESTION,
-            "|": Token.Kind.VERTICAL_BAR,
-        }
-        if current_char in single_char_punctuation:
-            return self._form_token(single_char_punctuation[current_char], start_pos)
+        if current_char in self._single_char_punctuation:
+            return self._form_token(
+                self._single_char_punctuation[current_char], start_pos
+            )
 
         # '...'
         if current_char == ".":
@@ -467,6 +513,23 @@ class Lexer:
             "Unexpected character: {}".format(current_char),
         )
 
+    _single_char_punctuation: ClassVar[dict[str, Token.Kind]] = {
+        ":": Token.Kind.COLON,
+        ",": Token.Kind.COMMA,
+        "(": Token.Kind.L_PAREN,
+        ")": Token.Kind.R_PAREN,
+        "}": Token.Kind.R_BRACE,
+        "[": Token.Kind.L_SQUARE,
+        "]": Token.Kind.R_SQUARE,
+        "<": Token.Kind.LESS,
+        ">": Token.Kind.GREATER,
+        "=": Token.Kind.EQUAL,
+        "+": Token.Kind.PLUS,
+        "*": Token.Kind.STAR,
+        "?": Token.Kind.QUESTION,
+        "|": Token.Kind.VERTICAL_BAR,
+    }
+
     _bare_identifier_suffix_regex = re.compile(r"[a-zA-Z0-9_$.]*")
 
     def _lex_bare_identifier(self, start_pos: Position) -> Token:
@@ -623,3 +686,76 @@ class Lexer:
         if match is not None:
             return self._form_token(Token.Kind.FLOAT_LIT, start_pos)
         return self._form_token(Token.Kind.INTEGER_LIT, start_pos)
+
+
+class StreamingLexer(Lexer):
+    """
+    A lexer reading its input from a text stream through a sliding buffer.
+
+    The buffer is extended line by line when the lexer reaches its end, and
+    already lexed text can be dropped with `discard_before`. Since no token other
+    than whitespace spans multiple lines, a buffer ending with a newline always
+    contains complete tokens.
+    """
+
+    stream: IO[str]
+    """Stream the input is read from."""
+
+    chunk_size: int
+    """Minimum number of characters read from the stream at once."""
+
+    _exhausted: bool
+    """Whether the whole stream has been read."""
+
+    def __init__(
+        self, stream: IO[str], name: str = "<unknown>", chunk_size: int = 1 << 20
+    ):
+        super().__init__(Input("", name))
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self._exhausted = False
+
+    def _read_more(self) -> bool:
+        """
+        Extend the buffer with the next lines of the stream.
+        Return False if the stream was already fully read.
+        """
+        if self._exhausted:
+            return False
+        # Grow the buffer geometrically, so that the total copying is linear
+        data = self.stream.read(max(self.chunk_size, self.input.len))
+        if not data.endswith("\n"):
+            data += self.stream.readline()
+        if not data:
+            self._exhausted = True
+            return False
+        self.input = Input(
+            self.input.content + data, self.input.name, self.input.line_offset
+        )
+        return True
+
+    def discard_before(self, pos: Position) -> int:
+        """
+        Drop the lines of the buffer preceding the line containing `pos`.
+        Positions are relative to the buffer, so they are shifted by the returned
+        number of dropped characters. Spans that were already created keep
+        referring to the previous buffer.
+        """
+        content = self.input.content
+        line_start = content.rfind("\n", 0, pos) + 1
+        if line_start == 0:
+            return 0
+        self.input = Input(
+            content[line_start:],
+            self.input.name,
+            self.input.line_offset + content.count("\n", 0, line_start),
+        )
+        self.pos -= line_start
+        return line_start
+
+    def lex(self) -> Token:
+        # Read the stream until a token or the end of the stream is found
+        self._consume_whitespace()
+        while self.pos >= self.input.len and self._read_more():
+            self._consume_whitespace()
+        return super().lex()
@@ -2,14 +2,16 @@ import argparse
 import sys
 import os
 
+from contextlib import nullcontext
 from io import StringIO
 from xdsl.dialects.riscv import RISCV
 from xdsl.dialects.snitch import Snitch
 from xdsl.frontend.symref import Symref
 
-from xdsl.ir import MLContext
+from xdsl.ir import MLContext, record_modified_operations
 from xdsl.parser import Parser, ParseError
-from xdsl.passes import ModulePass
+from xdsl.instrumentation import StatisticsInstrumentation
+from xdsl.passes import ModulePass, PassInstrumentation
 from xdsl.printer import Printer
 from xdsl.dialects.func import Func
 from xdsl.dialects.scf import Scf
@@ -31,8 +33,14 @@ from xdsl.dialects.experimental.stencil import StencilExp
 from xdsl.dialects.experimental.math import Math
 
 from xdsl.frontend.passes.desymref import DesymrefyPass
+from xdsl.transforms.common_subexpression_elimination import (
+    CommonSubexpressionElimination,
+)
+from xdsl.transforms.constant_folding import ConstantFolding
 from xdsl.transforms.dead_code_elimination import DeadCodeElimination
+from xdsl.transforms.inlining import InlineFunctions
 from xdsl.transforms.riscv_register_allocation import RISCVRegisterAllocation
+from xdsl.transforms.symbol_dce import SymbolDCE
 from xdsl.transforms.lower_mpi import LowerMPIPass
 from xdsl.transforms.experimental.ConvertStencilToLLMLIR import (
     ConvertStencilToGPUPass,
@@ -45,7 +53,7 @@ from xdsl.transforms.experimental.stencil_global_to_local import (
 
 from xdsl.utils.exceptions import DiagnosticException
 
-from typing import IO, Dict, Callable, List, Sequence, Type
+from typing import IO, ContextManager, Dict, Callable, List, Sequence, Type
 from xdsl.riscv_asm_writer import print_riscv_module
 
 
@@ -77,6 +85,15 @@ class xDSLOptMain:
     pipeline: List[ModulePass]
     """ The pass-pipeline to be applied. """
 
+    pass_instrumentations: List[PassInstrumentation]
+    """ The instrumentations called around each pass of the pipeline. """
+
+    statistics: StatisticsInstrumentation | None
+    """
+    The timings and statistics collected when `--timing` or `--pass-statistics`
+    is set.
+    """
+
     def __init__(
         self,
         description: str = "xDSL modular optimizer driver",
@@ -96,6 +113,18 @@ class xDSLOptMain:
         arg_parser = argparse.ArgumentParser(description=description)
         self.register_all_arguments(arg_parser)
         self.args = arg_parser.parse_args(args=args)
+        self.ctx.unique_attributes = self.args.unique_attributes
+
+        self.pass_instrumentations = []
+        self.statistics = None
+        if self.args.timing or self.args.pass_statistics:
+            # Operations and patterns are only needed for the statistics report.
+            self.statistics = StatisticsInstrumentation(
+                count_ops=self.args.pass_statistics
+            )
+            self.pass_instrumentations.append(self.statistics)
+            if self.args.pass_statistics:
+                self.ctx.pattern_rewriter_instrumentation = self.statistics
 
         self.setup_pipeline()
 
@@ -103,14 +132,15 @@ class xDSLOptMain:
         """
         Executes the different steps.
         """
-        if not self.args.parsing_diagnostics:
-            module = self.parse_input()
-        else:
-            try:
+        with self.time_phase("Parse"):
+            if not self.args.parsing_diagnostics:
                 module = self.parse_input()
-            except ParseError as e:
-                print(e)
-                exit(0)
+            else:
+                try:
+                    module = self.parse_input()
+                except ParseError as e:
+                    print(e)
+                    exit(0)
 
         if not self.args.verify_diagnostics:
             self.apply_passes(module)
@@ -121,8 +151,11 @@ class xDSLOptMain:
                 print(e)
                 exit(0)
 
-        contents = self.output_resulting_program(module)
-        self.print_to_output_stream(contents)
+        with self.time_phase("Output"):
+            contents = self.output_resulting_program(module)
+            self.print_to_output_stream(contents)
+
+        self.print_statistics()
 
     def register_all_arguments(self, arg_parser: argparse.ArgumentParser):
         """
@@ -202,6 +235,63 @@ class xDSLOptMain:
             help="Allow the parsing of unregistered dialects.",
         )
 
+        arg_parser.add_argument(
+            "--parse-jobs",
+            type=int,
+            default=1,
+            help="Number of processes used to parse the top-level operations "
+            "of the input module in parallel.",
+        )
+
+        arg_parser.add_argument(
+            "--stream-input",
+            default=False,
+            action="store_true",
+            help="Read the input incrementally instead of as a whole. The "
+            "top-level operations of a module in generic form are then parsed "
+            "one at a time, keeping only the text of one of them in memory.",
+        )
+
+        arg_parser.add_argument(
+            "--verify-jobs",
+            type=int,
+            default=1,
+            help="Number of processes used to verify the top-level operations "
+            "of the module in parallel.",
+        )
+
+        arg_parser.add_argument(
+            "--unique-attributes",
+            default=False,
+            action="store_true",
+            help="Represent structurally equal attributes by a single instance. "
+            "Only parsed attributes are uniqued, not the ones created by passes.",
+        )
+
+        arg_parser.add_argument(
+            "--timing",
+            default=False,
+            action="store_true",
+            help="Print the wall time spent in parsing, in each pass, in the "
+            "verifier, and in printing to stderr.",
+        )
+
+        arg_parser.add_argument(
+            "--pass-statistics",
+            default=False,
+            action="store_true",
+            help="Print the number of operations before and after each pass, and "
+            "the match attempts, rewrites, and wall time of each rewrite pattern "
+            "to stderr.",
+        )
+
+        arg_parser.add_argument(
+            "--statistics-format",
+            choices=["text", "json"],
+            default="text",
+            help="Format of the --timing and --pass-statistics reports.",
+        )
+
     def register_all_dialects(self):
         """
         Register all dialects that can be used.
@@ -239,10 +329,10 @@ class xDSLOptMain:
         def parse_mlir(io: IO[str]):
             return Parser(
                 self.ctx,
-                io.read(),
+                io if self.args.stream_input else io.read(),
                 self.get_input_name(),
                 self.args.allow_unregistered_dialect,
-            ).parse_module()
+            ).parse_module(self.args.parse_jobs)
 
         self.available_frontends["mlir"] = parse_mlir
 
@@ -262,6 +352,10 @@ class xDSLOptMain:
         self.register_pass(GlobalStencilToLocalStencil2DHorizontal)
         self.register_pass(DesymrefyPass)
         self.register_pass(DeadCodeElimination)
+        self.register_pass(ConstantFolding)
+        self.register_pass(CommonSubexpressionElimination)
+        self.register_pass(SymbolDCE)
+        self.register_pass(InlineFunctions)
         self.register_pass(RISCVRegisterAllocation)
 
     def register_all_targets(self):
@@ -326,21 +420,53 @@ class xDSLOptMain:
         return module
 
     def apply_passes(self, prog: ModuleOp):
-        """Apply passes in order."""
+        """
+        Apply passes in order.
+        The module is fully verified before the first pass and after the last
+        one. In between, only the operations modified by each pass are verified.
+        """
         assert isinstance(prog, ModuleOp)
         if not self.args.disable_verify:
-            prog.verify()
-        for p in self.pipeline:
-            p.apply(self.ctx, prog)
+            with self.time_phase("Verifier"):
+                prog.verify(jobs=self.args.verify_jobs)
+        for index, p in enumerate(self.pipeline):
+            for instrumentation in self.pass_instrumentations:
+                instrumentation.run_before_pass(p, prog)
+            with record_modified_operations() as modified_ops:
+                p.apply(self.ctx, prog)
+            for instrumentation in reversed(self.pass_instrumentations):
+                instrumentation.run_after_pass(p, prog)
             assert isinstance(prog, ModuleOp)
             if not self.args.disable_verify:
-                prog.verify()
+                with self.time_phase("Verifier"):
+                    if index == len(self.pipeline) - 1:
+                        prog.verify(jobs=self.args.verify_jobs)
+                    else:
+                        prog.verify(modified_ops=modified_ops)
             if self.args.print_between_passes:
                 print(f"IR after {p.name}:")
                 printer = Printer(stream=sys.stdout)
                 printer.print_op(prog)
                 print("\n\n\n")
 
+    def time_phase(self, name: str) -> ContextManager[None]:
+        """Time a phase of the driver if `--timing` is set."""
+        if self.statistics is None:
+            return nullcontext()
+        return self.statistics.time_phase(name)
+
+    def print_statistics(self):
+        """Print the reports requested by `--timing` and `--pass-statistics`."""
+        if self.statistics is None:
+            return
+        if self.args.statistics_format == "json":
+            print(self.statistics.json_report(), file=sys.stderr)
+            return
+        if self.args.timing:
+            print(self.statistics.timing_report(), file=sys.stderr)
+        if self.args.pass_statistics:
+            print(self.statistics.statistics_report(), file=sys.stderr)
+
     def output_resulting_program(self, prog: ModuleOp) -> str:
         """Get the resulting program."""
         output = StringIO()